@@ -0,0 +1,206 @@
+"""
+도메인별 적응형 수집 제어
+실행 중(그리고 실행 간) 도메인별 응답 시간 분포와 403/503 차단 비율을 학습해
+- 빠르고 차단하지 않는 도메인은 동시 요청 수를 늘리고 (AIMD: 성공하면 +1, 차단/타임아웃이면 절반)
+- 차단하는 도메인은 딜레이를 늘리고 재시도를 끄며
+- 타임아웃은 고정 10초 대신 관측된 p95 기준으로 설정
+"""
+import json
+import os
+import threading
+import time
+from collections import deque
+
+from concurrent_fetcher import get_domain_key
+
+DEFAULT_STATE_FILE = 'data/cache/domain_stats.json'
+
+LATENCY_WINDOW = 50          # 도메인별로 보관하는 응답 시간 샘플 수
+MIN_SAMPLES = 5              # p95 타임아웃을 쓰기 위한 최소 샘플 수
+DEFAULT_TIMEOUT = 10
+MIN_TIMEOUT = 4
+MAX_TIMEOUT = 20
+TIMEOUT_FACTOR = 3           # 타임아웃 = p95 * TIMEOUT_FACTOR
+SLOW_LATENCY = 3.0           # p95가 이보다 느리면 동시 요청 수를 늘리지 않음
+BLOCK_STATUS_CODES = (403, 429, 503)
+BLOCK_RATE_ALPHA = 0.2       # 차단 비율 지수 이동 평균 가중치
+BLOCKED_RATE = 0.5           # 이 이상이면 재시도하지 않음
+MIN_DELAY_FACTOR = 0.5
+MAX_DELAY_FACTOR = 4.0
+
+
+def percentile(values, pct):
+    """정렬 후 nearest-rank 백분위수"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[rank]
+
+
+class DomainController:
+    """도메인별 동시 요청 수/타임아웃/딜레이/재시도 결정 (스레드 안전)"""
+
+    def __init__(self, state_file=DEFAULT_STATE_FILE, min_limit=1, max_limit=3):
+        self.state_file = state_file
+        self.min_limit = max(1, int(min_limit))
+        self.max_limit = max(self.min_limit, int(max_limit))
+        self._domains = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    @classmethod
+    def from_settings(cls, settings):
+        """settings.json의 adaptiveFetch 옵션으로 생성 (시작 동시 수는 traditional.maxPerDomain)"""
+        options = settings.get('adaptiveFetch', {})
+        traditional = settings.get('scrapingMethodOptions', {}).get('traditional', {})
+        return cls(min_limit=traditional.get('maxPerDomain', 1), max_limit=options.get('maxPerDomain', 3))
+
+    def _new_state(self):
+        return {
+            'latencies': deque(maxlen=LATENCY_WINDOW),
+            'limit': self.min_limit,
+            'delay_factor': 1.0,
+            'block_rate': 0.0,
+            'streak': 0,
+            'requests': 0,
+            'blocked': 0,
+            'errors': 0
+        }
+
+    def _state(self, domain):
+        state = self._domains.get(domain)
+        if state is None:
+            state = self._domains[domain] = self._new_state()
+        return state
+
+    def _load(self):
+        """이전 실행에서 학습한 값 로드 (실행 간 카운터는 새로 시작)"""
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return
+        for domain, entry in saved.get('domains', {}).items():
+            state = self._new_state()
+            state['latencies'].extend(entry.get('latencies', []))
+            state['limit'] = max(self.min_limit, min(self.max_limit, int(entry.get('limit', self.min_limit))))
+            state['delay_factor'] = max(MIN_DELAY_FACTOR, min(MAX_DELAY_FACTOR, float(entry.get('delay_factor', 1.0))))
+            state['block_rate'] = float(entry.get('block_rate', 0.0))
+            self._domains[domain] = state
+
+    def save(self):
+        """학습 상태 저장 (다음 실행의 시작값)"""
+        with self._lock:
+            data = {
+                'updated_at': time.time(),
+                'domains': {
+                    domain: {
+                        'latencies': [round(v, 3) for v in state['latencies']],
+                        'limit': state['limit'],
+                        'delay_factor': round(state['delay_factor'], 3),
+                        'block_rate': round(state['block_rate'], 3)
+                    }
+                    for domain, state in self._domains.items()
+                }
+            }
+        try:
+            os.makedirs(os.path.dirname(self.state_file) or '.', exist_ok=True)
+            tmp_path = f'{self.state_file}.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.state_file)
+        except OSError as e:
+            print(f"[ADAPTIVE] Failed to save domain stats: {e}")
+
+    def record(self, url, latency, status_code=None, error=False):
+        """요청 결과 기록 (error: 타임아웃/연결 오류)"""
+        domain = get_domain_key(url)
+        blocked = error or status_code in BLOCK_STATUS_CODES
+        with self._lock:
+            state = self._state(domain)
+            state['requests'] += 1
+            state['latencies'].append(latency)
+            state['block_rate'] += BLOCK_RATE_ALPHA * ((1.0 if blocked else 0.0) - state['block_rate'])
+
+            if blocked:
+                # multiplicative decrease
+                state['blocked' if not error else 'errors'] += 1
+                state['streak'] = 0
+                state['limit'] = max(self.min_limit, state['limit'] // 2)
+                state['delay_factor'] = min(MAX_DELAY_FACTOR, state['delay_factor'] * 2)
+                return
+
+            state['streak'] += 1
+            state['delay_factor'] = max(MIN_DELAY_FACTOR, state['delay_factor'] * 0.9)
+            # additive increase: 현재 동시 수만큼 연속 성공하고 충분히 빠르면 +1
+            p95 = percentile(state['latencies'], 95)
+            if state['streak'] >= state['limit'] and p95 is not None and p95 < SLOW_LATENCY:
+                state['limit'] = min(self.max_limit, state['limit'] + 1)
+                state['streak'] = 0
+
+    def concurrency(self, domain):
+        """도메인(get_domain_key) 동시 요청 수 상한"""
+        with self._lock:
+            state = self._domains.get(domain)
+            return state['limit'] if state else self.min_limit
+
+    def timeout(self, url, default=DEFAULT_TIMEOUT):
+        """관측된 p95 기반 타임아웃 (샘플이 부족하면 기본값)"""
+        with self._lock:
+            state = self._domains.get(get_domain_key(url))
+            if not state or len(state['latencies']) < MIN_SAMPLES:
+                return default
+            p95 = percentile(state['latencies'], 95)
+        return max(MIN_TIMEOUT, min(MAX_TIMEOUT, p95 * TIMEOUT_FACTOR))
+
+    def scale_delay(self, url, delay):
+        """접근 전략 딜레이에 도메인 상태 반영 (차단되면 늘리고 건강하면 줄임)"""
+        with self._lock:
+            state = self._domains.get(get_domain_key(url))
+            return delay * state['delay_factor'] if state else delay
+
+    def retries(self, url, default):
+        """차단 비율이 높은 도메인은 재시도하지 않음"""
+        with self._lock:
+            state = self._domains.get(get_domain_key(url))
+            if state and state['block_rate'] >= BLOCKED_RATE:
+                return 0
+        return default
+
+    def snapshot(self):
+        """도메인별 현재 상태 요약 (실행 프로파일/로그용)"""
+        with self._lock:
+            return {
+                domain: {
+                    'limit': state['limit'],
+                    'p50': round(percentile(state['latencies'], 50) or 0, 3),
+                    'p95': round(percentile(state['latencies'], 95) or 0, 3),
+                    'block_rate': round(state['block_rate'], 3),
+                    'delay_factor': round(state['delay_factor'], 3),
+                    'requests': state['requests'],
+                    'blocked': state['blocked'],
+                    'errors': state['errors']
+                }
+                for domain, state in self._domains.items()
+            }
+
+
+# 전역 컨트롤러 인스턴스 (adaptiveFetch가 꺼져 있으면 None)
+domain_controller = None
+
+
+def configure_domain_controller(settings):
+    """settings의 adaptiveFetch.enabled에 따라 전역 컨트롤러 생성/해제"""
+    global domain_controller
+    if settings.get('adaptiveFetch', {}).get('enabled', False):
+        if domain_controller is None:
+            domain_controller = DomainController.from_settings(settings)
+    else:
+        domain_controller = None
+    return domain_controller
+
+
+def get_domain_controller():
+    """전역 도메인 컨트롤러 (설정되지 않았으면 None)"""
+    return domain_controller
@@ -0,0 +1,174 @@
+"""
+AI 결과 영구 캐시
+SQLite 기반으로 URL 판정, 콘텐츠 분류, 요약 결과를 실행 간에 보존
+항목별 TTL 만료, 개수/용량 기준 LRU 정리, 적중/미스 통계 제공
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+
+DEFAULT_DB_PATH = 'data/cache/ai_cache.db'
+
+_connections = {}
+_connections_lock = threading.Lock()
+
+
+def _get_connection(db_path):
+    """DB 파일별 공유 연결 (열 수 없으면 메모리 DB로 대체)"""
+    with _connections_lock:
+        conn = _connections.get(db_path)
+        if conn is None:
+            try:
+                if db_path != ':memory:':
+                    os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+                conn = sqlite3.connect(db_path, check_same_thread=False)
+            except (OSError, sqlite3.Error) as e:
+                print(f"[AI_CACHE] Cannot open {db_path} ({e}), using in-memory cache")
+                conn = sqlite3.connect(':memory:', check_same_thread=False)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS entries (
+                    namespace TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    expires_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    PRIMARY KEY (namespace, key)
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_access ON entries (namespace, accessed_at)")
+            conn.commit()
+            _connections[db_path] = conn
+        return conn
+
+
+class PersistentCache:
+    """네임스페이스 단위 영구 캐시 (dict와 같은 방식으로 사용)"""
+
+    def __init__(self, namespace, ttl_seconds, max_entries, max_bytes, db_path=DEFAULT_DB_PATH):
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._conn = _get_connection(db_path)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        """만료되지 않은 값 반환 (접근 시각 갱신)"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM entries WHERE namespace = ? AND key = ? AND expires_at > ?",
+                (self.namespace, key, now)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return default
+            self._conn.execute(
+                "UPDATE entries SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                (now, self.namespace, key)
+            )
+            self._conn.commit()
+            self.hits += 1
+        return json.loads(row[0])
+
+    def set(self, key, value, ttl=None):
+        """값 저장 (ttl 생략 시 기본 TTL)"""
+        now = time.time()
+        payload = json.dumps(value, ensure_ascii=False)
+        expires_at = now + (self.ttl_seconds if ttl is None else ttl)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (namespace, key, value, size, created_at, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (self.namespace, key, payload, len(payload.encode('utf-8')), now, expires_at, now)
+            )
+            self._conn.commit()
+
+    def __contains__(self, key):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM entries WHERE namespace = ? AND key = ? AND expires_at > ?",
+                (self.namespace, key, time.time())
+            ).fetchone()
+        return row is not None
+
+    def __getitem__(self, key):
+        marker = object()
+        value = self.get(key, marker)
+        if value is marker:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self.set(key, value)
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM entries WHERE namespace = ?", (self.namespace,)
+            ).fetchone()[0]
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE namespace = ?", (self.namespace,))
+            self._conn.commit()
+
+    def total_bytes(self):
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM entries WHERE namespace = ?", (self.namespace,)
+            ).fetchone()[0]
+
+    def expire(self):
+        """TTL이 지난 항목 삭제, 삭제 수 반환"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM entries WHERE namespace = ? AND expires_at <= ?",
+                (self.namespace, time.time())
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def evict(self):
+        """개수/용량 상한을 넘으면 가장 오래 사용하지 않은 항목부터 삭제, 삭제 수 반환"""
+        removed = 0
+        with self._lock:
+            count, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries WHERE namespace = ?",
+                (self.namespace,)
+            ).fetchone()
+            if count <= self.max_entries and total <= self.max_bytes:
+                return 0
+
+            rows = self._conn.execute(
+                "SELECT key, size FROM entries WHERE namespace = ? ORDER BY accessed_at ASC",
+                (self.namespace,)
+            ).fetchall()
+            victims = []
+            for key, size in rows:
+                if count <= self.max_entries and total <= self.max_bytes:
+                    break
+                victims.append((self.namespace, key))
+                count -= 1
+                total -= size
+            self._conn.executemany("DELETE FROM entries WHERE namespace = ? AND key = ?", victims)
+            self._conn.commit()
+            removed = len(victims)
+        return removed
+
+    def get_stats(self):
+        """적중/미스 통계"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self),
+            'bytes': self.total_bytes(),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0
+        }
@@ -0,0 +1,139 @@
+"""
+AI 제공자 클라이언트 레지스트리
+Cohere 클라이언트와 Gemini 모델을 프로세스당 한 번만 만들어 모든 호출부가 공유
+- 클라이언트가 가진 HTTP 연결 풀(TLS 세션 포함)을 요약마다 새로 만들지 않고 재사용
+- genai.configure는 처음 한 번만 호출, GenerativeModel은 모델 이름별로 하나씩 유지
+- 제공자별 호출/오류 수와 응답 시간, 연속 오류 기반 상태(health)를 기록
+"""
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# Cohere API
+try:
+    import cohere
+    COHERE_AVAILABLE = True
+except ImportError:
+    COHERE_AVAILABLE = False
+
+# Gemini API
+try:
+    import google.generativeai as genai
+    GEMINI_AVAILABLE = True
+except ImportError:
+    GEMINI_AVAILABLE = False
+
+DEFAULT_GEMINI_MODEL = 'gemini-1.5-flash'
+UNHEALTHY_AFTER = 3   # 연속 오류가 이 횟수 이상이면 unhealthy
+
+
+class AIClientRegistry:
+    """제공자별 장수명 클라이언트와 사용량 카운터 (스레드 안전)"""
+
+    def __init__(self):
+        self._clients = {}
+        self._usage = {}
+        self._gemini_key = None   # genai.configure에 마지막으로 설정한 키
+        self._lock = threading.Lock()
+
+    def _usage_entry(self, provider):
+        """제공자 사용량 항목 (잠금 안에서 호출)"""
+        return self._usage.setdefault(provider, {
+            'created': 0, 'calls': 0, 'errors': 0, 'consecutive_errors': 0,
+            'total_seconds': 0.0, 'last_error': None
+        })
+
+    def _get_or_create(self, key, provider, factory, label=None):
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                return client
+            try:
+                client = factory()
+            except Exception as e:
+                entry = self._usage_entry(provider)
+                entry['errors'] += 1
+                entry['consecutive_errors'] += 1
+                entry['last_error'] = f"{type(e).__name__}: {e}"
+                print(f"[AI_CLIENTS] Failed to create {provider} client: {type(e).__name__}: {e}")
+                return None
+            self._clients[key] = client
+            self._usage_entry(provider)['created'] += 1
+            print(f"[AI_CLIENTS] Created {label or provider} client")
+            return client
+
+    def cohere(self, api_key=None):
+        """공유 Cohere 클라이언트 (라이브러리나 COHERE_API_KEY가 없으면 None)"""
+        api_key = api_key or os.environ.get('COHERE_API_KEY')
+        if not COHERE_AVAILABLE or not api_key:
+            return None
+        return self._get_or_create(('cohere', api_key), 'cohere', lambda: cohere.Client(api_key))
+
+    def gemini(self, model_name=DEFAULT_GEMINI_MODEL, api_key=None):
+        """공유 Gemini GenerativeModel (라이브러리나 GOOGLE_GEMINI_API_KEY가 없으면 None)"""
+        api_key = api_key or os.environ.get('GOOGLE_GEMINI_API_KEY')
+        if not GEMINI_AVAILABLE or not api_key:
+            return None
+
+        def create():
+            # 같은 키로 이미 설정했다면 configure를 다시 호출하지 않음 (전송 채널 재사용)
+            if self._gemini_key != api_key:
+                genai.configure(api_key=api_key)
+                self._gemini_key = api_key
+            return genai.GenerativeModel(model_name)
+
+        return self._get_or_create(('gemini', api_key, model_name), 'gemini', create, label=f'gemini {model_name}')
+
+    @contextmanager
+    def track(self, provider):
+        """with 블록 안의 API 호출 한 번을 사용량/상태에 기록 (예외는 그대로 전달)"""
+        start = time.time()
+        try:
+            yield
+        except Exception as e:
+            self.record(provider, time.time() - start, error=e)
+            raise
+        self.record(provider, time.time() - start)
+
+    def record(self, provider, elapsed, error=None):
+        """호출 결과 기록"""
+        with self._lock:
+            entry = self._usage_entry(provider)
+            entry['calls'] += 1
+            entry['total_seconds'] += elapsed
+            if error is None:
+                entry['consecutive_errors'] = 0
+            else:
+                entry['errors'] += 1
+                entry['consecutive_errors'] += 1
+                entry['last_error'] = f"{type(error).__name__}: {error}"
+
+    def healthy(self, provider):
+        """최근 연속 오류가 UNHEALTHY_AFTER회 미만이면 True"""
+        with self._lock:
+            return self._usage.get(provider, {}).get('consecutive_errors', 0) < UNHEALTHY_AFTER
+
+    def get_stats(self):
+        """제공자별 사용량과 상태"""
+        with self._lock:
+            usage = {provider: dict(entry) for provider, entry in self._usage.items()}
+        for provider, entry in usage.items():
+            entry['avg_seconds'] = round(entry['total_seconds'] / entry['calls'], 3) if entry['calls'] else None
+            entry['total_seconds'] = round(entry['total_seconds'], 3)
+            entry['healthy'] = entry['consecutive_errors'] < UNHEALTHY_AFTER
+        return usage
+
+
+# 전역 레지스트리 (처음 사용할 때 생성)
+ai_clients = None
+_registry_lock = threading.Lock()
+
+
+def get_ai_clients():
+    """전역 AIClientRegistry 인스턴스"""
+    global ai_clients
+    with _registry_lock:
+        if ai_clients is None:
+            ai_clients = AIClientRegistry()
+        return ai_clients
@@ -5,15 +5,47 @@ import time
 import hashlib
 from datetime import datetime
 import pytz
-from typing import Dict, List, Optional, Tuple
-import google.generativeai as genai
-from bs4 import BeautifulSoup
+from typing import Dict, List, Optional, Tuple, Union
 import requests
 from urllib.parse import urljoin, urlparse
+from http_cache import get_http_cache
+from http_session import get_page_limits
+from ai_cache import PersistentCache
+from rate_limiter import get_rate_limiter
+from ai_clients import get_ai_clients
+from batch_ai_processor import BatchAIProcessor
+from parsed_document import ParsedDocument, element_text, is_excluded
+from instrumentation import get_profiler
+from async_fetcher import FetchJob
 
 # KST 타임존 설정
 KST = pytz.timezone('Asia/Seoul')
 
+# AI 결과 캐시 TTL (fallback 판정은 다음 실행에서 AI로 다시 시도하도록 짧게 유지)
+URL_CACHE_TTL = 7 * 24 * 3600
+CONTENT_CACHE_TTL = 3 * 24 * 3600
+SUMMARY_CACHE_TTL = 7 * 24 * 3600
+FALLBACK_CACHE_TTL = 3600
+
+# 페이지 요청 헤더 (스레드 수집과 async 수집이 같은 헤더 사용)
+PAGE_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# 기사임을 밝히는 JSON-LD @type (소문자)
+ARTICLE_LD_TYPES = {'article', 'newsarticle', 'reportagenewsarticle', 'analysisnewsarticle'}
+
+def declares_article(metadata):
+    """og:type이나 JSON-LD @type이 기사이면 True (ParsedDocument.metadata 사용)"""
+    if metadata.get('og:type', '').lower() == 'article':
+        return True
+    for item in metadata.get('json_ld', []):
+        types = item.get('@type')
+        types = types if isinstance(types, list) else [types]
+        if any(str(ld_type).lower() in ARTICLE_LD_TYPES for ld_type in types):
+            return True
+    return False
+
 def get_kst_now():
     """현재 한국 시간(KST) 반환"""
     return datetime.now(KST)
@@ -36,10 +68,11 @@ class AIScraper:
         self.model = None
         if self.api_key:
             try:
-                print("[AI_SCRAPER] Configuring Gemini API...")
-                genai.configure(api_key=self.api_key)
-                print("[AI_SCRAPER] Creating GenerativeModel...")
-                self.model = genai.GenerativeModel('gemini-1.5-flash')
+                # 요약 함수들과 같은 Gemini 모델을 공유 (프로세스당 한 번 생성)
+                print("[AI_SCRAPER] Getting shared Gemini model...")
+                self.model = get_ai_clients().gemini(api_key=self.api_key)
+                if self.model is None:
+                    raise RuntimeError("Gemini client could not be created")
                 print(f"[AI_SCRAPER] Gemini model initialized successfully")
                 print(f"[AI_SCRAPER] Model type: {type(self.model)}")
             except Exception as e:
@@ -54,84 +87,64 @@ class AIScraper:
             print("[AI_SCRAPER] Available env vars:", list(os.environ.keys())[:10], "...")  # 처음 10개만
         
         # Rate limiting for free tier (15 requests per minute)
-        self.last_request_time = 0
-        self.request_delay = 4.2  # 14 requests per minute (조금 더 빠르게)
-        
-        # 요청 카운터와 윈도우 관리 (1분 단위)
-        self.request_timestamps = []
-        self.max_requests_per_minute = 14  # 15개 제한에 가깝게 설정
+        # Gemini 요약과 같은 토큰 버킷을 공유 (같은 API 키의 분당 한도)
+        self.rate_limiter = get_rate_limiter('gemini')
+        self.max_requests_per_minute = self.rate_limiter.rate_per_minute  # 15개 제한에 가깝게 설정
+        self.request_delay = 60.0 / self.max_requests_per_minute
         
         # 배치 처리를 위한 URL 큐
         self.url_queue = []
         self.batch_size = 5  # 한 번에 5개씩 처리 (효율성 향상)
+        self.batch_processor = BatchAIProcessor(self.model, rate_limit=self._rate_limit,
+                                                content_batch_size=self.batch_size)
         
-        # 캐시 시스템 강화
-        self.url_cache = {}  # {url: is_valid}
-        self.content_cache = {}  # {url: classification}
-        self.summary_cache = {}  # {content_hash: summary}
+        # 캐시 시스템 강화 (실행 간 유지되는 영구 캐시)
+        self.url_cache = PersistentCache('url', URL_CACHE_TTL, max_entries=5000, max_bytes=2 * 1024 * 1024)  # {url: is_valid}
+        self.content_cache = PersistentCache('content', CONTENT_CACHE_TTL, max_entries=2000, max_bytes=2 * 1024 * 1024)  # {content_hash: classification}
+        self.summary_cache = PersistentCache('summary', SUMMARY_CACHE_TTL, max_entries=1000, max_bytes=5 * 1024 * 1024)  # {content_hash: summary}
 
     def _rate_limit(self):
-        """Rate limiting to avoid quota errors with sliding window"""
-        current_time = time.time()
-        
-        # 슬라이딩 윈도우: 1분 이전의 요청들을 제거
-        cutoff_time = current_time - 60  # 60초 전
-        self.request_timestamps = [t for t in self.request_timestamps if t > cutoff_time]
-        
-        # 현재 윈도우에 최대 요청 수 초과 시 대기
-        if len(self.request_timestamps) >= self.max_requests_per_minute:
-            oldest_request = min(self.request_timestamps)
-            wait_time = 60 - (current_time - oldest_request) + 1  # 1초 여유
-            if wait_time > 0:
-                print(f"[AI_SCRAPER] Rate limit reached. Waiting {wait_time:.1f} seconds...")
-                time.sleep(wait_time)
-                current_time = time.time()
-        
-        # 기존 지연 로직도 유지 (추가 안전 장치)
-        time_since_last = current_time - self.last_request_time
-        if time_since_last < self.request_delay:
-            sleep_time = self.request_delay - time_since_last
-            print(f"[AI_SCRAPER] Rate limiting: waiting {sleep_time:.1f}s between requests")
-            time.sleep(sleep_time)
-        
-        # 요청 시점 기록
-        self.last_request_time = time.time()
-        self.request_timestamps.append(self.last_request_time)
+        """토큰 버킷으로 요청 속도 제한 (대기는 호출한 스레드에서만 발생)"""
+        wait_time = self.rate_limiter.acquire()
+        if wait_time > 0:
+            print(f"[AI_SCRAPER] Rate limiting: waited {wait_time:.1f}s for a Gemini token")
+    
+    def _generate(self, prompt):
+        """공유 Gemini 모델 호출 (레지스트리 사용량/상태에 기록)"""
+        with get_ai_clients().track('gemini'):
+            return self.model.generate_content(prompt)
     
     def get_usage_stats(self) -> Dict[str, any]:
         """배치 AI 사용량 통계 반환"""
-        current_time = time.time()
-        cutoff_time = current_time - 60
-        recent_requests = [t for t in self.request_timestamps if t > cutoff_time]
+        requests_last_minute = self.rate_limiter.requests_last_minute()
         
         return {
-            'total_requests_sent': len(self.request_timestamps),
-            'requests_last_minute': len(recent_requests),
-            'remaining_quota': max(0, self.max_requests_per_minute - len(recent_requests)),
+            'total_requests_sent': self.rate_limiter.total_acquired,
+            'requests_last_minute': requests_last_minute,
+            'remaining_quota': max(0, self.max_requests_per_minute - requests_last_minute),
+            'rate_limiter': self.rate_limiter.get_stats(),
             'cache_sizes': {
                 'url_cache': len(self.url_cache),
                 'content_cache': len(self.content_cache),
                 'summary_cache': len(self.summary_cache)
             },
+            'cache_stats': {
+                'url_cache': self.url_cache.get_stats(),
+                'content_cache': self.content_cache.get_stats(),
+                'summary_cache': self.summary_cache.get_stats()
+            },
             'api_key_present': bool(self.api_key),
-            'model_available': bool(self.model)
+            'model_available': bool(self.model),
+            'ai_clients': get_ai_clients().get_stats()
         }
     
-    def clear_old_cache(self, max_age_minutes: int = 60):
-        """오래된 캐시 항목 제거"""
-        # 실제 사용에서는 캐시에 타임스탬프를 추가해야 하지만
-        # 지금은 간단하게 전체 삭제
-        if len(self.url_cache) > 1000:
-            self.url_cache.clear()
-            print("[AI_SCRAPER] Cleared URL cache (size limit reached)")
-        
-        if len(self.content_cache) > 500:
-            self.content_cache.clear()
-            print("[AI_SCRAPER] Cleared content cache (size limit reached)")
-            
-        if len(self.summary_cache) > 200:
-            self.summary_cache.clear()
-            print("[AI_SCRAPER] Cleared summary cache (size limit reached)")
+    def clear_old_cache(self):
+        """만료된 캐시 항목 삭제 후 개수/용량 상한에 맞춰 LRU 정리"""
+        for name, cache in (('URL', self.url_cache), ('content', self.content_cache), ('summary', self.summary_cache)):
+            expired = cache.expire()
+            evicted = cache.evict()
+            if expired or evicted:
+                print(f"[AI_SCRAPER] {name} cache: expired {expired}, evicted {evicted} entries")
     
     def _get_content_hash(self, content: str) -> str:
         """콘텐츠의 해시값 생성"""
@@ -143,9 +156,7 @@ class AIScraper:
             return False
         
         # 현재 분당 요청 수 확인
-        current_time = time.time()
-        cutoff_time = current_time - 60
-        recent_requests = [t for t in self.request_timestamps if t > cutoff_time]
+        recent_requests = self.rate_limiter.requests_last_minute()
         
         # 우선순위별 임계값 (더 관대하게 설정)
         thresholds = {
@@ -155,18 +166,19 @@ class AIScraper:
         }
         
         threshold = thresholds.get(priority, 8)
-        can_use_ai = len(recent_requests) < threshold
+        can_use_ai = recent_requests < threshold
         
         if not can_use_ai:
-            print(f"[AI_SCRAPER] Skipping AI for {priority} priority task (quota: {len(recent_requests)}/{self.max_requests_per_minute})")
+            print(f"[AI_SCRAPER] Skipping AI for {priority} priority task (quota: {recent_requests}/{self.max_requests_per_minute})")
         
         return can_use_ai
     
     def is_valid_article_url_ai(self, url: str, page_title: str = "", link_text: str = "") -> bool:
         """AI를 사용해 URL이 유효한 기사 링크인지 판단 (개선된 버전)"""
         # 캐시 확인
-        if url in self.url_cache:
-            return self.url_cache[url]
+        cached = self.url_cache.get(url)
+        if cached is not None:
+            return cached
             
         # 1단계: 먼저 패턴 기반 필터링으로 명백한 비기사 URL 제거
         if not self._fallback_url_validation(url):
@@ -175,7 +187,7 @@ class AIScraper:
             
         # 2단계: 패턴을 통과한 URL만 AI로 검증 (AI 호출 최소화)
         if not self.model:
-            self.url_cache[url] = True
+            self.url_cache.set(url, True, ttl=FALLBACK_CACHE_TTL)
             return True  # 패턴 검증을 통과했으면 기사로 간주
         
         try:
@@ -183,7 +195,7 @@ class AIScraper:
             if not self._should_use_ai('normal'):
                 # AI 요청 수 제한 초과 시 패턴 기반 판단만 사용
                 is_valid = self._is_obvious_article_url(url)
-                self.url_cache[url] = is_valid
+                self.url_cache.set(url, is_valid, ttl=FALLBACK_CACHE_TTL)
                 return is_valid
             
             # URL이 명백히 기사 패턴이면 AI 검증 스킵
@@ -208,7 +220,7 @@ URL: {url}
 답변을 정확히 "YES" 또는 "NO"로만 해주세요.
 """
             
-            response = self.model.generate_content(prompt)
+            response = self._generate(prompt)
             if response and response.text:
                 result = response.text.strip().upper()
                 is_valid = result == "YES"
@@ -226,6 +238,46 @@ URL: {url}
                 print(f"[AI_SCRAPER] Status code: {e.status_code}")
             return self._fallback_url_validation(url)
 
+    def validate_urls_batch_ai(self, urls_with_context: List[Tuple[str, str, str]]) -> Dict[str, bool]:
+        """여러 URL을 배치 요청으로 검증 (답변이 없는 URL은 패턴 기반 판단)"""
+        results = {}
+        pending = []
+        for url, title, text in urls_with_context:
+            cached = self.url_cache.get(url)
+            if cached is not None:
+                results[url] = cached
+            elif not self._fallback_url_validation(url):
+                self.url_cache[url] = False
+                results[url] = False
+            else:
+                pending.append((url, title, text))
+        
+        if pending and not self.model:
+            for url, _, _ in pending:
+                self.url_cache.set(url, True, ttl=FALLBACK_CACHE_TTL)
+                results[url] = True  # 패턴 검증을 통과했으면 기사로 간주
+            return results
+        
+        batch_size = self.batch_processor.url_batch_size
+        for start in range(0, len(pending), batch_size):
+            chunk = pending[start:start + batch_size]
+            answers = {}
+            use_ai = self._should_use_ai('normal')
+            if use_ai:
+                answers = self.batch_processor.validate_urls_batch(chunk)
+                print(f"[AI_SCRAPER] Batch URL validation: {len(answers)}/{len(chunk)} answered in one request")
+            
+            for url, _, _ in chunk:
+                if url in answers:
+                    self.url_cache[url] = answers[url]
+                    results[url] = answers[url]
+                else:
+                    # 할당량 부족이면 명백한 기사 패턴만 인정, 답변 누락/오류면 패턴 검증 결과 사용
+                    is_valid = self._fallback_url_validation(url) if use_ai else self._is_obvious_article_url(url)
+                    self.url_cache.set(url, is_valid, ttl=FALLBACK_CACHE_TTL)
+                    results[url] = is_valid
+        return results
+
     def _fallback_url_validation(self, url: str) -> bool:
         """AI 실패 시 폴백 URL 검증 - 더 관대한 버전"""
         url_lower = url.lower()
@@ -327,33 +379,36 @@ URL: {url}
         
         return any(re.search(pattern, url_lower) for pattern in obvious_patterns)
 
-    def classify_content_ai(self, html_content: str, url: str) -> Dict[str, any]:
+    def classify_content_ai(self, html_content: Union[str, ParsedDocument], url: str) -> Dict[str, any]:
         """AI를 사용해 HTML 콘텐츠를 분류 (캐시 기능 추가)"""
+        doc = ParsedDocument.wrap(html_content, url)
         if not self.model:
-            return self._fallback_content_classification(html_content)
+            return self._fallback_content_classification(doc)
         
-        # 콘텐츠 캐시 확인
-        content_hash = self._get_content_hash(html_content[:1000])  # 처음 1000자로 해시 생성
-        if content_hash in self.content_cache:
-            return self.content_cache[content_hash]
+        # 콘텐츠 캐시 확인 (같은 사이트 페이지는 앞부분이 같으므로 URL과 전체 본문으로 해시 생성)
+        content_hash = self._get_content_hash(url + doc.html)
+        cached = self.content_cache.get(content_hash)
+        if cached is not None:
+            return cached
         
         # AI 사용 여부 결정
         if not self._should_use_ai('high'):  # 콘텐츠 분류는 중요하므로 high priority
             print(f"[AI_SCRAPER] Skipping AI classification due to rate limit, using fallback")
-            fallback_result = self._fallback_content_classification(html_content)
-            self.content_cache[content_hash] = fallback_result
+            fallback_result = self._fallback_content_classification(doc)
+            self.content_cache.set(content_hash, fallback_result, ttl=FALLBACK_CACHE_TTL)
             return fallback_result
         
         try:
             self._rate_limit()  # Apply rate limiting
             # HTML을 텍스트로 변환 (처음 1500자로 축소)
-            soup = BeautifulSoup(html_content, 'html.parser')
-            text_content = soup.get_text()[:1500]  # 요청 사이즈 축소
+            text_content = doc.text()[:1500]  # 요청 사이즈 축소
+            structured = '뉴스 기사 (og:type/JSON-LD)' if declares_article(doc.metadata) else '없음'
             
             prompt = f"""
 다음 웹페이지 콘텐츠를 분석해서 분류해주세요:
 
 URL: {url}
+구조화 데이터: {structured}
 콘텐츠 (처음 2000자): {text_content}
 
 다음 중 어떤 종류의 페이지인지 판단해주세요:
@@ -373,7 +428,7 @@ URL: {url}
 정확히 위의 5개 중 하나만 답해주세요.
 """
             
-            response = self.model.generate_content(prompt)
+            response = self._generate(prompt)
             if response and response.text:
                 classification = response.text.strip().upper()
                 result = {
@@ -386,8 +441,8 @@ URL: {url}
                 return result
             else:
                 print(f"[AI_SCRAPER] WARNING: Empty response from AI for content classification")
-                fallback_result = self._fallback_content_classification(html_content)
-                self.content_cache[content_hash] = fallback_result
+                fallback_result = self._fallback_content_classification(doc)
+                self.content_cache.set(content_hash, fallback_result, ttl=FALLBACK_CACHE_TTL)
                 return fallback_result
                 
         except Exception as e:
@@ -396,14 +451,47 @@ URL: {url}
             print(f"[AI_SCRAPER] Error message: {str(e)}")
             if hasattr(e, 'status_code'):
                 print(f"[AI_SCRAPER] Status code: {e.status_code}")
-            fallback_result = self._fallback_content_classification(html_content)
-            self.content_cache[content_hash] = fallback_result
+            fallback_result = self._fallback_content_classification(doc)
+            self.content_cache.set(content_hash, fallback_result, ttl=FALLBACK_CACHE_TTL)
             return fallback_result
 
-    def _fallback_content_classification(self, html_content: str) -> Dict[str, any]:
+    def classify_contents_batch_ai(self, pages: List[Tuple[str, Union[str, ParsedDocument]]]) -> Dict[str, Dict]:
+        """여러 페이지를 batch_size개씩 묶어 한 번의 요청으로 분류 (답변이 없는 페이지는 폴백 분류)"""
+        results = {}
+        pending = []
+        for url, html_content in pages:
+            doc = ParsedDocument.wrap(html_content, url)
+            content_hash = self._get_content_hash(url + doc.html)
+            cached = self.content_cache.get(content_hash)
+            if cached is not None:
+                results[url] = cached
+            else:
+                pending.append((url, doc, content_hash))
+        
+        batch_size = self.batch_processor.content_batch_size
+        for start in range(0, len(pending), batch_size):
+            chunk = pending[start:start + batch_size]
+            answers = {}
+            if self.model and self._should_use_ai('high'):
+                contents = [(url, doc.text()[:1500]) for url, doc, _ in chunk]
+                answers = self.batch_processor.classify_content_batch(contents)
+                print(f"[AI_SCRAPER] Batch classification: {len(answers)}/{len(chunk)} answered in one request")
+            
+            for url, doc, content_hash in chunk:
+                if url in answers:
+                    self.content_cache[content_hash] = answers[url]
+                    results[url] = answers[url]
+                else:
+                    fallback_result = self._fallback_content_classification(doc)
+                    self.content_cache.set(content_hash, fallback_result, ttl=FALLBACK_CACHE_TTL)
+                    results[url] = fallback_result
+        return results
+
+    def _fallback_content_classification(self, html_content: Union[str, ParsedDocument]) -> Dict[str, any]:
         """AI 실패 시 폴백 콘텐츠 분류 - 개선된 버전"""
-        soup = BeautifulSoup(html_content, 'html.parser')
-        text = soup.get_text().lower()
+        doc = ParsedDocument.wrap(html_content)
+        soup = doc.soup
+        text = doc.text().lower()
         
         # 기사 지표들
         article_indicators = [
@@ -417,8 +505,10 @@ URL: {url}
             'latest news', 'top stories', 'breaking news'
         ]
         
-        # 점수 계산
+        # 점수 계산 (구조화 데이터가 기사라고 밝히면 기사 지표 조건은 충족한 것으로 봄)
         article_score = sum(1 for indicator in article_indicators if indicator in text)
+        if declares_article(doc.metadata):
+            article_score = max(article_score, 3)
         menu_score = sum(1 for indicator in menu_indicators if indicator in text)
         
         # h1, h2 태그 체크 (기사는 보통 명확한 제목이 있음)
@@ -442,27 +532,24 @@ URL: {url}
         else:
             return {'type': 'LANDING_PAGE', 'is_article': False, 'confidence': 'low'}
 
-    def extract_article_ai(self, html_content: str, url: str) -> Dict[str, str]:
+    def extract_article_ai(self, html_content: Union[str, ParsedDocument], url: str) -> Dict[str, str]:
         """AI를 사용해 HTML에서 기사 제목과 본문 추출"""
+        doc = ParsedDocument.wrap(html_content, url)
         if not self.model:
-            return self._fallback_article_extraction(html_content, url)
+            return self._fallback_article_extraction(doc, url)
         
         try:
             self._rate_limit()  # Apply rate limiting
-            # HTML을 정리해서 텍스트로 변환
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # 불필요한 요소 제거
-            for tag in soup(['script', 'style', 'nav', 'footer', 'header', 'aside']):
-                tag.decompose()
-            
+            # HTML을 텍스트로 변환 (불필요한 요소는 공유 트리를 바꾸지 않고 제외)
             # 텍스트 추출 (처음 5000자)
-            text_content = soup.get_text()[:5000]
+            text_content = doc.text(('script', 'style', 'nav', 'footer', 'header', 'aside'))[:5000]
+            meta_title = doc.metadata.get('og:title') or doc.metadata.get('title', '')
             
             prompt = f"""
 다음 웹페이지에서 뉴스 기사의 제목과 본문을 추출해주세요:
 
 URL: {url}
+메타데이터 제목: {meta_title}
 웹페이지 콘텐츠: {text_content}
 
 다음 형식으로 정확히 답해주세요:
@@ -476,13 +563,13 @@ CONTENT: [기사 본문 - 첫 500자 정도]
 4. 한 줄씩 구분해서 작성
 """
             
-            response = self.model.generate_content(prompt)
+            response = self._generate(prompt)
             if response and response.text:
                 result = self._parse_ai_extraction_result(response.text)
                 return result
             else:
                 print(f"[AI_SCRAPER] WARNING: Empty response from AI for article extraction")
-                return self._fallback_article_extraction(html_content, url)
+                return self._fallback_article_extraction(doc, url)
                 
         except Exception as e:
             print(f"[AI_SCRAPER] ERROR in article extraction for {url}")
@@ -490,7 +577,7 @@ CONTENT: [기사 본문 - 첫 500자 정도]
             print(f"[AI_SCRAPER] Error message: {str(e)}")
             if hasattr(e, 'status_code'):
                 print(f"[AI_SCRAPER] Status code: {e.status_code}")
-            return self._fallback_article_extraction(html_content, url)
+            return self._fallback_article_extraction(doc, url)
 
     def _parse_ai_extraction_result(self, ai_response: str) -> Dict[str, str]:
         """AI 응답을 파싱해서 제목과 본문 추출"""
@@ -517,13 +604,17 @@ CONTENT: [기사 본문 - 첫 500자 정도]
             'extracted_by': 'ai'
         }
 
-    def _fallback_article_extraction(self, html_content: str, url: str) -> Dict[str, str]:
+    def _fallback_article_extraction(self, html_content: Union[str, ParsedDocument], url: str) -> Dict[str, str]:
         """AI 실패 시 폴백 기사 추출 - 개선된 버전"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        doc = ParsedDocument.wrap(html_content, url)
+        soup = doc.soup
         
-        # 불필요한 요소 먼저 제거
-        for tag in soup(['script', 'style', 'nav', 'footer', 'header', 'aside', 'noscript']):
-            tag.decompose()
+        # 불필요한 요소는 트리에서 지우지 않고 건너뜀 (발행일 추출 등 이후 단계가 같은 트리 사용)
+        skip_tags = ('script', 'style', 'nav', 'footer', 'header', 'aside', 'noscript')
+        removed = []
+        
+        def first_match(selector):
+            return next((e for e in soup.select(selector) if not is_excluded(e, skip_tags, removed)), None)
         
         # 기본 제목 추출
         title = ""
@@ -532,19 +623,20 @@ CONTENT: [기사 본문 - 첫 500자 정도]
             'h1.title', 'article h1', 'main h1', 'h1'
         ]
         for selector in title_selectors:
-            elem = soup.select_one(selector)
+            elem = first_match(selector)
             if elem:
-                title_text = elem.get_text().strip()
+                title_text = element_text(elem, skip_tags).strip()
                 # 메뉴나 사이트명이 아닌 실제 제목인지 확인
                 if len(title_text) > 10 and not any(exclude in title_text.lower() for exclude in ['menu', 'search', 'sign in']):
                     title = title_text
                     break
         
-        # 제목이 없으면 title 태그에서 추출
+        # 제목이 없으면 og:title, 그다음 title 태그에서 추출
+        if not title:
+            title = doc.metadata.get('og:title', '')
         if not title:
-            title_elem = soup.find('title')
-            if title_elem:
-                title_text = title_elem.get_text().strip()
+            title_text = doc.metadata.get('title', '')
+            if title_text:
                 # 사이트명 제거
                 if ' - ' in title_text:
                     title = title_text.split(' - ')[0].strip()
@@ -561,16 +653,17 @@ CONTENT: [기사 본문 - 첫 500자 정도]
         ]
         
         for selector in content_selectors:
-            elem = soup.select_one(selector)
+            elem = first_match(selector)
             if elem:
-                # 내부의 불필요한 요소 제거
-                for unwanted in elem.select('.social-share, .related-articles, .advertisement'):
-                    unwanted.decompose()
+                # 내부의 불필요한 요소 제외
+                removed.extend(elem.select('.social-share, .related-articles, .advertisement'))
                 
                 # 단락 추출
                 paragraphs = []
                 for p in elem.find_all(['p', 'div']):
-                    p_text = p.get_text().strip()
+                    if is_excluded(p, skip_tags, removed, root=elem):
+                        continue
+                    p_text = element_text(p, skip_tags, removed).strip()
                     # 의미있는 단락인지 확인
                     if len(p_text) > 30 and not any(exclude in p_text.lower() for exclude in ['sign in', 'menu', 'search']):
                         paragraphs.append(p_text)
@@ -583,7 +676,9 @@ CONTENT: [기사 본문 - 첫 500자 정도]
         if not content:
             all_paragraphs = []
             for p in soup.find_all('p'):
-                p_text = p.get_text().strip()
+                if is_excluded(p, skip_tags, removed):
+                    continue
+                p_text = element_text(p, skip_tags, removed).strip()
                 if len(p_text) > 50:
                     all_paragraphs.append(p_text)
             
@@ -596,13 +691,14 @@ CONTENT: [기사 본문 - 첫 500자 정도]
             'extracted_by': 'fallback'
         }
 
-    def get_article_links_ai(self, html_content: str, base_url: str) -> List[str]:
+    def get_article_links_ai(self, html_content: Union[str, ParsedDocument], base_url: str) -> List[str]:
         """AI를 사용해 페이지에서 기사 링크들 추출"""
+        doc = ParsedDocument.wrap(html_content, base_url)
         if not self.model:
-            return self._fallback_link_extraction(html_content, base_url)
+            return self._fallback_link_extraction(doc, base_url)
         
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = doc.soup
             
             # 모든 링크 추출
             all_links = []
@@ -622,24 +718,27 @@ CONTENT: [기사 본문 - 첫 500자 정도]
                 if self._fallback_url_validation(link['url']):
                     pre_filtered.append(link)
             
-            # AI로 추가 검증 (처음 20개만)
-            valid_links = []
-            for link in pre_filtered[:20]:
-                if self._is_obvious_article_url(link['url']):
-                    valid_links.append(link['url'])
-                elif self.is_valid_article_url_ai(link['url'], link_text=link['text']):
-                    valid_links.append(link['url'])
+            # AI로 추가 검증 (처음 20개만, 명백한 기사 URL 외에는 한 번의 배치 요청으로 판단)
+            candidates = pre_filtered[:20]
+            verdicts = self.validate_urls_batch_ai([
+                (link['url'], '', link['text']) for link in candidates
+                if not self._is_obvious_article_url(link['url'])
+            ])
+            valid_links = [
+                link['url'] for link in candidates
+                if self._is_obvious_article_url(link['url']) or verdicts.get(link['url'])
+            ]
             
             return valid_links[:10]  # 최대 10개 반환
             
         except Exception as e:
             print(f"AI link extraction error: {e}")
-            return self._fallback_link_extraction(html_content, base_url)
+            return self._fallback_link_extraction(doc, base_url)
 
-    def _fallback_link_extraction(self, html_content: str, base_url: str) -> List[str]:
+    def _fallback_link_extraction(self, html_content: Union[str, ParsedDocument], base_url: str) -> List[str]:
         """AI 실패 시 폴백 링크 추출 - 개선된 버전"""
         print(f"[FALLBACK] Extracting links from {base_url}")
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = ParsedDocument.wrap(html_content, base_url).soup
         links = []
         seen_urls = set()
         
@@ -743,30 +842,34 @@ CONTENT: [기사 본문 - 첫 500자 정도]
         print(f"[FALLBACK] Total links found: {len(links)}")
         return links[:10]  # 최대 10개
 
-    def scrape_with_ai(self, url: str) -> Dict[str, any]:
-        """AI를 사용해 전체 스크랩 프로세스 수행"""
-        print(f"\n[AI_SCRAPER] Starting scrape for: {url}")
-        print(f"[AI_SCRAPER] AI Model Available: {self.model is not None}")
-        
-        try:
-            # 페이지 가져오기
-            print(f"[AI_SCRAPER] Fetching page...")
-            response = requests.get(url, timeout=10, headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            })
-            response.raise_for_status()
-            
-            html_content = response.content.decode('utf-8', errors='ignore')
-            print(f"[AI_SCRAPER] Page fetched, content length: {len(html_content)}")
-            
-            # 1. 콘텐츠 분류
-            print(f"[AI_SCRAPER] Classifying content...")
-            classification = self.classify_content_ai(html_content, url)
-            print(f"[AI_SCRAPER] Classification: {classification}")
-            
-            # 2. 기사가 아니면 링크 추출
-            if not classification['is_article']:
-                print(f"[AI_SCRAPER] Not an article, extracting links...")
+    def _fetch_page(self, url: str):
+        """페이지를 가져와 (response, ParsedDocument) 반환 (파싱은 처음 필요할 때 한 번만)"""
+        with get_profiler().timer('fetch', site=urlparse(url).netloc):
+            response = get_http_cache().get(url, timeout=10, headers=PAGE_HEADERS, limits=get_page_limits(url))
+        response.raise_for_status()
+        return response, ParsedDocument(response.content.decode('utf-8', errors='ignore'), url)
+
+    def _reuse_cached_result(self, response, doc: ParsedDocument) -> Optional[Dict[str, any]]:
+        """304로 재사용된 페이지면 이전 분류/추출 결과 반환 (AI 호출 및 재파싱 생략)"""
+        cached_result = get_http_cache().get_derived(response, 'ai_scrape')
+        if not cached_result:
+            return None
+        get_profiler().incr('ai_result_reused', site=urlparse(doc.url).netloc)
+        result = dict(cached_result)
+        if result['type'] == 'article':
+            result['html'] = doc.html
+            result['document'] = doc
+        return result
+
+    def _build_scrape_result(self, url: str, html_content: Union[str, ParsedDocument], classification: Dict[str, any]) -> Dict[str, any]:
+        """분류 결과에 따라 링크 추출 또는 기사 추출"""
+        html_content = ParsedDocument.wrap(html_content, url)
+        profiler = get_profiler()
+        site = urlparse(url).netloc
+        # 2. 기사가 아니면 링크 추출
+        if not classification['is_article']:
+            print(f"[AI_SCRAPER] Not an article, extracting links...")
+            with profiler.timer('link_extraction', site=site):
                 links = self.get_article_links_ai(html_content, url)
                 print(f"[AI_SCRAPER] Found {len(links)} links")
                 
@@ -774,16 +877,19 @@ CONTENT: [기사 본문 - 첫 500자 정도]
                 if not links:
                     print(f"[AI_SCRAPER] No links found with AI, trying fallback...")
                     links = self._fallback_link_extraction(html_content, url)
-                
-                return {
-                    'type': 'link_page',
-                    'classification': classification,
-                    'links': links,
-                    'url': url
-                }
             
-            # 3. 기사면 제목과 본문 추출
-            print(f"[AI_SCRAPER] Article detected, extracting content...")
+            result = {
+                'type': 'link_page',
+                'classification': classification,
+                'links': links,
+                'url': url
+            }
+            get_http_cache().set_derived(url, 'ai_scrape', result)
+            return result
+        
+        # 3. 기사면 제목과 본문 추출
+        print(f"[AI_SCRAPER] Article detected, extracting content...")
+        with profiler.timer('ai_extract', site=site):
             article_data = self.extract_article_ai(html_content, url)
             print(f"[AI_SCRAPER] Extraction complete: Title length={len(article_data.get('title', ''))}, Content length={len(article_data.get('content', ''))}")
             
@@ -791,33 +897,117 @@ CONTENT: [기사 본문 - 첫 500자 정도]
             if not article_data.get('title') or not article_data.get('content'):
                 print(f"[AI_SCRAPER] Missing title or content, trying fallback extraction...")
                 article_data = self._fallback_article_extraction(html_content, url)
-            
-            return {
-                'type': 'article',
-                'classification': classification,
-                'title': article_data['title'],
-                'content': article_data['content'],
-                'url': url,
-                'extracted_by': article_data['extracted_by'],
-                'html': html_content  # HTML 콘텐츠 추가
-            }
-            
-        except requests.RequestException as e:
-            print(f"[AI_SCRAPER] Request error for {url}: {e}")
+        profiler.incr(f"extracted_by_{article_data['extracted_by']}", site=site)
+        
+        result = {
+            'type': 'article',
+            'classification': classification,
+            'title': article_data['title'],
+            'content': article_data['content'],
+            'url': url,
+            'extracted_by': article_data['extracted_by']
+        }
+        # AI 할당량 부족으로 fallback 추출된 결과는 다음 실행에서 다시 시도하도록 저장하지 않음
+        if article_data['extracted_by'] == 'ai':
+            get_http_cache().set_derived(url, 'ai_scrape', result)
+        doc = ParsedDocument.wrap(html_content, url)
+        result['html'] = doc.html  # HTML 콘텐츠 추가
+        result['document'] = doc  # 발행일 추출 등에서 같은 트리를 재사용
+        return result
+
+    def _error_result(self, url: str, error: Exception) -> Dict[str, any]:
+        if isinstance(error, requests.RequestException):
+            print(f"[AI_SCRAPER] Request error for {url}: {error}")
             return {
                 'type': 'error',
-                'error': f"Request failed: {str(e)}",
+                'error': f"Request failed: {str(error)}",
                 'url': url
             }
+        print(f"[AI_SCRAPER] Unexpected error for {url}: {error}")
+        import traceback
+        traceback.print_exc()
+        return {
+            'type': 'error',
+            'error': str(error),
+            'url': url
+        }
+
+    def scrape_with_ai(self, url: str) -> Dict[str, any]:
+        """AI를 사용해 전체 스크랩 프로세스 수행"""
+        print(f"\n[AI_SCRAPER] Starting scrape for: {url}")
+        print(f"[AI_SCRAPER] AI Model Available: {self.model is not None}")
+        
+        try:
+            # 페이지 가져오기
+            print(f"[AI_SCRAPER] Fetching page...")
+            response, doc = self._fetch_page(url)
+            print(f"[AI_SCRAPER] Page fetched, content length: {len(doc)}")
+            
+            cached_result = self._reuse_cached_result(response, doc)
+            if cached_result:
+                print(f"[AI_SCRAPER] Page not modified, reusing previous result")
+                return cached_result
+            
+            # 1. 콘텐츠 분류
+            print(f"[AI_SCRAPER] Classifying content...")
+            with get_profiler().timer('ai_classify', site=urlparse(url).netloc):
+                classification = self.classify_content_ai(doc, url)
+            print(f"[AI_SCRAPER] Classification: {classification}")
+            
+            return self._build_scrape_result(url, doc, classification)
+            
         except Exception as e:
-            print(f"[AI_SCRAPER] Unexpected error for {url}: {e}")
-            import traceback
-            traceback.print_exc()
-            return {
-                'type': 'error',
-                'error': str(e),
-                'url': url
-            }
+            return self._error_result(url, e)
+
+    def scrape_many_with_ai(self, urls: List[str], fetcher=None, engine=None) -> List[Dict[str, any]]:
+        """여러 URL을 한꺼번에 스크랩 (분류는 batch_size개씩 한 번의 요청으로 처리)
+        
+        결과는 입력 순서대로 반환하며 각 항목은 scrape_with_ai와 같은 형식
+        fetcher(ConcurrentFetcher)를 주면 페이지를 동시에 가져옴
+        engine(AsyncFetchEngine)을 주면 모든 페이지를 한 이벤트 루프에서 미리 받아 둠
+        """
+        print(f"\n[AI_SCRAPER] Starting batch scrape for {len(urls)} URLs")
+        
+        if engine is not None and urls:
+            with get_profiler().timer('prefetch'):
+                engine.prefetch([FetchJob(url, PAGE_HEADERS, limits=get_page_limits(url)) for url in urls])
+        
+        def fetch(url):
+            try:
+                return self._fetch_page(url)
+            except Exception as e:
+                return e
+        
+        if fetcher is not None:
+            fetched = fetcher.map_ordered(fetch, urls, lambda url: url)
+        else:
+            fetched = [fetch(url) for url in urls]
+        
+        results = [None] * len(urls)
+        pending = []
+        for i, (url, page) in enumerate(zip(urls, fetched)):
+            if page is None or isinstance(page, Exception):
+                results[i] = self._error_result(url, page or RuntimeError('fetch failed'))
+                continue
+            response, doc = page
+            cached_result = self._reuse_cached_result(response, doc)
+            if cached_result:
+                results[i] = cached_result
+            else:
+                pending.append((i, url, doc))
+        
+        # 1. 콘텐츠 분류 (캐시에 없는 페이지만 묶어서 요청)
+        with get_profiler().timer('ai_classify'):
+            classifications = self.classify_contents_batch_ai([(url, doc) for _, url, doc in pending])
+        
+        for i, url, doc in pending:
+            try:
+                results[i] = self._build_scrape_result(url, doc, classifications[url])
+            except Exception as e:
+                results[i] = self._error_result(url, e)
+        
+        print(f"[AI_SCRAPER] Batch scrape complete: {len(pending)} classified, {len(urls) - len(pending)} reused or failed")
+        return results
 
 # 전역 인스턴스 - 지연 초기화를 위해 None으로 설정
 ai_scraper = None
@@ -1,12 +1,10 @@
 import os
 import time
+from rate_limiter import get_rate_limiter
+# Gemini 모델은 레지스트리에서 프로세스당 한 번만 생성해 공유
+from ai_clients import get_ai_clients, GEMINI_AVAILABLE
 
-# Gemini API
-try:
-    import google.generativeai as genai
-    GEMINI_AVAILABLE = True
-except ImportError:
-    GEMINI_AVAILABLE = False
+if not GEMINI_AVAILABLE:
     print("[AI_SUMMARY] Gemini library not available")
 
 def translate_to_korean_summary_gemini(title, content):
@@ -28,8 +26,9 @@ def translate_to_korean_summary_gemini(title, content):
         
         print(f"[AI_SUMMARY] Attempting Gemini API summary for: {title[:50]}...")
         
-        genai.configure(api_key=api_key)
-        model = genai.GenerativeModel('gemini-1.5-flash')
+        model = get_ai_clients().gemini(api_key=api_key)
+        if model is None:
+            return None
         
         # 프롬프트 최적화
         content_preview = content[:1000] if len(content) > 1000 else content
@@ -48,7 +47,13 @@ def translate_to_korean_summary_gemini(title, content):
 
 한국어 요약:"""
         
-        response = model.generate_content(prompt)
+        # AIScraper와 같은 Gemini 토큰 버킷 공유 (같은 API 키의 분당 한도)
+        wait_time = get_rate_limiter('gemini').acquire()
+        if wait_time > 0:
+            print(f"[AI_SUMMARY] Gemini rate limit: waited {wait_time:.1f}s")
+        
+        with get_ai_clients().track('gemini'):
+            response = model.generate_content(prompt)
         
         if response.text:
             print(f"[AI_SUMMARY] Gemini summary successful")
@@ -1,20 +1,14 @@
 import os
+import re
+import json
 import time
+from rate_limiter import get_rate_limiter
+# Cohere/Gemini 클라이언트는 레지스트리에서 프로세스당 한 번만 생성해 공유
+from ai_clients import get_ai_clients, COHERE_AVAILABLE, GEMINI_AVAILABLE
 
-# Cohere API
-try:
-    import cohere
-    COHERE_AVAILABLE = True
-except ImportError:
-    COHERE_AVAILABLE = False
+if not COHERE_AVAILABLE:
     print("[AI_SUMMARY] Cohere library not available")
-
-# Gemini API
-try:
-    import google.generativeai as genai
-    GEMINI_AVAILABLE = True
-except ImportError:
-    GEMINI_AVAILABLE = False
+if not GEMINI_AVAILABLE:
     print("[AI_SUMMARY] Gemini library not available")
 
 def translate_to_korean_summary_cohere(title, content):
@@ -30,8 +24,9 @@ def translate_to_korean_summary_cohere(title, content):
             print("[AI_SUMMARY] COHERE_API_KEY not found in environment")
             return None
         
-        print("[AI_SUMMARY] Cohere API key found, initializing client...")
-        co = cohere.Client(api_key)
+        co = get_ai_clients().cohere(api_key)
+        if co is None:
+            return None
         
         # 콘텐츠 길이 제한 (토큰 절약)
         content_preview = content[:600] if len(content) > 600 else content
@@ -69,15 +64,21 @@ def translate_to_korean_summary_cohere(title, content):
 
 한국어 요약:"""
         
+        # 분당 한도를 넘지 않도록 토큰 대기 (이 스레드만 대기)
+        wait_time = get_rate_limiter('cohere').acquire()
+        if wait_time > 0:
+            print(f"[AI_SUMMARY] Cohere rate limit: waited {wait_time:.1f}s")
+        
         print("[AI_SUMMARY] Calling Cohere API...")
         start_time = time.time()
         
-        response = co.chat(
-            model="command-r",
-            message=prompt,
-            max_tokens=300,
-            temperature=0.7
-        )
+        with get_ai_clients().track('cohere'):
+            response = co.chat(
+                model="command-r",
+                message=prompt,
+                max_tokens=300,
+                temperature=0.7
+            )
         
         api_time = time.time() - start_time
         print(f"[AI_SUMMARY] Cohere API response time: {api_time:.2f}s")
@@ -107,8 +108,9 @@ def translate_to_korean_summary_gemini(title, content):
             print("[AI_SUMMARY] GOOGLE_GEMINI_API_KEY not found in environment")
             return None
         
-        print("[AI_SUMMARY] Configuring Gemini API...")
-        genai.configure(api_key=api_key)
+        model = get_ai_clients().gemini(api_key=api_key)
+        if model is None:
+            return None
         
         # 콘텐츠 길이 제한
         content_preview = content[:600] if len(content) > 600 else content
@@ -146,17 +148,22 @@ def translate_to_korean_summary_gemini(title, content):
 
 한국어 요약:"""
         
+        # AIScraper와 같은 Gemini 토큰 버킷 공유 (같은 API 키의 분당 한도)
+        wait_time = get_rate_limiter('gemini').acquire()
+        if wait_time > 0:
+            print(f"[AI_SUMMARY] Gemini rate limit: waited {wait_time:.1f}s")
+        
         print("[AI_SUMMARY] Calling Gemini API...")
         start_time = time.time()
         
-        model = genai.GenerativeModel('gemini-1.5-flash')
-        response = model.generate_content(
-            prompt,
-            generation_config={
-                'temperature': 0.7,
-                'max_output_tokens': 300,
-            }
-        )
+        with get_ai_clients().track('gemini'):
+            response = model.generate_content(
+                prompt,
+                generation_config={
+                    'temperature': 0.7,
+                    'max_output_tokens': 300,
+                }
+            )
         
         api_time = time.time() - start_time
         print(f"[AI_SUMMARY] Gemini API response time: {api_time:.2f}s")
@@ -173,6 +180,125 @@ def translate_to_korean_summary_gemini(title, content):
         print(f"[AI_SUMMARY] Gemini ERROR: {type(e).__name__}: {str(e)}")
         return None
 
+# 배치 요약: 여러 기사를 번호(id)를 붙여 한 프롬프트로 보내고 JSON 배열로 받음
+BATCH_CONTENT_PREVIEW = 600      # 기사당 본문 미리보기 길이 (단건 요약과 동일)
+BATCH_OUTPUT_TOKENS = 250        # 기사당 출력 토큰 예산
+HANGUL_PATTERN = re.compile(r'[가-힣]')
+JSON_ARRAY_PATTERN = re.compile(r'\[.*\]', re.DOTALL)
+
+
+def build_batch_prompt(items):
+    """[(id, 제목, 본문)] → JSON 배열 응답을 요청하는 배치 요약 프롬프트"""
+    blocks = []
+    for item_id, title, content in items:
+        preview = ' '.join((content or '').split())[:BATCH_CONTENT_PREVIEW]
+        blocks.append(f"[{item_id}]\n제목: {title}\n내용: {preview}")
+    articles = '\n\n'.join(blocks)
+    return f"""다음 싱가포르 뉴스 {len(items)}건을 각각 한국어로 정확하고 간결하게 요약해주세요.
+기사는 영어 또는 중국어일 수 있으며, 모두 한국어로 번역해 요약합니다.
+
+{articles}
+
+요구사항:
+1. 각 기사 제목을 한국어로 정확히 번역 (title_ko)
+2. 각 기사의 핵심 내용을 한국어 2-3문장으로 요약 (summary_ko)
+3. 중요한 수치, 날짜, 인물명은 정확히 포함
+4. 기사 번호를 id(정수)로 그대로 사용하고 기사를 합치거나 빠뜨리지 말 것
+5. 다른 설명 없이 JSON 배열만 응답:
+[{{"id": 1, "title_ko": "...", "summary_ko": "..."}}]
+"""
+
+
+def parse_batch_summaries(text, ids):
+    """배치 응답에서 검증을 통과한 항목만 {id: 요약} 으로 반환
+
+    id가 요청한 번호가 아니거나, 중복이거나, 제목/요약이 비었거나 한글이 없는 항목은 제외
+    (제외된 기사는 호출한 쪽에서 다시 요청)
+    """
+    match = JSON_ARRAY_PATTERN.search(text or '')
+    if not match:
+        return {}
+    try:
+        items = json.loads(match.group(0))
+    except ValueError:
+        return {}
+    if not isinstance(items, list):
+        return {}
+
+    wanted = set(ids)
+    summaries = {}
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        try:
+            item_id = int(item.get('id'))
+        except (TypeError, ValueError):
+            continue
+        title_ko = item.get('title_ko')
+        summary_ko = item.get('summary_ko')
+        if item_id not in wanted or item_id in summaries:
+            continue
+        if not isinstance(title_ko, str) or not isinstance(summary_ko, str):
+            continue
+        if not title_ko.strip() or not HANGUL_PATTERN.search(summary_ko):
+            continue
+        summaries[item_id] = f"📰 제목: {title_ko.strip()}\n내용: {summary_ko.strip()}"
+    return summaries
+
+
+def summarize_batch_cohere(items):
+    """Cohere 한 번의 요청으로 여러 기사 요약, {id: 요약} 반환 (실패하면 빈 dict)"""
+    co = get_ai_clients().cohere()
+    if co is None:
+        return {}
+    try:
+        wait_time = get_rate_limiter('cohere').acquire()
+        if wait_time > 0:
+            print(f"[AI_SUMMARY] Cohere rate limit: waited {wait_time:.1f}s")
+
+        start_time = time.time()
+        with get_ai_clients().track('cohere'):
+            response = co.chat(
+                model="command-r",
+                message=build_batch_prompt(items),
+                max_tokens=BATCH_OUTPUT_TOKENS * len(items),
+                temperature=0.3
+            )
+        summaries = parse_batch_summaries(response.text if response else '', [item[0] for item in items])
+        print(f"[AI_SUMMARY] Cohere batch: {len(summaries)}/{len(items)} valid in {time.time() - start_time:.2f}s")
+        return summaries
+    except Exception as e:
+        print(f"[AI_SUMMARY] Cohere batch ERROR: {type(e).__name__}: {str(e)}")
+        return {}
+
+
+def summarize_batch_gemini(items):
+    """Gemini 한 번의 요청으로 여러 기사 요약, {id: 요약} 반환 (실패하면 빈 dict)"""
+    model = get_ai_clients().gemini()
+    if model is None:
+        return {}
+    try:
+        wait_time = get_rate_limiter('gemini').acquire()
+        if wait_time > 0:
+            print(f"[AI_SUMMARY] Gemini rate limit: waited {wait_time:.1f}s")
+
+        start_time = time.time()
+        with get_ai_clients().track('gemini'):
+            response = model.generate_content(
+                build_batch_prompt(items),
+                generation_config={
+                    'temperature': 0.3,
+                    'max_output_tokens': BATCH_OUTPUT_TOKENS * len(items),
+                    'response_mime_type': 'application/json',
+                }
+            )
+        summaries = parse_batch_summaries(response.text if response else '', [item[0] for item in items])
+        print(f"[AI_SUMMARY] Gemini batch: {len(summaries)}/{len(items)} valid in {time.time() - start_time:.2f}s")
+        return summaries
+    except Exception as e:
+        print(f"[AI_SUMMARY] Gemini batch ERROR: {type(e).__name__}: {str(e)}")
+        return {}
+
 def translate_to_korean_summary_fallback(title, content):
     """간단한 키워드 기반 폴백 요약"""
     keyword_mapping = {
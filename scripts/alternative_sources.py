@@ -3,28 +3,31 @@
 Google Cache, Archive.org, 모바일 URL 등 활용
 """
 
-import requests
 from bs4 import BeautifulSoup
 import time
 import random
 from urllib.parse import quote
 from datetime import datetime, timedelta
 import pytz
+from http_session import get_http_pool
+from fallback_racer import get_fallback_racer, is_usable_page
+from concurrent_fetcher import get_domain_key
 
 KST = pytz.timezone('Asia/Seoul')
 
 class AlternativeSources:
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
+        # 호스트별 keep-alive 세션은 공유 풀에서 관리
+        self.http = get_http_pool()
+        self.headers = {
             'User-Agent': 'Mozilla/5.0 (Linux; Android 10; SM-G973F) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Mobile Safari/537.36'
-        })
+        }
     
     def get_from_google_cache(self, url):
         """Google 캐시에서 페이지 가져오기"""
         cache_url = f"https://webcache.googleusercontent.com/search?q=cache:{quote(url)}"
         try:
-            response = self.session.get(cache_url, timeout=10)
+            response = self.http.get(cache_url, headers=self.headers, timeout=10)
             if response.status_code == 200:
                 return response.text
         except:
@@ -36,12 +39,12 @@ class AlternativeSources:
         # 최근 스냅샷 확인
         check_url = f"https://archive.org/wayback/available?url={quote(url)}"
         try:
-            response = requests.get(check_url, timeout=10)
+            response = self.http.get(check_url, timeout=10)
             data = response.json()
             
             if data.get('archived_snapshots', {}).get('closest', {}).get('available'):
                 snapshot_url = data['archived_snapshots']['closest']['url']
-                snapshot_response = requests.get(snapshot_url, timeout=15)
+                snapshot_response = self.http.get(snapshot_url, timeout=15)
                 if snapshot_response.status_code == 200:
                     return snapshot_response.text
         except:
@@ -60,7 +63,7 @@ class AlternativeSources:
         for variant_func in mobile_variants:
             try:
                 mobile_url = variant_func(url)
-                response = self.session.get(mobile_url, timeout=10)
+                response = self.http.get(mobile_url, headers=self.headers, timeout=10)
                 if response.status_code == 200:
                     return response.text
             except:
@@ -82,7 +85,7 @@ class AlternativeSources:
                     'Referer': 'https://www.google.com/',
                     'Origin': proxy_url.split('/')[2]
                 }
-                response = requests.get(proxy_url, headers=headers, timeout=15)
+                response = self.http.get(proxy_url, headers=headers, timeout=15)
                 if response.status_code == 200:
                     return response.text
             except:
@@ -109,7 +112,7 @@ class AlternativeSources:
         reddit_url = "https://www.reddit.com/r/singapore/search.json?q=site%3A" + site_name.lower().replace(' ', '') + "&sort=new&limit=10"
         
         try:
-            response = requests.get(reddit_url, headers={'User-Agent': 'Mozilla/5.0'})
+            response = self.http.get(reddit_url, headers={'User-Agent': 'Mozilla/5.0'})
             if response.status_code == 200:
                 data = response.json()
                 for post in data.get('data', {}).get('children', []):
@@ -125,20 +128,22 @@ class AlternativeSources:
             
         return articles
     
-    def get_alternative_content(self, url, site_name):
-        """다양한 대체 방법으로 콘텐츠 시도"""
-        methods = [
-            ('mobile', self.get_mobile_version),
-            ('google_cache', self.get_from_google_cache),
-            ('archive_org', self.get_from_archive_org),
-            ('proxy', self.get_via_proxy_services)
+    def candidates(self, url):
+        """대체 방법 목록 [(이름, 인자 없는 함수)] (fallback_racer에서 경쟁 실행)"""
+        return [
+            ('mobile', lambda: self.get_mobile_version(url)),
+            ('google_cache', lambda: self.get_from_google_cache(url)),
+            ('archive_org', lambda: self.get_from_archive_org(url)),
+            ('proxy', lambda: self.get_via_proxy_services(url))
         ]
-        
-        for method_name, method_func in methods:
-            print(f"[AlternativeSources] Trying {method_name} for {site_name}")
-            content = method_func(url)
-            if content:
-                print(f"[AlternativeSources] Success with {method_name}")
-                return content, method_name
-                
-        return None, None
\ No newline at end of file
+    
+    def get_alternative_content(self, url, site_name):
+        """다양한 대체 방법으로 콘텐츠 시도 (시차를 두고 동시에 실행해 먼저 성공한 결과 사용)
+
+        우승 기록은 scraper와 같은 도메인 키로 남겨 어느 경로에서 이긴 방법이든 다음 경쟁에서 먼저 시작
+        """
+        content, method_name = get_fallback_racer().race(get_domain_key(url), self.candidates(url),
+                                                         validate=is_usable_page)
+        if content:
+            print(f"[AlternativeSources] Success with {method_name}")
+        return content, method_name
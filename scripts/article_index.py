@@ -0,0 +1,199 @@
+"""
+기사 처리 이력 인덱스
+이전 실행에서 처리한 기사 URL을 추가 전용(JSONL) 로그로 보관해
+링크 단계에서 재수집을 건너뛰고, 본문이 같으면 이전 요약을 재사용
+다른 매체가 같은 기사를 실은 경우(제목+리드 SimHash가 거의 같으면)에도 요약을 재사용
+"""
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
+
+import pytz
+
+from deduplication import ArticleDeduplicator, hamming_distance
+
+KST = pytz.timezone('Asia/Seoul')
+
+DEFAULT_INDEX_FILE = 'data/cache/article_index.jsonl'
+DEFAULT_RETENTION_DAYS = 14
+
+# URL 정규화 시 제거할 추적용 쿼리 파라미터 (키 전체 일치, utm_ 계열만 접두사 일치)
+TRACKING_PARAMS = {'fbclid', 'gclid', 'cmpid', 'xtor', 'ref', 'ref_src'}
+TRACKING_PREFIXES = ('utm_',)
+
+# API 호출로 만든 요약만 재사용 (키워드 요약은 다시 만들어도 비용이 없음)
+REUSABLE_SUMMARY_SOURCES = {'cohere', 'gemini', 'fallback'}
+
+# 근사 중복으로 보는 SimHash 해밍 거리 상한 (64비트 중)
+DEFAULT_SIMILAR_DISTANCE = 3
+
+
+def canonical_url(url):
+    """비교용 정규 URL (프래그먼트, 추적 파라미터, 끝 슬래시 제거)"""
+    parsed = urlparse(url.strip())
+    query = [
+        (key, value) for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    ]
+    path = parsed.path.rstrip('/') or '/'
+    return urlunparse((parsed.scheme.lower(), parsed.netloc.lower(), path, '', urlencode(query), ''))
+
+
+class ArticleIndex:
+    """정규 URL → 본문 해시, 제목, 요약, 최초 수집 시각, 처리 상태"""
+
+    def __init__(self, path=DEFAULT_INDEX_FILE, retention_days=DEFAULT_RETENTION_DAYS):
+        self.path = path
+        self.retention_days = retention_days
+        self._entries = None
+        self._lock = threading.Lock()
+        self._deduplicator = ArticleDeduplicator()
+        self.stats = {'skipped': 0, 'summaries_reused': 0, 'similar_reused': 0, 'recorded': 0}
+
+    def _ensure_loaded(self):
+        """인덱스 파일 로드 (같은 URL은 마지막 줄이 우선), 필요하면 압축"""
+        if self._entries is not None:
+            return
+        self._entries = {}
+        line_count = 0
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    line_count += 1
+                    self._entries[entry['url']] = entry
+        except OSError:
+            return
+
+        cutoff = datetime.now(KST) - timedelta(days=self.retention_days)
+        expired = [url for url, entry in self._entries.items() if self._parse_time(entry.get('last_seen')) < cutoff]
+        for url in expired:
+            del self._entries[url]
+
+        if expired or line_count > len(self._entries) * 2:
+            self._compact()
+
+    @staticmethod
+    def _parse_time(value):
+        try:
+            return datetime.fromisoformat(value)
+        except (TypeError, ValueError):
+            return datetime.min.replace(tzinfo=KST)
+
+    def _compact(self):
+        """최신 항목만 남기도록 파일 재작성"""
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp_path = f'{self.path}.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                for entry in self._entries.values():
+                    f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            os.replace(tmp_path, self.path)
+            print(f"[ARTICLE_INDEX] Compacted index to {len(self._entries)} entries")
+        except OSError as e:
+            print(f"[ARTICLE_INDEX] Compaction failed: {e}")
+
+    def _append(self, entry):
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        except OSError as e:
+            print(f"[ARTICLE_INDEX] Failed to append entry: {e}")
+
+    def content_hash(self, title, content):
+        """기존 중복 제거와 같은 기준의 본문 해시"""
+        return self._deduplicator.calculate_content_hash(title or '', content or '')
+
+    def fingerprint(self, title, content):
+        """근사 중복 판정용 제목+리드 SimHash (16자리 hex 문자열로 저장)"""
+        return f"{self._deduplicator.calculate_simhash(title or '', content or ''):016x}"
+
+    def find_similar_summary(self, fingerprint, max_distance=DEFAULT_SIMILAR_DISTANCE, exclude_url=None):
+        """이번 실행이나 최근 실행에서 요약한 기사 중 지문이 가장 가까운 기사의 요약
+
+        (요약, 원본 URL, 거리) 반환, max_distance 안에 없으면 None
+        """
+        target = int(fingerprint, 16)
+        exclude = canonical_url(exclude_url) if exclude_url else None
+        best = None
+        with self._lock:
+            self._ensure_loaded()
+            for url, entry in self._entries.items():
+                if url == exclude or not entry.get('simhash') or not entry.get('summary'):
+                    continue
+                if entry.get('extracted_by') not in REUSABLE_SUMMARY_SOURCES:
+                    continue
+                distance = hamming_distance(target, int(entry['simhash'], 16))
+                if distance <= max_distance and (best is None or distance < best[2]):
+                    best = ({'text': entry['summary'], 'extracted_by': entry['extracted_by']}, url, distance)
+            if best:
+                self.stats['similar_reused'] += 1
+        return best
+
+    def get(self, url):
+        with self._lock:
+            self._ensure_loaded()
+            entry = self._entries.get(canonical_url(url))
+            return dict(entry) if entry else None
+
+    def filter_new(self, urls):
+        """이전 실행에서 이미 처리(수집 또는 제외)된 URL 제거"""
+        with self._lock:
+            self._ensure_loaded()
+            new_urls = [url for url in urls if canonical_url(url) not in self._entries]
+            self.stats['skipped'] += len(urls) - len(new_urls)
+        return new_urls
+
+    def get_summary(self, url, content_hash):
+        """본문 해시가 같으면 저장된 요약 반환"""
+        entry = self.get(url)
+        if not entry or entry.get('content_hash') != content_hash or not entry.get('summary'):
+            return None
+        if entry.get('extracted_by') not in REUSABLE_SUMMARY_SOURCES:
+            return None
+        with self._lock:
+            self.stats['summaries_reused'] += 1
+        return {'text': entry['summary'], 'extracted_by': entry['extracted_by']}
+
+    def record(self, url, status='accepted', **fields):
+        """처리 결과 기록 (기존 항목과 병합 후 한 줄 추가)"""
+        if not url:
+            return
+        key = canonical_url(url)
+        now = datetime.now(KST).isoformat()
+        with self._lock:
+            self._ensure_loaded()
+            entry = dict(self._entries.get(key, {}))
+            entry.update(fields)
+            entry['url'] = key
+            entry['status'] = status
+            entry.setdefault('first_seen', now)
+            entry['last_seen'] = now
+            self._entries[key] = entry
+            self.stats['recorded'] += 1
+            self._append(entry)
+
+    def record_rejected(self, url, reason):
+        """검증에서 제외된 URL 기록 (다음 실행에서 다시 받지 않음)"""
+        self.record(url, status='rejected', reason=reason)
+
+
+# 전역 인덱스 인스턴스
+article_index = None
+
+
+def get_article_index():
+    """기사 인덱스 인스턴스 반환 (싱글톤)"""
+    global article_index
+    if article_index is None:
+        article_index = ArticleIndex()
+    return article_index
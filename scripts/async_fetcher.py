@@ -0,0 +1,227 @@
+"""
+asyncio 기반 수집 엔진 (settings.json의 fetchEngine: "async")
+httpx AsyncClient로 여러 페이지를 한 이벤트 루프에서 동시에 받고, h2가 설치되어 있으면
+같은 호스트 요청을 HTTP/2 연결 하나로 다중화
+받은 응답은 requests.Response로 변환해 HTTP 캐시에 미리 넣어 두므로 기존 추출기는 그대로 사용
+"""
+import asyncio
+import time
+from collections import namedtuple
+from urllib.parse import urlparse
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from adaptive_controller import get_domain_controller
+from http_session import (
+    ACCEPT_ENCODING, DEFAULT_TIMEOUT, DEFAULT_USER_AGENT, RETRY_STATUS_CODES, STREAM_CHUNK_SIZE,
+    HttpSessionPool, LimitedBody, UnsupportedContentError, check_content_type
+)
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_PER_HOST = 6
+
+# HTTP/2에서 허용되지 않는 연결 관련 헤더 (HTTP/1.1에서도 기본 동작과 같음)
+HOP_BY_HOP_HEADERS = {'connection', 'keep-alive', 'proxy-connection', 'transfer-encoding', 'upgrade'}
+
+# url, 요청 헤더, 쿠키, 요청 전 딜레이(초), 본문 제한(http_session.PageLimits)
+FetchJob = namedtuple('FetchJob', ['url', 'headers', 'cookies', 'delay', 'limits'], defaults=(None, None, 0.0, None))
+
+
+def to_requests_response(response, content=None, truncated=None):
+    """httpx 응답을 기존 추출기가 쓰는 requests.Response로 변환 (본문 바이트 그대로)"""
+    converted = requests.Response()
+    converted.status_code = response.status_code
+    converted._content = response.content if content is None else content
+    converted.truncated = truncated
+    converted.headers = CaseInsensitiveDict(response.headers.items())
+    converted.encoding = get_encoding_from_headers(converted.headers)
+    converted.url = str(response.url)
+    converted.reason = response.reason_phrase
+    converted.http_version = response.http_version
+    return converted
+
+
+class AsyncFetchEngine:
+    """이벤트 루프 하나로 여러 요청을 동시에 수행하는 수집기
+
+    - max_connections: 전체 동시 요청 수 상한
+    - per_host: 호스트별 동시 요청 수 상한 (HTTP/2면 한 연결에서 다중화)
+    - 같은 호스트 요청은 FetchJob.delay 간격으로 시작해 접근 전략 딜레이를 유지
+    - controller(DomainController)가 있으면 p95 타임아웃을 쓰고, 차단하는 호스트는
+      동시 요청 1개/재시도 없이 요청하며, 응답 시간/상태를 기록
+    """
+
+    def __init__(self, max_connections=DEFAULT_MAX_CONNECTIONS, per_host=DEFAULT_PER_HOST, http2=True,
+                 timeout=DEFAULT_TIMEOUT, retries=2, backoff_factor=0.5, transport=None, controller=None):
+        self.max_connections = max(1, int(max_connections))
+        self.per_host = max(1, int(per_host))
+        self.http2 = bool(http2) and H2_AVAILABLE
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.transport = transport
+        self.controller = controller
+        self.stats = {'requests': 0, 'failures': 0, 'http2_responses': 0}
+
+    @classmethod
+    def from_settings(cls, settings):
+        """settings.json의 fetchEngineOptions로 생성"""
+        options = settings.get('fetchEngineOptions', {})
+        return cls(
+            max_connections=options.get('maxConnections', DEFAULT_MAX_CONNECTIONS),
+            per_host=options.get('maxPerHost', DEFAULT_PER_HOST),
+            http2=options.get('http2', True),
+            controller=get_domain_controller()
+        )
+
+    def _build_client(self, cookies):
+        client_options = {
+            'http2': self.http2,
+            'follow_redirects': True,
+            'timeout': self.timeout,
+            'cookies': cookies or None,
+            'limits': httpx.Limits(max_connections=self.per_host),
+            'headers': {'User-Agent': DEFAULT_USER_AGENT, 'Accept-Encoding': ACCEPT_ENCODING}
+        }
+        if self.transport is not None:
+            client_options['transport'] = self.transport
+        return httpx.AsyncClient(**client_options)
+
+    @staticmethod
+    def _request_headers(headers):
+        headers = HttpSessionPool._normalize_headers(headers)
+        return {k: v for k, v in headers.items() if k.lower() not in HOP_BY_HOP_HEADERS}
+
+    def _host_limit(self, url):
+        if self.controller is not None and self.controller.retries(url, 1) == 0:
+            return 1
+        return self.per_host
+
+    @staticmethod
+    async def _read_limited(response, limits):
+        """http_session.read_limited와 같은 규칙으로 스트리밍 본문 읽기"""
+        if response.status_code != 200:
+            return await response.aread(), None
+        check_content_type(response.headers, limits)
+        body = LimitedBody(limits)
+        async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+            if body.feed(chunk):
+                break
+        return body.content, body.truncated
+
+    async def _request(self, client, job, headers, timeout):
+        if job.limits is None:
+            response = await client.get(job.url, headers=headers, timeout=timeout)
+            return response, None, None
+        async with client.stream('GET', job.url, headers=headers, timeout=timeout) as response:
+            content, truncated = await self._read_limited(response, job.limits)
+        return response, content, truncated
+
+    async def _get(self, client, job):
+        headers = self._request_headers(job.headers)
+        timeout = self.timeout
+        retries = self.retries
+        if self.controller is not None:
+            timeout = self.controller.timeout(job.url, self.timeout)
+            retries = self.controller.retries(job.url, self.retries)
+
+        for attempt in range(retries + 1):
+            start = time.time()
+            try:
+                self.stats['requests'] += 1
+                response, content, truncated = await self._request(client, job, headers, timeout)
+                if self.controller is not None:
+                    self.controller.record(job.url, time.time() - start, response.status_code)
+                if response.status_code in RETRY_STATUS_CODES and attempt < retries:
+                    await asyncio.sleep(self.backoff_factor * (2 ** attempt))
+                    continue
+                if response.http_version == 'HTTP/2':
+                    self.stats['http2_responses'] += 1
+                return to_requests_response(response, content, truncated)
+            except UnsupportedContentError as e:
+                print(f"[ASYNC_FETCH] Skipped {job.url}: {e}")
+                return None
+            except httpx.HTTPError as e:
+                if self.controller is not None and isinstance(e, (httpx.TimeoutException, httpx.NetworkError)):
+                    self.controller.record(job.url, time.time() - start, error=True)
+                if attempt >= retries:
+                    print(f"[ASYNC_FETCH] Failed {job.url}: {type(e).__name__}: {e}")
+                    self.stats['failures'] += 1
+                    return None
+                await asyncio.sleep(self.backoff_factor * (2 ** attempt))
+
+    async def _fetch_all(self, jobs):
+        loop = asyncio.get_running_loop()
+        clients = {}
+        semaphore = asyncio.Semaphore(self.max_connections)
+        host_slots = {}
+        next_start = {}
+
+        async def run(job):
+            host = urlparse(job.url).netloc.lower()
+            # 호스트별로 delay만큼 간격을 두고 시작 (순차 수집의 요청 전 딜레이와 같은 간격)
+            now = loop.time()
+            next_start[host] = max(now, next_start.get(host, now)) + (job.delay or 0)
+            await asyncio.sleep(next_start[host] - now)
+
+            if host not in clients:
+                clients[host] = self._build_client(job.cookies)
+                host_slots[host] = asyncio.Semaphore(self._host_limit(job.url))
+            async with semaphore, host_slots[host]:
+                return await self._get(clients[host], job)
+
+        try:
+            return await asyncio.gather(*(run(job) for job in jobs))
+        finally:
+            for client in clients.values():
+                await client.aclose()
+
+    def fetch_all(self, jobs):
+        """FetchJob 목록을 동시에 받아 입력 순서대로 requests.Response(실패 시 None) 반환"""
+        jobs = [FetchJob(*job) if not isinstance(job, FetchJob) else job for job in jobs]
+        if not jobs:
+            return []
+        return asyncio.run(self._fetch_all(jobs))
+
+    def prefetch(self, jobs, cache=None):
+        """페이지를 미리 받아 HTTP 캐시에 넣어 둠 (이후 cache.get은 네트워크 요청 없이 이 응답 사용)
+
+        조건부 요청 헤더를 함께 보내므로 304 응답은 평소처럼 디스크 본문으로 대체됨
+        """
+        if cache is None:
+            from http_cache import get_http_cache
+            cache = get_http_cache()
+        jobs = [job._replace(headers=cache.request_headers(job.url, job.headers)) for job in jobs]
+        responses = self.fetch_all(jobs)
+        fetched = 0
+        for job, response in zip(jobs, responses):
+            if response is not None:
+                cache.add_prefetched(job.url, response)
+                fetched += 1
+        print(f"[ASYNC_FETCH] Prefetched {fetched}/{len(jobs)} pages "
+              f"(http2={'on' if self.http2 else 'off'}, {self.stats['http2_responses']} over HTTP/2)")
+        return fetched
+
+
+def get_fetch_engine(settings):
+    """settings의 fetchEngine이 "async"이면 AsyncFetchEngine, 아니면 None (기존 스레드 수집)"""
+    if settings.get('fetchEngine', 'threads') != 'async':
+        return None
+    if not HTTPX_AVAILABLE:
+        print("[ASYNC_FETCH] httpx not installed, using thread-based fetching")
+        return None
+    return AsyncFetchEngine.from_settings(settings)
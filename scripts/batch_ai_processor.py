@@ -1,23 +1,54 @@
 """
 배치 AI 프로세서 - 여러 URL을 한 번의 AI 요청으로 처리
 """
+import re
 import json
 from typing import List, Dict, Tuple
 
+from ai_clients import get_ai_clients
+
+# "1. YES", "2) ARTICLE", "**3.** MENU" 형태의 번호 답변
+NUMBERED_ANSWER_PATTERN = re.compile(r'^\W*(\d+)\s*[.):\-]\**\s*(.+)$')
+
+
+def parse_numbered_answers(text: str, count: int) -> Dict[int, str]:
+    """번호가 붙은 답변을 {0부터 시작하는 인덱스: 답변} 으로 변환 (범위 밖, 중복 번호는 무시)"""
+    answers = {}
+    for line in (text or '').strip().split('\n'):
+        match = NUMBERED_ANSWER_PATTERN.match(line.strip())
+        if not match:
+            continue
+        index = int(match.group(1)) - 1
+        if 0 <= index < count and index not in answers:
+            answers[index] = match.group(2).strip().upper()
+    return answers
+
+
 class BatchAIProcessor:
-    def __init__(self, ai_model):
+    def __init__(self, ai_model, rate_limit=None, url_batch_size=10, content_batch_size=5):
         self.model = ai_model
-        
+        self.rate_limit = rate_limit  # 요청 전에 호출할 속도 제한 함수
+        self.url_batch_size = url_batch_size
+        self.content_batch_size = content_batch_size
+
+    def _generate(self, prompt):
+        if self.rate_limit:
+            self.rate_limit()
+        with get_ai_clients().track('gemini'):
+            response = self.model.generate_content(prompt)
+        return response.text if response and response.text else ''
+
     def validate_urls_batch(self, urls_with_context: List[Tuple[str, str, str]]) -> Dict[str, bool]:
-        """여러 URL을 한 번에 검증"""
+        """여러 URL을 한 번에 검증 (답변을 받은 URL만 결과에 포함)"""
         if not self.model or not urls_with_context:
             return {}
-            
+
         # URL 리스트 준비
+        batch = urls_with_context[:self.url_batch_size]
         url_list = []
-        for i, (url, title, text) in enumerate(urls_with_context[:10]):  # 최대 10개씩
+        for i, (url, title, text) in enumerate(batch):
             url_list.append(f"{i+1}. URL: {url}\n   제목: {title}\n   텍스트: {text[:50]}")
-        
+
         prompt = f"""
 다음 URL들이 실제 뉴스 기사인지 판단해주세요. 각 번호별로 YES 또는 NO로 답하세요.
 
@@ -33,36 +64,33 @@ class BatchAIProcessor:
 - 실제 뉴스 기사면 YES
 - 메뉴, 광고, 로그인 페이지 등이면 NO
 """
-        
+
         try:
-            response = self.model.generate_content(prompt)
-            if response and response.text:
-                results = {}
-                lines = response.text.strip().split('\n')
-                for i, line in enumerate(lines):
-                    if i < len(urls_with_context):
-                        url = urls_with_context[i][0]
-                        # YES/NO 추출
-                        if 'YES' in line.upper():
-                            results[url] = True
-                        else:
-                            results[url] = False
-                return results
+            answers = parse_numbered_answers(self._generate(prompt), len(batch))
+            results = {}
+            for index, answer in answers.items():
+                # YES/NO 추출
+                if answer.startswith('YES'):
+                    results[batch[index][0]] = True
+                elif answer.startswith('NO'):
+                    results[batch[index][0]] = False
+            return results
         except Exception as e:
             print(f"Batch AI validation error: {e}")
-            
+
         return {}
-    
+
     def classify_content_batch(self, contents: List[Tuple[str, str]]) -> Dict[str, Dict]:
-        """여러 콘텐츠를 한 번에 분류"""
+        """여러 콘텐츠를 한 번에 분류 (답변을 받은 URL만 결과에 포함)"""
         if not self.model or not contents:
             return {}
-            
+
         # 콘텐츠 리스트 준비
+        batch = contents[:self.content_batch_size]
         content_list = []
-        for i, (url, html_text) in enumerate(contents[:5]):  # 최대 5개씩
-            content_list.append(f"{i+1}. URL: {url}\n   내용: {html_text[:300]}...")
-        
+        for i, (url, text) in enumerate(batch):
+            content_list.append(f"{i+1}. URL: {url}\n   내용: {' '.join(text.split())[:300]}...")
+
         prompt = f"""
 다음 웹페이지들을 분류해주세요:
 
@@ -80,27 +108,23 @@ class BatchAIProcessor:
 3. ARTICLE
 ...
 """
-        
+
         try:
-            response = self.model.generate_content(prompt)
-            if response and response.text:
-                results = {}
-                lines = response.text.strip().split('\n')
-                for i, line in enumerate(lines):
-                    if i < len(contents):
-                        url = contents[i][0]
-                        # 분류 추출
-                        line_upper = line.upper()
-                        if 'ARTICLE' in line_upper:
-                            results[url] = {'type': 'NEWS_ARTICLE', 'is_article': True}
-                        elif 'MENU' in line_upper:
-                            results[url] = {'type': 'MENU_PAGE', 'is_article': False}
-                        elif 'LANDING' in line_upper:
-                            results[url] = {'type': 'LANDING_PAGE', 'is_article': False}
-                        else:
-                            results[url] = {'type': 'OTHER', 'is_article': False}
-                return results
+            answers = parse_numbered_answers(self._generate(prompt), len(batch))
+            results = {}
+            for index, answer in answers.items():
+                url = batch[index][0]
+                # 분류 추출
+                if 'ARTICLE' in answer:
+                    results[url] = {'type': 'NEWS_ARTICLE', 'is_article': True, 'confidence': 'high'}
+                elif 'MENU' in answer:
+                    results[url] = {'type': 'MENU_PAGE', 'is_article': False, 'confidence': 'high'}
+                elif 'LANDING' in answer:
+                    results[url] = {'type': 'LANDING_PAGE', 'is_article': False, 'confidence': 'high'}
+                elif 'OTHER' in answer:
+                    results[url] = {'type': 'OTHER', 'is_article': False, 'confidence': 'low'}
+            return results
         except Exception as e:
             print(f"Batch AI classification error: {e}")
-            
-        return {}
\ No newline at end of file
+
+        return {}
@@ -3,19 +3,22 @@
 각 사이트별 맞춤 접근 방법
 """
 
-import requests
 from bs4 import BeautifulSoup
 import json
 import time
 import random
 from datetime import datetime
 import pytz
+from http_session import get_http_pool
+from fallback_racer import get_fallback_racer
+from concurrent_fetcher import get_domain_key
 
 KST = pytz.timezone('Asia/Seoul')
 
 class BlockedSitesHandler:
     def __init__(self):
-        self.session = requests.Session()
+        # 호스트별 keep-alive 세션은 공유 풀에서 관리
+        self.http = get_http_pool()
         
     def get_mothership_via_api(self):
         """Mothership의 비공식 API 사용"""
@@ -30,7 +33,7 @@ class BlockedSitesHandler:
         
         for endpoint in api_endpoints:
             try:
-                response = self.session.get(endpoint, timeout=10)
+                response = self.http.get(endpoint, timeout=10)
                 if response.status_code == 200:
                     data = response.json()
                     # API 응답 구조에 따라 파싱
@@ -59,7 +62,7 @@ class BlockedSitesHandler:
         wayback_url = f"https://web.archive.org/web/{today}/https://www.todayonline.com/"
         
         try:
-            response = requests.get(wayback_url, timeout=15)
+            response = self.http.get(wayback_url, timeout=15)
             if response.status_code == 200:
                 soup = BeautifulSoup(response.content, 'html.parser')
                 
@@ -97,7 +100,7 @@ class BlockedSitesHandler:
         }
         
         try:
-            response = self.session.get(mobile_url, headers=headers, timeout=10)
+            response = self.http.get(mobile_url, headers=headers, timeout=10)
             if response.status_code == 200:
                 soup = BeautifulSoup(response.content, 'html.parser')
                 
@@ -129,7 +132,7 @@ class BlockedSitesHandler:
         
         try:
             # feedparser 대신 직접 파싱
-            response = requests.get(google_news_url, timeout=10)
+            response = self.http.get(google_news_url, timeout=10)
             if response.status_code == 200:
                 soup = BeautifulSoup(response.content, 'xml')
                 
@@ -170,32 +173,22 @@ class BlockedSitesHandler:
         return None
     
     def get_blocked_site_articles(self, site_name, site_url):
-        """차단된 사이트별 맞춤 처리"""
-        articles = []
+        """차단된 사이트별 맞춤 처리 (맞춤 방법과 Google News를 시차를 두고 경쟁시켜 먼저 성공한 결과 사용)"""
+        candidates = []
         
         if site_name == "Mothership":
             # 1. API 시도
-            articles = self.get_mothership_via_api()
-            # 2. Google News 백업
-            if not articles:
-                articles = self.get_via_google_news("Mothership")
-                
+            candidates.append(('api', self.get_mothership_via_api))
         elif site_name == "TODAY Online":
             # 1. Wayback Machine
-            articles = self.get_today_online_via_wayback()
-            # 2. Google News 백업
-            if not articles:
-                articles = self.get_via_google_news("TODAY Online")
-                
+            candidates.append(('wayback_machine', self.get_today_online_via_wayback))
         elif site_name == "The Independent Singapore":
             # 1. 모바일 버전
-            articles = self.get_independent_sg_mobile()
-            # 2. Google News 백업
-            if not articles:
-                articles = self.get_via_google_news("The Independent Singapore")
-                
-        else:
-            # 기타 차단 사이트는 Google News 사용
-            articles = self.get_via_google_news(site_name)
-            
-        return articles
\ No newline at end of file
+            candidates.append(('mobile_version', self.get_independent_sg_mobile))
+        
+        # 2. Google News 백업 (기타 차단 사이트는 Google News만 사용)
+        candidates.append(('google_news', lambda: self.get_via_google_news(site_name)))
+        
+        # 우승 기록은 scraper와 같은 도메인 키(사이트 이름이 아님)로 남김
+        articles, _ = get_fallback_racer().race(get_domain_key(site_url), candidates)
+        return articles or []
@@ -0,0 +1,206 @@
+"""
+헤드리스 브라우저 풀
+JavaScript 렌더링이 필요한 기사(TODAY Online, Tech in Asia 등)마다 Chrome을 새로 띄우지 않도록
+- 필요할 때 최대 size개까지 드라이버를 시작하고 (지연 시작)
+- 같은 드라이버에서 페이지 이동만 반복해 재사용하며
+- max_pages 페이지를 읽었거나 메모리(RSS)가 max_memory_mb를 넘으면 드라이버를 교체하고
+- 실행이 끝나면 shutdown()으로 모두 종료 (프로세스 종료 시에도 atexit로 정리)
+"""
+import atexit
+import threading
+from contextlib import contextmanager
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+DEFAULT_SIZE = 2
+DEFAULT_MAX_PAGES = 50
+DEFAULT_MAX_MEMORY_MB = 1024
+ACQUIRE_TIMEOUT = 120
+
+_memory_warning_logged = False
+
+
+def default_driver_factory():
+    """scraper_browser의 헤드리스 Chrome 설정으로 드라이버 시작"""
+    from scraper_browser import create_driver
+    return create_driver()
+
+
+def driver_memory_mb(driver):
+    """드라이버가 띄운 브라우저 프로세스 트리의 RSS 합계(MB) (알 수 없으면 None)"""
+    if not PSUTIL_AVAILABLE:
+        return None
+    try:
+        root = psutil.Process(driver.service.process.pid)
+        processes = [root] + root.children(recursive=True)
+        return sum(process.memory_info().rss for process in processes) / (1024 * 1024)
+    except Exception:
+        return None
+
+
+def _warn_memory_limit_disabled(max_memory_mb):
+    """psutil이 없어 메모리 기준 교체를 할 수 없음을 한 번만 기록"""
+    global _memory_warning_logged
+    if not _memory_warning_logged:
+        _memory_warning_logged = True
+        print(f"[BROWSER_POOL] psutil not installed, max_memory_mb={max_memory_mb} is not enforced "
+              f"(drivers are recycled by page count only)")
+
+
+class BrowserPool:
+    """재사용 가능한 웹드라이버 풀 (스레드 안전)"""
+
+    def __init__(self, size=DEFAULT_SIZE, max_pages=DEFAULT_MAX_PAGES, max_memory_mb=DEFAULT_MAX_MEMORY_MB,
+                 factory=None):
+        self.size = max(1, int(size))
+        self.max_pages = max(1, int(max_pages))
+        self.max_memory_mb = max_memory_mb
+        if max_memory_mb and not PSUTIL_AVAILABLE:
+            _warn_memory_limit_disabled(max_memory_mb)
+        self.factory = factory or default_driver_factory
+        self._idle = []            # [(driver, 읽은 페이지 수)]
+        self._active = 0           # 시작된 드라이버 수 (사용 중 + 대기 중)
+        self._closed = False
+        self._condition = threading.Condition()
+        self.stats = {'started': 0, 'recycled': 0, 'pages': 0, 'failed_starts': 0}
+
+    @classmethod
+    def from_settings(cls, settings):
+        """settings.json의 browserPool 옵션으로 생성"""
+        options = settings.get('browserPool', {})
+        return cls(
+            size=options.get('size', DEFAULT_SIZE),
+            max_pages=options.get('maxPagesPerDriver', DEFAULT_MAX_PAGES),
+            max_memory_mb=options.get('maxMemoryMb', DEFAULT_MAX_MEMORY_MB)
+        )
+
+    def _take(self):
+        """대기 중인 드라이버를 꺼내거나, 여유가 있으면 새로 시작할 자리를 예약"""
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._idle or self._active < self.size or self._closed,
+                                            timeout=ACQUIRE_TIMEOUT):
+                raise TimeoutError("No browser available")
+            if self._closed:
+                raise RuntimeError("Browser pool is shut down")
+            if self._idle:
+                return self._idle.pop()
+            self._active += 1
+
+        try:
+            driver = self.factory()
+        except Exception:
+            with self._condition:
+                self._active -= 1
+                self.stats['failed_starts'] += 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self.stats['started'] += 1
+        return driver, 0
+
+    def _should_recycle(self, driver, pages):
+        if pages >= self.max_pages:
+            return True
+        memory = driver_memory_mb(driver)
+        return memory is not None and self.max_memory_mb and memory > self.max_memory_mb
+
+    @staticmethod
+    def _is_alive(driver):
+        try:
+            driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def _discard(self, driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        with self._condition:
+            self._active -= 1
+            self._condition.notify()
+
+    @contextmanager
+    def acquire(self):
+        """드라이버 하나를 빌려 씀 (반납 시 페이지 수/메모리/상태를 보고 재사용 또는 교체)"""
+        driver, pages = self._take()
+        try:
+            yield driver
+        finally:
+            pages += 1
+            with self._condition:
+                self.stats['pages'] += 1
+                closed = self._closed
+            if closed or not self._is_alive(driver):
+                self._discard(driver)
+            elif self._should_recycle(driver, pages):
+                with self._condition:
+                    self.stats['recycled'] += 1
+                self._discard(driver)
+            else:
+                with self._condition:
+                    self._idle.append((driver, pages))
+                    self._condition.notify()
+
+    def get_page(self, url, wait_selector=None):
+        """풀의 드라이버로 JavaScript 렌더링된 페이지 소스 반환 (실패 시 None)"""
+        from scraper_browser import BrowserScraper
+        try:
+            with self.acquire() as driver:
+                return BrowserScraper(driver=driver).get_page_with_js(url, wait_selector)
+        except Exception as e:
+            print(f"[BROWSER_POOL] Failed to get {url}: {type(e).__name__}: {e}")
+            return None
+
+    def shutdown(self):
+        """모든 드라이버 종료 (이후 acquire는 실패)"""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+        for driver, _ in idle:
+            self._discard(driver)
+        if self.stats['started']:
+            print(f"[BROWSER_POOL] Shut down: {self.stats['started']} drivers started, "
+                  f"{self.stats['pages']} pages, {self.stats['recycled']} recycled")
+
+
+# 전역 브라우저 풀 (처음 사용할 때 생성)
+browser_pool = None
+_pool_lock = threading.Lock()
+
+
+def configure_browser_pool(settings):
+    """settings의 browserPool 옵션으로 전역 풀 설정 (이전 풀은 종료)"""
+    global browser_pool
+    with _pool_lock:
+        if browser_pool is not None:
+            browser_pool.shutdown()
+        browser_pool = BrowserPool.from_settings(settings)
+        return browser_pool
+
+
+def get_browser_pool():
+    """전역 브라우저 풀"""
+    global browser_pool
+    with _pool_lock:
+        if browser_pool is None:
+            browser_pool = BrowserPool()
+        return browser_pool
+
+
+def shutdown_browser_pool():
+    """전역 풀의 드라이버를 모두 종료 (다음 사용 시 새 풀 생성)"""
+    global browser_pool
+    with _pool_lock:
+        pool, browser_pool = browser_pool, None
+    if pool is not None:
+        pool.shutdown()
+
+
+atexit.register(shutdown_browser_pool)
@@ -0,0 +1,193 @@
+"""
+도메인별 서킷 브레이커 (사이트 상태 기록)
+차단된 사이트에서 기사 링크마다 Cloudflare 우회 → 대체 소스 → Selenium을 반복하지 않도록
+- 연속 차단이 threshold번 이상이면 회로를 열어(open) 남은 링크는 바로 건너뛰고
+- cooldown이 지나면 반열림(half_open) 상태로 직접 요청 1건만 시험 삼아 보냄
+- 상태와 마지막 성공 시각은 data/cache/site_health.json에 저장되어 다음 실행으로 이어짐
+  (열린 채로 끝난 도메인은 다음 실행에서 반열림으로 시작하므로 첫 요청이 가벼운 시험 요청이 됨)
+"""
+import json
+import os
+import threading
+import time
+
+from concurrent_fetcher import get_domain_key
+
+DEFAULT_STATE_FILE = 'data/cache/site_health.json'
+DEFAULT_THRESHOLD = 3
+DEFAULT_COOLDOWN = 30 * 60   # 같은 실행 안에서 다시 시험 요청을 보내기까지의 시간(초)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitBreaker:
+    """도메인별 차단 상태 관리 (스레드 안전)
+
+    allow(url)의 반환값
+    - CLOSED: 평소처럼 요청하고 실패하면 대체 방법까지 시도
+    - HALF_OPEN: 직접 요청 1건만 시도 (대체 방법 없이), 결과를 record_*로 알리고 끝나면 end_probe 호출
+    - OPEN: 요청하지 않고 건너뜀
+    """
+
+    def __init__(self, state_file=DEFAULT_STATE_FILE, threshold=DEFAULT_THRESHOLD, cooldown=DEFAULT_COOLDOWN):
+        self.state_file = state_file
+        self.threshold = max(1, int(threshold))
+        self.cooldown = cooldown
+        self._domains = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    @classmethod
+    def from_settings(cls, settings):
+        """settings.json의 circuitBreaker 옵션으로 생성"""
+        options = settings.get('circuitBreaker', {})
+        return cls(
+            threshold=options.get('threshold', DEFAULT_THRESHOLD),
+            cooldown=options.get('cooldownMinutes', DEFAULT_COOLDOWN // 60) * 60
+        )
+
+    def _new_state(self):
+        return {
+            'state': CLOSED,
+            'failures': 0,
+            'opened_at': None,
+            'last_success': None,
+            'last_failure': None,
+            'probing': False,
+            'skipped': 0
+        }
+
+    def _state(self, domain):
+        state = self._domains.get(domain)
+        if state is None:
+            state = self._domains[domain] = self._new_state()
+        return state
+
+    def _load(self):
+        """이전 실행의 사이트 상태 로드 (열려 있던 회로는 반열림으로 시작)"""
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return
+        for domain, entry in saved.get('domains', {}).items():
+            state = self._new_state()
+            state['state'] = HALF_OPEN if entry.get('state') in (OPEN, HALF_OPEN) else CLOSED
+            state['failures'] = int(entry.get('failures', 0))
+            state['opened_at'] = entry.get('opened_at')
+            state['last_success'] = entry.get('last_success')
+            state['last_failure'] = entry.get('last_failure')
+            self._domains[domain] = state
+
+    def save(self):
+        """사이트 상태 저장 (다음 실행의 시작값)"""
+        with self._lock:
+            data = {
+                'updated_at': time.time(),
+                'domains': {
+                    domain: {
+                        'state': state['state'],
+                        'failures': state['failures'],
+                        'opened_at': state['opened_at'],
+                        'last_success': state['last_success'],
+                        'last_failure': state['last_failure']
+                    }
+                    for domain, state in self._domains.items()
+                }
+            }
+        try:
+            os.makedirs(os.path.dirname(self.state_file) or '.', exist_ok=True)
+            tmp_path = f'{self.state_file}.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.state_file)
+        except OSError as e:
+            print(f"[CIRCUIT] Failed to save site health: {e}")
+
+    def state(self, url):
+        """도메인의 현재 회로 상태 (기록 없이 조회만)"""
+        with self._lock:
+            state = self._domains.get(get_domain_key(url))
+            return state['state'] if state else CLOSED
+
+    def allow(self, url):
+        """요청 전 호출: CLOSED/HALF_OPEN/OPEN 중 하나를 반환"""
+        domain = get_domain_key(url)
+        with self._lock:
+            state = self._domains.get(domain)
+            if state is None or state['state'] == CLOSED:
+                return CLOSED
+            if state['state'] == OPEN and time.time() - state['opened_at'] >= self.cooldown:
+                state['state'] = HALF_OPEN
+            # 반열림 상태에서는 동시에 한 건만 시험 요청
+            if state['state'] == HALF_OPEN and not state['probing']:
+                state['probing'] = True
+                return HALF_OPEN
+            state['skipped'] += 1
+            return OPEN
+
+    def record_success(self, url):
+        """기사를 얻었을 때 호출 (회로를 닫음)"""
+        domain = get_domain_key(url)
+        with self._lock:
+            state = self._state(domain)
+            if state['state'] != CLOSED:
+                print(f"[CIRCUIT] {domain} recovered, closing circuit")
+            state.update(state=CLOSED, failures=0, opened_at=None, probing=False, last_success=time.time())
+
+    def record_failure(self, url):
+        """차단되어 모든 방법이 실패했을 때 호출 (연속 threshold번이면 회로를 엶)"""
+        domain = get_domain_key(url)
+        with self._lock:
+            state = self._state(domain)
+            state['failures'] += 1
+            state['last_failure'] = time.time()
+            state['probing'] = False
+            if state['state'] == HALF_OPEN or state['failures'] >= self.threshold:
+                if state['state'] != OPEN:
+                    print(f"[CIRCUIT] {domain} blocked {state['failures']} times in a row, opening circuit")
+                state['state'] = OPEN
+                state['opened_at'] = time.time()
+
+    def end_probe(self, url):
+        """시험 요청이 record_* 없이 끝났을 때 호출 (probing을 풀어 다음 요청이 다시 시험)"""
+        domain = get_domain_key(url)
+        with self._lock:
+            state = self._domains.get(domain)
+            if state is not None:
+                state['probing'] = False
+
+    def snapshot(self):
+        """도메인별 현재 상태 요약 (실행 프로파일/로그용)"""
+        with self._lock:
+            return {
+                domain: {
+                    'state': state['state'],
+                    'failures': state['failures'],
+                    'skipped': state['skipped'],
+                    'last_success': state['last_success']
+                }
+                for domain, state in self._domains.items()
+            }
+
+
+# 전역 서킷 브레이커 인스턴스 (circuitBreaker가 꺼져 있으면 None)
+circuit_breaker = None
+
+
+def configure_circuit_breaker(settings):
+    """settings의 circuitBreaker.enabled에 따라 전역 서킷 브레이커 생성/해제"""
+    global circuit_breaker
+    if settings.get('circuitBreaker', {}).get('enabled', False):
+        if circuit_breaker is None:
+            circuit_breaker = CircuitBreaker.from_settings(settings)
+    else:
+        circuit_breaker = None
+    return circuit_breaker
+
+
+def get_circuit_breaker():
+    """전역 서킷 브레이커 (설정되지 않았으면 None)"""
+    return circuit_breaker
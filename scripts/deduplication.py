@@ -3,6 +3,46 @@ from difflib import SequenceMatcher
 from typing import List, Dict
 import hashlib
 
+SIMHASH_BITS = 64
+LEAD_LENGTH = 500   # 지문에 사용하는 본문 앞부분(리드) 길이
+
+
+def simhash(text: str, bits: int = SIMHASH_BITS) -> int:
+    """단어와 연속 두 단어(bigram)를 특징으로 하는 SimHash 지문
+
+    같은 기사를 옮겨 실은 경우처럼 거의 같은 텍스트는 해밍 거리가 작은 지문을 가짐
+    """
+    words = text.split()
+    features = words + [f'{a} {b}' for a, b in zip(words, words[1:])]
+    if not features:
+        return 0
+    weights = [0] * bits
+    for feature in features:
+        value = int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=bits // 8).digest(), 'big')
+        for bit in range(bits):
+            weights[bit] += 1 if value >> bit & 1 else -1
+    return sum(1 << bit for bit in range(bits) if weights[bit] > 0)
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """두 지문에서 다른 비트 수"""
+    return bin(a ^ b).count('1')
+
+
+def near_duplicate_groups(fingerprints: List[int], max_distance: int = 3) -> List[int]:
+    """각 지문마다 처음 나온 유사 지문의 인덱스 (자신이 대표면 자기 인덱스)"""
+    representatives = []
+    groups = []
+    for index, fingerprint in enumerate(fingerprints):
+        match = next((rep for rep in representatives
+                      if hamming_distance(fingerprints[rep], fingerprint) <= max_distance), None)
+        if match is None:
+            representatives.append(index)
+            match = index
+        groups.append(match)
+    return groups
+
+
 class ArticleDeduplicator:
     """기사 중복 제거를 위한 유틸리티 클래스"""
     
@@ -24,6 +64,10 @@ class ArticleDeduplicator:
         normalized = self.normalize_text(f"{title} {content[:500]}")
         return hashlib.md5(normalized.encode()).hexdigest()
     
+    def calculate_simhash(self, title: str, content: str) -> int:
+        """제목과 리드 문단 기반 SimHash 지문 (근사 중복 판정용)"""
+        return simhash(self.normalize_text(f"{title} {content[:LEAD_LENGTH]}"))
+    
     def calculate_similarity(self, text1: str, text2: str) -> float:
         """두 텍스트의 유사도 계산 (0-1)"""
         norm1 = self.normalize_text(text1)
@@ -0,0 +1,181 @@
+"""
+대체 수집 방법 경쟁 실행 (hedged fallback)
+차단된 기사/사이트의 대체 방법(Cloudflare 우회, 모바일, 캐시, 아카이브, 프록시, Selenium 등)을
+하나씩 타임아웃까지 기다리며 시도하는 대신
+- 앞선 방법이 hedge_delay초 안에 결과를 내지 못하면 다음 방법을 함께 시작하고 (실패하면 즉시 시작)
+- 검증을 통과한 첫 결과를 사용하며 아직 시작하지 않은 방법은 취소
+- 도메인별로 이긴 방법을 기록해 다음에는 그 방법부터 시작 (data/cache/fallback_wins.json)
+"""
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+DEFAULT_STATE_FILE = 'data/cache/fallback_wins.json'
+DEFAULT_HEDGE_DELAY = 2.0
+DEFAULT_TIMEOUT = 30
+
+# 차단/확인 페이지 판정 (본문 어디에나 나올 수 있는 'captcha' 같은 단어가 아니라 페이지 고유의 표식으로 판정)
+# - <title>이 확인 페이지 문구로 시작
+CHALLENGE_TITLE = re.compile(
+    r'<title[^>]*>\s*(just a moment|attention required|access denied|checking your browser|'
+    r'security check|verify you are human|are you a robot)', re.I)
+# - Cloudflare 챌린지 페이지에만 있는 스크립트/요소 (일반 페이지의 challenge-platform/scripts/jsd는 제외)
+CHALLENGE_SIGNATURE = re.compile(r'_cf_chl_opt|cf-chl-|challenge-platform/h/|id="challenge-form"', re.I)
+# - 캡차 폼/위젯 (본문 텍스트가 거의 없을 때만 차단 페이지로 봄, reCAPTCHA 스크립트만으로는 판정하지 않음)
+CAPTCHA_WIDGET = re.compile(r'class="[^"]*\b(g-recaptcha|h-captcha|cf-turnstile)\b|<form[^>]*captcha', re.I)
+NON_TEXT = re.compile(r'<(script|style)\b.*?</\1>|<[^>]+>', re.I | re.S)
+MIN_PAGE_LENGTH = 500
+MIN_TEXT_LENGTH = 500   # 캡차 위젯이 있어도 텍스트가 이보다 많으면 기사 페이지로 봄
+
+
+def is_usable_page(content):
+    """대체 방법으로 받은 HTML이 기사 페이지로 쓸 만한지 (빈 응답/차단 페이지 제외)"""
+    if not content or len(content) < MIN_PAGE_LENGTH:
+        return False
+    html = content if isinstance(content, str) else content.decode('utf-8', 'ignore')
+    if CHALLENGE_TITLE.search(html[:5000]) or CHALLENGE_SIGNATURE.search(html):
+        return False
+    if CAPTCHA_WIDGET.search(html):
+        text = ' '.join(NON_TEXT.sub(' ', html).split())
+        return len(text) >= MIN_TEXT_LENGTH
+    return True
+
+
+class FallbackRacer:
+    """대체 방법 목록을 시차를 두고 동시에 실행해 가장 먼저 성공한 결과를 반환 (스레드 안전)
+
+    - hedge_delay: 다음 방법을 추가로 시작하기까지 기다리는 시간 (None이면 앞 방법이 끝난 뒤 시작 = 순차)
+    - timeout: 경쟁 전체 상한 (초과하면 실패로 처리하고 실행 중인 방법의 결과는 버림)
+    """
+
+    def __init__(self, state_file=DEFAULT_STATE_FILE, hedge_delay=DEFAULT_HEDGE_DELAY, timeout=DEFAULT_TIMEOUT):
+        self.state_file = state_file
+        self.hedge_delay = hedge_delay
+        self.timeout = timeout
+        self._wins = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    @classmethod
+    def from_settings(cls, settings):
+        """settings.json의 fallbackRace 옵션으로 생성 (enabled가 false면 순차 실행)"""
+        options = settings.get('fallbackRace', {})
+        enabled = options.get('enabled', True)
+        return cls(
+            hedge_delay=options.get('hedgeDelay', DEFAULT_HEDGE_DELAY) if enabled else None,
+            timeout=options.get('timeout', DEFAULT_TIMEOUT)
+        )
+
+    def _load(self):
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                self._wins = json.load(f).get('domains', {})
+        except (OSError, ValueError):
+            self._wins = {}
+
+    def save(self):
+        """도메인별 우승 기록 저장"""
+        with self._lock:
+            data = {'updated_at': time.time(), 'domains': self._wins}
+            try:
+                os.makedirs(os.path.dirname(self.state_file) or '.', exist_ok=True)
+                tmp_path = f'{self.state_file}.tmp'
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
+                os.replace(tmp_path, self.state_file)
+            except OSError as e:
+                print(f"[FALLBACK] Failed to save fallback wins: {e}")
+
+    def order(self, domain, candidates):
+        """이전에 이긴 방법을 앞으로 (승리 횟수 순, 같으면 원래 순서)"""
+        with self._lock:
+            wins = self._wins.get(domain, {}).get('wins', {})
+            last = self._wins.get(domain, {}).get('last_winner')
+        return sorted(candidates, key=lambda candidate: (candidate[0] != last, -wins.get(candidate[0], 0)))
+
+    def record_win(self, domain, method, elapsed):
+        with self._lock:
+            entry = self._wins.setdefault(domain, {'wins': {}})
+            entry['wins'][method] = entry['wins'].get(method, 0) + 1
+            entry['last_winner'] = method
+            entry['last_elapsed'] = round(elapsed, 3)
+
+    def winner(self, domain):
+        """도메인에서 마지막으로 이긴 방법"""
+        with self._lock:
+            return self._wins.get(domain, {}).get('last_winner')
+
+    def race(self, domain, candidates, validate=None):
+        """candidates [(이름, 인자 없는 함수)]를 경쟁시켜 (결과, 이름) 반환, 모두 실패하면 (None, None)
+
+        validate(결과)가 False인 결과는 실패로 보고 다음 방법을 즉시 시작
+        """
+        validate = validate or bool
+        pending_candidates = list(self.order(domain, candidates))
+        if not pending_candidates:
+            return None, None
+
+        start = time.time()
+        deadline = start + self.timeout
+        executor = ThreadPoolExecutor(max_workers=len(pending_candidates), thread_name_prefix='fallback')
+        running = {}
+
+        def launch():
+            name, func = pending_candidates.pop(0)
+            print(f"[FALLBACK] Starting {name} for {domain}")
+            running[executor.submit(func)] = name
+
+        try:
+            launch()
+            while running:
+                now = time.time()
+                if now >= deadline:
+                    print(f"[FALLBACK] Timed out after {self.timeout}s for {domain}")
+                    break
+                wait_for = deadline - now
+                if pending_candidates and self.hedge_delay is not None:
+                    wait_for = min(wait_for, self.hedge_delay)
+                done, _ = wait(running, timeout=wait_for, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        print(f"[FALLBACK] {name} failed for {domain}: {type(e).__name__}: {e}")
+                        continue
+                    if validate(result):
+                        elapsed = time.time() - start
+                        print(f"[FALLBACK] {name} won for {domain} in {elapsed:.1f}s")
+                        self.record_win(domain, name, elapsed)
+                        return result, name
+
+                # 실패로 끝났거나(done) hedge_delay가 지났으면(not done) 다음 방법 시작
+                if pending_candidates and (done or self.hedge_delay is not None):
+                    launch()
+            return None, None
+        finally:
+            # 아직 시작하지 않은 방법은 취소, 실행 중인 방법은 자체 타임아웃으로 끝나며 결과는 버림
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+# 전역 인스턴스 (configure_fallback_racer로 설정, 없으면 기본값으로 생성)
+fallback_racer = None
+
+
+def configure_fallback_racer(settings):
+    """settings의 fallbackRace 옵션으로 전역 인스턴스 생성"""
+    global fallback_racer
+    fallback_racer = FallbackRacer.from_settings(settings)
+    return fallback_racer
+
+
+def get_fallback_racer():
+    """전역 FallbackRacer 인스턴스"""
+    global fallback_racer
+    if fallback_racer is None:
+        fallback_racer = FallbackRacer()
+    return fallback_racer
@@ -0,0 +1,358 @@
+"""
+필터 엔진 - 메뉴/랜딩 페이지/키워드/URL 판정용 사전 컴파일 매처
+지표 목록을 모듈 로드 시 하나의 트라이 정규식으로 컴파일해 텍스트를 한 번만 훑어서 판정
+설정의 키워드 목록은 실행마다 한 번만 컴파일해 재사용
+"""
+import re
+from functools import lru_cache
+
+
+def _trie_pattern(phrases):
+    """문구 목록을 공통 접두사로 묶은 정규식 (같은 위치에서는 가장 긴 문구가 매칭됨)"""
+    trie = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def build(node):
+        terminal = '' in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if terminal:
+            return '(?:' + body + ')?'
+        return body
+
+    return build(trie)
+
+
+class PhraseMatcher:
+    """부분 문자열 목록 매처 (`any(p in text ...)`, `sum(1 for p ... if p in text)`와 같은 결과)
+
+    입력 텍스트는 호출 측에서 소문자로 변환해 전달
+    """
+
+    def __init__(self, phrases):
+        self.phrases = tuple(dict.fromkeys(p.lower() for p in phrases if p))
+        if self.phrases:
+            pattern = _trie_pattern(self.phrases)
+            self._search = re.compile(pattern)
+            # 전방 탐색으로 위치마다 가장 긴 문구를 찾아 겹치는 매칭도 모두 수집
+            self._scan = re.compile('(?=(' + pattern + '))')
+        else:
+            self._search = self._scan = None
+        # 같은 위치에서 가장 긴 문구가 매칭되면 그 접두사인 문구들도 함께 매칭된 것
+        self._implied = {
+            phrase: [other for other in self.phrases if phrase.startswith(other)]
+            for phrase in self.phrases
+        }
+
+    def search(self, text):
+        """문구 중 하나라도 포함되면 True"""
+        return self._search is not None and self._search.search(text) is not None
+
+    def found(self, text):
+        """포함된 문구 집합"""
+        if self._scan is None:
+            return set()
+        found = set()
+        for longest in set(self._scan.findall(text)):
+            found.update(self._implied[longest])
+        return found
+
+    def count(self, text):
+        """포함된 서로 다른 문구 수"""
+        return len(self.found(text))
+
+    def matches(self, text):
+        """포함된 문구를 원래 목록 순서대로 반환"""
+        found = self.found(text)
+        return [phrase for phrase in self.phrases if phrase in found]
+
+
+def compile_any(patterns, flags=0):
+    """정규식 목록을 하나의 대안 패턴으로 컴파일 (`any(re.search(p, s) ...)`와 같은 결과)"""
+    return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns), flags)
+
+
+@lru_cache(maxsize=32)
+def _keyword_matcher(keywords):
+    return PhraseMatcher(keywords)
+
+
+def get_keyword_matcher(keywords):
+    """쉼표 구분 문자열 또는 리스트로 된 키워드의 매처 (같은 키워드는 한 번만 컴파일)"""
+    if isinstance(keywords, str):
+        keywords = [k.strip() for k in keywords.split(',') if k.strip()]
+    return _keyword_matcher(tuple(keywords))
+
+
+# ---- scraper.py 판정 함수에서 사용하는 지표 목록 ----
+
+MENU_TEXT_INDICATORS = PhraseMatcher([
+    # 로그인/계정 관련
+    'log in', 'sign in', 'account', 'my feed', 'manage account', 'log out',
+    'subscribe', 'newsletter', 'subscription',
+
+    # 메뉴/네비게이션
+    'menu', 'search', 'share', 'edition', 'search menu', 'breadcrumb',
+    'navigation', 'header', 'footer', 'sidebar',
+
+    # 사이트 섹션
+    'top stories', 'latest news', 'breaking news', 'live tv', 'podcasts',
+    'radio schedule', 'tv schedule', 'watch', 'listen',
+
+    # 카테고리
+    'business', 'sport', 'lifestyle', 'luxury', 'commentary', 'sustainability',
+    'singapore', 'asia', 'world', 'insider', 'cna explains',
+
+    # 기술적 요소
+    'news id', 'type landing_page', 'type all_videos', 'type all_vod', 'type all_podcasts',
+    'id 1822271', 'id 1821936', 'id 1821901', 'id 4310561', 'id 1821876',
+    'id 1821886', 'id 1821896', 'id 3384986', 'id 1881506', 'id 1821906',
+    'id 1821911', 'id 1821891', 'id 1431321', 'id 1822266', 'id 5197731',
+    'id 2005266', 'id 5191361',
+
+    # 기타 UI 요소
+    'find out what', 'submitted by', 'anonymous', 'verified', 'newsletters',
+    'get the best', 'select your', 'sent to your inbox', 'east asia',
+    'us/uk', 'cnar', 'cna938', 'documentaries & shows', 'news reports'
+])
+
+# ID 패턴 (News Id 1234567, Type landing_page 등)
+MENU_ID_PATTERN = re.compile(r'\b(id|type)\s+\d+|\b(id|type)\s+\w+_\w+')
+
+MENU_SENTENCE_PATTERNS = PhraseMatcher([
+    '내 피드 에디션 메뉴',
+    'sign in account my feed',
+    'edition menu edition',
+    '싱가포르 인도네시아 아시아',
+    'singapore indonesia asia',
+    'cna 라이프 스타일 럭셔리',
+    'cna lifestyle luxury',
+    'top stories', 'latest news', 'live tv',
+    'news id', 'type landing_page',
+    'search menu search edition'
+])
+
+MENU_SENTENCE_WORDS = frozenset([
+    'feed', 'edition', 'menu', 'account', 'sign', 'search',
+    'lifestyle', 'luxury', 'today', 'stories', 'news',
+    'singapore', 'indonesia', 'asia', 'cna', 'cnar'
+])
+
+MEANINGFUL_CONTENT_INDICATORS = PhraseMatcher([
+    'said', 'announced', 'reported', 'according to', 'in a statement',
+    'the government', 'the ministry', 'officials', 'spokesperson',
+    'singapore', 'minister', 'prime minister', 'parliament',
+    'economic', 'policy', 'development', 'growth', 'investment',
+    'will', 'would', 'can', 'could', 'should', 'may', 'might',
+    'new', 'project', 'plan', 'programme', 'service', 'system',
+    'million', 'billion', 'percent', 'year', 'month', 'week',
+    'company', 'business', 'market', 'price', 'cost', 'budget',
+    'people', 'public', 'residents', 'citizens', 'community'
+])
+
+LANDING_DEFINITE_INDICATORS = PhraseMatcher([
+    'sign in account my feed edition menu',
+    'type landing_page',
+    'news id 1822271 type landing_page',
+    'top stories id 1821936 type landing_page',
+    'latest news id 1822271 type landing_page'
+])
+
+LANDING_MENU_PATTERNS = [
+    re.compile(r'id \d+ type landing_page'),
+    re.compile(r'sign in account my feed edition menu'),
+    re.compile(r'edition menu edition singapore indonesia asia')
+]
+
+LANDING_MENU_WORDS = frozenset([
+    'sign', 'account', 'feed', 'edition', 'menu', 'search',
+    'landing_page', 'landing', 'type'
+])
+
+LANDING_ARTICLE_INDICATORS = PhraseMatcher([
+    'said', 'announced', 'reported', 'according to', 'minister', 'government',
+    'policy', 'economic', 'business', 'investment', 'development', 'growth',
+    'court', 'sentenced', 'charged', 'arrested', 'police', 'trial',
+    'company', 'market', 'shares', 'profit', 'revenue', 'customers',
+    'singapore', 'malaysian', 'indonesian', 'thai', 'vietnam'
+])
+
+INVALID_TITLE_INDICATORS = PhraseMatcher([
+    'newsletters', 'breaking news', 'sign up', 'login', 'register',
+    'share on whatsapp', 'yoursingapore story', 'featured',
+    'menu', 'search', 'edition'
+])
+
+FINAL_NEWS_INDICATORS = PhraseMatcher([
+    'said', 'announced', 'reported', 'according to', 'minister',
+    'government', 'policy', 'singapore', 'parliament', 'court',
+    'arrested', 'charged', 'sentenced', 'company', 'business',
+    'economy', 'investment', 'market', 'development', 'residents',
+    'citizens', 'public', 'authorities', 'officials', 'plan',
+    'project', 'programme', 'service', 'system', 'will', 'would',
+    'can', 'could', 'should', 'million', 'billion', 'percent',
+    'year', 'years', 'month', 'months', 'week', 'weeks', 'day', 'days'
+])
+
+REAL_ARTICLE_SIGNALS = PhraseMatcher([
+    # 인용구
+    'said', 'announced', 'reported', 'stated', 'explained', 'confirmed',
+    'according to', 'in a statement', 'speaking to', 'told reporters',
+
+    # 정부/기관
+    'government', 'ministry', 'minister', 'prime minister', 'parliament',
+    'official', 'spokesperson', 'department', 'agency',
+
+    # 지역/국가
+    'singapore', 'malaysian', 'indonesian', 'thai', 'asean',
+
+    # 수치/날짜
+    'percent', 'million', 'billion', 'year', 'month', 'week',
+    'january', 'february', 'march', 'april', 'may', 'june',
+    'july', 'august', 'september', 'october', 'november', 'december',
+
+    # 기사 내용
+    'policy', 'economic', 'growth', 'development', 'investment',
+    'business', 'market', 'industry', 'company', 'project'
+])
+
+# ---- is_valid_article_url 패턴 ----
+
+URL_EXCLUDE_PATTERNS = PhraseMatcher([
+    'javascript:', 'mailto:', 'tel:', '#', 'wa.me', 'whatsapp',
+    '.pdf', '.jpg', '.png', '.gif', '.mp4', '.css', '.js',
+    'subscribe', 'login', 'register', 'sign-up', 'newsletter-signup',
+    'privacy-policy', 'terms-of-service', 'contact-us', 'about-us',
+    '/search', '/tag/', '/topic/', '/category/', '/author/'
+])
+
+SITE_URL_PATTERNS = {
+    'cna': compile_any([
+        r'/singapore/[a-z0-9-]{5,}',          # 싱가포르 섹션 + 짧은 제목도 허용
+        r'/asia/[a-z0-9-]{5,}',               # 아시아 섹션
+        r'/world/[a-z0-9-]{5,}',              # 월드 섹션
+        r'/business/[a-z0-9-]{5,}',           # 비즈니스 섹션
+        r'/sport/[a-z0-9-]{5,}',              # 스포츠 섹션
+        r'/lifestyle/[a-z0-9-]{5,}',          # 라이프스타일 섹션
+        r'/commentary/[a-z0-9-]{5,}',         # 논평 섹션
+        r'/\d{4}/\d{2}/\d{2}/[a-z0-9-]{5,}',  # 날짜 패턴
+        r'/[a-z0-9-]{10,}-\d+$'               # 긴 제목-숫자 패턴
+    ]),
+    'straitstimes': compile_any([
+        r'/singapore/[a-zA-Z0-9-]{5,}',          # 싱가포르 섹션
+        r'/asia/[a-zA-Z0-9-/]{5,}',              # 아시아 섹션
+        r'/world/[a-zA-Z0-9-/]{5,}',             # 월드 섹션
+        r'/business/[a-zA-Z0-9-/]{5,}',          # 비즈니스 섹션
+        r'/sport/[a-zA-Z0-9-/]{5,}',             # 스포츠 섹션
+        r'/life/[a-zA-Z0-9-/]{5,}',              # 라이프 섹션
+        r'/opinion/[a-zA-Z0-9-]{5,}',            # 오피니언 섹션
+        r'/tech/[a-zA-Z0-9-]{5,}',               # 기술 섹션
+        r'/politics/[a-zA-Z0-9-]{5,}',           # 정치 섹션
+        r'/\d{4}/\d{2}/\d{2}/[a-zA-Z0-9-]{5,}',  # 날짜 패턴
+        r'/[a-zA-Z]{2,}/[a-zA-Z0-9-]{5,}',       # 두 글자 섹션
+        r'/[a-zA-Z0-9-]{10,}'                    # 일반 기사 패턴 (더 유연하게)
+    ]),
+    'businesstimes': compile_any([
+        r'/economy/[a-z0-9-]{5,}',            # 경제 섹션
+        r'/companies/[a-z0-9-]{5,}',          # 기업 섹션
+        r'/banking-finance/[a-z0-9-]{5,}',    # 금융 섹션
+        r'/asean/[a-z0-9-]{5,}',              # 아세안 섹션
+        r'/tech/[a-z0-9-]{5,}',               # 기술 섹션
+        r'/\d{4}/\d{2}/\d{2}/[a-z0-9-]{5,}',  # 날짜 패턴
+        r'/[a-z0-9-]{15,}$'                   # 긴 제목 URL
+    ]),
+    'sbr': compile_any([
+        r'/economy/[a-z0-9-]{5,}',                # 경제 섹션
+        r'/companies/[a-z0-9-]{5,}',              # 기업 섹션
+        r'/banking/[a-z0-9-]{5,}',                # 금융 섹션
+        r'/real-estate/[a-z0-9-]{5,}',            # 부동산 섹션
+        r'/technology/[a-z0-9-]{5,}',             # 기술 섹션
+        r'/startups/[a-z0-9-]{5,}',               # 스타트업 섹션
+        r'/sustainability/[a-z0-9-]{5,}',         # 지속가능성 섹션
+        r'/\d{4}/\d{2}/\d{2}/[a-z0-9-]{5,}',      # 날짜 패턴
+        r'/[a-z0-9-]{10,}$'                       # 기사 제목 URL
+    ]),
+    'moe': compile_any([
+        r'/news/[a-z0-9-]{5,}',                   # 뉴스
+        r'/press-releases/[a-z0-9-]{5,}',         # 보도자료
+        r'/parliamentary-replies/[a-z0-9-]{5,}',  # 국회 답변
+        r'/speeches/[a-z0-9-]{5,}',               # 연설
+        r'/initiatives/[a-z0-9-]{5,}',            # 이니셔티브
+        r'/policies/[a-z0-9-]{5,}',               # 정책
+        r'/programmes/[a-z0-9-]{5,}',             # 프로그램
+        r'/\d{4}/\d{2}/\d{2}/[a-z0-9-]{5,}',      # 날짜 패턴
+        r'/[a-z0-9-]{10,}$'                       # 긴 제목 URL
+    ]),
+    'nac': compile_any([
+        r'/whatson/[a-z0-9-]{5,}',                # 행사/프로그램
+        r'/engage/[a-z0-9-]{5,}',                 # 참여 프로그램
+        r'/news/[a-z0-9-]{5,}',                   # 뉴스
+        r'/press-releases/[a-z0-9-]{5,}',         # 보도자료
+        r'/events/[a-z0-9-]{5,}',                 # 이벤트
+        r'/programmes/[a-z0-9-]{5,}',             # 프로그램
+        r'/grants/[a-z0-9-]{5,}',                 # 보조금 정보
+        r'/initiatives/[a-z0-9-]{5,}',            # 이니셔티브
+        r'/\d{4}/\d{2}/\d{2}/[a-z0-9-]{5,}',      # 날짜 패턴
+        r'/[a-z0-9-]{10,}$'                       # 긴 제목 URL
+    ]),
+    'yahoo': compile_any([
+        r'/[a-zA-Z0-9-]+-\d+\.html',           # Yahoo 기사 패턴 (제목-숫자.html)
+        r'/news/[a-zA-Z0-9-]+',                # 뉴스 섹션
+        r'/singapore/[a-zA-Z0-9-]+',           # 싱가포르 섹션
+        r'/finance/[a-zA-Z0-9-]+',             # 금융 섹션
+        r'/lifestyle/[a-zA-Z0-9-]+',           # 라이프스타일 섹션
+        r'/[a-zA-Z0-9-]{15,}'                  # 긴 제목 URL
+    ]),
+    'mothership': compile_any([
+        r'/\d{4}/\d{2}/[a-zA-Z0-9-]+',         # 날짜 기반 URL
+        r'/[a-zA-Z0-9-]+-[a-zA-Z0-9-]+',       # 하이픈이 포함된 URL
+        r'/[a-zA-Z0-9-]{10,}'                  # 긴 제목 URL
+    ]),
+    'independent': compile_any([
+        r'/\d{4}/\d{2}/\d{2}/[a-zA-Z0-9-]+',   # 날짜 기반 URL
+        r'/[a-zA-Z0-9-]+-[a-zA-Z0-9-]+',       # 하이픈이 포함된 URL
+        r'/[a-zA-Z0-9-]{15,}'                  # 긴 제목 URL
+    ]),
+    'today': compile_any([
+        r'/singapore/[a-zA-Z0-9-]+',           # 싱가포르 섹션
+        r'/world/[a-zA-Z0-9-]+',               # 월드 섹션
+        r'/commentary/[a-zA-Z0-9-]+',          # 논평 섹션
+        r'/lifestyle/[a-zA-Z0-9-]+',           # 라이프스타일 섹션
+        r'/[a-zA-Z0-9-]+-\d+',                 # 제목-숫자 패턴
+        r'/[a-zA-Z0-9-]{15,}'                  # 긴 제목 URL
+    ]),
+    # 기본 패턴 (모든 사이트용) - 매우 관대하게
+    'general': compile_any([
+        r'/20\d{2}/\d{2}/\d{2}/[a-z0-9-]{3,}',   # 날짜 + 제목 패턴 (더 짧은 제목도 허용)
+        r'/articles?/[a-z0-9-]{3,}',             # 기사 URL
+        r'/news/[a-z0-9-]{3,}',                  # 뉴스 URL
+        r'/story/[a-z0-9-]{3,}',                 # 스토리 URL
+        r'/post/[a-z0-9-]{3,}',                  # 포스트 URL
+        r'/press-releases/[a-z0-9-]{3,}',        # 보도자료 URL
+        r'/events?/[a-z0-9-]{3,}',               # 이벤트 URL
+        r'/programmes?/[a-z0-9-]{3,}',           # 프로그램 URL
+        r'/initiatives?/[a-z0-9-]{3,}',          # 이니셔티브 URL
+        r'/policies/[a-z0-9-]{3,}',              # 정책 URL
+        r'/speeches/[a-z0-9-]{3,}',              # 연설 URL
+        r'/singapore/[a-z0-9-]{3,}',             # 싱가포르 섹션
+        r'/asia/[a-z0-9-]{3,}',                  # 아시아 섹션
+        r'/world/[a-z0-9-]{3,}',                 # 월드 섹션
+        r'/business/[a-z0-9-]{3,}',              # 비즈니스 섹션
+        r'/economy/[a-z0-9-]{3,}',               # 경제 섹션
+        r'/technology/[a-z0-9-]{3,}',            # 기술 섹션
+        r'/[a-z0-9-]{10,}$',                     # 긴 제목 URL (10자 이상)
+        r'/[a-z0-9-]+-\d+$',                     # 제목-숫자 패턴
+        r'/[a-z0-9-]+/[a-z0-9-]{5,}',            # 카테고리/제목 패턴
+        r'\w+://[^/]+/[^?#]+[a-zA-Z0-9-]{5,}'    # 일반적인 콘텐츠 URL (쿼리/앵커 제외)
+    ]),
+}
+
+CNA_SECTION_ROOTS = frozenset(['/singapore', '/asia', '/world', '/business', '/sport', '/lifestyle', '/commentary'])
+ST_EXCLUDE_PATTERNS = PhraseMatcher(['/multimedia/', '/graphics/', '/180'])
+MOTHERSHIP_EXCLUDE_PATTERNS = PhraseMatcher(['/category/', '/tag/', '/author/'])
@@ -0,0 +1,256 @@
+"""
+조건부 GET HTTP 캐시
+URL별로 본문과 ETag/Last-Modified를 디스크에 저장하고, 다음 실행에서
+If-None-Match/If-Modified-Since로 재검증해 304 응답은 디스크 본문으로 대체
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from http_session import get_http_pool
+
+DEFAULT_CACHE_DIR = 'data/cache/http'
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024  # 50MB
+
+# 본문은 디코딩된 상태로 저장하므로 전송 관련 헤더는 보관하지 않음
+SKIP_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection', 'set-cookie'}
+
+
+class HttpCache:
+    """ETag/Last-Modified 기반 디스크 캐시 (용량 초과 시 LRU 정리)"""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes = None
+        self._prefetched = {}
+        self.stats = {'hits': 0, 'misses': 0, 'stored': 0, 'evicted': 0, 'bytes_saved': 0}
+
+    def _paths(self, url):
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return (os.path.join(self.cache_dir, f'{key}.json'),
+                os.path.join(self.cache_dir, f'{key}.body'))
+
+    def _load_meta(self, url):
+        meta_path, _ = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_meta(self, meta_path, meta):
+        tmp_path = f'{meta_path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(tmp_path, meta_path)
+
+    @staticmethod
+    def conditional_headers(meta):
+        """저장된 검증자로 조건부 요청 헤더 생성"""
+        headers = {}
+        if meta:
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def request_headers(self, url, headers=None):
+        """요청 헤더에 저장된 검증자의 조건부 헤더 추가"""
+        request_headers = dict(headers or {})
+        request_headers.update(self.conditional_headers(self._load_meta(url)))
+        return request_headers
+
+    def add_prefetched(self, url, response):
+        """다른 수집 엔진(async_fetcher)이 미리 받은 응답 등록 - 다음 get(url)에서 한 번 사용"""
+        with self._lock:
+            self._prefetched[url] = response
+
+    def is_prefetched(self, url):
+        with self._lock:
+            return url in self._prefetched
+
+    def get(self, url, headers=None, **kwargs):
+        """조건부 GET 요청 (304면 디스크 본문으로 200 응답 구성)"""
+        meta = self._load_meta(url)
+        request_headers = dict(headers or {})
+        request_headers.update(self.conditional_headers(meta))
+
+        with self._lock:
+            response = self._prefetched.pop(url, None)
+        if response is None:
+            response = get_http_pool().get(url, headers=request_headers, **kwargs)
+
+        if response.status_code == 304 and meta:
+            cached = self._build_response(url, meta)
+            if cached is not None:
+                with self._lock:
+                    self.stats['hits'] += 1
+                    self.stats['bytes_saved'] += meta.get('size', 0)
+                return cached
+            # 본문 파일이 유실된 경우 조건 없이 다시 요청
+            response = get_http_pool().get(url, headers=headers, **kwargs)
+
+        response.from_cache = False
+        response.cache_key = url
+        with self._lock:
+            self.stats['misses'] += 1
+        if response.status_code == 200:
+            self._store(url, response)
+        return response
+
+    def _build_response(self, url, meta):
+        """저장된 본문으로 requests.Response 재구성"""
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(body_path, 'rb') as f:
+                body = f.read()
+        except OSError:
+            return None
+
+        # LRU 기준 시각 갱신
+        try:
+            os.utime(meta_path)
+        except OSError:
+            pass
+
+        response = requests.Response()
+        response.status_code = 200
+        response._content = body
+        response.headers = CaseInsensitiveDict(meta.get('headers', {}))
+        response.url = meta.get('final_url', url)
+        response.encoding = meta.get('encoding')
+        response.reason = 'OK'
+        response.from_cache = True
+        response.cache_key = url
+        return response
+
+    def _store(self, url, response):
+        """검증자가 있는 200 응답만 저장"""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+
+        body = response.content
+        meta = {
+            'url': url,
+            'final_url': response.url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'encoding': response.encoding,
+            'headers': {k: v for k, v in response.headers.items() if k.lower() not in SKIP_HEADERS},
+            'size': len(body),
+            'stored_at': time.time(),
+            'derived': {}
+        }
+
+        meta_path, body_path = self._paths(url)
+        try:
+            with self._lock:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                previous = self._entry_size(meta_path, body_path)
+                with open(f'{body_path}.tmp', 'wb') as f:
+                    f.write(body)
+                os.replace(f'{body_path}.tmp', body_path)
+                self._write_meta(meta_path, meta)
+                self.stats['stored'] += 1
+                self._adjust_total(self._entry_size(meta_path, body_path) - previous)
+                self._evict_if_needed()
+        except OSError as e:
+            print(f"[HTTP_CACHE] Failed to store {url}: {e}")
+
+    def get_derived(self, response, key):
+        """304로 재사용된 응답에 대해 이전에 저장한 파생 결과 반환"""
+        if not getattr(response, 'from_cache', False):
+            return None
+        meta = self._load_meta(response.cache_key)
+        if not meta:
+            return None
+        return meta.get('derived', {}).get(key)
+
+    def set_derived(self, url, key, value):
+        """캐시된 본문에서 계산한 결과(추출된 기사, 링크 등) 저장"""
+        meta_path, _ = self._paths(url)
+        with self._lock:
+            meta = self._load_meta(url)
+            if not meta:
+                return
+            meta.setdefault('derived', {})[key] = value
+            try:
+                self._write_meta(meta_path, meta)
+            except (OSError, TypeError, ValueError) as e:
+                print(f"[HTTP_CACHE] Failed to store derived '{key}' for {url}: {e}")
+
+    @staticmethod
+    def _entry_size(meta_path, body_path):
+        size = 0
+        for path in (meta_path, body_path):
+            try:
+                size += os.path.getsize(path)
+            except OSError:
+                pass
+        return size
+
+    def _adjust_total(self, delta):
+        if self._total_bytes is None:
+            self._total_bytes = self._scan_total()
+        else:
+            self._total_bytes += delta
+
+    def _scan_total(self):
+        total = 0
+        try:
+            for name in os.listdir(self.cache_dir):
+                total += os.path.getsize(os.path.join(self.cache_dir, name))
+        except OSError:
+            pass
+        return total
+
+    def _evict_if_needed(self):
+        """용량 초과 시 가장 오래 사용하지 않은 항목부터 삭제 (lock 보유 상태에서 호출)"""
+        if self._total_bytes is None or self._total_bytes <= self.max_bytes:
+            return
+
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.json'):
+                path = os.path.join(self.cache_dir, name)
+                try:
+                    entries.append((os.path.getmtime(path), name[:-5]))
+                except OSError:
+                    continue
+        entries.sort()
+
+        for _, key in entries:
+            if self._total_bytes <= self.max_bytes:
+                break
+            meta_path = os.path.join(self.cache_dir, f'{key}.json')
+            body_path = os.path.join(self.cache_dir, f'{key}.body')
+            size = self._entry_size(meta_path, body_path)
+            for path in (meta_path, body_path):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self._total_bytes -= size
+            self.stats['evicted'] += 1
+
+
+# 전역 HTTP 캐시 인스턴스
+http_cache = None
+
+
+def get_http_cache():
+    """HTTP 캐시 인스턴스 반환 (싱글톤)"""
+    global http_cache
+    if http_cache is None:
+        http_cache = HttpCache()
+    return http_cache
@@ -0,0 +1,341 @@
+"""
+공유 HTTP 세션 계층
+호스트별 requests.Session 풀(keep-alive), 재시도/백오프 정책, gzip/brotli 처리와
+도메인별 SiteAccessStrategy 헤더/쿠키 상태를 한 곳에서 관리
+페이지 요청은 스트리밍으로 받아 Content-Type을 먼저 확인하고 바이트 상한/종료 표식에서 읽기를 멈출 수 있음
+"""
+import threading
+import time
+from collections import namedtuple
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from adaptive_controller import get_domain_controller
+
+try:
+    from site_access_strategy import SiteAccessStrategy
+    SITE_STRATEGY_AVAILABLE = True
+except ImportError:
+    SITE_STRATEGY_AVAILABLE = False
+
+# brotli 디코더가 있을 때만 br 인코딩 요청 (없으면 응답 본문을 해석할 수 없음)
+try:
+    import brotli  # noqa: F401
+    BROTLI_AVAILABLE = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        BROTLI_AVAILABLE = True
+    except ImportError:
+        BROTLI_AVAILABLE = False
+
+ACCEPT_ENCODING = 'gzip, deflate, br' if BROTLI_AVAILABLE else 'gzip, deflate'
+DEFAULT_TIMEOUT = 10
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
+
+# 403/503은 차단 신호로 상위 fallback 로직이 처리하므로 재시도하지 않음
+RETRY_STATUS_CODES = (429, 500, 502, 504)
+
+# 페이지 스트리밍 수집 설정
+DEFAULT_MAX_PAGE_BYTES = 2 * 1024 * 1024  # 2MB (디코딩된 본문 기준)
+DEFAULT_MAX_LISTING_BYTES = 10 * 1024 * 1024  # 10MB (홈페이지/목록 페이지, 뒤쪽 기사 링크까지 받도록)
+PAGE_CONTENT_TYPES = ('text/html', 'application/xhtml+xml', 'application/xml', 'text/xml', 'text/plain')
+STREAM_CHUNK_SIZE = 16 * 1024
+
+# max_bytes: 읽을 최대 바이트, stop_markers: 이 문자열이 나오면 읽기 중단, content_types: 허용 Content-Type
+PageLimits = namedtuple('PageLimits', ['max_bytes', 'stop_markers', 'content_types'],
+                        defaults=(DEFAULT_MAX_PAGE_BYTES, (), PAGE_CONTENT_TYPES))
+
+# settings.json의 pageFetch 옵션 (configure_page_limits로 설정)
+_page_fetch_options = {'enabled': True, 'maxBytes': DEFAULT_MAX_PAGE_BYTES,
+                       'maxListingBytes': DEFAULT_MAX_LISTING_BYTES, 'stopMarkers': {}}
+
+
+class UnsupportedContentError(requests.RequestException):
+    """페이지가 아닌 응답 (PDF, 동영상, 이미지 등) - 본문을 받지 않고 중단"""
+
+
+def configure_page_limits(settings):
+    """settings의 pageFetch 옵션 적용
+
+    maxBytes는 기사 요청, maxListingBytes는 홈페이지/목록 요청의 상한
+    stopMarkers는 도메인별 목록 (예: {"example.com": ["</article>"]}) - 기사 요청에만 적용
+    """
+    options = settings.get('pageFetch', {})
+    _page_fetch_options.update({
+        'enabled': options.get('enabled', True),
+        'maxBytes': int(options.get('maxBytes', DEFAULT_MAX_PAGE_BYTES)),
+        'maxListingBytes': int(options.get('maxListingBytes', DEFAULT_MAX_LISTING_BYTES)),
+        'stopMarkers': dict(options.get('stopMarkers', {}))
+    })
+
+
+def get_page_limits(url, article=False):
+    """URL의 PageLimits (pageFetch가 꺼져 있으면 None)
+
+    종료 표식과 기사 상한은 기사 요청에만 사용 (홈페이지는 첫 </article>이나 2MB에서 끊기면
+    뒤쪽 기사 링크를 잃으므로 더 큰 목록 상한만 적용)
+    """
+    if not _page_fetch_options['enabled']:
+        return None
+    if not article:
+        return PageLimits(_page_fetch_options['maxListingBytes'])
+    markers = ()
+    domain = urlparse(url).netloc.lower()
+    for site_domain, site_markers in _page_fetch_options['stopMarkers'].items():
+        if site_domain in domain:
+            markers = tuple(site_markers)
+            break
+    return PageLimits(_page_fetch_options['maxBytes'], markers)
+
+
+def check_content_type(headers, limits):
+    """허용되지 않은 Content-Type이면 UnsupportedContentError (헤더가 없으면 통과)"""
+    content_type = headers.get('Content-Type', '').split(';')[0].strip().lower()
+    if content_type and content_type not in limits.content_types:
+        raise UnsupportedContentError(f"Unsupported content type: {content_type}")
+
+
+class LimitedBody:
+    """청크를 모으다가 바이트 상한이나 종료 표식에서 멈추는 본문 버퍼"""
+
+    def __init__(self, limits):
+        self.max_bytes = limits.max_bytes
+        self.markers = [m.lower().encode('utf-8') if isinstance(m, str) else m.lower() for m in limits.stop_markers]
+        self._keep = max((len(m) for m in self.markers), default=1) - 1
+        self._chunks = []
+        self._tail = b''
+        self.size = 0
+        self.truncated = None
+
+    def feed(self, chunk):
+        """청크 추가, 더 읽을 필요가 없으면 True"""
+        room = self.max_bytes - self.size
+        if len(chunk) >= room:
+            chunk = chunk[:room]
+            self.truncated = 'max_bytes'
+        self._chunks.append(chunk)
+        self.size += len(chunk)
+
+        if self.markers:
+            window = (self._tail + chunk).lower()
+            if any(marker in window for marker in self.markers):
+                self.truncated = 'marker'
+            self._tail = window[-self._keep:] if self._keep else b''
+        return self.truncated is not None
+
+    @property
+    def content(self):
+        return b''.join(self._chunks)
+
+
+def read_limited(response, limits):
+    """스트리밍 응답 본문을 제한에 맞춰 읽고 response.content로 설정
+
+    200이 아닌 응답(304, 오류 페이지)은 그대로 읽음
+    response.truncated: None(전부 읽음), 'max_bytes', 'marker'
+    """
+    response.truncated = None
+    if response.status_code != 200:
+        response.content
+        return response
+
+    try:
+        check_content_type(response.headers, limits)
+    except UnsupportedContentError:
+        response.close()
+        raise
+
+    declared = response.headers.get('Content-Length', '')
+    if declared.isdigit() and int(declared) > limits.max_bytes:
+        print(f"[HTTP] {response.url}: {int(declared)} bytes declared, reading first {limits.max_bytes}")
+
+    body = LimitedBody(limits)
+    for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+        if body.feed(chunk):
+            break
+
+    if body.truncated:
+        # 남은 본문이 있는 연결은 재사용하지 않음
+        response.raw.close()
+    response._content = body.content
+    response._content_consumed = True
+    response.truncated = body.truncated
+    response.close()
+    return response
+
+
+class HttpSessionPool:
+    """호스트별 keep-alive 세션 풀
+
+    도메인 컨트롤러가 재시도 횟수를 바꾸면 사용 중인 세션의 어댑터를 교체하지 않고
+    (호스트, 재시도 횟수)별 세션을 따로 두며, 같은 호스트의 세션은 쿠키를 공유
+    """
+
+    def __init__(self, retries=2, backoff_factor=0.5, pool_maxsize=10):
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.pool_maxsize = pool_maxsize
+        self._sessions = {}
+        self._strategies = {}
+        self._lock = threading.Lock()
+        self.stats = {'requests': 0, 'sessions_created': 0, 'truncated': 0, 'unsupported': 0}
+
+    @staticmethod
+    def _host_key(url):
+        return urlparse(url).netloc.lower()
+
+    def _mount_adapter(self, session, retries):
+        """재시도 정책과 커넥션 풀이 설정된 어댑터 연결"""
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=retries,
+            status=retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset(['GET', 'HEAD']),
+            respect_retry_after_header=False,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(max_retries=retry, pool_connections=4, pool_maxsize=self.pool_maxsize)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+
+    def _build_session(self, retries):
+        """재시도 정책과 커넥션 풀이 설정된 세션 생성"""
+        session = requests.Session()
+        self._mount_adapter(session, retries)
+        session.headers.update({
+            'User-Agent': DEFAULT_USER_AGENT,
+            'Accept-Encoding': ACCEPT_ENCODING,
+            'Connection': 'keep-alive'
+        })
+        return session
+
+    def get_session(self, url, retries=None):
+        """URL 호스트와 재시도 횟수에 해당하는 세션 반환 (없으면 생성)"""
+        host = self._host_key(url)
+        retries = self.retries if retries is None else retries
+        with self._lock:
+            session = self._sessions.get((host, retries))
+            if session is None:
+                session = self._build_session(retries)
+                # 같은 호스트의 다른 세션이 있으면 쿠키 공유
+                sibling = next((s for (h, _), s in self._sessions.items() if h == host), None)
+                if sibling is not None:
+                    session.cookies = sibling.cookies
+                self._sessions[(host, retries)] = session
+                self.stats['sessions_created'] += 1
+            return session
+
+    def get_strategy(self, url):
+        """도메인별 접근 전략 반환
+
+        User-Agent/헤더/쿠키는 도메인당 한 번 정해 같은 세션에서 일관되게 유지하고,
+        딜레이는 호출마다 새로 계산
+        """
+        if not SITE_STRATEGY_AVAILABLE:
+            return {'headers': {}, 'cookies': {}, 'delay': 0, 'retry_count': 2,
+                    'use_session': True, 'user_agent': DEFAULT_USER_AGENT}
+
+        strategy = SiteAccessStrategy.get_strategy(url)
+        host = self._host_key(url)
+        with self._lock:
+            state = self._strategies.get(host)
+            if state is None:
+                state = {
+                    'headers': self._normalize_headers(strategy['headers']),
+                    'cookies': dict(strategy.get('cookies', {})),
+                    'user_agent': strategy['user_agent']
+                }
+                self._strategies[host] = state
+        strategy['headers'] = dict(state['headers'])
+        strategy['cookies'] = dict(state['cookies'])
+        strategy['user_agent'] = state['user_agent']
+
+        # 적응형 제어: 차단하는 도메인은 딜레이를 늘리고 건강한 도메인은 줄임
+        controller = get_domain_controller()
+        if controller is not None:
+            strategy['delay'] = controller.scale_delay(url, strategy['delay'])
+            strategy['retry_count'] = controller.retries(url, strategy['retry_count'])
+        return strategy
+
+    @staticmethod
+    def _normalize_headers(headers):
+        """brotli 미설치 환경에서 br 인코딩 요청 제거"""
+        headers = dict(headers or {})
+        for key in list(headers):
+            if key.lower() == 'accept-encoding':
+                headers[key] = ACCEPT_ENCODING
+        return headers
+
+    def get(self, url, headers=None, cookies=None, timeout=DEFAULT_TIMEOUT, limits=None, retries=None, **kwargs):
+        """호스트 세션을 통한 GET 요청
+
+        도메인 컨트롤러가 설정되어 있으면 관측된 p95 기반 타임아웃을 쓰고,
+        차단하는 도메인은 재시도하지 않으며, 응답 시간/상태를 기록
+        limits(PageLimits)를 주면 스트리밍으로 받아 Content-Type 확인 후 상한까지만 읽음
+        retries를 주면 세션 기본 재시도 대신 사용 (호출 측이 직접 재시도하면 0)
+        """
+        retries = self.retries if retries is None else retries
+        controller = get_domain_controller()
+        if controller is not None:
+            timeout = controller.timeout(url, timeout)
+            retries = controller.retries(url, retries)
+        session = self.get_session(url, retries)
+        with self._lock:
+            self.stats['requests'] += 1
+        if limits is not None:
+            kwargs['stream'] = True
+
+        start = time.time()
+        try:
+            response = session.get(url, headers=self._normalize_headers(headers), cookies=cookies,
+                                   timeout=timeout, **kwargs)
+            if limits is not None:
+                read_limited(response, limits)
+        except (requests.Timeout, requests.ConnectionError):
+            if controller is not None:
+                controller.record(url, time.time() - start, error=True)
+            raise
+        except UnsupportedContentError:
+            with self._lock:
+                self.stats['unsupported'] += 1
+            raise
+
+        if controller is not None:
+            controller.record(url, time.time() - start, response.status_code)
+        if getattr(response, 'truncated', None):
+            with self._lock:
+                self.stats['truncated'] += 1
+        return response
+
+    def head(self, url, headers=None, timeout=DEFAULT_TIMEOUT, **kwargs):
+        """호스트 세션을 통한 HEAD 요청"""
+        session = self.get_session(url)
+        with self._lock:
+            self.stats['requests'] += 1
+        return session.head(url, headers=self._normalize_headers(headers), timeout=timeout, **kwargs)
+
+    def close(self):
+        """모든 세션 종료"""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+# 전역 세션 풀 인스턴스
+http_pool = None
+
+
+def get_http_pool():
+    """HTTP 세션 풀 인스턴스 반환 (싱글톤)"""
+    global http_pool
+    if http_pool is None:
+        http_pool = HttpSessionPool()
+    return http_pool
@@ -104,7 +104,8 @@ class HybridScraper:
         
         try:
             if ai_scraper.model:
-                response = ai_scraper.model.generate_content(prompt)
+                ai_scraper._rate_limit()
+                response = ai_scraper._generate(prompt)
                 return 'YES' in response.text.upper()
         except:
             pass
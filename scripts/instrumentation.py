@@ -0,0 +1,144 @@
+"""
+실행 단계별 계측 (시간/카운터)
+fetch, parse, 링크 추출, 검증, AI 분류/추출, 요약 단계를 사이트별로 측정해
+실행마다 JSON 프로파일로 저장 (monitoring.save_run_profile)
+"""
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+# 프로파일에 남길 느린 사이트 수
+TOP_SITES = 5
+
+# 다른 단계 안에서(parse는 extract/링크 추출 안) 또는 겹쳐서(prefetch는 fetch와) 측정되는 단계
+# 사이트 총 시간을 단계 합으로 계산할 때 제외 (중복 집계 방지)
+NESTED_STAGES = ('parse', 'prefetch')
+
+
+def _new_timing():
+    return {'count': 0, 'total': 0.0, 'max': 0.0}
+
+
+def _add_timing(timing, seconds):
+    timing['count'] += 1
+    timing['total'] += seconds
+    timing['max'] = max(timing['max'], seconds)
+
+
+def _round_timings(timings):
+    return {
+        stage: {'count': t['count'], 'total': round(t['total'], 3), 'max': round(t['max'], 3)}
+        for stage, t in sorted(timings.items(), key=lambda item: -item[1]['total'])
+    }
+
+
+class RunProfiler:
+    """단계별 소요 시간과 카운터 (전체 및 사이트별, 스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.started_at = datetime.now()
+            self._start = time.time()
+            self.stages = {}
+            self.counters = {}
+            self.sites = {}
+
+    def _site_entry(self, site):
+        entry = self.sites.get(site)
+        if entry is None:
+            entry = self.sites[site] = {'stages': {}, 'counters': {}, 'wall': 0.0, 'timed': False}
+        return entry
+
+    @property
+    def current_site(self):
+        return getattr(self._local, 'site', None)
+
+    @contextmanager
+    def site(self, name):
+        """블록 안에서 기록되는 단계/카운터를 이 사이트로 태그 (현재 스레드 한정)
+        
+        블록의 실제 경과 시간을 사이트 총 시간으로 누적 (같은 사이트 안에 중첩되면 바깥 블록만)
+        """
+        previous = self.current_site
+        if previous == name:
+            yield
+            return
+        self._local.site = name
+        start = time.time()
+        try:
+            yield
+        finally:
+            self._local.site = previous
+            with self._lock:
+                entry = self._site_entry(name)
+                entry['wall'] += time.time() - start
+                entry['timed'] = True
+
+    def record(self, stage, seconds, site=None):
+        site = site or self.current_site
+        with self._lock:
+            _add_timing(self.stages.setdefault(stage, _new_timing()), seconds)
+            if site:
+                _add_timing(self._site_entry(site)['stages'].setdefault(stage, _new_timing()), seconds)
+
+    @contextmanager
+    def timer(self, stage, site=None):
+        """블록 소요 시간을 stage로 기록 (예외가 나도 기록)"""
+        start = time.time()
+        try:
+            yield
+        finally:
+            self.record(stage, time.time() - start, site)
+
+    def incr(self, counter, amount=1, site=None):
+        site = site or self.current_site
+        with self._lock:
+            self.counters[counter] = self.counters.get(counter, 0) + amount
+            if site:
+                counters = self._site_entry(site)['counters']
+                counters[counter] = counters.get(counter, 0) + amount
+
+    @staticmethod
+    def _site_total(entry):
+        """사이트 총 시간: site 블록 경과 시간, 없으면 최상위 단계 합"""
+        if entry['timed']:
+            return entry['wall']
+        return sum(t['total'] for stage, t in entry['stages'].items() if stage not in NESTED_STAGES)
+
+    def to_dict(self):
+        """JSON으로 저장할 실행 프로파일"""
+        with self._lock:
+            sites = {
+                name: {
+                    'total': round(self._site_total(entry), 3),
+                    'stages': _round_timings(entry['stages']),
+                    'counters': dict(entry['counters'])
+                }
+                for name, entry in self.sites.items()
+            }
+            return {
+                'started_at': self.started_at.isoformat(),
+                'duration': round(time.time() - self._start, 3),
+                'stages': _round_timings(self.stages),
+                'counters': dict(sorted(self.counters.items())),
+                'slowest_sites': sorted(sites, key=lambda name: -sites[name]['total'])[:TOP_SITES],
+                'sites': sites
+            }
+
+
+# 전역 프로파일러 인스턴스
+profiler = None
+
+
+def get_profiler():
+    """실행 프로파일러 인스턴스 반환 (싱글톤)"""
+    global profiler
+    if profiler is None:
+        profiler = RunProfiler()
+    return profiler
@@ -202,6 +202,28 @@ def save_monitoring_log(summary):
     with open(log_file, 'w', encoding='utf-8') as f:
         json.dump(logs, f, ensure_ascii=False, indent=2)
 
+def save_run_profile(profile, keep=30):
+    """실행 프로파일(단계별 시간/카운터) 저장 - 최근 keep개 파일만 유지"""
+    log_dir = 'data/monitoring'
+    os.makedirs(log_dir, exist_ok=True)
+    
+    profile_file = os.path.join(log_dir, f"profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    with open(profile_file, 'w', encoding='utf-8') as f:
+        json.dump(profile, f, ensure_ascii=False, indent=2)
+    
+    # 오래된 프로파일 정리
+    profiles = sorted(name for name in os.listdir(log_dir) if name.startswith('profile_') and name.endswith('.json'))
+    for name in profiles[:-keep]:
+        os.remove(os.path.join(log_dir, name))
+    
+    # 소요 시간이 큰 단계 출력
+    print(f"[PROFILE] Run took {profile.get('duration', 0):.1f}s, saved to {profile_file}")
+    for stage, timing in list(profile.get('stages', {}).items())[:5]:
+        print(f"[PROFILE]   {stage}: {timing['total']:.1f}s ({timing['count']} calls, max {timing['max']:.1f}s)")
+    if profile.get('slowest_sites'):
+        print(f"[PROFILE] Slowest sites: {', '.join(profile['slowest_sites'])}")
+    return profile_file
+
 if __name__ == "__main__":
     # 테스트 실행
     print("Testing monitoring system...")
@@ -0,0 +1,155 @@
+"""
+파싱된 HTML 문서
+페이지마다 한 번만 파싱하고, 트리/텍스트/메타데이터를 분류, 날짜 추출, 본문 추출, 검증 단계에서 함께 사용
+트리를 바꾸지 않는 텍스트 추출 함수를 제공해 여러 단계가 같은 트리를 공유할 수 있음
+"""
+import json
+import time
+from bs4 import BeautifulSoup, NavigableString, CData, Tag
+from instrumentation import get_profiler
+
+try:
+    import lxml  # noqa: F401
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+DEFAULT_PARSER = 'html.parser'
+
+# get_text()가 포함하는 문자열 타입 (주석, 스크립트, 스타일 제외)
+TEXT_STRING_TYPES = (NavigableString, CData)
+
+_default_parser = DEFAULT_PARSER
+
+
+def set_default_parser(parser):
+    """기본 파서 설정 ('html.parser' 또는 'lxml', lxml이 없으면 html.parser 사용)"""
+    global _default_parser
+    if parser == 'lxml' and not LXML_AVAILABLE:
+        print("[PARSER] lxml not installed, using html.parser")
+        parser = DEFAULT_PARSER
+    _default_parser = parser or DEFAULT_PARSER
+    return _default_parser
+
+
+def get_default_parser():
+    return _default_parser
+
+
+def _is_skipped(node, exclude_tags, exclude_ids):
+    return isinstance(node, Tag) and (node.name in exclude_tags or id(node) in exclude_ids)
+
+
+def element_text(node, exclude_tags=(), exclude_elements=()):
+    """트리를 바꾸지 않고 제외할 태그/요소 아래 텍스트를 뺀 get_text() 결과"""
+    if not exclude_tags and not exclude_elements:
+        return node.get_text()
+    exclude_tags = set(exclude_tags)
+    exclude_ids = {id(elem) for elem in exclude_elements}
+    parts = []
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, Tag):
+            if current is not node and _is_skipped(current, exclude_tags, exclude_ids):
+                continue
+            stack.extend(reversed(current.contents))
+        elif type(current) in TEXT_STRING_TYPES:
+            parts.append(str(current))
+    return ''.join(parts)
+
+
+def is_excluded(element, exclude_tags=(), exclude_elements=(), root=None):
+    """요소 자신이나 (root까지의) 상위 요소가 제외 대상이면 True"""
+    exclude_ids = {id(elem) for elem in exclude_elements}
+    node = element
+    while node is not None and node is not root:
+        if _is_skipped(node, exclude_tags, exclude_ids):
+            return True
+        node = node.parent
+    return False
+
+
+class ParsedDocument:
+    """원본 바이트, 지연 생성 트리, 추출 텍스트, 메타데이터"""
+
+    def __init__(self, content, url='', parser=None):
+        self.url = url
+        self.parser = parser or _default_parser
+        self._source = content if content is not None else b''
+        self._soup = None
+        self._texts = {}
+        self._metadata = None
+
+    @classmethod
+    def wrap(cls, value, url=''):
+        """이미 ParsedDocument면 그대로, 문자열/바이트면 새 문서로 감싸서 반환"""
+        if isinstance(value, cls):
+            return value
+        return cls(value, url)
+
+    @property
+    def raw(self):
+        if isinstance(self._source, bytes):
+            return self._source
+        return self._source.encode('utf-8')
+
+    @property
+    def html(self):
+        if isinstance(self._source, bytes):
+            return self._source.decode('utf-8', errors='ignore')
+        return self._source
+
+    @property
+    def is_parsed(self):
+        return self._soup is not None
+
+    @property
+    def soup(self):
+        """처음 접근할 때 한 번만 파싱한 트리 (공유 트리이므로 decompose 등으로 수정하지 말 것)"""
+        if self._soup is None:
+            start = time.time()
+            self._soup = BeautifulSoup(self._source, self.parser)
+            get_profiler().record('parse', time.time() - start)
+        return self._soup
+
+    def text(self, exclude_tags=()):
+        """문서 전체 텍스트 (제외 태그별로 한 번만 계산)"""
+        key = tuple(sorted(exclude_tags))
+        if key not in self._texts:
+            self._texts[key] = element_text(self.soup, key)
+        return self._texts[key]
+
+    @property
+    def metadata(self):
+        """<title>, meta 태그(name/property/itemprop 소문자 → content), JSON-LD 객체 목록('json_ld')"""
+        if self._metadata is None:
+            metadata = {}
+            title = self.soup.find('title')
+            if title:
+                metadata['title'] = title.get_text().strip()
+            for meta in self.soup.find_all('meta'):
+                key = meta.get('property') or meta.get('name') or meta.get('itemprop')
+                if key and meta.get('content') and key.lower() not in metadata:
+                    metadata[key.lower()] = meta['content'].strip()
+            metadata['json_ld'] = self._json_ld()
+            self._metadata = metadata
+        return self._metadata
+
+    def _json_ld(self):
+        """application/ld+json 스크립트의 객체 목록 (배열과 @graph는 펼침, 잘못된 JSON은 무시)"""
+        objects = []
+        for script in self.soup.find_all('script', {'type': 'application/ld+json'}):
+            try:
+                data = json.loads(script.string or '')
+            except ValueError:
+                continue
+            stack = data if isinstance(data, list) else [data]
+            for item in stack:
+                if isinstance(item, dict):
+                    objects.append(item)
+                    objects.extend(node for node in item.get('@graph', []) if isinstance(node, dict))
+        return objects
+
+    def __len__(self):
+        return len(self._source)
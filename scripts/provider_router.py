@@ -0,0 +1,242 @@
+"""
+한글 요약 제공자 라우팅
+apiPriority의 제공자(cohere, gemini 등)별로 최근 응답 시간, 오류율, 남은 월간 할당량을 기록해
+- 요청마다 예상 소요 시간이 가장 짧은 제공자를 먼저 호출하고
+- 그 제공자의 p90 응답 시간이 지나도 결과가 없으면 두 번째 제공자를 함께 호출해 먼저 온 유효한 결과를 사용
+- 실패하면 다음 제공자를 바로 호출
+- 통계는 data/cache/provider_stats.json에 저장해 다음 실행도 좋은 순서로 시작
+"""
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime
+
+from rate_limiter import get_rate_limiter
+
+DEFAULT_STATE_FILE = 'data/cache/provider_stats.json'
+DEFAULT_TIMEOUT = 30
+DEFAULT_LATENCY = 3.0      # 기록이 없는 제공자의 예상 응답 시간 (초)
+DEFAULT_HEDGE_DELAY = 6.0  # 기록이 없을 때 두 번째 제공자를 부르기까지 기다리는 시간
+MIN_HEDGE_DELAY = 1.0
+WINDOW = 50                # 제공자별로 보관하는 최근 호출 수
+HEDGE_PERCENTILE = 0.9
+
+# 제공자별 월간 호출 한도 (없으면 무제한)
+DEFAULT_MONTHLY_QUOTA = {'cohere': 1000}  # 트라이얼 키 월 1000회
+
+
+def percentile(values, q):
+    """정렬하지 않은 값 목록의 q 분위수 (없으면 None)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+class ProviderRouter:
+    """제공자 통계 기반 라우팅과 헤징 (스레드 안전)
+
+    - hedge: False면 두 번째 제공자는 첫 제공자가 실패했을 때만 호출
+    - timeout: 한 요청 전체 상한 (초과하면 실패, 실행 중인 호출의 결과는 통계에만 반영)
+    - limiter_for: 제공자 이름 → 분당 한도 토큰 버킷 (기본은 요약 함수와 공유하는 rate_limiter 버킷)
+    """
+
+    def __init__(self, state_file=DEFAULT_STATE_FILE, hedge=True, timeout=DEFAULT_TIMEOUT, monthly_quota=None,
+                 limiter_for=get_rate_limiter):
+        self.state_file = state_file
+        self.limiter_for = limiter_for
+        self.hedge = hedge
+        self.timeout = timeout
+        self.monthly_quota = DEFAULT_MONTHLY_QUOTA if monthly_quota is None else monthly_quota
+        self._stats = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    @classmethod
+    def from_settings(cls, settings):
+        """settings.json의 providerRouting 옵션으로 생성"""
+        options = settings.get('providerRouting', {})
+        return cls(
+            hedge=options.get('hedge', True),
+            timeout=options.get('timeout', DEFAULT_TIMEOUT),
+            monthly_quota=options.get('monthlyQuota')
+        )
+
+    def _load(self):
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                self._stats = json.load(f).get('providers', {})
+        except (OSError, ValueError):
+            self._stats = {}
+
+    def save(self):
+        """제공자 통계 저장"""
+        with self._lock:
+            data = {'updated_at': time.time(), 'providers': self._stats}
+            try:
+                os.makedirs(os.path.dirname(self.state_file) or '.', exist_ok=True)
+                tmp_path = f'{self.state_file}.tmp'
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
+                os.replace(tmp_path, self.state_file)
+            except OSError as e:
+                print(f"[ROUTER] Failed to save provider stats: {e}")
+
+    def _entry(self, name):
+        """제공자 통계 항목 (달이 바뀌면 월간 호출 수 초기화, 잠금 안에서 호출)"""
+        month = datetime.now().strftime('%Y-%m')
+        entry = self._stats.setdefault(name, {'latencies': [], 'outcomes': [], 'month': month, 'calls': 0})
+        if entry.get('month') != month:
+            entry['month'] = month
+            entry['calls'] = 0
+        return entry
+
+    def record(self, name, elapsed, ok):
+        """호출 결과 기록 (성공한 호출만 응답 시간 분포에 포함)"""
+        with self._lock:
+            entry = self._entry(name)
+            entry['calls'] += 1
+            entry['outcomes'] = (entry['outcomes'] + [1 if ok else 0])[-WINDOW:]
+            if ok:
+                entry['latencies'] = (entry['latencies'] + [round(elapsed, 3)])[-WINDOW:]
+
+    def latency(self, name, q=0.5):
+        """최근 성공 호출의 q 분위 응답 시간 (기록이 없으면 None)"""
+        with self._lock:
+            return percentile(list(self._stats.get(name, {}).get('latencies', [])), q)
+
+    def error_rate(self, name):
+        """최근 호출 중 실패 비율 (기록이 없으면 0)"""
+        with self._lock:
+            outcomes = self._stats.get(name, {}).get('outcomes', [])
+            return 1 - sum(outcomes) / len(outcomes) if outcomes else 0.0
+
+    def remaining_quota(self, name):
+        """이번 달 남은 호출 수 (한도가 없으면 None)"""
+        quota = self.monthly_quota.get(name)
+        if quota is None:
+            return None
+        with self._lock:
+            return max(0, quota - self._entry(name)['calls'])
+
+    def expected_cost(self, name):
+        """성공 결과를 얻기까지 예상 시간 = (중앙 응답 시간 / 성공률) + 속도 제한 대기"""
+        with self._lock:
+            outcomes = self._stats.get(name, {}).get('outcomes', [])
+            success_rate = (sum(outcomes) + 1) / (len(outcomes) + 2)
+        median = self.latency(name)
+        return (median if median is not None else DEFAULT_LATENCY) / success_rate \
+            + self.limiter_for(name).peek_wait()
+
+    def rank(self, providers):
+        """[(이름, func)]를 예상 비용 순으로 정렬 (할당량이 끝난 제공자 제외, 같으면 원래 우선순위)"""
+        available = [(index, provider) for index, provider in enumerate(providers)
+                     if self.remaining_quota(provider[0]) != 0]
+        return [provider for _, provider in sorted(
+            available, key=lambda item: (self.expected_cost(item[1][0]), item[0]))]
+
+    def hedge_delay(self, name):
+        """두 번째 제공자를 함께 호출하기까지 기다리는 시간 (첫 제공자의 p90 응답 시간)"""
+        p90 = self.latency(name, HEDGE_PERCENTILE)
+        if p90 is None:
+            return DEFAULT_HEDGE_DELAY
+        return min(max(p90, MIN_HEDGE_DELAY), self.timeout)
+
+    def _timed(self, name, func, args):
+        def call():
+            start = time.time()
+            try:
+                result = func(*args)
+            except Exception as e:
+                print(f"[ROUTER] {name} failed: {type(e).__name__}: {e}")
+                result = None
+            self.record(name, time.time() - start, bool(result))
+            return result
+        return call
+
+    def route(self, providers, *args, validate=None):
+        """providers [(이름, func)] 중 가장 좋은 제공자로 func(*args) 호출, (결과, 이름) 반환
+
+        모두 실패하거나 timeout을 넘기면 (None, None)
+        """
+        validate = validate or bool
+        pending = self.rank(providers)
+        if not pending:
+            return None, None
+
+        start = time.time()
+        deadline = start + self.timeout
+        hedge_at = start + self.hedge_delay(pending[0][0]) if self.hedge else None
+        executor = ThreadPoolExecutor(max_workers=len(pending), thread_name_prefix='provider')
+        running = {}
+
+        def launch():
+            name, func = pending.pop(0)
+            running[executor.submit(self._timed(name, func, args))] = name
+
+        try:
+            launch()
+            while running:
+                now = time.time()
+                if now >= deadline:
+                    print(f"[ROUTER] Timed out after {self.timeout}s")
+                    break
+                wait_for = deadline - now
+                if pending and hedge_at is not None:
+                    wait_for = max(0, min(wait_for, hedge_at - now))
+                done, _ = wait(running, timeout=wait_for, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    name = running.pop(future)
+                    result = future.result()
+                    if validate(result):
+                        return result, name
+
+                if not pending:
+                    continue
+                if done and not running:
+                    # 실행 중인 제공자가 모두 실패하면 다음 제공자를 바로 호출
+                    launch()
+                elif hedge_at is not None and time.time() >= hedge_at:
+                    # p90이 지나도 응답이 없으면 두 번째 제공자를 한 번만 함께 호출
+                    print(f"[ROUTER] Hedging to {pending[0][0]} after {time.time() - start:.1f}s")
+                    hedge_at = None
+                    launch()
+            return None, None
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_stats(self):
+        with self._lock:
+            names = list(self._stats)
+        return {
+            name: {
+                'p50': self.latency(name),
+                'p90': self.latency(name, HEDGE_PERCENTILE),
+                'error_rate': round(self.error_rate(name), 3),
+                'remaining_quota': self.remaining_quota(name)
+            }
+            for name in names
+        }
+
+
+# 전역 인스턴스 (providerRouting이 꺼져 있으면 None)
+provider_router = None
+
+
+def configure_provider_router(settings):
+    """settings의 providerRouting.enabled에 따라 전역 인스턴스 생성/해제"""
+    global provider_router
+    if settings.get('providerRouting', {}).get('enabled', False):
+        if provider_router is None:
+            provider_router = ProviderRouter.from_settings(settings)
+    else:
+        provider_router = None
+    return provider_router
+
+
+def get_provider_router():
+    """전역 제공자 라우터 (설정되지 않았으면 None)"""
+    return provider_router
@@ -0,0 +1,117 @@
+"""
+AI API 호출용 토큰 버킷 속도 제한기
+제공자(gemini, cohere)별로 하나의 버킷을 공유해 같은 API 키의 분당 한도를 지킴
+대기는 호출한 스레드/코루틴에서만 일어나므로 수집·파싱 작업은 계속 진행됨
+"""
+import asyncio
+import threading
+import time
+from collections import deque
+
+# 제공자별 분당 한도 (burst=1이면 어떤 60초 구간에서도 rate+1회를 넘지 않음)
+PROVIDER_LIMITS = {
+    'gemini': {'rate_per_minute': 14, 'burst': 1},  # 무료 티어 15 RPM
+    'cohere': {'rate_per_minute': 20, 'burst': 1},  # 트라이얼 키 20 RPM
+}
+DEFAULT_LIMIT = {'rate_per_minute': 10, 'burst': 1}
+
+
+class TokenBucket:
+    """예약 방식 토큰 버킷 (acquire는 O(1), 먼저 요청한 호출이 먼저 토큰을 받음)"""
+
+    def __init__(self, rate_per_minute, burst=1):
+        self.rate_per_minute = rate_per_minute
+        self.rate = rate_per_minute / 60.0
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._recent = deque()
+        self.total_acquired = 0
+        self.total_wait = 0.0
+
+    def _refill(self, now):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _record(self, at):
+        self.total_acquired += 1
+        self._recent.append(at)
+        cutoff = at - 60
+        while self._recent and self._recent[0] <= cutoff:
+            self._recent.popleft()
+
+    def reserve(self):
+        """토큰 하나를 예약하고 사용 가능 시점까지의 대기 시간(초) 반환"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+            self._record(now + wait)
+            self.total_wait += wait
+            return wait
+
+    def peek_wait(self):
+        """토큰을 예약하지 않고, 지금 요청하면 기다려야 하는 시간(초)"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            return 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+
+    def try_acquire(self):
+        """대기 없이 토큰을 얻을 수 있으면 True"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            self._record(now)
+            return True
+
+    def acquire(self):
+        """토큰을 얻을 때까지 현재 스레드만 대기, 대기 시간 반환"""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self):
+        """토큰을 얻을 때까지 이벤트 루프를 막지 않고 대기"""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def requests_last_minute(self):
+        """최근 60초 동안 허용된 요청 수 (오래된 기록은 앞에서부터 제거)"""
+        with self._lock:
+            cutoff = time.monotonic() - 60
+            while self._recent and self._recent[0] <= cutoff:
+                self._recent.popleft()
+            return len(self._recent)
+
+    def get_stats(self):
+        return {
+            'rate_per_minute': self.rate_per_minute,
+            'total_acquired': self.total_acquired,
+            'requests_last_minute': self.requests_last_minute(),
+            'total_wait_seconds': round(self.total_wait, 2)
+        }
+
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(provider):
+    """제공자별 공유 토큰 버킷 반환"""
+    provider = provider.lower()
+    with _limiters_lock:
+        limiter = _limiters.get(provider)
+        if limiter is None:
+            limit = PROVIDER_LIMITS.get(provider, DEFAULT_LIMIT)
+            limiter = TokenBucket(limit['rate_per_minute'], limit['burst'])
+            _limiters[provider] = limiter
+        return limiter
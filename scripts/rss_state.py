@@ -0,0 +1,101 @@
+"""
+RSS 피드 상태 저장
+피드별 ETag/Last-Modified와 이미 처리한 항목 ID를 data/cache/rss_state.json에 저장해
+- 다음 실행에서 조건부 요청을 보내 바뀌지 않은 피드는 304로 본문 없이 끝내고
+- 바뀐 피드도 지난 실행 이후 새로 올라온 항목만 처리
+"""
+import json
+import os
+import threading
+import time
+
+DEFAULT_STATE_FILE = 'data/cache/rss_state.json'
+MAX_SEEN_IDS = 300   # 피드별로 보관하는 처리한 항목 ID 수
+
+
+def entry_id(entry):
+    """피드 항목 식별자 (guid → link → title)"""
+    return entry.get('id') or entry.get('link') or entry.get('title')
+
+
+class FeedState:
+    """피드별 조건부 요청 값과 처리한 항목 ID 관리 (스레드 안전)"""
+
+    def __init__(self, state_file=DEFAULT_STATE_FILE):
+        self.state_file = state_file
+        self._feeds = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                self._feeds = json.load(f).get('feeds', {})
+        except (OSError, ValueError):
+            self._feeds = {}
+
+    def save(self):
+        """피드 상태 저장"""
+        with self._lock:
+            data = {'updated_at': time.time(), 'feeds': self._feeds}
+            try:
+                os.makedirs(os.path.dirname(self.state_file) or '.', exist_ok=True)
+                tmp_path = f'{self.state_file}.tmp'
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False)
+                os.replace(tmp_path, self.state_file)
+            except OSError as e:
+                print(f"[RSS] Failed to save feed state: {e}")
+
+    def validators(self, feed_url):
+        """feedparser.parse에 넘길 etag/modified 인자"""
+        with self._lock:
+            feed = self._feeds.get(feed_url, {})
+            return {'etag': feed.get('etag'), 'modified': feed.get('modified')}
+
+    def request_headers(self, feed_url, headers=None):
+        """직접 요청할 때 쓸 조건부 요청 헤더 (If-None-Match/If-Modified-Since)"""
+        headers = dict(headers or {})
+        validators = self.validators(feed_url)
+        if validators['etag']:
+            headers['If-None-Match'] = validators['etag']
+        if validators['modified']:
+            headers['If-Modified-Since'] = validators['modified']
+        return headers
+
+    def update_validators(self, feed_url, etag=None, modified=None):
+        """응답의 ETag/Last-Modified 저장 (없으면 기존 값 삭제)"""
+        with self._lock:
+            feed = self._feeds.setdefault(feed_url, {})
+            feed['etag'] = etag
+            feed['modified'] = modified
+            feed['checked_at'] = time.time()
+
+    def new_entries(self, feed_url, entries):
+        """지난 실행까지 처리하지 않은 항목만 반환 (처음 보는 피드는 전부)"""
+        with self._lock:
+            seen = set(self._feeds.get(feed_url, {}).get('seen', []))
+        return [entry for entry in entries if entry_id(entry) not in seen]
+
+    def mark_seen(self, feed_url, entries):
+        """평가한 피드 항목을 처리한 것으로 기록 (최근 MAX_SEEN_IDS개 유지)"""
+        ids = [entry_id(entry) for entry in entries if entry_id(entry)]
+        current = set(ids)
+        with self._lock:
+            feed = self._feeds.setdefault(feed_url, {})
+            merged = ids + [seen_id for seen_id in feed.get('seen', []) if seen_id not in current]
+            feed['seen'] = merged[:MAX_SEEN_IDS]
+
+
+# 전역 피드 상태 (처음 사용할 때 로드)
+feed_state = None
+_state_lock = threading.Lock()
+
+
+def get_feed_state():
+    """전역 FeedState 인스턴스"""
+    global feed_state
+    with _state_lock:
+        if feed_state is None:
+            feed_state = FeedState()
+        return feed_state
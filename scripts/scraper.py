@@ -3,7 +3,6 @@ import os
 import requests
 from datetime import datetime, timedelta
 import pytz
-from bs4 import BeautifulSoup
 import re
 import random
 import time
@@ -12,6 +11,20 @@ from urllib.parse import urljoin, urlparse
 from ai_scraper import get_ai_scraper
 from text_processing import TextProcessor
 from deduplication import ArticleDeduplicator
+from concurrent_fetcher import ConcurrentFetcher, get_domain_key
+from parsed_document import ParsedDocument, set_default_parser
+import filter_engine as filters
+from filter_engine import get_keyword_matcher
+from http_session import get_http_pool, get_page_limits, configure_page_limits, UnsupportedContentError
+from http_cache import get_http_cache
+from article_index import get_article_index, DEFAULT_SIMILAR_DISTANCE
+from instrumentation import get_profiler
+from async_fetcher import FetchJob, get_fetch_engine
+from adaptive_controller import configure_domain_controller, get_domain_controller
+from circuit_breaker import configure_circuit_breaker, get_circuit_breaker, CLOSED, HALF_OPEN, OPEN
+from fallback_racer import configure_fallback_racer, get_fallback_racer, is_usable_page
+from sitemap_discovery import configure_sitemap_discovery, get_sitemap_discovery
+from provider_router import configure_provider_router, get_provider_router
 try:
     from site_access_strategy import SiteAccessStrategy
     SITE_STRATEGY_AVAILABLE = True
@@ -34,8 +47,8 @@ except ImportError:
     print("[WARNING] Cloudflare scraper not available")
 
 try:
-    from scraper_browser import BrowserScraper
-    BROWSER_SCRAPER_AVAILABLE = True
+    from scraper_browser import SELENIUM_AVAILABLE as BROWSER_SCRAPER_AVAILABLE
+    from browser_pool import configure_browser_pool, get_browser_pool, shutdown_browser_pool
 except ImportError:
     BROWSER_SCRAPER_AVAILABLE = False
     print("[WARNING] Browser scraper not available")
@@ -79,9 +92,11 @@ def extract_domain(url):
     except:
         return url
 
-def extract_publish_date(soup, default_to_now=True):
+def extract_publish_date(document, default_to_now=True):
     """
-    HTML에서 기사 발행일 추출
+    HTML에서 기사 발행일 추출 (document: ParsedDocument 또는 HTML 문자열)
+    
+    메타 태그와 JSON-LD는 문서에 한 번만 만든 메타데이터에서 읽음
     
     Returns:
         datetime: 발행일 (KST) 또는 None
@@ -93,12 +108,14 @@ def extract_publish_date(soup, default_to_now=True):
         'parsely-pub-date', 'datePublished'
     ]
     
+    document = ParsedDocument.wrap(document)
+    metadata = document.metadata
     for name in date_meta_names:
-        meta = soup.find('meta', {'property': name}) or soup.find('meta', {'name': name})
-        if meta and meta.get('content'):
+        content = metadata.get(name.lower())
+        if content:
             try:
                 # ISO 형식 파싱 시도
-                pub_date = datetime.fromisoformat(meta['content'].replace('Z', '+00:00'))
+                pub_date = datetime.fromisoformat(content.replace('Z', '+00:00'))
                 # KST로 변환
                 if pub_date.tzinfo is None:
                     pub_date = KST.localize(pub_date)
@@ -109,7 +126,7 @@ def extract_publish_date(soup, default_to_now=True):
                 pass
     
     # time 태그에서 찾기
-    time_tag = soup.find('time', {'datetime': True})
+    time_tag = document.soup.find('time', {'datetime': True})
     if time_tag:
         try:
             pub_date = datetime.fromisoformat(time_tag['datetime'].replace('Z', '+00:00'))
@@ -122,10 +139,8 @@ def extract_publish_date(soup, default_to_now=True):
             pass
     
     # JSON-LD 구조화 데이터에서 찾기
-    scripts = soup.find_all('script', {'type': 'application/ld+json'})
-    for script in scripts:
+    for data in metadata['json_ld']:
         try:
-            data = json.loads(script.string)
             if isinstance(data, dict):
                 if 'datePublished' in data:
                     pub_date = datetime.fromisoformat(data['datePublished'].replace('Z', '+00:00'))
@@ -145,7 +160,7 @@ def extract_publish_date(soup, default_to_now=True):
         r'\d{1,2}\s+(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}'  # 23 January 2024
     ]
     
-    text = soup.get_text()[:2000]  # 처음 2000자만 검색
+    text = document.text()[:2000]  # 처음 2000자만 검색
     for pattern in date_patterns:
         match = re.search(pattern, text)
         if match:
@@ -175,6 +190,7 @@ def load_settings():
             - sendSchedule: 전송 스케줄 설정
             - blockedKeywords: 차단 키워드 목록
             - scrapingMethod: 스크래핑 방식 (traditional/ai/rss/hybrid)
+            - fetchEngine: 페이지 수집 엔진 (threads/async)
             - monitoring: 모니터링 설정
     
     우선순위:
@@ -219,8 +235,22 @@ def load_settings():
             "scrapingMethod": "traditional",
             "scrapingMethodOptions": {
                 "ai": {"provider": "gemini", "model": "gemini-1.5-flash", "fallbackToTraditional": True},
-                "traditional": {"useEnhancedFiltering": True}
+                "traditional": {"useEnhancedFiltering": True, "maxWorkers": 8, "maxPerDomain": 1},
+                "rss": {"maxWorkers": 16, "maxPerDomain": 2},
+                "hybrid": {"maxAiSummaries": 25, "maxWorkers": 4, "maxPerProvider": 2,
+                           "batchSize": 5, "maxAiRequests": 25, "batchRetries": 1}
             },
+            "skipSeenArticles": True,
+            "htmlParser": "html.parser",
+            "fetchEngine": "threads",
+            "adaptiveFetch": {"enabled": True, "maxPerDomain": 3},
+            "pageFetch": {"enabled": True, "maxBytes": 2097152, "maxListingBytes": 10485760, "stopMarkers": {}},
+            "circuitBreaker": {"enabled": True, "threshold": 3, "cooldownMinutes": 30},
+            "fallbackRace": {"enabled": True, "hedgeDelay": 2.0, "timeout": 30},
+            "browserPool": {"size": 2, "maxPagesPerDriver": 50, "maxMemoryMb": 1024},
+            "sitemapDiscovery": {"enabled": True, "maxAgeHours": 48},
+            "summaryReuse": {"enabled": True, "maxDistance": 3},
+            "providerRouting": {"enabled": True, "hedge": True, "timeout": 30, "monthlyQuota": {"cohere": 1000}},
             "monitoring": {"enabled": True}
         }
 
@@ -311,12 +341,8 @@ def contains_keywords(text, keywords):
     if not text or not keywords:
         return False
     
-    # 문자열인 경우 리스트로 변환
-    if isinstance(keywords, str):
-        keywords = [k.strip() for k in keywords.split(',') if k.strip()]
-    
-    text_lower = text.lower()
-    return any(keyword.lower() in text_lower for keyword in keywords)
+    # 키워드 목록은 한 번만 컴파일해 재사용 (문자열이면 쉼표로 분리)
+    return get_keyword_matcher(keywords).search(text.lower())
 
 def is_blocked(text, blocked_keywords):
     """
@@ -332,12 +358,8 @@ def is_blocked(text, blocked_keywords):
     if not text or not blocked_keywords:
         return False
     
-    # 문자열인 경우 리스트로 변환
-    if isinstance(blocked_keywords, str):
-        blocked_keywords = [k.strip() for k in blocked_keywords.split(',') if k.strip()]
-    
-    text_lower = text.lower()
-    return any(keyword.lower() in text_lower for keyword in blocked_keywords)
+    # 키워드 목록은 한 번만 컴파일해 재사용 (문자열이면 쉼표로 분리)
+    return get_keyword_matcher(blocked_keywords).search(text.lower())
 
 def validate_article(article):
     """
@@ -483,21 +505,9 @@ def is_meaningful_content(text):
     if len(words) < 20:  # 30 -> 20으로 완화
         return False
     
-    # 진엄한 기사 내용 패턴 - 더 넓은 범위
-    article_indicators = [
-        'said', 'announced', 'reported', 'according to', 'in a statement',
-        'the government', 'the ministry', 'officials', 'spokesperson',
-        'singapore', 'minister', 'prime minister', 'parliament',
-        'economic', 'policy', 'development', 'growth', 'investment',
-        'will', 'would', 'can', 'could', 'should', 'may', 'might',
-        'new', 'project', 'plan', 'programme', 'service', 'system',
-        'million', 'billion', 'percent', 'year', 'month', 'week',
-        'company', 'business', 'market', 'price', 'cost', 'budget',
-        'people', 'public', 'residents', 'citizens', 'community'
-    ]
-    
+    # 진엄한 기사 내용 패턴 - 더 넓은 범위 (filter_engine에서 사전 컴파일)
     text_lower = text.lower()
-    article_score = sum(1 for indicator in article_indicators if indicator in text_lower)
+    article_score = filters.MEANINGFUL_CONTENT_INDICATORS.count(text_lower)
     
     # 문장 구조 체크 (마침표, 쉼표 등)
     punctuation_score = text.count('.') + text.count(',') + text.count(';')
@@ -576,33 +586,15 @@ def is_menu_sentence(sentence):
     """멤뉴 문장인지 더 엄격하게 판단"""
     sentence_lower = sentence.lower().strip()
     
-    # 직접적인 메뉴 패턴
-    direct_menu_patterns = [
-        '내 피드 에디션 메뉴',
-        'sign in account my feed',
-        'edition menu edition',
-        '싱가포르 인도네시아 아시아',
-        'singapore indonesia asia',
-        'cna 라이프 스타일 럭셔리',
-        'cna lifestyle luxury',
-        'top stories', 'latest news', 'live tv',
-        'news id', 'type landing_page',
-        'search menu search edition'
-    ]
-    
-    # 직접 매칭
-    if any(pattern in sentence_lower for pattern in direct_menu_patterns):
+    # 직접적인 메뉴 패턴 (filter_engine에서 사전 컴파일)
+    if filters.MENU_SENTENCE_PATTERNS.search(sentence_lower):
         return True
     
     # 패턴 기반 판단
     words = sentence_lower.split()
     
     # 진엄한 메뉴 단어 비율
-    menu_words = [
-        'feed', 'edition', 'menu', 'account', 'sign', 'search',
-        'lifestyle', 'luxury', 'today', 'stories', 'news',
-        'singapore', 'indonesia', 'asia', 'cna', 'cnar'
-    ]
+    menu_words = filters.MENU_SENTENCE_WORDS
     
     if len(words) > 0:
         menu_word_ratio = sum(1 for word in words if word in menu_words) / len(words)
@@ -645,27 +637,12 @@ def is_landing_page_content(content):
     
     content_lower = content.lower()
     
-    # 확실한 랜딩 페이지 지표들만 체크
-    definite_landing_indicators = [
-        'sign in account my feed edition menu',
-        'type landing_page',
-        'news id 1822271 type landing_page',
-        'top stories id 1821936 type landing_page',
-        'latest news id 1822271 type landing_page'
-    ]
-    
-    # 확실한 지표가 하나라도 있으면 랜딩 페이지
-    if any(indicator in content_lower for indicator in definite_landing_indicators):
+    # 확실한 랜딩 페이지 지표들만 체크 (하나라도 있으면 랜딩 페이지)
+    if filters.LANDING_DEFINITE_INDICATORS.search(content_lower):
         return True
     
     # 메뉴 텍스트 패턴 확인 - 더 엄격하게
-    menu_patterns = [
-        r'id \d+ type landing_page',
-        r'sign in account my feed edition menu',
-        r'edition menu edition singapore indonesia asia'
-    ]
-    
-    pattern_matches = sum(1 for pattern in menu_patterns if re.search(pattern, content_lower))
+    pattern_matches = sum(1 for pattern in filters.LANDING_MENU_PATTERNS if pattern.search(content_lower))
     
     # 패턴 매칭이 2개 이상이면 랜딩 페이지
     if pattern_matches >= 2:
@@ -673,10 +650,7 @@ def is_landing_page_content(content):
     
     # 전체 단어 수 대비 메뉴 단어 비율 계산 - 더 관대하게
     words = content_lower.split()
-    menu_words = [
-        'sign', 'account', 'feed', 'edition', 'menu', 'search',
-        'landing_page', 'landing', 'type'
-    ]
+    menu_words = filters.LANDING_MENU_WORDS
     
     if len(words) > 0:
         menu_word_ratio = sum(1 for word in words if word in menu_words) / len(words)
@@ -685,19 +659,8 @@ def is_landing_page_content(content):
         if menu_word_ratio > 0.7:
             return True
     
-    # 실제 기사 내용의 지표 확인
-    article_indicators = [
-        'said', 'announced', 'reported', 'according to', 'minister', 'government',
-        'policy', 'economic', 'business', 'investment', 'development', 'growth',
-        'court', 'sentenced', 'charged', 'arrested', 'police', 'trial',
-        'company', 'market', 'shares', 'profit', 'revenue', 'customers',
-        'singapore', 'malaysian', 'indonesian', 'thai', 'vietnam'
-    ]
-    
-    article_score = sum(1 for indicator in article_indicators if indicator in content_lower)
-    
-    # 기사 지표가 있으면 일단 기사로 판단
-    if article_score > 0:
+    # 실제 기사 내용의 지표 확인 - 기사 지표가 있으면 일단 기사로 판단
+    if filters.LANDING_ARTICLE_INDICATORS.search(content_lower):
         return False
     
     # 기사 지표가 전혀 없고 메뉴 단어 비율이 50% 이상이면 랜딩 페이지
@@ -720,31 +683,14 @@ def validate_final_article_content(article_data):
         print(f"[DEBUG] Final validation for: {title}")
     
     # 제목 검사 - 명백한 메뉴/네비게이션 제목들만
-    invalid_titles = [
-        'newsletters', 'breaking news', 'sign up', 'login', 'register',
-        'share on whatsapp', 'yoursingapore story', 'featured',
-        'menu', 'search', 'edition'
-    ]
-    
-    if any(invalid in title.lower() for invalid in invalid_titles):
+    if filters.INVALID_TITLE_INDICATORS.search(title.lower()):
         if DEBUG_MODE:
             print(f"[DEBUG] Invalid title detected: {title}")
         return False
     
     # 내용 검사 - 실제 뉴스 기사의 특징 확인 (더 관대하게)
-    news_indicators = [
-        'said', 'announced', 'reported', 'according to', 'minister',
-        'government', 'policy', 'singapore', 'parliament', 'court',
-        'arrested', 'charged', 'sentenced', 'company', 'business',
-        'economy', 'investment', 'market', 'development', 'residents',
-        'citizens', 'public', 'authorities', 'officials', 'plan',
-        'project', 'programme', 'service', 'system', 'will', 'would',
-        'can', 'could', 'should', 'million', 'billion', 'percent',
-        'year', 'years', 'month', 'months', 'week', 'weeks', 'day', 'days'
-    ]
-    
     content_lower = content.lower()
-    news_score = sum(1 for indicator in news_indicators if indicator in content_lower)
+    news_score = filters.FINAL_NEWS_INDICATORS.count(content_lower)
     
     # 뉴스 지표가 전혀 없으면 기사가 아님 (하지만 더 관대하게)
     if news_score == 0:
@@ -1008,47 +954,14 @@ def extract_article_content_cna(url, soup):
 
 def is_menu_text(text):
     """메뉴나 네비게이션 텍스트인지 확인"""
-    menu_indicators = [
-        # 로그인/계정 관련
-        'log in', 'sign in', 'account', 'my feed', 'manage account', 'log out',
-        'subscribe', 'newsletter', 'subscription',
-        
-        # 메뉴/네비게이션
-        'menu', 'search', 'share', 'edition', 'search menu', 'breadcrumb',
-        'navigation', 'header', 'footer', 'sidebar',
-        
-        # 사이트 섹션
-        'top stories', 'latest news', 'breaking news', 'live tv', 'podcasts', 
-        'radio schedule', 'tv schedule', 'watch', 'listen',
-        
-        # 카테고리
-        'business', 'sport', 'lifestyle', 'luxury', 'commentary', 'sustainability',
-        'singapore', 'asia', 'world', 'insider', 'cna explains',
-        
-        # 기술적 요소
-        'news id', 'type landing_page', 'type all_videos', 'type all_vod', 'type all_podcasts',
-        'id 1822271', 'id 1821936', 'id 1821901', 'id 4310561', 'id 1821876',
-        'id 1821886', 'id 1821896', 'id 3384986', 'id 1881506', 'id 1821906',
-        'id 1821911', 'id 1821891', 'id 1431321', 'id 1822266', 'id 5197731',
-        'id 2005266', 'id 5191361',
-        
-        # 기타 UI 요소
-        'find out what', 'submitted by', 'anonymous', 'verified', 'newsletters',
-        'get the best', 'select your', 'sent to your inbox', 'east asia',
-        'us/uk', 'cnar', 'cna938', 'documentaries & shows', 'news reports'
-    ]
-    
     text_lower = text.lower().strip()
     
-    # 직접 매칭
-    if any(indicator in text_lower for indicator in menu_indicators):
+    # 직접 매칭 (filter_engine에서 사전 컴파일)
+    if filters.MENU_TEXT_INDICATORS.search(text_lower):
         return True
     
-    # 패턴 매칭
-    import re
-    
     # ID 패턴 (News Id 1234567, Type landing_page 등)
-    if re.search(r'\b(id|type)\s+\d+|\b(id|type)\s+\w+_\w+', text_lower):
+    if filters.MENU_ID_PATTERN.search(text_lower):
         return True
     
     # 진엄한 메뉴 패턴 (A B C D E... 나열)
@@ -1171,31 +1084,9 @@ def is_real_article_content(text):
     if is_menu_sentence(text) and len(text) < 50:
         return False
     
-    # 진짜 기사 내용의 지표
-    article_signals = [
-        # 인용구
-        'said', 'announced', 'reported', 'stated', 'explained', 'confirmed',
-        'according to', 'in a statement', 'speaking to', 'told reporters',
-        
-        # 정부/기관
-        'government', 'ministry', 'minister', 'prime minister', 'parliament',
-        'official', 'spokesperson', 'department', 'agency',
-        
-        # 지역/국가
-        'singapore', 'malaysian', 'indonesian', 'thai', 'asean',
-        
-        # 수치/날짜
-        'percent', 'million', 'billion', 'year', 'month', 'week',
-        'january', 'february', 'march', 'april', 'may', 'june',
-        'july', 'august', 'september', 'october', 'november', 'december',
-        
-        # 기사 내용
-        'policy', 'economic', 'growth', 'development', 'investment',
-        'business', 'market', 'industry', 'company', 'project'
-    ]
-    
+    # 진짜 기사 내용의 지표 (filter_engine에서 사전 컴파일)
     text_lower = text.lower()
-    signal_count = sum(1 for signal in article_signals if signal in text_lower)
+    signal_count = filters.REAL_ARTICLE_SIGNALS.count(text_lower)
     
     # 기사 지표가 없으면 기본 문장 구조 체크
     if signal_count == 0:
@@ -1213,8 +1104,10 @@ def is_real_article_content(text):
     
     return signal_count > 0 or len(text.split('.')) >= 2
 
-def extract_article_content_generic(url, soup):
+def extract_article_content_generic(url, document):
     """범용 콘텐츠 추출 (폴백)"""
+    document = ParsedDocument.wrap(document, url)
+    soup = document.soup
     article = {
         'title': '',
         'content': '',
@@ -1222,7 +1115,7 @@ def extract_article_content_generic(url, soup):
     }
     
     # 발행일 추출 시도
-    publish_date = extract_publish_date(soup, default_to_now=False)
+    publish_date = extract_publish_date(document, default_to_now=False)
     if publish_date:
         article['publish_date'] = publish_date
     else:
@@ -1289,121 +1182,206 @@ def extract_article_content_generic(url, soup):
     
     return article
 
+def article_to_cache(article_data, extracted_at):
+    """추출된 기사를 HTTP 캐시에 저장할 수 있는 형태로 변환"""
+    cached = dict(article_data)
+    publish_date = cached.get('publish_date')
+    cached['publish_date'] = None
+    cached['publish_date_fallback'] = False
+    if isinstance(publish_date, datetime):
+        try:
+            # 발행일을 찾지 못해 현재 시각으로 채운 경우는 재사용 시 다시 현재 시각으로 채움
+            cached['publish_date_fallback'] = publish_date >= extracted_at
+        except TypeError:
+            pass
+        if not cached['publish_date_fallback']:
+            cached['publish_date'] = publish_date.isoformat()
+    return cached
+
+def article_from_cache(cached):
+    """HTTP 캐시에 저장된 추출 결과를 기사 데이터로 복원"""
+    article_data = dict(cached)
+    fallback = article_data.pop('publish_date_fallback', False)
+    if fallback:
+        article_data['publish_date'] = get_kst_now()
+    elif article_data.get('publish_date'):
+        article_data['publish_date'] = datetime.fromisoformat(article_data['publish_date'])
+    return article_data
+
+def article_request_options(url):
+    """기사 요청 헤더/쿠키/요청 전 딜레이(초) - 스레드 수집과 async 수집이 같은 값을 사용"""
+    # 사이트별 접근 전략 사용
+    if SITE_STRATEGY_AVAILABLE:
+        strategy = get_http_pool().get_strategy(url)
+        headers = strategy['headers']
+        cookies = strategy['cookies']
+        delay = strategy.get('delay', 1)
+        
+        if DEBUG_MODE:
+            print(f"[DEBUG] Using strategy for {url}")
+            print(f"[DEBUG] User-Agent: {headers['User-Agent'][:50]}...")
+            print(f"[DEBUG] Delay: {strategy['delay']:.2f}s")
+    else:
+        # 폴백: 기존 User-Agent 로테이션
+        USER_AGENTS = [
+            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0',
+            'Mozilla/5.0 (iPhone; CPU iPhone OS 17_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Mobile/15E148 Safari/604.1'
+        ]
+        
+        selected_ua = random.choice(USER_AGENTS)
+        headers = {
+            'User-Agent': selected_ua,
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.5',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive',
+            'Upgrade-Insecure-Requests': '1'
+        }
+        cookies = {}
+        delay = 0
+    
+    # Mothership의 경우 추가 헤더
+    if 'mothership' in url.lower():
+        headers['Referer'] = 'https://www.google.com/'
+    
+    # 접근 전략 딜레이 + 봇 탐지 회피를 위한 랜덤 딜레이 (1-3초)
+    return headers, cookies, delay + random.uniform(1, 3)
+
+def fallback_candidates(url, domain):
+    """직접 요청이 차단됐을 때의 대체 방법 목록 [(이름, 인자 없는 함수)] (앞에 있을수록 먼저 시작)"""
+    candidates = []
+    
+    # 1. Cloudflare 우회
+    if CLOUDFLARE_SCRAPER_AVAILABLE and domain in ['mothership.sg', 'todayonline.com']:
+        candidates.append(('cloudflare_bypass', lambda: CloudflareScraper().fetch_with_cloudflare_bypass(url)))
+    
+    # 2. 대체 소스 (모바일, Google 캐시, archive.org, 프록시)
+    if ALTERNATIVE_SOURCES_AVAILABLE:
+        candidates.extend(AlternativeSources().candidates(url))
+    
+    # 3. Selenium (JavaScript 필수 사이트)
+    if BROWSER_SCRAPER_AVAILABLE and domain in ['todayonline.com', 'techinasia.com']:
+        # 실행 동안 재사용되는 헤드리스 드라이버 사용 (기사마다 Chrome을 시작하지 않음)
+        candidates.append(('selenium', lambda: get_browser_pool().get_page(url)))
+    
+    return candidates
+
 def extract_article_content(url):
     """URL에 따라 적절한 추출 방법 선택"""
+    # 차단이 계속된 도메인은 건너뛰고, 반열림이면 대체 방법 없이 직접 요청 1건만 시도
+    breaker = get_circuit_breaker()
+    circuit = breaker.allow(url) if breaker else CLOSED
+    if circuit == OPEN:
+        if DEBUG_MODE:
+            print(f"[DEBUG] Circuit open, skipping {url}")
+        get_profiler().incr('circuit_skipped')
+        return None
     try:
-        # 사이트별 접근 전략 사용
-        if SITE_STRATEGY_AVAILABLE:
-            strategy = SiteAccessStrategy.get_strategy(url)
-            headers = strategy['headers']
-            cookies = strategy['cookies']
-            retry_count = strategy['retry_count']
-            
-            # 접근 전 딜레이
-            SiteAccessStrategy.apply_delay(strategy)
-            
-            if DEBUG_MODE:
-                print(f"[DEBUG] Using strategy for {url}")
-                print(f"[DEBUG] User-Agent: {headers['User-Agent'][:50]}...")
-                print(f"[DEBUG] Delay: {strategy['delay']:.2f}s")
-        else:
-            # 폴백: 기존 User-Agent 로테이션
-            USER_AGENTS = [
-                'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0',
-                'Mozilla/5.0 (iPhone; CPU iPhone OS 17_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Mobile/15E148 Safari/604.1'
-            ]
-            
-            selected_ua = random.choice(USER_AGENTS)
-            headers = {
-                'User-Agent': selected_ua,
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1'
-            }
-            cookies = {}
-            retry_count = 2
-        
-        # Mothership의 경우 추가 헤더
-        if 'mothership' in url.lower():
-            headers['Referer'] = 'https://www.google.com/'
+        return fetch_article_content(url, breaker, circuit)
+    finally:
+        # 시험 요청이 결과를 기록하지 못하고 끝나도(예외 등) 다음 요청이 다시 시험할 수 있도록 해제
+        if circuit == HALF_OPEN:
+            breaker.end_probe(url)
+
+def fetch_article_content(url, breaker, circuit):
+    """기사 페이지를 받아(차단 시 대체 방법 경쟁) 도메인별 추출 함수로 기사 데이터 추출"""
+    try:
+        headers, cookies, delay = article_request_options(url)
+        profiler = get_profiler()
         
-        # 봇 탐지 회피를 위한 랜덤 딜레이 (1-3초)
-        time.sleep(random.uniform(1, 3))
+        # async 엔진이 미리 받은 페이지는 이미 딜레이를 두고 요청했으므로 바로 사용
+        if not get_http_cache().is_prefetched(url):
+            with profiler.timer('delay'):
+                time.sleep(delay)
         
         # 일반 방법으로 시도
         response = None
-        soup = None
+        document = None
         
         try:
-            response = requests.get(url, timeout=10, headers=headers, cookies=cookies)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-            elif response.status_code in [403, 503]:  # 차단됨
+            with profiler.timer('fetch'):
+                response = get_http_cache().get(url, timeout=10, headers=headers, cookies=cookies,
+                                                limits=get_page_limits(url, article=True))
+            if response.status_code in [403, 503]:  # 차단됨
                 print(f"[SCRAPER] Blocked with status {response.status_code}, trying alternatives...")
                 raise Exception("Blocked")
+            if breaker:
+                breaker.record_success(url)
+            if response.status_code == 200:
+                # 304로 재사용된 본문이면 이전 추출 결과를 그대로 사용 (재파싱 생략)
+                cached_article = get_http_cache().get_derived(response, 'article')
+                if cached_article:
+                    if DEBUG_MODE:
+                        print(f"[DEBUG] Using cached extraction for {url}")
+                    profiler.incr('article_extraction_reused')
+                    return article_from_cache(cached_article)
+                document = ParsedDocument(response.content, url)
+        except UnsupportedContentError as e:
+            # PDF/동영상 등은 대체 방법으로도 기사를 얻을 수 없음
+            print(f"[SCRAPER] Skipping {url}: {e}")
+            if breaker:
+                breaker.record_success(url)
+            return None
         except:
-            # 대체 방법들 시도
-            domain = extract_domain(url)
-            content = None
-            method = None
-            
-            # 1. Cloudflare 우회 시도
-            if CLOUDFLARE_SCRAPER_AVAILABLE and domain in ['mothership.sg', 'todayonline.com']:
-                print(f"[SCRAPER] Trying Cloudflare bypass for {domain}")
-                cf_scraper = CloudflareScraper()
-                content = cf_scraper.fetch_with_cloudflare_bypass(url)
-                if content:
-                    soup = BeautifulSoup(content, 'html.parser')
-                    method = 'cloudflare_bypass'
-            
-            # 2. 대체 소스 시도
-            if not soup and ALTERNATIVE_SOURCES_AVAILABLE:
-                print(f"[SCRAPER] Trying alternative sources for {domain}")
-                alt_sources = AlternativeSources()
-                content, method = alt_sources.get_alternative_content(url, domain)
-                if content:
-                    soup = BeautifulSoup(content, 'html.parser')
+            # 시험 요청이 실패하면 대체 방법 없이 회로를 다시 엶
+            if circuit == HALF_OPEN:
+                print(f"[SCRAPER] Probe request failed for {url}, skipping alternatives")
+                breaker.record_failure(url)
+                return None
             
-            # 3. Selenium 시도 (JavaScript 필수 사이트)
-            if not soup and BROWSER_SCRAPER_AVAILABLE and domain in ['todayonline.com', 'techinasia.com']:
-                print(f"[SCRAPER] Trying Selenium for {domain}")
-                browser = BrowserScraper()
-                content = browser.get_page_with_js(url)
-                if content:
-                    soup = BeautifulSoup(content, 'html.parser')
-                    method = 'selenium'
-                browser.close_driver()
+            # 대체 방법들을 시차를 두고 동시에 시도해 먼저 성공한 결과 사용 (우승 기록은 도메인 키 기준)
+            domain = get_domain_key(url)
+            with profiler.timer('fallback'):
+                content, method = get_fallback_racer().race(
+                    domain, fallback_candidates(url, domain), validate=is_usable_page
+                )
+            if content:
+                document = ParsedDocument(content, url)
+                profiler.incr(f'fallback_{method}')
             
-            if not soup:
+            if document is None:
                 print(f"[SCRAPER] All methods failed for {url}")
+                if breaker:
+                    breaker.record_failure(url)
                 return None
+            if breaker:
+                breaker.record_success(url)
         
         # 도메인에 따라 다른 추출 방법 사용
         domain = urlparse(url).netloc.lower()
+        extracted_at = get_kst_now()
+        
+        # 200이 아닌 응답(404 등)은 추출할 문서가 없음
+        if document is None:
+            return None
         
         article_data = None
-        if 'straitstimes.com' in domain:
-            article_data = extract_article_content_straits_times(url, soup)
-        elif 'businesstimes.com.sg' in domain:
-            article_data = extract_article_content_business_times(url, soup)
-        elif 'channelnewsasia.com' in domain or 'cna.com.sg' in domain:
-            article_data = extract_article_content_cna(url, soup)
-        elif 'moe.gov.sg' in domain:
-            article_data = extract_article_content_moe(url, soup)
-        elif 'nac.gov.sg' in domain or 'catch.sg' in domain:
-            article_data = extract_article_content_nac(url, soup)
-        elif 'theindependent.sg' in domain:
-            article_data = extract_article_content_independent(url, soup)
-        else:
-            article_data = extract_article_content_generic(url, soup)
+        soup = document.soup
+        with profiler.timer('extract'):
+            if 'straitstimes.com' in domain:
+                article_data = extract_article_content_straits_times(url, soup)
+            elif 'businesstimes.com.sg' in domain:
+                article_data = extract_article_content_business_times(url, soup)
+            elif 'channelnewsasia.com' in domain or 'cna.com.sg' in domain:
+                article_data = extract_article_content_cna(url, soup)
+            elif 'moe.gov.sg' in domain:
+                article_data = extract_article_content_moe(url, soup)
+            elif 'nac.gov.sg' in domain or 'catch.sg' in domain:
+                article_data = extract_article_content_nac(url, soup)
+            elif 'theindependent.sg' in domain:
+                article_data = extract_article_content_independent(url, soup)
+            else:
+                article_data = extract_article_content_generic(url, document)
+            
+            # 추출된 데이터 후처리
+            if article_data:
+                article_data = post_process_article_content(article_data)
         
-        # 추출된 데이터 후처리
-        if article_data:
-            article_data = post_process_article_content(article_data)
+        # 직접 받은 본문의 추출 결과는 다음 실행의 304 응답에서 재사용
+        if article_data and response is not None and response.status_code == 200:
+            get_http_cache().set_derived(url, 'article', article_to_cache(article_data, extracted_at))
         
         return article_data
             
@@ -1417,277 +1395,58 @@ def is_valid_article_url(url, domain):
     if DEBUG_MODE:
         print(f"[DEBUG] Checking URL: {url}")
     
-    # 제외할 패턴들 - 핵심적인 것들만
-    exclude_patterns = [
-        'javascript:', 'mailto:', 'tel:', '#', 'wa.me', 'whatsapp',
-        '.pdf', '.jpg', '.png', '.gif', '.mp4', '.css', '.js',
-        'subscribe', 'login', 'register', 'sign-up', 'newsletter-signup',
-        'privacy-policy', 'terms-of-service', 'contact-us', 'about-us',
-        '/search', '/tag/', '/topic/', '/category/', '/author/'
-    ]
-    
-    # 제외 패턴 체크
-    if any(pattern in url_lower for pattern in exclude_patterns):
+    # 제외할 패턴들 - 핵심적인 것들만 (filter_engine에서 사전 컴파일)
+    if filters.URL_EXCLUDE_PATTERNS.search(url_lower):
         if DEBUG_MODE:
             print(f"[DEBUG] URL excluded by pattern: {url}") 
         return False
     
-    # 사이트별 기사 URL 패턴 - 더 유연하게
+    # 사이트별 기사 URL 패턴 - 더 유연하게 (사이트마다 하나의 정규식으로 컴파일됨)
     if 'channelnewsasia.com' in domain or 'cna.com.sg' in domain:
-        if DEBUG_MODE:
-            print(f"[DEBUG] Checking CNA URL patterns for: {url}")
-        
-        # CNA 기사 패턴 - 더 유연하게
-        cna_patterns = [
-            r'/singapore/[a-z0-9-]{5,}',          # 싱가포르 섹션 + 짧은 제목도 허용
-            r'/asia/[a-z0-9-]{5,}',               # 아시아 섹션
-            r'/world/[a-z0-9-]{5,}',              # 월드 섹션
-            r'/business/[a-z0-9-]{5,}',           # 비즈니스 섹션
-            r'/sport/[a-z0-9-]{5,}',              # 스포츠 섹션
-            r'/lifestyle/[a-z0-9-]{5,}',          # 라이프스타일 섹션
-            r'/commentary/[a-z0-9-]{5,}',         # 논평 섹션
-            r'/\d{4}/\d{2}/\d{2}/[a-z0-9-]{5,}', # 날짜 패턴
-            r'/[a-z0-9-]{10,}-\d+$'               # 긴 제목-숫자 패턴
-        ]
-        
+        site_key, site_label = 'cna', 'CNA'
         # 섹션 루트 페이지는 제외 (정확히 매칭)
         url_path = urlparse(url).path.rstrip('/')
-        if url_path in ['/singapore', '/asia', '/world', '/business', '/sport', '/lifestyle', '/commentary']:
+        if url_path in filters.CNA_SECTION_ROOTS:
             if DEBUG_MODE:
                 print(f"[DEBUG] CNA section root page excluded: {url_path}")
             return False
-        
-        matched = any(re.search(pattern, url) for pattern in cna_patterns)
-        if DEBUG_MODE:
-            print(f"[DEBUG] CNA URL pattern match: {matched}")
-        return matched
-    
     elif 'straitstimes.com' in domain:
-        if DEBUG_MODE:
-            print(f"[DEBUG] Checking ST URL patterns for: {url}")
-        
-        # Straits Times 기사 패턴 - 대소문자 모두 허용하고 더 유연하게
-        st_patterns = [
-            r'/singapore/[a-zA-Z0-9-]{5,}',          # 싱가포르 섹션
-            r'/asia/[a-zA-Z0-9-/]{5,}',              # 아시아 섹션
-            r'/world/[a-zA-Z0-9-/]{5,}',             # 월드 섹션
-            r'/business/[a-zA-Z0-9-/]{5,}',          # 비즈니스 섹션
-            r'/sport/[a-zA-Z0-9-/]{5,}',             # 스포츠 섹션
-            r'/life/[a-zA-Z0-9-/]{5,}',              # 라이프 섹션
-            r'/opinion/[a-zA-Z0-9-]{5,}',            # 오피니언 섹션
-            r'/tech/[a-zA-Z0-9-]{5,}',               # 기술 섹션
-            r'/politics/[a-zA-Z0-9-]{5,}',           # 정치 섹션
-            r'/\d{4}/\d{2}/\d{2}/[a-zA-Z0-9-]{5,}', # 날짜 패턴
-            r'/[a-zA-Z]{2,}/[a-zA-Z0-9-]{5,}',       # 두 글자 섹션
-            r'/[a-zA-Z0-9-]{10,}'                     # 일반 기사 패턴 (더 유연하게)
-        ]
-        
+        site_key, site_label = 'straitstimes', 'ST'
         # ST 특별 페이지들만 제외
-        if any(exclude in url_lower for exclude in ['/multimedia/', '/graphics/', '/180']):
+        if filters.ST_EXCLUDE_PATTERNS.search(url_lower):
             if DEBUG_MODE:
                 print(f"[DEBUG] ST special page excluded")
             return False
-            
-        matched = any(re.search(pattern, url) for pattern in st_patterns)
-        if DEBUG_MODE:
-            print(f"[DEBUG] ST URL pattern match: {matched}")
-        return matched
-    
     elif 'businesstimes.com.sg' in domain:
-        if DEBUG_MODE:
-            print(f"[DEBUG] Checking BT URL patterns for: {url}")
-        
-        # Business Times 기사 패턴 - 더 유연하게
-        bt_patterns = [
-            r'/economy/[a-z0-9-]{5,}',            # 경제 섹션
-            r'/companies/[a-z0-9-]{5,}',          # 기업 섹션
-            r'/banking-finance/[a-z0-9-]{5,}',    # 금융 섹션
-            r'/asean/[a-z0-9-]{5,}',              # 아세안 섹션
-            r'/tech/[a-z0-9-]{5,}',               # 기술 섹션
-            r'/\d{4}/\d{2}/\d{2}/[a-z0-9-]{5,}', # 날짜 패턴
-            r'/[a-z0-9-]{15,}$'                   # 긴 제목 URL
-        ]
-        
-        matched = any(re.search(pattern, url) for pattern in bt_patterns)
-        if DEBUG_MODE:
-            print(f"[DEBUG] BT URL pattern match: {matched}")
-        return matched
-    
+        site_key, site_label = 'businesstimes', 'BT'
     elif 'sbr.com.sg' in domain:
-        if DEBUG_MODE:
-            print(f"[DEBUG] Checking SBR URL patterns for: {url}")
-        
-        # Singapore Business Review 기사 패턴
-        sbr_patterns = [
-            r'/economy/[a-z0-9-]{5,}',                # 경제 섹션
-            r'/companies/[a-z0-9-]{5,}',              # 기업 섹션
-            r'/banking/[a-z0-9-]{5,}',                # 금융 섹션
-            r'/real-estate/[a-z0-9-]{5,}',            # 부동산 섹션
-            r'/technology/[a-z0-9-]{5,}',             # 기술 섹션
-            r'/startups/[a-z0-9-]{5,}',               # 스타트업 섹션
-            r'/sustainability/[a-z0-9-]{5,}',         # 지속가능성 섹션
-            r'/\d{4}/\d{2}/\d{2}/[a-z0-9-]{5,}',     # 날짜 패턴
-            r'/[a-z0-9-]{10,}$'                       # 기사 제목 URL
-        ]
-        
-        matched = any(re.search(pattern, url) for pattern in sbr_patterns)
-        if DEBUG_MODE:
-            print(f"[DEBUG] SBR URL pattern match: {matched}")
-        return matched
-    
+        site_key, site_label = 'sbr', 'SBR'
     elif 'moe.gov.sg' in domain:
-        if DEBUG_MODE:
-            print(f"[DEBUG] Checking MOE URL patterns for: {url}")
-        
-        # Ministry of Education 페이지 패턴
-        moe_patterns = [
-            r'/news/[a-z0-9-]{5,}',                   # 뉴스
-            r'/press-releases/[a-z0-9-]{5,}',         # 보도자료
-            r'/parliamentary-replies/[a-z0-9-]{5,}',  # 국회 답변
-            r'/speeches/[a-z0-9-]{5,}',               # 연설
-            r'/initiatives/[a-z0-9-]{5,}',            # 이니셔티브
-            r'/policies/[a-z0-9-]{5,}',               # 정책
-            r'/programmes/[a-z0-9-]{5,}',             # 프로그램
-            r'/\d{4}/\d{2}/\d{2}/[a-z0-9-]{5,}',     # 날짜 패턴
-            r'/[a-z0-9-]{10,}$'                       # 긴 제목 URL
-        ]
-        
-        matched = any(re.search(pattern, url) for pattern in moe_patterns)
-        if DEBUG_MODE:
-            print(f"[DEBUG] MOE URL pattern match: {matched}")
-        return matched
-    
+        site_key, site_label = 'moe', 'MOE'
     elif 'nac.gov.sg' in domain:
-        if DEBUG_MODE:
-            print(f"[DEBUG] Checking NAC URL patterns for: {url}")
-        
-        # National Arts Council 페이지 패턴
-        nac_patterns = [
-            r'/whatson/[a-z0-9-]{5,}',                # 행사/프로그램
-            r'/engage/[a-z0-9-]{5,}',                 # 참여 프로그램
-            r'/news/[a-z0-9-]{5,}',                   # 뉴스
-            r'/press-releases/[a-z0-9-]{5,}',         # 보도자료
-            r'/events/[a-z0-9-]{5,}',                 # 이벤트
-            r'/programmes/[a-z0-9-]{5,}',             # 프로그램
-            r'/grants/[a-z0-9-]{5,}',                 # 보조금 정보
-            r'/initiatives/[a-z0-9-]{5,}',            # 이니셔티브
-            r'/\d{4}/\d{2}/\d{2}/[a-z0-9-]{5,}',     # 날짜 패턴
-            r'/[a-z0-9-]{10,}$'                       # 긴 제목 URL
-        ]
-        
-        matched = any(re.search(pattern, url) for pattern in nac_patterns)
-        if DEBUG_MODE:
-            print(f"[DEBUG] NAC URL pattern match: {matched}")
-        return matched
-    
-    # Yahoo Singapore
+        site_key, site_label = 'nac', 'NAC'
     elif 'yahoo.com' in domain and 'sg' in domain:
-        if DEBUG_MODE:
-            print(f"[DEBUG] Checking Yahoo SG URL patterns for: {url}")
-        
-        yahoo_patterns = [
-            r'/[a-zA-Z0-9-]+-\d+\.html',           # Yahoo 기사 패턴 (제목-숫자.html)
-            r'/news/[a-zA-Z0-9-]+',                 # 뉴스 섹션
-            r'/singapore/[a-zA-Z0-9-]+',            # 싱가포르 섹션
-            r'/finance/[a-zA-Z0-9-]+',              # 금융 섹션
-            r'/lifestyle/[a-zA-Z0-9-]+',            # 라이프스타일 섹션
-            r'/[a-zA-Z0-9-]{15,}'                   # 긴 제목 URL
-        ]
-        
-        matched = any(re.search(pattern, url) for pattern in yahoo_patterns)
-        if DEBUG_MODE:
-            print(f"[DEBUG] Yahoo URL pattern match: {matched}")
-        return matched
-    
-    # Mothership
+        site_key, site_label = 'yahoo', 'Yahoo'
     elif 'mothership.sg' in domain:
-        if DEBUG_MODE:
-            print(f"[DEBUG] Checking Mothership URL patterns for: {url}")
-        
-        mothership_patterns = [
-            r'/\d{4}/\d{2}/[a-zA-Z0-9-]+',         # 날짜 기반 URL
-            r'/[a-zA-Z0-9-]+-[a-zA-Z0-9-]+',       # 하이픈이 포함된 URL
-            r'/[a-zA-Z0-9-]{10,}'                   # 긴 제목 URL
-        ]
-        
+        site_key, site_label = 'mothership', 'Mothership'
         # Mothership 제외 패턴
-        if any(exclude in url_lower for exclude in ['/category/', '/tag/', '/author/']):
+        if filters.MOTHERSHIP_EXCLUDE_PATTERNS.search(url_lower):
             return False
-            
-        matched = any(re.search(pattern, url) for pattern in mothership_patterns)
-        if DEBUG_MODE:
-            print(f"[DEBUG] Mothership URL pattern match: {matched}")
-        return matched
-    
-    # The Independent Singapore
     elif 'theindependent.sg' in domain:
-        if DEBUG_MODE:
-            print(f"[DEBUG] Checking Independent SG URL patterns for: {url}")
-        
-        independent_patterns = [
-            r'/\d{4}/\d{2}/\d{2}/[a-zA-Z0-9-]+',  # 날짜 기반 URL
-            r'/[a-zA-Z0-9-]+-[a-zA-Z0-9-]+',       # 하이픈이 포함된 URL
-            r'/[a-zA-Z0-9-]{15,}'                   # 긴 제목 URL
-        ]
-        
-        matched = any(re.search(pattern, url) for pattern in independent_patterns)
-        if DEBUG_MODE:
-            print(f"[DEBUG] Independent URL pattern match: {matched}")
-        return matched
-    
-    # TODAY Online
+        site_key, site_label = 'independent', 'Independent'
     elif 'todayonline.com' in domain:
-        if DEBUG_MODE:
-            print(f"[DEBUG] Checking TODAY URL patterns for: {url}")
-        
-        today_patterns = [
-            r'/singapore/[a-zA-Z0-9-]+',            # 싱가포르 섹션
-            r'/world/[a-zA-Z0-9-]+',                # 월드 섹션
-            r'/commentary/[a-zA-Z0-9-]+',           # 논평 섹션
-            r'/lifestyle/[a-zA-Z0-9-]+',            # 라이프스타일 섹션
-            r'/[a-zA-Z0-9-]+-\d+',                 # 제목-숫자 패턴
-            r'/[a-zA-Z0-9-]{15,}'                   # 긴 제목 URL
-        ]
-        
-        matched = any(re.search(pattern, url) for pattern in today_patterns)
-        if DEBUG_MODE:
-            print(f"[DEBUG] TODAY URL pattern match: {matched}")
-        return matched
-    
-    # 기본 패턴 (모든 사이트용) - 매우 관대하게
-    general_patterns = [
-        r'/20\d{2}/\d{2}/\d{2}/[a-z0-9-]{3,}',   # 날짜 + 제목 패턴 (더 짧은 제목도 허용)
-        r'/articles?/[a-z0-9-]{3,}',             # 기사 URL
-        r'/news/[a-z0-9-]{3,}',                  # 뉴스 URL
-        r'/story/[a-z0-9-]{3,}',                 # 스토리 URL
-        r'/post/[a-z0-9-]{3,}',                  # 포스트 URL
-        r'/press-releases/[a-z0-9-]{3,}',        # 보도자료 URL
-        r'/events?/[a-z0-9-]{3,}',               # 이벤트 URL
-        r'/programmes?/[a-z0-9-]{3,}',           # 프로그램 URL
-        r'/initiatives?/[a-z0-9-]{3,}',          # 이니셔티브 URL
-        r'/policies/[a-z0-9-]{3,}',              # 정책 URL
-        r'/speeches/[a-z0-9-]{3,}',              # 연설 URL
-        r'/singapore/[a-z0-9-]{3,}',             # 싱가포르 섹션
-        r'/asia/[a-z0-9-]{3,}',                  # 아시아 섹션
-        r'/world/[a-z0-9-]{3,}',                 # 월드 섹션
-        r'/business/[a-z0-9-]{3,}',              # 비즈니스 섹션
-        r'/economy/[a-z0-9-]{3,}',               # 경제 섹션
-        r'/technology/[a-z0-9-]{3,}',            # 기술 섹션
-        r'/[a-z0-9-]{10,}$',                     # 긴 제목 URL (10자 이상)
-        r'/[a-z0-9-]+-\d+$',                     # 제목-숫자 패턴
-        r'/[a-z0-9-]+/[a-z0-9-]{5,}',           # 카테고리/제목 패턴
-        r'\w+://[^/]+/[^?#]+[a-zA-Z0-9-]{5,}'   # 일반적인 콘텐츠 URL (쿼리/앵커 제외)
-    ]
-    
-    # URL이 최소 길이 요건을 만족하는지 확인
-    if len(url) < 30:  # 너무 짧은 URL은 기사가 아닐 가능성
-        if DEBUG_MODE:
-            print(f"[DEBUG] URL too short: {url}")
-        return False
+        site_key, site_label = 'today', 'TODAY'
+    else:
+        site_key, site_label = 'general', 'General'
+        # URL이 최소 길이 요건을 만족하는지 확인
+        if len(url) < 30:  # 너무 짧은 URL은 기사가 아닐 가능성
+            if DEBUG_MODE:
+                print(f"[DEBUG] URL too short: {url}")
+            return False
     
-    matched = any(re.search(pattern, url) for pattern in general_patterns)
+    matched = filters.SITE_URL_PATTERNS[site_key].search(url) is not None
     if DEBUG_MODE:
-        print(f"[DEBUG] General URL pattern match: {matched} for {url}")
+        print(f"[DEBUG] {site_label} URL pattern match: {matched} for {url}")
     return matched
 
 def get_article_links_straits_times(soup, base_url):
@@ -1988,6 +1747,68 @@ def should_use_ai_summary(article_data, site_name):
     return can_use
 
 def create_summary(article_data, settings, site_name=''):
+    """요약 생성 - 이전 실행과 본문이 같거나, 다른 매체의 같은 기사(근사 중복)를 이미 요약했으면
+    저장된 요약 재사용 (AI 사용량에 포함되지 않음)"""
+    article_index = get_article_index()
+    url = article_data.get('url', '')
+    title = article_data.get('title', '')
+    content_hash = article_index.content_hash(title, article_data.get('content', ''))
+    fingerprint = article_index.fingerprint(title, article_data.get('content', ''))
+    
+    profiler = get_profiler()
+    reused = article_index.get_summary(url, content_hash) if url else None
+    if reused:
+        print(f"[SUMMARY] Reusing stored {reused['extracted_by']} summary for unchanged article: {url}")
+        profiler.incr('summary_reused', site=site_name or None)
+        return reused
+    
+    # 이번 실행/최근 실행에서 요약한 근사 중복 기사의 요약 재사용 (제목+리드 SimHash)
+    reuse_options = settings.get('summaryReuse', {})
+    similar = None
+    if reuse_options.get('enabled', True):
+        similar = article_index.find_similar_summary(
+            fingerprint, reuse_options.get('maxDistance', DEFAULT_SIMILAR_DISTANCE), exclude_url=url)
+    if similar:
+        summary_result, source_url, distance = similar
+        print(f"[SUMMARY] Reusing {summary_result['extracted_by']} summary of near-duplicate "
+              f"{source_url} (distance {distance}) for {url}")
+        profiler.incr('summary_near_duplicate', site=site_name or None)
+    else:
+        with profiler.timer('summarize', site=site_name or None):
+            summary_result = generate_summary(article_data, settings, site_name)
+    
+    summary_text = summary_result['text'] if isinstance(summary_result, dict) else summary_result
+    summary_api = summary_result.get('extracted_by', 'keyword') if isinstance(summary_result, dict) else 'keyword'
+    article_index.record(
+        url,
+        title=title,
+        content_hash=content_hash,
+        simhash=fingerprint,
+        summary=summary_text,
+        extracted_by=summary_api
+    )
+    profiler.incr(f'summary_{summary_api}', site=site_name or None)
+    return summary_result
+
+def summary_providers(settings):
+    """apiPriority 순서의 (이름, 요약 함수) 목록 (API 키가 없거나 구현이 없는 제공자는 제외)"""
+    summarizers = {
+        'cohere': ('COHERE_API_KEY', translate_to_korean_summary_cohere),
+        'gemini': ('GOOGLE_GEMINI_API_KEY', translate_to_korean_summary_gemini)
+    }
+    priority = settings.get('scrapingMethodOptions', {}).get('hybrid', {}).get('apiPriority', ['cohere', 'gemini'])
+    providers = []
+    for name in priority:
+        if name not in summarizers:
+            continue
+        key_env, func = summarizers[name]
+        if not os.environ.get(key_env):
+            print(f"[SUMMARY] {name}: API key not found, skipping")
+            continue
+        providers.append((name, func))
+    return providers
+
+def generate_summary(article_data, settings, site_name=''):
     """설정에 따른 요약 생성 (AI 사용량 제한)"""
     global AI_SUMMARY_COUNT
     
@@ -2018,56 +1839,26 @@ def create_summary(article_data, settings, site_name=''):
     
     print(f"[SUMMARY] Attempting AI summary ({AI_SUMMARY_COUNT + 1}/{MAX_AI_SUMMARIES}) for {site_name}")
     
-    # 멀티 API 폴백 시스템: Cohere → Gemini → Google Translate
-    ai_apis = [
-        {
-            'name': 'Cohere', 
-            'function': 'translate_to_korean_summary_cohere',
-            'key_env': 'COHERE_API_KEY'
-        },
-        {
-            'name': 'Gemini',
-            'function': 'translate_to_korean_summary_gemini',
-            'key_env': 'GOOGLE_GEMINI_API_KEY'
-        },
-        {
-            'name': 'Fallback',
-            'function': 'translate_to_korean_summary_fallback', 
-            'key_env': None  # Fallback은 API 키 불필요
-        }
-    ]
+    # 멀티 API 폴백 시스템: apiPriority 순서의 제공자(API 키가 있는 것만) → Fallback
+    # providerRouting이 켜져 있으면 하이브리드와 같은 라우터가 응답 시간/오류율/할당량으로 제공자 선택
+    providers = summary_providers(settings) if AI_SUMMARY_AVAILABLE else []
+    router = get_provider_router()
+    if router is not None and providers:
+        summary_result, api_name = router.route(providers, article_data['title'], article_data['content'])
+        if summary_result:
+            AI_SUMMARY_COUNT += 1
+            print(f"[SUMMARY] {api_name} SUCCESS via router! ({AI_SUMMARY_COUNT}/{MAX_AI_SUMMARIES}) - {summary_result[:100]}...")
+            return {'text': summary_result, 'extracted_by': api_name}
+        print(f"[SUMMARY] Router: all providers failed, trying fallback")
+        providers = []
+    
+    if AI_SUMMARY_AVAILABLE:
+        providers.append(('fallback', translate_to_korean_summary_fallback))
+    else:
+        print(f"[SUMMARY] AI summary functions not available")
     
-    for api_info in ai_apis:
-        api_name = api_info['name']
-        function_name = api_info['function']
-        key_env = api_info['key_env']
-        
-        # API 키 필요한 경우 확인
-        if key_env:
-            api_key_check = os.environ.get(key_env)
-            if not api_key_check:
-                print(f"[SUMMARY] {api_name}: API key not found, skipping")
-                continue
-            print(f"[SUMMARY] {api_name}: API key present, attempting...")
-        else:
-            print(f"[SUMMARY] {api_name}: No API key required, attempting...")
-        
+    for api_name, ai_function in providers:
         try:
-            # AI 요약 함수 확인
-            if not AI_SUMMARY_AVAILABLE:
-                print(f"[SUMMARY] AI summary functions not available, skipping {api_name}")
-                continue
-            
-            if function_name == 'translate_to_korean_summary_gemini':
-                ai_function = translate_to_korean_summary_gemini
-            elif function_name == 'translate_to_korean_summary_cohere':
-                ai_function = translate_to_korean_summary_cohere
-            elif function_name == 'translate_to_korean_summary_fallback':
-                ai_function = translate_to_korean_summary_fallback
-            else:
-                print(f"[SUMMARY] {api_name}: Unknown function, skipping")
-                continue
-            
             print(f"[SUMMARY] {api_name}: Calling API...")
             summary_result = ai_function(article_data['title'], article_data['content'])
             
@@ -2076,7 +1867,7 @@ def create_summary(article_data, settings, site_name=''):
                 print(f"[SUMMARY] {api_name} SUCCESS! ({AI_SUMMARY_COUNT}/{MAX_AI_SUMMARIES}) - {summary_result[:100]}...")
                 return {
                     'text': summary_result,
-                    'extracted_by': api_name.lower()
+                    'extracted_by': api_name
                 }
             else:
                 print(f"[SUMMARY] {api_name}: Returned empty result, trying next API")
@@ -2200,14 +1991,20 @@ def scrape_news_ai():
     blocked_keywords = [kw.strip() for kw in settings.get('blockedKeywords', '').split(',') if kw.strip()]
     important_keywords = [kw.strip() for kw in settings.get('importantKeywords', '').split(',') if kw.strip()]
     
-    for site in sites:
+    ai_scraper = get_ai_scraper()
+    fetcher = ConcurrentFetcher.from_settings(settings, controller=get_domain_controller())
+    engine = get_fetch_engine(settings)
+    
+    # 1단계: 모든 사이트 홈페이지를 묶어서 분류 (batch_size개씩 한 번의 AI 요청)
+    site_results = ai_scraper.scrape_many_with_ai([site['url'] for site in sites], fetcher=fetcher, engine=engine)
+    
+    # 사이트별 후보 기사 (site, article_url) - 2단계에서 한꺼번에 분류
+    article_jobs = []
+    
+    for site, site_result in zip(sites, site_results):
         try:
             print(f"AI Scraping {site['name']}...")
             
-            # AI 스크래퍼로 사이트 분석
-            ai_scraper = get_ai_scraper()
-            site_result = ai_scraper.scrape_with_ai(site['url'])
-            
             if site_result['type'] == 'error':
                 print(f"[ERROR] Failed to scrape {site['name']}: {site_result['error']}")
                 continue
@@ -2231,84 +2028,20 @@ def scrape_news_ai():
                 }
                 max_links = priority_limits.get(site['name'], 3)  # 기본값 3개
                 
+                # 이전 실행에서 이미 처리한 기사는 다시 받지 않음
+                if settings.get('skipSeenArticles', True):
+                    new_links = get_article_index().filter_new(links)
+                    if len(new_links) < len(links):
+                        print(f"[AI] Skipping {len(links) - len(new_links)} previously processed links for {site['name']}")
+                    links = new_links
+                
                 # 링크가 없으면 건너뛰기
                 if not links:
                     print(f"[AI] No links to process for {site['name']}")
                     continue
-                    
-                for idx, article_url in enumerate(links[:max_links]):
-                    try:
-                        print(f"[AI] Processing article {idx+1}/{min(len(links), max_links)}: {article_url}")
-                        
-                        # AI로 기사 추출
-                        ai_scraper = get_ai_scraper()
-                        article_result = ai_scraper.scrape_with_ai(article_url)
-                        
-                        if article_result['type'] != 'article':
-                            print(f"[AI] Skipping: not an article - {article_result['type']}")
-                            continue
-                        
-                        # 기사 데이터 검증
-                        if not article_result.get('title') or not article_result.get('content'):
-                            print(f"[AI] Skipping: missing title or content")
-                            continue
-                        
-                        if len(article_result['content']) < 50:
-                            print(f"[AI] Skipping: content too short ({len(article_result['content'])} chars)")
-                            continue
-                        
-                        # 키워드 필터링
-                        full_text = f"{article_result['title']} {article_result['content']}"
-                        
-                        if is_blocked(full_text, blocked_keywords):
-                            print(f"[AI] Skipping: blocked by keywords")
-                            continue
-                        
-                        if settings['scrapTarget'] == 'important' and not contains_keywords(full_text, important_keywords):
-                            print(f"[AI] Skipping: no important keywords")
-                            continue
-                        
-                        print(f"[AI] Article passed validation: {article_result['title']}")
-                        
-                        # 기사 HTML에서 발행일 추출 시도
-                        publish_date = None
-                        if article_result.get('html'):
-                            try:
-                                soup = BeautifulSoup(article_result['html'], 'html.parser')
-                                publish_date = extract_publish_date(soup, default_to_now=True)
-                            except:
-                                pass
-                        
-                        if not publish_date:
-                            publish_date = get_kst_now()
-                        
-                        # 요약 생성
-                        article_data = {
-                            'title': article_result['title'],
-                            'content': article_result['content'],
-                            'publish_date': publish_date,
-                            'url': article_url
-                        }
-                        summary_result = create_summary(article_data, settings, site['name'])
-                        summary_text = summary_result['text'] if isinstance(summary_result, dict) else summary_result
-                        summary_api = summary_result.get('extracted_by', 'ai') if isinstance(summary_result, dict) else 'ai'
-                        print(f"[AI] Generated summary: {summary_text[:100]}...")
-                        
-                        # 그룹별로 기사 수집
-                        articles_by_group[site['group']].append({
-                            'site': site['name'],
-                            'title': article_result['title'],
-                            'url': article_url,
-                            'summary': summary_text,
-                            'content': article_result['content'],
-                            'publish_date': publish_date.isoformat() if isinstance(publish_date, datetime) else publish_date,
-                            'extracted_by': f"ai_{summary_api}",
-                            'ai_classification': article_result.get('classification', {})
-                        })
-                        
-                    except Exception as e:
-                        print(f"[ERROR] Error processing article {article_url}: {e}")
-                        continue
+                
+                for article_url in links[:max_links]:
+                    article_jobs.append((site, article_url))
             
             # 직접 기사인 경우
             elif site_result['type'] == 'article':
@@ -2323,10 +2056,10 @@ def scrape_news_ai():
                             
                             # 발행일 추출 시도
                             publish_date = None
-                            if site_result.get('html'):
+                            if site_result.get('document'):
                                 try:
-                                    soup = BeautifulSoup(site_result['html'], 'html.parser')
-                                    publish_date = extract_publish_date(soup, default_to_now=True)
+                                    # 분류/추출 단계에서 파싱한 트리 재사용
+                                    publish_date = extract_publish_date(site_result['document'], default_to_now=True)
                                 except:
                                     pass
                             
@@ -2366,6 +2099,80 @@ def scrape_news_ai():
             print(f"[ERROR] Error scraping {site['name']}: {e}")
             continue
     
+    # 2단계: 모든 사이트의 후보 기사를 묶어서 분류한 뒤 기사별로 추출/요약
+    article_results = ai_scraper.scrape_many_with_ai([url for _, url in article_jobs], fetcher=fetcher, engine=engine) if article_jobs else []
+    
+    for idx, ((site, article_url), article_result) in enumerate(zip(article_jobs, article_results)):
+        try:
+            print(f"[AI] Processing article {idx+1}/{len(article_jobs)}: {article_url}")
+            
+            if article_result['type'] != 'article':
+                print(f"[AI] Skipping: not an article - {article_result['type']}")
+                continue
+            
+            # 기사 데이터 검증
+            if not article_result.get('title') or not article_result.get('content'):
+                print(f"[AI] Skipping: missing title or content")
+                continue
+            
+            if len(article_result['content']) < 50:
+                print(f"[AI] Skipping: content too short ({len(article_result['content'])} chars)")
+                continue
+            
+            # 키워드 필터링
+            full_text = f"{article_result['title']} {article_result['content']}"
+            
+            if is_blocked(full_text, blocked_keywords):
+                print(f"[AI] Skipping: blocked by keywords")
+                continue
+            
+            if settings['scrapTarget'] == 'important' and not contains_keywords(full_text, important_keywords):
+                print(f"[AI] Skipping: no important keywords")
+                continue
+            
+            print(f"[AI] Article passed validation: {article_result['title']}")
+            get_profiler().incr('articles_accepted', site=site['name'])
+            
+            # 기사 HTML에서 발행일 추출 시도
+            publish_date = None
+            if article_result.get('document'):
+                try:
+                    # 분류/추출 단계에서 파싱한 트리 재사용
+                    publish_date = extract_publish_date(article_result['document'], default_to_now=True)
+                except:
+                    pass
+            
+            if not publish_date:
+                publish_date = get_kst_now()
+            
+            # 요약 생성
+            article_data = {
+                'title': article_result['title'],
+                'content': article_result['content'],
+                'publish_date': publish_date,
+                'url': article_url
+            }
+            summary_result = create_summary(article_data, settings, site['name'])
+            summary_text = summary_result['text'] if isinstance(summary_result, dict) else summary_result
+            summary_api = summary_result.get('extracted_by', 'ai') if isinstance(summary_result, dict) else 'ai'
+            print(f"[AI] Generated summary: {summary_text[:100]}...")
+            
+            # 그룹별로 기사 수집
+            articles_by_group[site['group']].append({
+                'site': site['name'],
+                'title': article_result['title'],
+                'url': article_url,
+                'summary': summary_text,
+                'content': article_result['content'],
+                'publish_date': publish_date.isoformat() if isinstance(publish_date, datetime) else publish_date,
+                'extracted_by': f"ai_{summary_api}",
+                'ai_classification': article_result.get('classification', {})
+            })
+            
+        except Exception as e:
+            print(f"[ERROR] Error processing article {article_url}: {e}")
+            continue
+    
     # 그룹별로 기사 통합
     consolidated_articles = []
     
@@ -2421,13 +2228,32 @@ def scrape_news_ai():
 
 def scrape_news():
     """메인 스크랩 함수 - 설정에 따라 방식 선택"""
-    # AI 요약 카운터 리셋
+    # AI 요약 카운터 및 실행 프로파일 리셋
     reset_ai_summary_count()
+    get_profiler().reset()
     
     settings = load_settings()
     scraping_method = settings.get('scrapingMethod', 'traditional')
     
     print(f"[SCRAPER] Selected method: {scraping_method}")
+    print(f"[SCRAPER] HTML parser: {set_default_parser(settings.get('htmlParser', 'html.parser'))}")
+    configure_page_limits(settings)
+    
+    # 도메인별 적응형 동시성/타임아웃 제어 (이전 실행에서 학습한 값으로 시작)
+    controller = configure_domain_controller(settings)
+    print(f"[SCRAPER] Adaptive fetch: {'on (' + str(len(controller.snapshot())) + ' known domains)' if controller else 'off'}")
+    
+    configure_fallback_racer(settings)
+    configure_sitemap_discovery(settings)
+    configure_provider_router(settings)
+    if BROWSER_SCRAPER_AVAILABLE:
+        configure_browser_pool(settings)
+    
+    # 도메인별 서킷 브레이커 (이전 실행에서 차단된 도메인은 시험 요청부터 시작)
+    breaker = configure_circuit_breaker(settings)
+    if breaker:
+        recovering = [domain for domain, state in breaker.snapshot().items() if state['state'] != CLOSED]
+        print(f"[SCRAPER] Circuit breaker: on ({len(recovering)} domains to probe{': ' + ', '.join(recovering) if recovering else ''})")
     
     # AI 스크래퍼 초기화 (지연 초기화)
     ai_scraper = get_ai_scraper()
@@ -2487,15 +2313,38 @@ def scrape_news():
         print("Using traditional scraping...")
         return scrape_news_traditional()
 
-def scrape_news_traditional():
-    """기존 방식의 스크랩 함수 (AI 없이)"""
-    settings = load_settings()
-    sites = load_sites()
-    articles_by_group = defaultdict(list)
+def extract_site_links(site, response):
+    """홈페이지 응답에서 사이트별 추출기로 기사 링크 추출"""
+    soup = ParsedDocument(response.content, site['url']).soup
     
-    blocked_keywords = [kw.strip() for kw in settings.get('blockedKeywords', '').split(',') if kw.strip()]
-    important_keywords = [kw.strip() for kw in settings.get('importantKeywords', '').split(',') if kw.strip()]
+    # 사이트별 링크 추출
+    domain = urlparse(site['url']).netloc.lower()
+    print(f"[SCRAPER] Domain: {domain}")
     
+    if 'straitstimes.com' in domain:
+        print(f"[SCRAPER] Using Straits Times specific extractor")
+        links = get_article_links_straits_times(soup, site['url'])
+    elif 'moe.gov.sg' in domain:
+        print(f"[SCRAPER] Using MOE specific extractor")
+        links = get_article_links_moe(soup, site['url'])
+    elif 'theindependent.sg' in domain:
+        print(f"[SCRAPER] Using Independent specific extractor")
+        links = get_article_links_independent(soup, site['url'])
+    else:
+        print(f"[SCRAPER] Using generic extractor")
+        links = get_article_links_generic(soup, site['url'])
+    
+    if len(links) == 0:
+        # 페이지 타이틀 확인
+        title = soup.title.string if soup.title else "No title"
+        print(f"[SCRAPER] Page title: {title[:100]}")
+    
+    # 다음 실행에서 홈페이지가 304면 재사용
+    get_http_cache().set_derived(site['url'], 'links', links)
+    return links
+
+def site_request_headers(site):
+    """사이트 홈페이지 요청 헤더 (사이트별로 다른 User-Agent)"""
     # 더 나은 User-Agent 헤더들
     user_agents = [
         'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
@@ -2503,109 +2352,216 @@ def scrape_news_traditional():
         'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36'
     ]
     
-    for site in sites:
-        try:
-            print(f"\n[SCRAPER] === Scraping {site['name']} ({site['url']}) ===")
-            
+    headers = {
+        'User-Agent': user_agents[hash(site['name']) % len(user_agents)],
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+        'Accept-Encoding': 'gzip, deflate',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1'
+    }
+    
+    # Mothership의 경우 추가 헤더
+    if 'mothership' in site['url'].lower():
+        headers['Referer'] = 'https://www.google.com/'
+    return headers
+
+def site_request_delay():
+    """사이트 접속 전 랜덤 딜레이 (0.5-2초)"""
+    return random.uniform(0.5, 2)
+
+def collect_site_links(site, skip_seen=True):
+    """사이트 뉴스 사이트맵 또는 홈페이지에서 처리할 기사 링크 목록 수집 (병렬 수집 단위)"""
+    try:
+        print(f"\n[SCRAPER] === Scraping {site['name']} ({site['url']}) ===")
+        
+        profiler = get_profiler()
+        
+        # 뉴스 사이트맵이 있으면 발행 시각으로 이미 걸러진 최신 기사 URL 사용 (홈페이지 파싱 생략)
+        # 사이트맵이 없거나 최근 기사가 없으면 기존처럼 홈페이지에서 링크 추출
+        discovery = get_sitemap_discovery()
+        entries = None
+        if discovery is not None:
+            with profiler.timer('sitemap'):
+                entries = discovery.discover(site)
+        
+        if entries:
+            links = [entry.url for entry in entries]
+            print(f"[SCRAPER] Sitemap: {len(links)} recent articles for {site['name']}")
+            profiler.incr('links_from_sitemap', len(links))
+        else:
             # 사이트별로 다른 헤더 사용
-            headers = {
-                'User-Agent': user_agents[hash(site['name']) % len(user_agents)],
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1'
-            }
-            
-            # Mothership의 경우 추가 헤더
-            if 'mothership' in site['url'].lower():
-                headers['Referer'] = 'https://www.google.com/'
+            headers = site_request_headers(site)
             
-            # 사이트 접속 전 랜덤 딜레이 (0.5-2초)
-            time.sleep(random.uniform(0.5, 2))
+            # async 엔진이 미리 받은 페이지는 딜레이 없이 바로 사용
+            if not get_http_cache().is_prefetched(site['url']):
+                with profiler.timer('delay'):
+                    time.sleep(site_request_delay())
             
-            response = requests.get(site['url'], timeout=10, headers=headers)
+            with profiler.timer('fetch'):
+                response = get_http_cache().get(site['url'], timeout=10, headers=headers,
+                                                limits=get_page_limits(site['url']))
             
             print(f"[SCRAPER] HTTP Status: {response.status_code}")
             if response.status_code != 200:
                 print(f"[SCRAPER] Failed to access {site['name']}: HTTP {response.status_code}")
-                continue
-                
-            soup = BeautifulSoup(response.content, 'html.parser')
+                return []
             
-            # 사이트별 링크 추출
-            domain = urlparse(site['url']).netloc.lower()
-            print(f"[SCRAPER] Domain: {domain}")
-            
-            if 'straitstimes.com' in domain:
-                print(f"[SCRAPER] Using Straits Times specific extractor")
-                links = get_article_links_straits_times(soup, site['url'])
-            elif 'moe.gov.sg' in domain:
-                print(f"[SCRAPER] Using MOE specific extractor")
-                links = get_article_links_moe(soup, site['url'])
-            elif 'theindependent.sg' in domain:
-                print(f"[SCRAPER] Using Independent specific extractor")
-                links = get_article_links_independent(soup, site['url'])
-            else:
-                print(f"[SCRAPER] Using generic extractor")
-                links = get_article_links_generic(soup, site['url'])
-            
-            print(f"[SCRAPER] Found {len(links)} article links for {site['name']}")
-            if len(links) == 0:
-                print(f"[SCRAPER] WARNING: No links found for {site['name']} - site may have changed structure")
-                # 페이지 타이틀 확인
-                title = soup.title.string if soup.title else "No title"
-                print(f"[SCRAPER] Page title: {title[:100]}")
-                continue
-            
-            # 기사별 처리
-            # 우선순위별 링크 수 설정
-            priority_limits = {
-                'The Straits Times': 5,
-                'Channel NewsAsia': 5,
-                'The Business Times': 4,
-                'Yahoo Singapore News': 4,
-                'Mothership': 4,
-                'The Independent Singapore': 3,
-                'MustShareNews': 3,
-                'AsiaOne': 3
-            }
-            max_links = priority_limits.get(site['name'], 2)  # 기본값 2개
-            
-            for article_url in links[:max_links]:
-                try:
-                    if DEBUG_MODE:
-                        print(f"[DEBUG] Processing article: {article_url}")
-                    article_data = extract_article_content(article_url)
-                    
+            # 304로 재사용된 홈페이지면 이전에 추출한 링크 사용
+            links = get_http_cache().get_derived(response, 'links')
+            if links is None:
+                with profiler.timer('link_extraction'):
+                    links = extract_site_links(site, response)
+        
+        print(f"[SCRAPER] Found {len(links)} article links for {site['name']}")
+        profiler.incr('links_found', len(links))
+        if len(links) == 0:
+            print(f"[SCRAPER] WARNING: No links found for {site['name']} - site may have changed structure")
+            return []
+        
+        # 이전 실행에서 이미 처리한 기사는 다시 받지 않음
+        if skip_seen:
+            new_links = get_article_index().filter_new(links)
+            if len(new_links) < len(links):
+                print(f"[SCRAPER] Skipping {len(links) - len(new_links)} previously processed links for {site['name']}")
+                profiler.incr('links_skipped_seen', len(links) - len(new_links))
+            links = new_links
+        
+        # 우선순위별 링크 수 설정
+        priority_limits = {
+            'The Straits Times': 5,
+            'Channel NewsAsia': 5,
+            'The Business Times': 4,
+            'Yahoo Singapore News': 4,
+            'Mothership': 4,
+            'The Independent Singapore': 3,
+            'MustShareNews': 3,
+            'AsiaOne': 3
+        }
+        max_links = priority_limits.get(site['name'], 2)  # 기본값 2개
+        
+        return links[:max_links]
+        
+    except Exception as e:
+        print(f"[SCRAPER] ERROR scraping {site['name']}: {e}")
+        import traceback
+        traceback.print_exc()
+        return []
+
+def collect_articles_traditional(settings=None, sites=None, summarize=True):
+    """사이트별 링크 수집 → 본문 추출 → 검증을 거친 기사 레코드를 그룹별로 반환 (파일 저장 없음)
+
+    summarize=False면 요약을 만들지 않음 (하이브리드 모드에서 AI 요약 전 단계로 사용)
+    """
+    settings = settings or load_settings()
+    sites = load_sites() if sites is None else sites
+    articles_by_group = defaultdict(list)
+    
+    blocked_keywords = [kw.strip() for kw in settings.get('blockedKeywords', '').split(',') if kw.strip()]
+    important_keywords = [kw.strip() for kw in settings.get('importantKeywords', '').split(',') if kw.strip()]
+    
+    # 동시 수집 설정 (maxWorkers=1이면 기존 순차 방식과 동일)
+    fetcher = ConcurrentFetcher.from_settings(settings, controller=get_domain_controller())
+    print(f"[SCRAPER] Concurrent fetch: maxWorkers={fetcher.max_workers}, maxPerDomain={fetcher.per_domain}")
+    
+    # async 엔진: 홈페이지/기사를 한 이벤트 루프에서 미리 받아 HTTP 캐시에 넣어 둠 (추출은 기존 경로 그대로)
+    engine = get_fetch_engine(settings)
+    
+    # 1단계: 홈페이지 수집 및 링크 추출 (도메인 간 병렬)
+    skip_seen = settings.get('skipSeenArticles', True)
+    profiler = get_profiler()
+    if engine:
+        # 뉴스 사이트맵을 쓰는 사이트는 홈페이지를 받지 않음
+        discovery = get_sitemap_discovery()
+        with profiler.timer('prefetch'):
+            engine.prefetch([
+                FetchJob(site['url'], site_request_headers(site), delay=site_request_delay(),
+                         limits=get_page_limits(site['url']))
+                for site in sites
+                if discovery is None or not discovery.has_sitemap(site)
+            ])
+    
+    def collect_links(site):
+        with profiler.site(site['name']):
+            return collect_site_links(site, skip_seen)
+    
+    site_links = fetcher.map_ordered(collect_links, sites, lambda site: site['url'])
+    
+    # 2단계: 기사 본문 수집 (도메인 간 병렬, 도메인 내에서는 접근 전략 딜레이 유지)
+    article_jobs = [
+        (site, article_url)
+        for site, links in zip(sites, site_links)
+        for article_url in (links or [])
+    ]
+    
+    def fetch_article(job):
+        if DEBUG_MODE:
+            print(f"[DEBUG] Processing article: {job[1]}")
+        with profiler.site(job[0]['name']):
+            return extract_article_content(job[1])
+    
+    if engine and article_jobs:
+        breaker = get_circuit_breaker()
+        with profiler.timer('prefetch'):
+            engine.prefetch([
+                FetchJob(article_url, *article_request_options(article_url),
+                         limits=get_page_limits(article_url, article=True))
+                for _, article_url in article_jobs
+                if breaker is None or breaker.state(article_url) == CLOSED
+            ])
+    
+    article_results = fetcher.map_ordered(fetch_article, article_jobs, lambda job: job[1])
+    
+    # JavaScript 렌더링용 브라우저는 본문 수집이 끝나면 바로 종료
+    if BROWSER_SCRAPER_AVAILABLE:
+        shutdown_browser_pool()
+    
+    # 3단계: 검증 및 요약 (사이트/링크 순서대로 순차 처리해 순차 모드와 같은 결과 유지)
+    article_index = get_article_index()
+    
+    def reject(reason, remember=True):
+        # 설정과 무관한 거절 사유만 기사 인덱스에 기록 (키워드 필터는 설정이 바뀌면 다시 평가)
+        profiler.incr(f'rejected_{reason}')
+        if remember:
+            article_index.record_rejected(article_url, reason)
+    
+    for (site, article_url), article_data in zip(article_jobs, article_results):
+        with profiler.site(site['name']):
+            try:
+                with profiler.timer('validate'):
                     if not article_data or not article_data['title']:
                         if DEBUG_MODE:
                             print(f"[DEBUG] Skipping: no title or data")
+                        reject('no_data', remember=False)
                         continue
-                        
+                
                     if len(article_data['content']) < 30:
                         if DEBUG_MODE:
                             print(f"[DEBUG] Skipping: content too short ({len(article_data['content'])} chars)")
+                        reject('too_short', remember=False)
                         continue
-                    
+            
                     # 제목부터 메뉴/네비게이션 페이지 확인
                     if is_menu_text(article_data['title']):
                         if DEBUG_MODE:
                             print(f"[DEBUG] Skipping: menu title detected - {article_data['title']}")
+                        reject('menu_title')
                         continue
-                    
+            
                     # 랜딩 페이지 또는 메뉴 페이지인지 확인
                     if is_landing_page_content(article_data['content']):
                         if DEBUG_MODE:
                             print(f"[DEBUG] Skipping: landing page content detected")
+                        reject('landing_page')
                         continue
-                        
+                
                     # 의미있는 기사 내용인지 확인
                     if not is_meaningful_content(article_data['content']):
                         if DEBUG_MODE:
                             print(f"[DEBUG] Skipping: not meaningful content")
+                        reject('not_meaningful')
                         continue
-                    
+            
                     # 카테고리 페이지 필터링 (제목 기반)
                     category_page_titles = [
                         'features', 'big read', 'top stories', 'latest news',
@@ -2615,61 +2571,80 @@ def scrape_news_traditional():
                         'learning minds', 'newsletter', 'subscribe', 'health',
                         'politics', 'science', 'culture', 'entertainment'
                     ]
-                    
+            
                     if any(cat.lower() == article_data['title'].lower().strip() for cat in category_page_titles):
                         if DEBUG_MODE:
                             print(f"[DEBUG] Skipping: category page title detected - {article_data['title']}")
+                        reject('category_page')
                         continue
-                    
+            
                     full_text = f"{article_data['title']} {article_data['content']}"
-                    
+            
                     # 필터링
                     if is_blocked(full_text, blocked_keywords):
                         print(f"[DEBUG] Skipping: blocked by keywords")
+                        reject('blocked', remember=False)
                         continue
-                    
+            
                     if settings['scrapTarget'] == 'recent' and not is_recent_article(article_data['publish_date']):
                         print(f"[DEBUG] Skipping: not recent article")
+                        reject('not_recent')
                         continue
-                    
+            
                     if settings['scrapTarget'] == 'important' and not contains_keywords(full_text, important_keywords):
                         print(f"[DEBUG] Skipping: no important keywords")
+                        reject('not_important', remember=False)
                         continue
-                    
+            
                     # 최종 유효성 검사 - 실제 기사 내용인지 재확인
                     if not validate_final_article_content(article_data):
                         print(f"[DEBUG] Skipping: failed final validation")
+                        reject('final_validation')
                         continue
-                    
+            
                     print(f"[DEBUG] Article passed all validations: {article_data['title']}")
-                    
-                    # 요약 생성
+                profiler.incr('articles_accepted')
+            
+                # 요약 생성 (summarize=False면 생략하고 summary는 None)
+                summary_text = None
+                summary_api = None
+                if summarize:
                     article_data['url'] = article_url  # URL 추가
                     summary_result = create_summary(article_data, settings, site['name'])
                     summary_text = summary_result['text'] if isinstance(summary_result, dict) else summary_result
                     summary_api = summary_result.get('extracted_by', 'traditional') if isinstance(summary_result, dict) else 'traditional'
                     print(f"[DEBUG] Generated summary: {summary_text[:100]}...")
-                    
-                    # 그룹별로 기사 수집
-                    articles_by_group[site['group']].append({
-                        'site': site['name'],
-                        'title': article_data['title'],
-                        'url': article_url,
-                        'summary': summary_text,
-                        'content': article_data['content'],
-                        'publish_date': article_data['publish_date'].isoformat() if article_data['publish_date'] else None,
-                        'extracted_by': f"traditional_{summary_api}"
-                    })
-                    
-                except Exception as e:
-                    print(f"[ERROR] Error processing article {article_url}: {e}")
-                    continue
-                    
-        except Exception as e:
-            print(f"[SCRAPER] ERROR scraping {site['name']}: {e}")
-            import traceback
-            traceback.print_exc()
-            continue
+            
+                # 그룹별로 기사 수집
+                articles_by_group[site['group']].append({
+                    'site': site['name'],
+                    'title': article_data['title'],
+                    'url': article_url,
+                    'summary': summary_text,
+                    'content': article_data['content'],
+                    'publish_date': article_data['publish_date'].isoformat() if article_data['publish_date'] else None,
+                    'extracted_by': f"traditional_{summary_api}" if summary_api else 'traditional'
+                })
+            
+            except Exception as e:
+                print(f"[ERROR] Error processing article {article_url}: {e}")
+                continue
+    
+    return articles_by_group
+
+def select_group_articles(group_articles, limit=5):
+    """그룹 내 제목 기준 중복 제거 후 앞에서부터 limit개 선택"""
+    unique_articles = []
+    seen_titles = set()
+    for article in group_articles:
+        if article['title'] not in seen_titles:
+            seen_titles.add(article['title'])
+            unique_articles.append(article)
+    return unique_articles[:limit]
+
+def scrape_news_traditional():
+    """기존 방식의 스크랩 함수 (AI 없이)"""
+    articles_by_group = collect_articles_traditional()
     
     # 그룹별로 기사 통합
     consolidated_articles = []
@@ -2677,17 +2652,9 @@ def scrape_news_traditional():
     for group, group_articles in articles_by_group.items():
         if not group_articles:
             continue
-            
-        # 중복 제거 (제목 기준)
-        unique_articles = []
-        seen_titles = set()
-        for article in group_articles:
-            if article['title'] not in seen_titles:
-                seen_titles.add(article['title'])
-                unique_articles.append(article)
         
-        # 각 그룹에서 최대 5개의 주요 기사 선택 (기존 3개에서 증가)
-        selected_articles = unique_articles[:5]
+        # 중복 제거 후 각 그룹에서 최대 5개의 주요 기사 선택 (기존 3개에서 증가)
+        selected_articles = select_group_articles(group_articles, 5)
         
         # 그룹별 통합 기사 생성
         # KST 타임존 생성
@@ -2733,6 +2700,27 @@ def scrape_news_traditional():
     print(f"\nScraped {total_articles} articles from {len(consolidated_articles)} groups")
     return output_file
 
+def save_run_state():
+    """실행 프로파일, 도메인 학습 상태, 사이트 상태 저장 (성공/실패 모두)"""
+    from monitoring import save_run_profile
+    profile = get_profiler().to_dict()
+    controller = get_domain_controller()
+    if controller is not None:
+        profile['domains'] = controller.snapshot()
+        controller.save()
+    breaker = get_circuit_breaker()
+    if breaker is not None:
+        profile['site_health'] = breaker.snapshot()
+        breaker.save()
+    get_fallback_racer().save()
+    discovery = get_sitemap_discovery()
+    if discovery is not None:
+        discovery.save()
+    router = get_provider_router()
+    if router is not None:
+        router.save()
+    save_run_profile(profile)
+
 if __name__ == "__main__":
     import sys
     from monitoring import create_execution_summary, check_and_send_notification, save_monitoring_log
@@ -2744,8 +2732,9 @@ if __name__ == "__main__":
         # 실행 결과 요약 생성
         summary = create_execution_summary(scraped_file=output_file)
         
-        # 모니터링 로그 저장
+        # 모니터링 로그 및 실행 프로파일 저장
         save_monitoring_log(summary)
+        save_run_state()
         
         # 알림 전송
         check_and_send_notification(summary['status'], summary)
@@ -2759,8 +2748,9 @@ if __name__ == "__main__":
         # 오류 요약 생성
         summary = create_execution_summary(error=e)
         
-        # 모니터링 로그 저장
+        # 모니터링 로그 및 실행 프로파일 저장
         save_monitoring_log(summary)
+        save_run_state()
         
         # 오류 알림 전송
         check_and_send_notification('failure', summary)
@@ -10,6 +10,7 @@ try:
     from selenium.webdriver.support import expected_conditions as EC
     from selenium.webdriver.chrome.options import Options
     from selenium.webdriver.chrome.service import Service
+    from selenium.common.exceptions import TimeoutException
     SELENIUM_AVAILABLE = True
 except ImportError:
     SELENIUM_AVAILABLE = False
@@ -20,39 +21,121 @@ import random
 from bs4 import BeautifulSoup
 from datetime import datetime
 import pytz
+from urllib.parse import urlparse
 
 KST = pytz.timezone('Asia/Seoul')
 
+# 렌더링 프로필: 기사 텍스트에 필요 없는 리소스(이미지/폰트/미디어)와 광고/분석 호스트 차단
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.avif', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    '*.mp4', '*.webm', '*.mp3', '*.m3u8', '*.ts',
+    '*doubleclick.net*', '*googlesyndication.com*', '*googletagservices.com*', '*googletagmanager.com*',
+    '*google-analytics.com*', '*adservice.google.*', '*amazon-adsystem.com*', '*adnxs.com*', '*criteo.*',
+    '*taboola.com*', '*outbrain.com*', '*facebook.net*', '*connect.facebook.com*', '*scorecardresearch.com*',
+    '*chartbeat.*', '*hotjar.com*', '*newrelic.com*', '*nr-data.net*', '*quantserve.com*', '*permutive.*',
+    '*cxense.com*', '*tiktok.com/i18n/pixel*', '*sentry.io*'
+]
+
+# 렌더링 완료로 보는 사이트별 요소 (기사 JSON-LD가 나타나도 완료로 봄)
+READY_SELECTORS = {
+    'todayonline.com': 'article h1, .article-content, div[class*="article-body"]',
+    'techinasia.com': 'article h1, [class*="post-content"], [class*="post-card"]',
+    'theedgesingapore.com': 'article h1, .article, [class*="article-body"]',
+    'asiaone.com': 'article h1, .article-item, [class*="article-body"]',
+}
+DEFAULT_READY_SELECTOR = 'article, h1'
+JSON_LD_SELECTOR = 'script[type="application/ld+json"]'
+RENDER_TIMEOUT = 10
+READY_POLL_INTERVAL = 0.2
+
+def ready_selector(url):
+    """URL 도메인의 렌더링 완료 셀렉터 (기사 JSON-LD 포함)"""
+    domain = urlparse(url).netloc.lower()
+    selector = next((value for key, value in READY_SELECTORS.items() if key in domain), DEFAULT_READY_SELECTOR)
+    return f'{selector}, {JSON_LD_SELECTOR}'
+
+def wait_until_ready(driver, selector=None, timeout=RENDER_TIMEOUT):
+    """고정 sleep 대신 준비 요소가 나타나는 즉시 반환 (시간 초과 시 False, 페이지는 그대로 사용 가능)"""
+    selector = selector or ready_selector(driver.current_url)
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=READY_POLL_INTERVAL).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+        )
+        return True
+    except TimeoutException:
+        return False
+
+def apply_rendering_profile(options):
+    """eager 로딩(DOMContentLoaded에서 get 반환)과 이미지 비활성화"""
+    options.page_load_strategy = 'eager'
+    options.add_argument('--blink-settings=imagesEnabled=false')
+    options.add_argument('--mute-audio')
+    options.add_experimental_option('prefs', {
+        'profile.managed_default_content_settings.images': 2,
+        'profile.default_content_setting_values.notifications': 2
+    })
+    return options
+
+def block_resources(driver):
+    """CDP로 불필요한 리소스/광고·분석 호스트 요청 차단 (Chrome이 아니면 무시)"""
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        print(f"[BrowserScraper] Resource blocking unavailable: {e}")
+
+def chrome_options():
+    """헤드리스 Chrome 옵션"""
+    options = Options()
+    
+    # Headless 모드 (서버 환경)
+    options.add_argument('--headless')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    
+    # 봇 탐지 회피
+    options.add_argument('--disable-blink-features=AutomationControlled')
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option('useAutomationExtension', False)
+    
+    # User-Agent 설정
+    options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36')
+    
+    # 기타 옵션
+    options.add_argument('--disable-gpu')
+    options.add_argument('--disable-extensions')
+    options.add_argument('--proxy-server="direct://"')
+    options.add_argument('--proxy-bypass-list=*')
+    options.add_argument('--start-maximized')
+    return apply_rendering_profile(options)
+
+def create_driver(options=None):
+    """Chrome 드라이버 시작 (실패하면 예외 발생)"""
+    # GitHub Actions 환경에서는 chromedriver가 PATH에 있음
+    driver = webdriver.Chrome(options=options or chrome_options())
+    
+    # 봇 탐지 회피 스크립트
+    driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
+        'source': '''
+            Object.defineProperty(navigator, 'webdriver', {
+                get: () => undefined
+            })
+        '''
+    })
+    block_resources(driver)
+    return driver
+
 class BrowserScraper:
-    def __init__(self):
+    def __init__(self, driver=None):
+        """driver를 넘기면 그 드라이버로 페이지를 읽음 (browser_pool의 재사용 드라이버)"""
         if not SELENIUM_AVAILABLE:
             self.driver = None
             return
             
         # Chrome 옵션 설정
-        self.options = Options()
-        
-        # Headless 모드 (서버 환경)
-        self.options.add_argument('--headless')
-        self.options.add_argument('--no-sandbox')
-        self.options.add_argument('--disable-dev-shm-usage')
-        
-        # 봇 탐지 회피
-        self.options.add_argument('--disable-blink-features=AutomationControlled')
-        self.options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        self.options.add_experimental_option('useAutomationExtension', False)
-        
-        # User-Agent 설정
-        self.options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36')
-        
-        # 기타 옵션
-        self.options.add_argument('--disable-gpu')
-        self.options.add_argument('--disable-extensions')
-        self.options.add_argument('--proxy-server="direct://"')
-        self.options.add_argument('--proxy-bypass-list=*')
-        self.options.add_argument('--start-maximized')
-        
-        self.driver = None
+        self.options = chrome_options()
+        self.driver = driver
     
     def init_driver(self):
         """드라이버 초기화"""
@@ -60,18 +143,7 @@ class BrowserScraper:
             return False
             
         try:
-            # GitHub Actions 환경에서는 chromedriver가 PATH에 있음
-            self.driver = webdriver.Chrome(options=self.options)
-            
-            # 봇 탐지 회피 스크립트
-            self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
-                'source': '''
-                    Object.defineProperty(navigator, 'webdriver', {
-                        get: () => undefined
-                    })
-                '''
-            })
-            
+            self.driver = create_driver(self.options)
             return True
         except Exception as e:
             print(f"[BrowserScraper] Failed to init driver: {e}")
@@ -104,13 +176,13 @@ class BrowserScraper:
             # 페이지 로드
             self.driver.get(url)
             
-            # 특정 요소 대기
+            # 특정 요소 대기 (지정하지 않으면 사이트별 준비 요소나 기사 JSON-LD가 나타날 때까지만 대기)
             if wait_selector:
-                WebDriverWait(self.driver, 10).until(
+                WebDriverWait(self.driver, RENDER_TIMEOUT, poll_frequency=READY_POLL_INTERVAL).until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, wait_selector))
                 )
-            else:
-                self.wait_and_scroll()
+            elif not wait_until_ready(self.driver, ready_selector(url)):
+                print(f"[BrowserScraper] Ready element not found for {url}, using current DOM")
             
             # 페이지 소스 반환
             return self.driver.page_source
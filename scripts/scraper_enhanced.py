@@ -20,6 +20,7 @@ from collections import defaultdict
 from urllib.parse import urljoin, urlparse
 from text_processing import TextProcessor
 from deduplication import ArticleDeduplicator
+from http_session import get_http_pool
 
 # User-Agent 로테이션
 USER_AGENTS = [
@@ -48,7 +49,9 @@ def get_headers():
 
 def fetch_with_retry(url, max_retries=3, delay=2):
     """재시도 로직이 포함된 페이지 가져오기"""
-    session = requests.Session()
+    # 호스트별 keep-alive 세션 재사용 (쿠키도 세션에 유지됨)
+    # 재시도는 이 루프(User-Agent 교체/429 대기)만 담당하도록 urllib3 재시도는 끔
+    pool = get_http_pool()
     
     for attempt in range(max_retries):
         try:
@@ -57,10 +60,11 @@ def fetch_with_retry(url, max_retries=3, delay=2):
                 time.sleep(delay * attempt)
             
             # 쿠키 처리를 위한 세션 사용
-            response = session.get(
+            response = pool.get(
                 url, 
                 headers=get_headers(), 
                 timeout=15,
+                retries=0,
                 allow_redirects=True
             )
             
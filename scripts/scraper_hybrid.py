@@ -12,30 +12,30 @@ from collections import defaultdict
 
 # 전통적 스크래퍼 가져오기
 try:
-    from scraper import scrape_news_traditional, load_settings, load_sites, get_kst_now, get_kst_now_iso
+    from scraper import collect_articles_traditional, select_group_articles, load_settings, load_sites, get_kst_now, get_kst_now_iso
 except ImportError:
     # 상대 임포트 시도
     import sys
     sys.path.append(os.path.dirname(__file__))
-    from scraper import scrape_news_traditional, load_settings, load_sites, get_kst_now, get_kst_now_iso
+    from scraper import collect_articles_traditional, select_group_articles, load_settings, load_sites, get_kst_now, get_kst_now_iso
+from filter_engine import get_keyword_matcher
+from summary_workers import SummaryWorkers
+from deduplication import near_duplicate_groups
+from provider_router import configure_provider_router
+from article_index import get_article_index, DEFAULT_SIMILAR_DISTANCE
+from instrumentation import get_profiler
 
 def is_blocked_content(text, blocked_keywords):
     """텍스트가 차단 키워드를 포함하는지 확인 (강화된 버전)"""
     if not text or not blocked_keywords:
         return False
     
-    # 문자열인 경우 리스트로 변환
-    if isinstance(blocked_keywords, str):
-        blocked_keywords = [k.strip() for k in blocked_keywords.split(',') if k.strip()]
+    # 리스트인 경우 키워드 앞뒤 공백 제거 (문자열은 매처에서 쉼표로 분리)
+    if not isinstance(blocked_keywords, str):
+        blocked_keywords = [k.strip() for k in blocked_keywords]
     
-    text_lower = text.lower()
-    
-    # 각 키워드 확인 및 로깅
-    matched_keywords = []
-    for keyword in blocked_keywords:
-        keyword_clean = keyword.lower().strip()
-        if keyword_clean and keyword_clean in text_lower:
-            matched_keywords.append(keyword_clean)
+    # 사전 컴파일된 매처로 한 번에 확인 및 로깅
+    matched_keywords = get_keyword_matcher(blocked_keywords).matches(text.lower())
     
     if matched_keywords:
         print(f"[HYBRID] Matched blocked keywords: {matched_keywords[:5]}")
@@ -60,45 +60,39 @@ def scrape_news_hybrid():
     print("\n[HYBRID] Phase 1: Traditional Link Collection")
     articles_by_group = defaultdict(list)
     
-    # Traditional 스크래퍼로 기사 링크와 기본 정보 수집
+    # Traditional 스크래퍼로 기사 링크와 기본 정보 수집 (요약/파일 저장 없이 메모리로 전달)
     try:
-        traditional_file = scrape_news_traditional()
-        if traditional_file and os.path.exists(traditional_file):
-            # Traditional 스크래핑 결과 파일 읽기
-            with open(traditional_file, 'r', encoding='utf-8') as f:
-                traditional_articles = json.load(f)
-            
-            # 기사 데이터를 하이브리드 구조로 변환
-            blocked_keywords = settings.get('blockedKeywords', '')
-            for group_data in traditional_articles:
-                group = group_data['group']
-                for article in group_data['articles']:
-                    # 강화된 키워드 필터링 적용
-                    full_text = f"{article['title']} {article['content']}"
-                    
-                    # 디버그: 키워드 필터링 로그
-                    print(f"[HYBRID] Checking keywords for: {article['title'][:60]}...")
-                    
-                    is_blocked_result = is_blocked_content(full_text, blocked_keywords)
-                    print(f"[HYBRID] Keyword filtering result: {'BLOCKED' if is_blocked_result else 'ALLOWED'}")
+        traditional_articles = collect_articles_traditional(settings, sites, summarize=False)
+        
+        # 기사 데이터를 하이브리드 구조로 변환
+        blocked_keywords = settings.get('blockedKeywords', '')
+        for group, group_articles in traditional_articles.items():
+            # 중복 제거 후 그룹별 상위 5개만 요약 대상으로 사용
+            for article in select_group_articles(group_articles, 5):
+                # 강화된 키워드 필터링 적용
+                full_text = f"{article['title']} {article['content']}"
+                
+                # 디버그: 키워드 필터링 로그
+                print(f"[HYBRID] Checking keywords for: {article['title'][:60]}...")
+                
+                is_blocked_result = is_blocked_content(full_text, blocked_keywords)
+                print(f"[HYBRID] Keyword filtering result: {'BLOCKED' if is_blocked_result else 'ALLOWED'}")
+                
+                if is_blocked_result:
+                    print(f"[HYBRID] SKIPPING: blocked by keywords - {article['title'][:60]}...")
+                    continue
+                else:
+                    print(f"[HYBRID] ACCEPTING: passed keyword filter - {article['title'][:60]}...")
                     
-                    if is_blocked_result:
-                        print(f"[HYBRID] SKIPPING: blocked by keywords - {article['title'][:60]}...")
-                        continue
-                    else:
-                        print(f"[HYBRID] ACCEPTING: passed keyword filter - {article['title'][:60]}...")
-                        
-                    articles_by_group[group].append({
-                        'site': article['site'],
-                        'title': article['title'],
-                        'url': article['url'],
-                        'content': article['content'],
-                        'publish_date': article['publish_date'],
-                        'extracted_by': 'traditional'
-                    })
-            print(f"[HYBRID] Traditional: Loaded articles from {len(traditional_articles)} groups")
-        else:
-            print("[HYBRID] Traditional scraping returned no file or file not found")
+                articles_by_group[group].append({
+                    'site': article['site'],
+                    'title': article['title'],
+                    'url': article['url'],
+                    'content': article['content'],
+                    'publish_date': article['publish_date'],
+                    'extracted_by': 'traditional'
+                })
+        print(f"[HYBRID] Traditional: Collected articles from {len(traditional_articles)} groups")
     except Exception as e:
         print(f"[HYBRID] Traditional scraping error: {e}")
         import traceback
@@ -107,6 +101,52 @@ def scrape_news_hybrid():
     # Phase 2: AI 요약 생성
     print("\n[HYBRID] Phase 2: AI Summary Generation")
     
+    # 이전 실행에서 본문이 같은 기사를 요약했으면 저장된 요약 재사용 (AI 사용량에 포함되지 않음)
+    article_index = get_article_index()
+    all_articles = [article for group_articles in articles_by_group.values() for article in group_articles]
+    content_hashes = [article_index.content_hash(a['title'], a['content']) for a in all_articles]
+    fingerprints = [article_index.fingerprint(a['title'], a['content']) for a in all_articles]
+    # 기사 인덱스에 기록할 요약 출처 (API 요약만 다음 실행에서 재사용, 기본 요약은 keyword)
+    summary_sources = ['keyword'] * len(all_articles)
+    pending = []
+    for position, article in enumerate(all_articles):
+        reused = article_index.get_summary(article['url'], content_hashes[position])
+        if reused:
+            print(f"[HYBRID] Reusing stored {reused['extracted_by']} summary for unchanged article: {article['url']}")
+            get_profiler().incr('summary_reused', site=article['site'])
+            article['summary'] = reused['text']
+            article['extracted_by'] = f"hybrid_{reused['extracted_by']}"
+            summary_sources[position] = reused['extracted_by']
+        else:
+            pending.append(position)
+    
+    # 다른 매체가 실은 같은 기사(제목+리드 SimHash 근사 중복)는 대표 기사 하나만 요약하고 결과 공유
+    # 최근 실행에서 요약한 근사 중복 기사가 인덱스에 있으면 대표 기사도 요약하지 않고 그 요약 재사용
+    representatives = {position: position for position in pending}
+    reuse_options = settings.get('summaryReuse', {})
+    if reuse_options.get('enabled', True):
+        max_distance = reuse_options.get('maxDistance', DEFAULT_SIMILAR_DISTANCE)
+        groups = near_duplicate_groups([int(fingerprints[i], 16) for i in pending], max_distance)
+        representatives = {position: pending[group] for position, group in zip(pending, groups)}
+        reused_groups = set()
+        for representative in sorted(set(representatives.values())):
+            url = all_articles[representative]['url']
+            similar = article_index.find_similar_summary(fingerprints[representative], max_distance, exclude_url=url)
+            if not similar:
+                continue
+            summary_result, source_url, distance = similar
+            print(f"[HYBRID] Reusing {summary_result['extracted_by']} summary of near-duplicate "
+                  f"{source_url} (distance {distance}) for {url}")
+            reused_groups.add(representative)
+            for position in pending:
+                if representatives[position] == representative:
+                    article = all_articles[position]
+                    get_profiler().incr('summary_near_duplicate', site=article['site'])
+                    article['summary'] = summary_result['text']
+                    article['extracted_by'] = f"hybrid_{summary_result['extracted_by']}"
+                    summary_sources[position] = summary_result['extracted_by']
+        pending = [position for position in pending if representatives[position] not in reused_groups]
+    
     # AI 요약이 가능한지 확인 (Cohere 또는 Gemini)
     cohere_available = bool(os.environ.get('COHERE_API_KEY'))
     gemini_available = bool(os.environ.get('GOOGLE_GEMINI_API_KEY'))
@@ -119,72 +159,79 @@ def scrape_news_hybrid():
         try:
             # AI 요약 모듈 임포트 시도
             try:
-                from ai_summary_simple import translate_to_korean_summary_cohere, translate_to_korean_summary_gemini
+                from ai_summary_simple import (translate_to_korean_summary_cohere, translate_to_korean_summary_gemini,
+                                               summarize_batch_cohere, summarize_batch_gemini)
             except ImportError:
                 import sys
                 sys.path.append(os.path.dirname(__file__))
-                from ai_summary_simple import translate_to_korean_summary_cohere, translate_to_korean_summary_gemini
+                from ai_summary_simple import (translate_to_korean_summary_cohere, translate_to_korean_summary_gemini,
+                                               summarize_batch_cohere, summarize_batch_gemini)
+            
+            # 사용 가능한 API를 apiPriority 순서대로 병렬 작업자에 전달 (구현이 없는 제공자는 제외)
+            summarizers = {}
+            batch_summarizers = {}
+            if cohere_available:
+                summarizers['cohere'] = translate_to_korean_summary_cohere
+                batch_summarizers['cohere'] = summarize_batch_cohere
+            if gemini_available:
+                summarizers['gemini'] = translate_to_korean_summary_gemini
+                batch_summarizers['gemini'] = summarize_batch_gemini
+            hybrid_options = settings.get('scrapingMethodOptions', {}).get('hybrid', {})
+            priority = hybrid_options.get('apiPriority', ['cohere', 'gemini'])
+            providers = [(name, summarizers[name]) for name in priority if name in summarizers]
+            # batchSize가 2 이상이면 여러 기사를 한 요청(JSON 배열 응답)으로 요약
+            batch_providers = [(name, batch_summarizers[name]) for name in priority if name in batch_summarizers]
             
-            # 각 기사에 대해 AI 요약 생성
-            ai_count = 0
-            max_ai_summaries = 25  # 최대 AI 요약 수 제한 (Cohere 월 1000개 제한 고려)
+            # providerRouting이 켜져 있으면 응답 시간/오류율/할당량 기반으로 제공자 선택 및 헤징
+            router = configure_provider_router(settings)
+            workers = SummaryWorkers.from_settings(settings, providers, router=router, batch_providers=batch_providers)
             
-            for group, group_articles in articles_by_group.items():
-                for article in group_articles:
-                    if ai_count >= max_ai_summaries:
-                        print(f"[HYBRID] AI summary limit reached ({max_ai_summaries})")
-                        article['summary'] = create_basic_summary(article['title'], article['content'])
-                        continue
-                        
-                    try:
-                        ai_summary = None
-                        api_used = None
-                        
-                        # Cohere API 우선 시도
-                        if cohere_available and ai_count < max_ai_summaries:
-                            print(f"[HYBRID] Trying Cohere API for: {article['title'][:50]}...")
-                            ai_summary = translate_to_korean_summary_cohere(
-                                article['title'], 
-                                article['content']
-                            )
-                            if ai_summary:
-                                api_used = 'cohere'
-                                ai_count += 1
-                        
-                        # Cohere 실패시 Gemini 시도
-                        if not ai_summary and gemini_available and ai_count < max_ai_summaries:
-                            print(f"[HYBRID] Trying Gemini API for: {article['title'][:50]}...")
-                            ai_summary = translate_to_korean_summary_gemini(
-                                article['title'], 
-                                article['content']
-                            )
-                            if ai_summary:
-                                api_used = 'gemini'
-                                ai_count += 1
-                        
-                        if ai_summary:
-                            article['summary'] = ai_summary
-                            article['extracted_by'] = f'hybrid_{api_used}'
-                            print(f"[HYBRID] AI summary generated using {api_used} ({ai_count}/{max_ai_summaries})")
-                        else:
-                            # AI 요약 실패시 기본 요약 사용
-                            article['summary'] = create_basic_summary(article['title'], article['content'])
-                            article['extracted_by'] = 'hybrid_fallback'
-                            print(f"[HYBRID] Using basic summary for: {article['title'][:50]}...")
-                            
-                    except Exception as e:
-                        print(f"[HYBRID] AI summary error for {article['title'][:30]}: {e}")
-                        article['summary'] = create_basic_summary(article['title'], article['content'])
-                        article['extracted_by'] = 'hybrid_error'
+            # 재사용할 요약이 없는 대표 기사만 AI 요약 생성 (결과는 기사 순서대로)
+            distinct = sorted({representatives[position] for position in pending})
+            if len(distinct) < len(pending):
+                print(f"[HYBRID] {len(pending) - len(distinct)} near-duplicate articles share another outlet's summary")
+            distinct_results = dict(zip(distinct, workers.summarize([all_articles[i] for i in distinct])))
+            
+            for position in pending:
+                article = all_articles[position]
+                result = distinct_results[representatives[position]]
+                if result.summary:
+                    article['summary'] = result.summary
+                    article['extracted_by'] = f'hybrid_{result.status}'
+                    summary_sources[position] = result.status
+                    continue
+                
+                # 상한 초과/실패/오류시 기본 요약 사용
+                article['summary'] = create_basic_summary(article['title'], article['content'])
+                if result.status == 'fallback':
+                    article['extracted_by'] = 'hybrid_fallback'
+                    print(f"[HYBRID] Using basic summary for: {article['title'][:50]}...")
+                elif result.status == 'error':
+                    article['extracted_by'] = 'hybrid_error'
+            
+            if router is not None:
+                print(f"[HYBRID] Provider stats: {router.get_stats()}")
+                router.save()
         except ImportError as e:
             print(f"[HYBRID] AI summary module import error: {e}")
             ai_available = False
     
     if not ai_available:
         print("[HYBRID] Using basic keyword summaries")
-        for group, group_articles in articles_by_group.items():
-            for article in group_articles:
-                article['summary'] = create_basic_summary(article['title'], article['content'])
+        for position in pending:
+            article = all_articles[position]
+            article['summary'] = create_basic_summary(article['title'], article['content'])
+    
+    # 처리한 기사를 인덱스에 기록 (다음 실행의 skipSeenArticles와 요약 재사용에 사용)
+    for article, content_hash, fingerprint, source in zip(all_articles, content_hashes, fingerprints, summary_sources):
+        article_index.record(
+            article['url'],
+            title=article['title'],
+            content_hash=content_hash,
+            simhash=fingerprint,
+            summary=article['summary'],
+            extracted_by=source
+        )
     
     # Phase 3: 결과 통합 및 최종 처리
     print("\n[HYBRID] Phase 3: Final Processing")
@@ -1,11 +1,11 @@
 import json
 import os
-import requests
 from datetime import datetime, timedelta
 from bs4 import BeautifulSoup
 import re
 from collections import defaultdict
 from urllib.parse import urljoin, urlparse
+from http_session import get_http_pool
 
 def load_settings():
     with open('data/settings.json', 'r') as f:
@@ -171,7 +171,7 @@ def extract_article_content_generic(url, soup):
 def extract_article_content(url):
     """URL에 따라 적절한 추출 방법 선택"""
     try:
-        response = requests.get(url, timeout=10, headers={
+        response = get_http_pool().get(url, timeout=10, headers={
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
         soup = BeautifulSoup(response.content, 'html.parser')
@@ -309,7 +309,7 @@ def scrape_news():
     for site in sites:
         try:
             print(f"Scraping {site['name']}...")
-            response = requests.get(site['url'], timeout=10, headers={
+            response = get_http_pool().get(site['url'], timeout=10, headers={
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             })
             soup = BeautifulSoup(response.content, 'html.parser')
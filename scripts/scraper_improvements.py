@@ -231,14 +231,14 @@ def consolidate_articles_improved(articles_by_group: Dict[str, List[Dict]]) -> L
 
 def validate_and_fix_urls(sites: List[Dict]) -> List[Dict]:
     """사이트 URL 검증 및 수정"""
-    import requests
+    from http_session import get_http_pool
     
     fixed_sites = []
     
     for site in sites:
         try:
             # URL 접근 가능한지 확인
-            response = requests.head(site['url'], timeout=5, allow_redirects=True)
+            response = get_http_pool().head(site['url'], timeout=5, allow_redirects=True)
             
             # 리다이렉트된 경우 새 URL 사용
             if response.url != site['url']:
@@ -12,6 +12,16 @@ import os
 from collections import defaultdict
 from urllib.parse import urlparse
 import re
+from async_fetcher import FetchJob, get_fetch_engine
+from concurrent_fetcher import ConcurrentFetcher
+from rss_state import get_feed_state
+
+# async 엔진으로 피드를 받을 때 feedparser가 직접 요청할 때와 같은 헤더 사용
+FEED_HEADERS = {
+    'User-Agent': feedparser.USER_AGENT,
+    'Accept': feedparser.http.ACCEPT_HEADER,
+    'A-IM': 'feed'
+}
 
 # RSS 피드 목록 (2025년 7월 업데이트)
 RSS_FEEDS = {
@@ -166,27 +176,52 @@ def create_keyword_summary(title, content):
     
     return summary
 
-def scrape_rss_feed(feed_url, site_name, settings):
-    """RSS 피드에서 기사 수집"""
+def scrape_rss_feed(feed_url, site_name, settings, response=None, state=None):
+    """RSS 피드에서 기사 수집 (response가 있으면 미리 받은 피드 본문 사용)
+
+    state(FeedState)가 있으면 저장된 ETag/Last-Modified로 조건부 요청을 보내
+    바뀌지 않은 피드(304)는 건너뛰고, 지난 실행 이후 새로 올라온 항목만 처리
+    """
     articles = []
     
     try:
         print(f"\n[RSS] Fetching feed from {site_name}: {feed_url}")
         
         # feedparser로 RSS 피드 파싱
-        feed = feedparser.parse(feed_url)
+        if response is not None and response.status_code == 304:
+            print(f"[RSS] {site_name} feed not modified since last run")
+            return articles
+        if response is not None and response.status_code == 200:
+            headers = {key.lower(): value for key, value in response.headers.items()}
+            feed = feedparser.parse(response.content, response_headers=headers)
+        else:
+            feed = feedparser.parse(feed_url, **(state.validators(feed_url) if state else {}))
+            headers = feed.get('headers', {})
+        
+        if feed.get('status') == 304:
+            print(f"[RSS] {site_name} feed not modified since last run")
+            return articles
         
         if feed.bozo:
             print(f"[RSS] Warning: Feed parsing error for {site_name}: {feed.bozo_exception}")
         
         print(f"[RSS] Found {len(feed.entries)} entries in {site_name} feed")
         
+        entries = feed.entries
+        if state is not None:
+            entries = state.new_entries(feed_url, feed.entries)
+            if len(entries) < len(feed.entries):
+                print(f"[RSS] {len(entries)} new entries since last run in {site_name} feed")
+        
         # 설정에서 가져올 최대 기사 수
         max_articles = int(settings.get('maxArticlesPerSite', 3))
         blocked_keywords = [kw.strip() for kw in settings.get('blockedKeywords', '').split(',') if kw.strip()]
         important_keywords = [kw.strip() for kw in settings.get('importantKeywords', '').split(',') if kw.strip()]
         
-        for entry in feed.entries[:max_articles * 2]:  # 필터링을 고려해 더 많이 가져옴
+        # 평가를 마친 항목만 처리한 것으로 기록 (평가하지 않았거나 예외가 난 항목은 다음 실행에서 다시 처리)
+        evaluated = []
+        for entry in entries[:max_articles * 2]:  # 필터링을 고려해 더 많이 가져옴
+            evaluated.append(entry)
             try:
                 # 제목과 내용 추출
                 title = clean_text(entry.get('title', ''))
@@ -262,8 +297,16 @@ def scrape_rss_feed(feed_url, site_name, settings):
                     break
                     
             except Exception as e:
+                evaluated.pop()
                 print(f"[RSS] Error processing entry: {e}")
                 continue
+        
+        if state is not None:
+            state.mark_seen(feed_url, evaluated)
+            # 남은 새 항목이 있으면 다음 실행이 304로 건너뛰지 않도록 ETag/Last-Modified를 갱신하지 않음
+            if len(evaluated) == len(entries):
+                state.update_validators(feed_url, feed.get('etag') or headers.get('etag'),
+                                        feed.get('modified') or headers.get('last-modified'))
                 
     except Exception as e:
         print(f"[RSS] Error fetching feed from {site_name}: {e}")
@@ -275,10 +318,28 @@ def scrape_news_rss():
     settings = load_settings()
     articles_by_group = defaultdict(list)
     
-    # 각 RSS 피드에서 기사 수집
-    for site_name, feed_url in RSS_FEEDS.items():
-        articles = scrape_rss_feed(feed_url, site_name, settings)
-        
+    state = get_feed_state()
+    
+    # async 엔진이면 모든 피드를 한 이벤트 루프에서 동시에 받음 (저장된 ETag/Last-Modified로 조건부 요청)
+    responses = {}
+    engine = get_fetch_engine(settings)
+    if engine:
+        feed_urls = list(RSS_FEEDS.values())
+        jobs = [FetchJob(url, state.request_headers(url, FEED_HEADERS)) for url in feed_urls]
+        responses = dict(zip(feed_urls, engine.fetch_all(jobs)))
+    
+    # 각 RSS 피드에서 기사 수집 (피드 간 병렬, 결과는 RSS_FEEDS 순서대로)
+    options = settings.get('scrapingMethodOptions', {}).get('rss', {})
+    fetcher = ConcurrentFetcher(max_workers=options.get('maxWorkers', len(RSS_FEEDS)),
+                                per_domain=options.get('maxPerDomain', 2))
+    feeds = list(RSS_FEEDS.items())
+    results = fetcher.map_ordered(
+        lambda feed: scrape_rss_feed(feed[1], feed[0], settings, responses.get(feed[1]), state),
+        feeds,
+        lambda feed: feed[1]
+    )
+    
+    for (site_name, feed_url), articles in zip(feeds, results):
         if articles:
             group = SITE_GROUP_MAPPING.get(site_name, 'News')
             articles_by_group[group].extend(articles)
@@ -334,6 +395,9 @@ def scrape_news_rss():
     with open('data/latest.json', 'w', encoding='utf-8') as f:
         json.dump(latest_info, f, ensure_ascii=False, indent=2)
     
+    # 결과를 저장한 뒤에 피드 상태 저장 (저장 전에 실패하면 다음 실행에서 같은 항목을 다시 처리)
+    state.save()
+    
     total_articles = sum(len(group['articles']) for group in consolidated_articles)
     print(f"\n[RSS] Total scraped: {total_articles} articles from {len(consolidated_articles)} groups")
     return output_file
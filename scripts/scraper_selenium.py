@@ -20,6 +20,8 @@ from bs4 import BeautifulSoup
 import re
 from text_processing import TextProcessor
 from deduplication import ArticleDeduplicator
+from browser_pool import BrowserPool
+from scraper_browser import apply_rendering_profile, block_resources, ready_selector, wait_until_ready
 
 def setup_driver():
     """Selenium WebDriver 설정"""
@@ -36,12 +38,16 @@ def setup_driver():
         options.add_argument('--disable-software-rasterizer')
         options.binary_location = '/usr/bin/google-chrome-stable'
     
+    # 이미지/폰트/광고 차단, eager 로딩
+    apply_rendering_profile(options)
+    
     try:
         driver = webdriver.Chrome(options=options)
+        block_resources(driver)
         return driver
     except Exception as e:
         print(f"[SELENIUM] Failed to setup driver: {e}")
-        return None
+        raise
 
 def scrape_today_online(driver):
     """TODAY Online 스크래핑"""
@@ -56,9 +62,6 @@ def scrape_today_online(driver):
             EC.presence_of_element_located((By.TAG_NAME, "article"))
         )
         
-        # JavaScript 실행 대기
-        time.sleep(3)
-        
         # 기사 링크 수집
         article_elements = driver.find_elements(By.CSS_SELECTOR, "article a[href*='/news/']")
         urls = [elem.get_attribute('href') for elem in article_elements[:5]]
@@ -66,7 +69,7 @@ def scrape_today_online(driver):
         for url in urls:
             try:
                 driver.get(url)
-                time.sleep(2)
+                wait_until_ready(driver, ready_selector(url))
                 
                 # 제목
                 title_elem = driver.find_element(By.TAG_NAME, "h1")
@@ -113,8 +116,6 @@ def scrape_edge_singapore(driver):
             EC.presence_of_element_located((By.CLASS_NAME, "article"))
         )
         
-        time.sleep(3)
-        
         # 기사 링크 수집
         article_links = driver.find_elements(By.CSS_SELECTOR, "a[href*='/singapore/']")
         urls = [link.get_attribute('href') for link in article_links[:5]]
@@ -122,7 +123,7 @@ def scrape_edge_singapore(driver):
         for url in urls:
             try:
                 driver.get(url)
-                time.sleep(2)
+                wait_until_ready(driver, ready_selector(url))
                 
                 # 제목
                 title_elem = driver.find_element(By.CSS_SELECTOR, "h1.article-title")
@@ -169,8 +170,6 @@ def scrape_tech_in_asia(driver):
             EC.presence_of_element_located((By.CLASS_NAME, "post-item"))
         )
         
-        time.sleep(3)
-        
         # 기사 링크 수집
         article_elements = driver.find_elements(By.CSS_SELECTOR, ".post-item a")
         urls = [elem.get_attribute('href') for elem in article_elements[:5]]
@@ -178,7 +177,7 @@ def scrape_tech_in_asia(driver):
         for url in urls:
             try:
                 driver.get(url)
-                time.sleep(2)
+                wait_until_ready(driver, ready_selector(url))
                 
                 # 제목
                 title_elem = driver.find_element(By.TAG_NAME, "h1")
@@ -225,8 +224,6 @@ def scrape_asiaone(driver):
             EC.presence_of_element_located((By.CLASS_NAME, "article-item"))
         )
         
-        time.sleep(3)
-        
         # 기사 링크 수집
         article_links = driver.find_elements(By.CSS_SELECTOR, "a[href*='/singapore/']")
         urls = [link.get_attribute('href') for link in article_links[:5]]
@@ -234,7 +231,7 @@ def scrape_asiaone(driver):
         for url in urls:
             try:
                 driver.get(url)
-                time.sleep(2)
+                wait_until_ready(driver, ready_selector(url))
                 
                 # 제목
                 title_elem = driver.find_element(By.TAG_NAME, "h1")
@@ -265,12 +262,8 @@ def scrape_asiaone(driver):
     return articles
 
 def scrape_with_selenium(sites_to_scrape):
-    """Selenium을 사용한 동적 사이트 스크래핑"""
-    driver = setup_driver()
-    if not driver:
-        print("[SELENIUM] Driver setup failed")
-        return []
-    
+    """Selenium을 사용한 동적 사이트 스크래핑 (드라이버 하나를 사이트 간에 재사용, 페이지 수/메모리 기준으로 교체)"""
+    pool = BrowserPool(size=1, factory=setup_driver)
     all_articles = []
     
     try:
@@ -285,7 +278,12 @@ def scrape_with_selenium(sites_to_scrape):
         for site_name in sites_to_scrape:
             if site_name in scrapers:
                 print(f"\n[SELENIUM] Processing {site_name}...")
-                articles = scrapers[site_name](driver)
+                try:
+                    with pool.acquire() as driver:
+                        articles = scrapers[site_name](driver)
+                except Exception as e:
+                    print(f"[SELENIUM] Driver setup failed: {e}")
+                    break
                 all_articles.extend(articles)
                 print(f"[SELENIUM] Got {len(articles)} articles from {site_name}")
                 
@@ -293,7 +291,7 @@ def scrape_with_selenium(sites_to_scrape):
                 time.sleep(2)
     
     finally:
-        driver.quit()
+        pool.shutdown()
     
     return all_articles
 
@@ -0,0 +1,288 @@
+"""
+뉴스 사이트맵 기반 기사 링크 수집
+Google News 사이트맵(news:news)이나 robots.txt에 등록된 뉴스 사이트맵을 스트리밍으로 읽어
+- 발행 시각/제목이 이미 붙은 기사 URL을 얻고 오래된 기사는 본문 요청 전에 제외
+- 사이트맵이 있는 사이트는 홈페이지 파싱과 링크 셀렉터/URL 패턴 검사를 건너뜀
+- 사이트별 사이트맵 위치(없음 포함)는 data/cache/sitemap_sources.json에 저장해 매 실행 탐색하지 않음
+"""
+import json
+import os
+import threading
+import time
+import zlib
+from collections import namedtuple
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urljoin, urlparse
+from xml.etree.ElementTree import XMLPullParser, ParseError
+
+from concurrent_fetcher import get_domain_key
+from http_session import get_http_pool, STREAM_CHUNK_SIZE
+
+DEFAULT_STATE_FILE = 'data/cache/sitemap_sources.json'
+DEFAULT_MAX_AGE_HOURS = 48
+RECHECK_DAYS = 7                      # 사이트맵 위치를 다시 탐색하는 주기
+MAX_SITEMAP_BYTES = 10 * 1024 * 1024  # 사이트맵 하나에서 읽는 최대 바이트 (압축 해제 전)
+MAX_CHILD_SITEMAPS = 3                # 사이트맵 인덱스에서 따라가는 하위 사이트맵 수
+SITEMAP_TIMEOUT = 10
+
+# robots.txt에 뉴스 사이트맵이 없을 때 확인하는 일반적인 위치
+WELL_KNOWN_PATHS = ('/news-sitemap.xml', '/sitemap-news.xml', '/sitemap_news.xml', '/news_sitemap.xml')
+
+# url: 기사 URL, title: news:title, published: news:publication_date 또는 lastmod (UTC datetime)
+SitemapEntry = namedtuple('SitemapEntry', ['url', 'title', 'published'])
+
+
+def local_name(tag):
+    """'{namespace}name' → 'name'"""
+    return tag.rsplit('}', 1)[-1]
+
+
+def parse_sitemap_date(value):
+    """W3C 날짜/시각 문자열을 UTC datetime으로 (실패하면 None)"""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.strip().replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+class SitemapParser:
+    """조각 단위로 받은 사이트맵 XML(gzip 포함)을 점진적으로 파싱
+
+    feed(chunk) 후 entries(기사)와 children(사이트맵 인덱스의 하위 사이트맵)에 결과가 쌓임
+    처리한 요소는 바로 비워 큰 사이트맵도 메모리를 적게 사용
+    """
+
+    def __init__(self):
+        self._parser = XMLPullParser(events=('end',))
+        self._decompressor = None
+        self._started = False
+        self.entries = []
+        self.children = []
+        self.is_news = False
+
+    def feed(self, chunk):
+        if not self._started:
+            self._started = True
+            if chunk[:2] == b'\x1f\x8b':
+                self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        if self._decompressor is not None:
+            chunk = self._decompressor.decompress(chunk)
+        self._parser.feed(chunk)
+        self._collect()
+
+    def close(self):
+        try:
+            self._parser.close()
+        except ParseError:
+            pass
+        self._collect()
+
+    def _collect(self):
+        try:
+            events = list(self._parser.read_events())
+        except ParseError:
+            return
+        for _, elem in events:
+            name = local_name(elem.tag)
+            if name == 'url':
+                self._add_entry(elem)
+                elem.clear()
+            elif name == 'sitemap':
+                loc = next((child.text for child in elem if local_name(child.tag) == 'loc'), None)
+                if loc:
+                    self.children.append(loc.strip())
+                elem.clear()
+
+    def _add_entry(self, elem):
+        loc = title = published = lastmod = None
+        for child in elem.iter():
+            name = local_name(child.tag)
+            if name == 'loc' and loc is None:
+                loc = (child.text or '').strip()
+            elif name == 'title':
+                title = (child.text or '').strip()
+            elif name == 'publication_date':
+                published = parse_sitemap_date(child.text)
+            elif name == 'lastmod':
+                lastmod = parse_sitemap_date(child.text)
+            elif name == 'news':
+                self.is_news = True
+        if loc:
+            self.entries.append(SitemapEntry(loc, title, published or lastmod))
+
+
+class SitemapDiscovery:
+    """사이트별 뉴스 사이트맵에서 최근 기사 URL 수집 (스레드 안전)"""
+
+    def __init__(self, state_file=DEFAULT_STATE_FILE, max_age_hours=DEFAULT_MAX_AGE_HOURS, http=None):
+        self.state_file = state_file
+        self.max_age = timedelta(hours=max_age_hours)
+        self.http = http or get_http_pool()
+        self._sources = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    @classmethod
+    def from_settings(cls, settings):
+        """settings.json의 sitemapDiscovery 옵션으로 생성"""
+        options = settings.get('sitemapDiscovery', {})
+        return cls(max_age_hours=options.get('maxAgeHours', DEFAULT_MAX_AGE_HOURS))
+
+    def _load(self):
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                self._sources = json.load(f).get('domains', {})
+        except (OSError, ValueError):
+            self._sources = {}
+
+    def save(self):
+        """사이트별 사이트맵 위치 저장"""
+        with self._lock:
+            data = {'updated_at': time.time(), 'domains': self._sources}
+            try:
+                os.makedirs(os.path.dirname(self.state_file) or '.', exist_ok=True)
+                tmp_path = f'{self.state_file}.tmp'
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
+                os.replace(tmp_path, self.state_file)
+            except OSError as e:
+                print(f"[SITEMAP] Failed to save sitemap sources: {e}")
+
+    def _cached_sources(self, domain):
+        with self._lock:
+            entry = self._sources.get(domain)
+        if entry and time.time() - entry.get('checked_at', 0) < RECHECK_DAYS * 86400:
+            return entry.get('sitemaps', [])
+        return None
+
+    def has_sitemap(self, site):
+        """네트워크 요청 없이, 이전에 뉴스 사이트맵을 찾은 사이트인지"""
+        if site.get('sitemap'):
+            return True
+        return bool(self._cached_sources(get_domain_key(site['url'])))
+
+    def read_sitemap(self, url):
+        """사이트맵을 스트리밍으로 읽어 SitemapParser 반환 (실패하면 None)"""
+        try:
+            response = self.http.get(url, timeout=SITEMAP_TIMEOUT, stream=True)
+        except Exception as e:
+            print(f"[SITEMAP] Failed to fetch {url}: {type(e).__name__}: {e}")
+            return None
+        parser = SitemapParser()
+        try:
+            if response.status_code != 200:
+                return None
+            received = 0
+            for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+                parser.feed(chunk)
+                received += len(chunk)
+                if received >= MAX_SITEMAP_BYTES:
+                    print(f"[SITEMAP] {url} exceeds {MAX_SITEMAP_BYTES} bytes, using the first part only")
+                    break
+            parser.close()
+            return parser
+        except (zlib.error, OSError) as e:
+            print(f"[SITEMAP] Failed to read {url}: {e}")
+            return None
+        finally:
+            response.close()
+
+    def _robots_sitemaps(self, base_url):
+        try:
+            response = self.http.get(urljoin(base_url, '/robots.txt'), timeout=SITEMAP_TIMEOUT)
+        except Exception:
+            return []
+        if response.status_code != 200:
+            return []
+        return [
+            line.split(':', 1)[1].strip()
+            for line in response.text.splitlines()
+            if line.lower().startswith('sitemap:')
+        ]
+
+    def find_sitemaps(self, site):
+        """사이트의 뉴스 사이트맵 URL 목록 (sites.json의 sitemap → 저장된 위치 → robots.txt → 일반 위치)"""
+        if site.get('sitemap'):
+            configured = site['sitemap']
+            return configured if isinstance(configured, list) else [configured]
+
+        domain = get_domain_key(site['url'])
+        cached = self._cached_sources(domain)
+        if cached is not None:
+            return cached
+
+        parsed = urlparse(site['url'])
+        base_url = f'{parsed.scheme}://{parsed.netloc}'
+        candidates = [url for url in self._robots_sitemaps(base_url) if 'news' in url.lower()]
+        candidates += [urljoin(base_url, path) for path in WELL_KNOWN_PATHS]
+
+        found = []
+        for candidate in candidates:
+            parser = self.read_sitemap(candidate)
+            if parser is not None and (parser.is_news or parser.children):
+                found.append(candidate)
+                break
+
+        with self._lock:
+            self._sources[domain] = {'sitemaps': found, 'checked_at': time.time()}
+        print(f"[SITEMAP] {domain}: {found[0] if found else 'no news sitemap'}")
+        return found
+
+    def discover(self, site, now=None):
+        """최근 기사 SitemapEntry 목록(최신순), 뉴스 사이트맵이 없으면 None (홈페이지 파싱으로 대체)"""
+        sitemaps = self.find_sitemaps(site)
+        if not sitemaps:
+            return None
+
+        domain = get_domain_key(site['url'])
+        cutoff = (now or datetime.now(timezone.utc)) - self.max_age
+        entries = []
+        readable = False
+        for sitemap_url in sitemaps:
+            parser = self.read_sitemap(sitemap_url)
+            if parser is None:
+                continue
+            readable = True
+            entries.extend(parser.entries)
+            # 사이트맵 인덱스는 뉴스 사이트맵을 우선으로 앞쪽 몇 개만 따라감
+            children = sorted(parser.children, key=lambda url: 'news' not in url.lower())[:MAX_CHILD_SITEMAPS]
+            for child_url in children:
+                child = self.read_sitemap(child_url)
+                if child is not None:
+                    entries.extend(child.entries)
+        if not readable:
+            return None
+
+        recent = {}
+        for entry in entries:
+            if entry.published is None or entry.published < cutoff:
+                continue
+            if get_domain_key(entry.url) != domain:
+                continue
+            recent.setdefault(entry.url, entry)
+        return sorted(recent.values(), key=lambda entry: entry.published, reverse=True)
+
+
+# 전역 인스턴스 (sitemapDiscovery가 꺼져 있으면 None)
+sitemap_discovery = None
+
+
+def configure_sitemap_discovery(settings):
+    """settings의 sitemapDiscovery.enabled에 따라 전역 인스턴스 생성/해제"""
+    global sitemap_discovery
+    if settings.get('sitemapDiscovery', {}).get('enabled', False):
+        if sitemap_discovery is None:
+            sitemap_discovery = SitemapDiscovery.from_settings(settings)
+    else:
+        sitemap_discovery = None
+    return sitemap_discovery
+
+
+def get_sitemap_discovery():
+    """전역 사이트맵 수집기 (설정되지 않았으면 None)"""
+    return sitemap_discovery
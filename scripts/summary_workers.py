@@ -0,0 +1,217 @@
+"""
+AI 요약 병렬 작업자
+하이브리드 모드 Phase 2의 기사 요약을 스레드 풀로 동시에 실행
+- 제공자별 동시 실행 수 제한 (분당 요청 수는 각 요약 함수의 rate_limiter 토큰 버킷이 제한)
+- 전체 AI 요약 수 상한(기본 25개)은 동시 실행 중에도 정확히 지킴
+- 결과는 입력 기사 순서대로 반환
+- router(ProviderRouter)가 있으면 고정 순서 대신 통계 기반으로 제공자를 고르고 헤징
+- 배치 모드(batch_size > 1)는 여러 기사를 한 요청으로 요약하고, 빠지거나 잘못된 기사만 다시 요청
+  (이때 상한은 요약 수가 아니라 API 요청 수: 같은 할당량으로 batch_size배까지 요약)
+"""
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_MAX_SUMMARIES = 25   # Cohere 월 1000개 제한 고려
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_PER_PROVIDER = 2
+DEFAULT_BATCH_SIZE = 5
+DEFAULT_MAX_REQUESTS = 25    # 배치 모드의 API 요청 상한 (단건 모드의 요약 상한과 같은 할당량)
+DEFAULT_BATCH_RETRIES = 1    # 응답에서 빠진 기사를 다시 묶어 요청하는 횟수
+
+# summary: 요약 (없으면 None)
+# status: 사용한 제공자 이름, 'limit'(상한 초과), 'fallback'(모든 제공자 실패), 'error'(예외)
+SummaryResult = namedtuple('SummaryResult', ['summary', 'status'])
+
+
+class SummaryBudget:
+    """동시 실행 중에도 정확한 AI 요약 상한
+
+    요청 전에 reserve()로 자리를 잡고 성공하면 commit(), 실패하면 release()
+    상한이 진행 중인 요청으로만 차 있으면 결과가 나올 때까지 기다려
+    실패로 돌아온 자리를 다음 기사가 사용 (완료된 요약 수만 상한에 포함)
+    """
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.used = 0
+        self._pending = 0
+        self._cond = threading.Condition()
+
+    def reserve(self):
+        """자리를 잡으면 True, 완료된 요약으로 상한이 찼으면 False"""
+        with self._cond:
+            while self.used + self._pending >= self.limit:
+                if self._pending == 0:
+                    return False
+                self._cond.wait()
+            self._pending += 1
+            return True
+
+    def commit(self):
+        with self._cond:
+            self._pending -= 1
+            self.used += 1
+            self._cond.notify_all()
+
+    def release(self):
+        with self._cond:
+            self._pending -= 1
+            self._cond.notify_all()
+
+
+class SummaryWorkers:
+    """제공자 우선순위(예: Cohere → Gemini)대로 기사 요약을 병렬 생성
+
+    providers: [(이름, func(title, content) -> 요약 또는 None), ...]
+    batch_providers: [(이름, func([(id, title, content)]) -> {id: 요약}), ...] (배치 모드)
+    """
+
+    def __init__(self, providers, max_summaries=DEFAULT_MAX_SUMMARIES,
+                 max_workers=DEFAULT_MAX_WORKERS, per_provider=DEFAULT_PER_PROVIDER, router=None,
+                 batch_providers=None, batch_size=1, max_requests=DEFAULT_MAX_REQUESTS,
+                 batch_retries=DEFAULT_BATCH_RETRIES):
+        self.providers = list(providers)
+        self.batch_providers = list(batch_providers or [])
+        self.max_summaries = max_summaries
+        self.max_workers = max(1, max_workers)
+        self.router = router
+        self.batch_size = max(1, batch_size)
+        self.max_requests = max_requests
+        self.batch_retries = batch_retries
+        names = {name for name, _ in self.providers + self.batch_providers}
+        self._slots = {name: threading.Semaphore(max(1, per_provider)) for name in names}
+
+    @classmethod
+    def from_settings(cls, settings, providers, router=None, batch_providers=None):
+        """settings.json의 scrapingMethodOptions.hybrid 옵션으로 생성"""
+        options = settings.get('scrapingMethodOptions', {}).get('hybrid', {})
+        return cls(
+            providers,
+            max_summaries=options.get('maxAiSummaries', DEFAULT_MAX_SUMMARIES),
+            max_workers=options.get('maxWorkers', DEFAULT_MAX_WORKERS),
+            per_provider=options.get('maxPerProvider', DEFAULT_PER_PROVIDER),
+            router=router,
+            batch_providers=batch_providers,
+            batch_size=options.get('batchSize', 1),
+            max_requests=options.get('maxAiRequests', DEFAULT_MAX_REQUESTS),
+            batch_retries=options.get('batchRetries', DEFAULT_BATCH_RETRIES)
+        )
+
+    @property
+    def batched(self):
+        return bool(self.batch_providers) and self.batch_size > 1
+
+    def _limited(self, name, func):
+        """제공자별 동시 실행 수 제한을 적용한 함수"""
+        def call(*args):
+            with self._slots[name]:
+                return func(*args)
+        return call
+
+    def _attempts(self, article):
+        """(제공자 이름, 요약) 시도 결과를 차례로 생성 (라우터가 있으면 라우터가 고른 결과 하나)"""
+        limited = [(name, self._limited(name, func)) for name, func in self.providers]
+        if self.router is not None:
+            summary, name = self.router.route(limited, article['title'], article['content'])
+            yield name, summary
+            return
+        for name, func in limited:
+            print(f"[HYBRID] Trying {name} API for: {article['title'][:50]}...")
+            yield name, func(article['title'], article['content'])
+
+    def _summarize_one(self, budget, article):
+        if not budget.reserve():
+            return SummaryResult(None, 'limit')
+        try:
+            for name, summary in self._attempts(article):
+                if summary:
+                    budget.commit()
+                    print(f"[HYBRID] AI summary generated using {name} ({budget.used}/{budget.limit})")
+                    return SummaryResult(summary, name)
+        except Exception as e:
+            budget.release()
+            print(f"[HYBRID] AI summary error for {article['title'][:30]}: {e}")
+            return SummaryResult(None, 'error')
+        budget.release()
+        return SummaryResult(None, 'fallback')
+
+    def _batch_attempt(self, items):
+        """배치 하나를 요약해 ({id: 요약}, 제공자 이름) 반환 (라우터가 있으면 라우터가 제공자 선택)"""
+        limited = [(name, self._limited(name, func)) for name, func in self.batch_providers]
+        if self.router is not None:
+            summaries, name = self.router.route(limited, items)
+            return summaries or {}, name
+        for name, func in limited:
+            print(f"[HYBRID] Trying {name} batch API for {len(items)} articles...")
+            summaries = func(items)
+            if summaries:
+                return summaries, name
+        return {}, None
+
+    def _summarize_chunk(self, budget, articles, chunk):
+        """기사 인덱스 묶음을 한 요청으로 요약, (결과 {인덱스: SummaryResult}, 상한 초과 여부) 반환"""
+        if not budget.reserve():
+            return {}, True
+        items = [(position + 1, articles[index]['title'], articles[index]['content'])
+                 for position, index in enumerate(chunk)]
+        try:
+            summaries, name = self._batch_attempt(items)
+        except Exception as e:
+            budget.release()
+            print(f"[HYBRID] AI batch summary error: {e}")
+            return {}, False
+        if not summaries:
+            budget.release()
+            return {}, False
+        budget.commit()
+        print(f"[HYBRID] Batch summary using {name}: {len(summaries)}/{len(chunk)} articles "
+              f"(request {budget.used}/{budget.limit})")
+        return {chunk[item_id - 1]: SummaryResult(summary, name) for item_id, summary in summaries.items()}, False
+
+    def _summarize_batched(self, articles):
+        """배치 모드: batch_size개씩 묶어 요청하고 빠진 기사만 다시 묶어 batch_retries회까지 재요청"""
+        results = [None] * len(articles)
+        limited = set()
+        budget = SummaryBudget(self.max_requests)
+        queue = list(range(len(articles)))
+
+        for attempt in range(self.batch_retries + 1):
+            if not queue:
+                break
+            if attempt:
+                print(f"[HYBRID] Re-queueing {len(queue)} articles missing from batch responses")
+            chunks = [queue[i:i + self.batch_size] for i in range(0, len(queue), self.batch_size)]
+            workers = min(self.max_workers, len(chunks))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                outcomes = list(executor.map(lambda chunk: self._summarize_chunk(budget, articles, chunk), chunks))
+            queue = []
+            for chunk, (found, over_limit) in zip(chunks, outcomes):
+                for index in chunk:
+                    if index in found:
+                        results[index] = found[index]
+                    elif over_limit:
+                        limited.add(index)
+                    else:
+                        queue.append(index)
+
+        if limited:
+            print(f"[HYBRID] AI request limit reached ({self.max_requests}), {len(limited)} articles use basic summaries")
+        return [result or SummaryResult(None, 'limit' if index in limited else 'fallback')
+                for index, result in enumerate(results)]
+
+    def summarize(self, articles):
+        """기사 목록을 요약해 같은 순서의 SummaryResult 목록 반환"""
+        articles = list(articles)
+        if not articles:
+            return []
+        if self.batched:
+            return self._summarize_batched(articles)
+        budget = SummaryBudget(self.max_summaries)
+        workers = min(self.max_workers, len(articles))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(lambda article: self._summarize_one(budget, article), articles))
+        if budget.used >= self.max_summaries:
+            skipped = sum(1 for result in results if result.status == 'limit')
+            print(f"[HYBRID] AI summary limit reached ({self.max_summaries}), {skipped} articles use basic summaries")
+        return results
@@ -0,0 +1,112 @@
+"""
+Unit tests for the adaptive per-domain fetch controller
+"""
+import pytest
+import requests
+from unittest.mock import Mock, patch
+
+try:
+    from scripts.adaptive_controller import DomainController, percentile, MAX_TIMEOUT, MIN_TIMEOUT
+    from scripts.concurrent_fetcher import ConcurrentFetcher
+    from scripts.http_session import HttpSessionPool
+except ImportError:
+    pytest.skip("adaptive_controller module not available", allow_module_level=True)
+
+
+URL = 'https://www.straitstimes.com/singapore/a'
+
+
+@pytest.fixture
+def controller(tmp_path):
+    return DomainController(state_file=str(tmp_path / 'domain_stats.json'), min_limit=1, max_limit=3)
+
+
+class TestDomainController:
+    """Test AIMD concurrency, p95 timeouts and block handling"""
+
+    def test_fast_healthy_domain_gains_concurrency(self, controller):
+        """Test additive increase up to max_limit on fast successes"""
+        for _ in range(10):
+            controller.record(URL, 0.3, 200)
+        assert controller.concurrency('straitstimes.com') == 3
+        assert controller.scale_delay(URL, 2.0) < 2.0
+
+    def test_blocks_halve_concurrency_and_stop_retries(self, controller):
+        """Test multiplicative decrease, longer delays and no retries on 403/503 hosts"""
+        for _ in range(10):
+            controller.record(URL, 0.3, 200)
+        controller.record(URL, 0.3, 403)
+        assert controller.concurrency('straitstimes.com') == 1
+
+        for _ in range(4):
+            controller.record('https://mothership.sg/x', 0.5, 503)
+        assert controller.retries('https://mothership.sg/y', 2) == 0
+        assert controller.scale_delay('https://mothership.sg/y', 1.0) > 1.0
+        assert controller.retries(URL, 2) == 2
+
+    def test_timeout_follows_p95(self, controller):
+        """Test that timeouts come from observed latency once enough samples exist"""
+        assert controller.timeout(URL, 10) == 10
+        for latency in [0.5, 0.6, 0.7, 0.8, 2.0]:
+            controller.record(URL, latency, 200)
+        assert controller.timeout(URL, 10) == 6.0
+
+        for _ in range(10):
+            controller.record('https://slow.sg/a', 30, 200)
+        assert controller.timeout('https://slow.sg/a') == MAX_TIMEOUT
+        for _ in range(10):
+            controller.record('https://fast.sg/a', 0.1, 200)
+        assert controller.timeout('https://fast.sg/a') == MIN_TIMEOUT
+
+    def test_state_persists_across_runs(self, controller):
+        """Test that learned limits and latencies are the next run's starting point"""
+        for _ in range(10):
+            controller.record(URL, 0.4, 200)
+        controller.save()
+
+        restored = DomainController(state_file=controller.state_file, min_limit=1, max_limit=3)
+        assert restored.concurrency('straitstimes.com') == 3
+        assert restored.timeout(URL, 10) == MIN_TIMEOUT
+        assert restored.snapshot()['straitstimes.com']['requests'] == 0
+
+    def test_percentile_nearest_rank(self):
+        """Test the nearest-rank percentile helper"""
+        assert percentile([], 95) is None
+        assert percentile([3, 1, 2], 50) == 2
+        assert percentile(list(range(1, 101)), 95) == 95
+
+
+class TestIntegration:
+    """Test that the fetcher and session pool consult the controller"""
+
+    def test_concurrent_fetcher_uses_controller_limit(self, controller):
+        """Test that per-domain limits come from the controller when one is attached"""
+        fetcher = ConcurrentFetcher(max_workers=4, per_domain=1, controller=controller)
+        assert fetcher.domain_limit('straitstimes.com') == 1
+        for _ in range(10):
+            controller.record(URL, 0.2, 200)
+        assert fetcher.domain_limit('straitstimes.com') == 3
+
+    def test_session_pool_records_and_applies_timeout(self, controller):
+        """Test that GETs are recorded and use the learned timeout"""
+        pool = HttpSessionPool()
+        session = Mock()
+        session.get.return_value = Mock(status_code=200)
+        with patch('scripts.http_session.get_domain_controller', return_value=controller), \
+                patch.object(pool, 'get_session', return_value=session):
+            for _ in range(5):
+                pool.get(URL, timeout=10)
+            assert controller.snapshot()['straitstimes.com']['requests'] == 5
+            pool.get(URL, timeout=10)
+        assert session.get.call_args.kwargs['timeout'] == MIN_TIMEOUT
+
+    def test_session_pool_records_timeouts_as_errors(self, controller):
+        """Test that timeouts count against the domain and are re-raised"""
+        pool = HttpSessionPool()
+        session = Mock()
+        session.get.side_effect = requests.Timeout()
+        with patch('scripts.http_session.get_domain_controller', return_value=controller), \
+                patch.object(pool, 'get_session', return_value=session):
+            with pytest.raises(requests.Timeout):
+                pool.get(URL)
+        assert controller.snapshot()['straitstimes.com']['errors'] == 1
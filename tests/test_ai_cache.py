@@ -0,0 +1,86 @@
+"""
+Unit tests for the persistent AI result cache
+"""
+import time
+import pytest
+
+try:
+    from scripts.ai_cache import PersistentCache
+except ImportError:
+    pytest.skip("ai_cache module not available", allow_module_level=True)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Per-test SQLite file"""
+    return str(tmp_path / 'ai_cache.db')
+
+
+class TestPersistentCache:
+    """Test TTL expiry, LRU eviction and hit/miss statistics"""
+
+    def test_dict_style_access_and_persistence(self, db_path):
+        """Test that values survive a new cache instance on the same file"""
+        cache = PersistentCache('content', 60, max_entries=10, max_bytes=10000, db_path=db_path)
+        cache['abc'] = {'type': 'NEWS_ARTICLE', 'is_article': True}
+
+        reopened = PersistentCache('content', 60, max_entries=10, max_bytes=10000, db_path=db_path)
+        assert 'abc' in reopened
+        assert reopened['abc'] == {'type': 'NEWS_ARTICLE', 'is_article': True}
+
+    def test_namespaces_are_isolated(self, db_path):
+        """Test that caches sharing a file do not see each other's keys"""
+        urls = PersistentCache('url', 60, max_entries=10, max_bytes=10000, db_path=db_path)
+        content = PersistentCache('content', 60, max_entries=10, max_bytes=10000, db_path=db_path)
+        urls['k'] = True
+
+        assert 'k' not in content
+        assert len(urls) == 1 and len(content) == 0
+
+    def test_ttl_expiry(self, db_path):
+        """Test that expired entries are not returned and are removed by expire()"""
+        cache = PersistentCache('url', 60, max_entries=10, max_bytes=10000, db_path=db_path)
+        cache.set('short', True, ttl=0.01)
+        cache.set('long', True)
+        time.sleep(0.02)
+
+        assert cache.get('short') is None
+        assert cache.expire() == 1
+        assert cache.get('long') is True
+
+    def test_lru_eviction_by_count(self, db_path):
+        """Test that the least recently used entries are evicted first"""
+        cache = PersistentCache('url', 60, max_entries=2, max_bytes=10000, db_path=db_path)
+        cache['a'] = 1
+        time.sleep(0.01)
+        cache['b'] = 2
+        time.sleep(0.01)
+        cache.get('a')  # a를 최근 사용으로 갱신
+        time.sleep(0.01)
+        cache['c'] = 3
+
+        assert cache.evict() == 1
+        assert 'b' not in cache
+        assert 'a' in cache and 'c' in cache
+
+    def test_eviction_by_bytes(self, db_path):
+        """Test that the byte limit is enforced"""
+        cache = PersistentCache('summary', 60, max_entries=100, max_bytes=250, db_path=db_path)
+        for i in range(5):
+            cache[f'k{i}'] = 'x' * 100
+            time.sleep(0.01)
+
+        cache.evict()
+        assert cache.total_bytes() <= 250
+
+    def test_hit_miss_counters(self, db_path):
+        """Test that lookups are counted in get_stats"""
+        cache = PersistentCache('url', 60, max_entries=10, max_bytes=10000, db_path=db_path)
+        cache['a'] = True
+        cache.get('a')
+        cache.get('missing')
+
+        stats = cache.get_stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['hit_rate'] == 0.5
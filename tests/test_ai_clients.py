@@ -0,0 +1,82 @@
+"""
+Unit tests for the shared AI client registry
+"""
+import pytest
+from unittest.mock import Mock, patch
+
+try:
+    from scripts import ai_clients
+    from scripts.ai_clients import AIClientRegistry, UNHEALTHY_AFTER
+except ImportError:
+    pytest.skip("ai_clients module not available", allow_module_level=True)
+
+
+@pytest.fixture
+def registry():
+    return AIClientRegistry()
+
+
+class TestClientCreation:
+    """Test that clients are created once and reused"""
+
+    def test_cohere_client_created_once(self, registry, monkeypatch):
+        """Test that repeated calls reuse one Cohere client"""
+        monkeypatch.setattr(ai_clients, 'COHERE_AVAILABLE', True)
+        fake_cohere = Mock()
+        with patch.object(ai_clients, 'cohere', fake_cohere, create=True):
+            first = registry.cohere('key-1')
+            second = registry.cohere('key-1')
+        assert first is second
+        fake_cohere.Client.assert_called_once_with('key-1')
+        assert registry.get_stats()['cohere']['created'] == 1
+
+    def test_gemini_configured_once_per_key(self, registry, monkeypatch):
+        """Test that genai.configure runs once and models are cached by name"""
+        monkeypatch.setattr(ai_clients, 'GEMINI_AVAILABLE', True)
+        fake_genai = Mock()
+        with patch.object(ai_clients, 'genai', fake_genai, create=True):
+            model = registry.gemini(api_key='g-key')
+            assert registry.gemini(api_key='g-key') is model
+            registry.gemini('gemini-1.5-pro', api_key='g-key')
+        fake_genai.configure.assert_called_once_with(api_key='g-key')
+        assert fake_genai.GenerativeModel.call_count == 2
+
+    def test_missing_key_returns_none(self, registry, monkeypatch):
+        """Test that no client is built without an API key"""
+        monkeypatch.delenv('COHERE_API_KEY', raising=False)
+        monkeypatch.delenv('GOOGLE_GEMINI_API_KEY', raising=False)
+        assert registry.cohere() is None
+        assert registry.gemini() is None
+
+    def test_creation_failure_is_reported(self, registry, monkeypatch):
+        """Test that a constructor error returns None and counts as an error"""
+        monkeypatch.setattr(ai_clients, 'COHERE_AVAILABLE', True)
+        fake_cohere = Mock()
+        fake_cohere.Client.side_effect = ValueError('bad key')
+        with patch.object(ai_clients, 'cohere', fake_cohere, create=True):
+            assert registry.cohere('key') is None
+        assert registry.get_stats()['cohere']['last_error'] == 'ValueError: bad key'
+
+
+class TestUsageAndHealth:
+    """Test call counters and consecutive-error health"""
+
+    def test_track_counts_calls_and_errors(self, registry):
+        """Test that tracked calls update usage and re-raise errors"""
+        with registry.track('gemini'):
+            pass
+        with pytest.raises(RuntimeError):
+            with registry.track('gemini'):
+                raise RuntimeError('quota')
+        stats = registry.get_stats()['gemini']
+        assert (stats['calls'], stats['errors']) == (2, 1)
+        assert stats['last_error'] == 'RuntimeError: quota'
+
+    def test_consecutive_errors_mark_unhealthy(self, registry):
+        """Test that a success resets the consecutive error count"""
+        for _ in range(UNHEALTHY_AFTER):
+            registry.record('cohere', 0.1, error=RuntimeError('down'))
+        assert not registry.healthy('cohere')
+        registry.record('cohere', 0.1)
+        assert registry.healthy('cohere')
+        assert registry.healthy('unknown')
@@ -0,0 +1,54 @@
+"""
+Unit tests for batched Korean summary prompts and response parsing
+"""
+import json
+import pytest
+
+try:
+    from scripts.ai_summary_simple import build_batch_prompt, parse_batch_summaries
+except ImportError:
+    pytest.skip("ai_summary_simple module not available", allow_module_level=True)
+
+
+class TestBatchPrompt:
+    """Test prompt construction"""
+
+    def test_numbered_articles_with_preview(self):
+        """Test that every article gets its id and a whitespace-collapsed preview"""
+        prompt = build_batch_prompt([(1, 'Budget 2025', 'Line one\n\nline two ' + 'x' * 1000),
+                                     (2, '新加坡新闻', '内容')])
+        assert '[1]\n제목: Budget 2025\n내용: Line one line two' in prompt
+        assert '[2]\n제목: 新加坡新闻' in prompt
+        assert 'x' * 601 not in prompt
+        assert '"title_ko"' in prompt and '"summary_ko"' in prompt
+
+
+class TestParseBatchSummaries:
+    """Test validation of the JSON array response"""
+
+    def test_valid_items_are_formatted(self):
+        """Test that items map to the single-summary output format"""
+        text = '```json\n' + json.dumps([
+            {'id': 1, 'title_ko': '2025 예산 발표', 'summary_ko': '정부가 예산을 발표했다.'},
+            {'id': '2', 'title_ko': '새 HDB 아파트', 'summary_ko': '신규 분양이 시작됐다.'},
+        ], ensure_ascii=False) + '\n```'
+        summaries = parse_batch_summaries(text, [1, 2])
+        assert summaries[1] == '📰 제목: 2025 예산 발표\n내용: 정부가 예산을 발표했다.'
+        assert set(summaries) == {1, 2}
+
+    def test_malformed_items_are_dropped(self):
+        """Test that unknown ids, duplicates, empty and non-Korean items are rejected"""
+        text = json.dumps([
+            {'id': 1, 'title_ko': '제목', 'summary_ko': '요약'},
+            {'id': 1, 'title_ko': '중복', 'summary_ko': '중복 요약'},
+            {'id': 2, 'title_ko': '', 'summary_ko': '요약'},
+            {'id': 3, 'title_ko': 'Title', 'summary_ko': 'English only'},
+            {'id': 9, 'title_ko': '범위 밖', 'summary_ko': '요약'},
+            'not an object',
+        ], ensure_ascii=False)
+        assert list(parse_batch_summaries(text, [1, 2, 3])) == [1]
+
+    def test_unparseable_response(self):
+        """Test that non-JSON output yields no summaries"""
+        assert parse_batch_summaries('Sorry, I cannot help with that.', [1]) == {}
+        assert parse_batch_summaries('[{"id": 1,', [1]) == {}
@@ -0,0 +1,61 @@
+"""
+Unit tests for the persistent seen-article index
+"""
+import json
+import pytest
+
+try:
+    from scripts.article_index import ArticleIndex, canonical_url
+except ImportError:
+    pytest.skip("article_index module not available", allow_module_level=True)
+
+
+class TestArticleIndex:
+    """Test URL canonicalization, skipping and summary reuse"""
+
+    def test_canonical_url_strips_tracking_and_fragments(self):
+        """Test that tracking parameters, fragments and trailing slashes are ignored"""
+        assert canonical_url('https://WWW.Example.com/news/a/?utm_source=x&id=1#top') == \
+            canonical_url('https://www.example.com/news/a?id=1')
+
+    def test_canonical_url_keeps_params_that_only_share_a_prefix(self):
+        """Test that ref/fbclid are matched by exact key, not by prefix"""
+        assert canonical_url('https://example.com/a?ref=home&fbclid=1&utm_medium=x&id=2') == 'https://example.com/a?id=2'
+        assert canonical_url('https://example.com/a?referenceId=1') != canonical_url('https://example.com/a?referenceId=2')
+        assert canonical_url('https://example.com/a?refresh=1&xtor_id=3') == 'https://example.com/a?refresh=1&xtor_id=3'
+
+    def test_filter_new_skips_recorded_urls(self, tmp_path):
+        """Test that accepted and rejected URLs are skipped on the next run"""
+        path = str(tmp_path / 'index.jsonl')
+        index = ArticleIndex(path=path)
+        index.record('https://example.com/a', title='A', content_hash='h1', summary='s', extracted_by='cohere')
+        index.record_rejected('https://example.com/b', 'landing_page')
+
+        reloaded = ArticleIndex(path=path)
+        links = ['https://example.com/a/', 'https://example.com/b', 'https://example.com/c']
+        assert reloaded.filter_new(links) == ['https://example.com/c']
+        assert reloaded.stats['skipped'] == 2
+
+    def test_summary_reused_only_for_matching_hash(self, tmp_path):
+        """Test that stored summaries are reused only when the content hash matches"""
+        index = ArticleIndex(path=str(tmp_path / 'index.jsonl'))
+        index.record('https://example.com/a', content_hash='h1', summary='요약', extracted_by='gemini')
+
+        assert index.get_summary('https://example.com/a', 'h1') == {'text': '요약', 'extracted_by': 'gemini'}
+        assert index.get_summary('https://example.com/a', 'h2') is None
+
+    def test_keyword_summaries_are_not_reused(self, tmp_path):
+        """Test that cheap keyword summaries are regenerated instead of reused"""
+        index = ArticleIndex(path=str(tmp_path / 'index.jsonl'))
+        index.record('https://example.com/a', content_hash='h1', summary='키워드', extracted_by='keyword')
+        assert index.get_summary('https://example.com/a', 'h1') is None
+
+    def test_expired_entries_are_compacted(self, tmp_path):
+        """Test that entries older than the retention period are dropped on load"""
+        path = tmp_path / 'index.jsonl'
+        old = {'url': 'https://example.com/old', 'status': 'accepted', 'last_seen': '2020-01-01T00:00:00+09:00'}
+        path.write_text(json.dumps(old) + '\n', encoding='utf-8')
+
+        index = ArticleIndex(path=str(path), retention_days=14)
+        assert index.filter_new(['https://example.com/old']) == ['https://example.com/old']
+        assert path.read_text(encoding='utf-8') == ''
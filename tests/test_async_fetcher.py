@@ -0,0 +1,147 @@
+"""
+Unit tests for the asyncio fetch engine
+"""
+import gzip
+import time
+import pytest
+from unittest.mock import patch
+
+try:
+    import httpx
+    from scripts.async_fetcher import AsyncFetchEngine, FetchJob, get_fetch_engine
+    from scripts.http_cache import HttpCache
+except ImportError:
+    pytest.skip("async_fetcher module or httpx not available", allow_module_level=True)
+
+
+def make_engine(handler, **kwargs):
+    return AsyncFetchEngine(transport=httpx.MockTransport(handler), backoff_factor=0, **kwargs)
+
+
+class TestAsyncFetchEngine:
+    """Test ordering, header handling, pacing and retries"""
+
+    def test_results_in_input_order_with_identical_bytes(self):
+        """Test that decoded bodies and headers match what requests would hand to the extractors"""
+        body = '<html><body>Budget 2025 — 싱가포르</body></html>'.encode('utf-8')
+
+        def handler(request):
+            if request.url.path == '/gz':
+                return httpx.Response(200, content=gzip.compress(body),
+                                      headers={'Content-Encoding': 'gzip', 'Content-Type': 'text/html; charset=utf-8'})
+            return httpx.Response(200, content=request.url.path.encode(), headers={'Content-Type': 'text/html'})
+
+        responses = make_engine(handler).fetch_all([
+            FetchJob('https://a.sg/gz'), FetchJob('https://b.sg/second'), FetchJob('https://a.sg/third')
+        ])
+
+        assert responses[0].content == body
+        assert responses[0].encoding == 'utf-8'
+        assert responses[0].headers['content-type'] == 'text/html; charset=utf-8'
+        assert [r.content for r in responses[1:]] == [b'/second', b'/third']
+
+    def test_strategy_headers_and_cookies_are_sent(self):
+        """Test that access-strategy headers and cookies reach the server"""
+        seen = {}
+
+        def handler(request):
+            seen.update(request.headers)
+            return httpx.Response(200, content=b'ok')
+
+        make_engine(handler).fetch_all([FetchJob(
+            'https://mothership.sg/a',
+            {'User-Agent': 'UA-test', 'Referer': 'https://www.google.com/', 'Connection': 'keep-alive'},
+            {'consent': 'yes'}
+        )])
+
+        assert seen['user-agent'] == 'UA-test'
+        assert seen['referer'] == 'https://www.google.com/'
+        assert seen['cookie'] == 'consent=yes'
+
+    def test_same_host_requests_are_paced_by_delay(self):
+        """Test that jobs for one host start delay seconds apart while other hosts are not held back"""
+        started = {}
+
+        def handler(request):
+            started[str(request.url)] = time.monotonic()
+            return httpx.Response(200)
+
+        begin = time.monotonic()
+        make_engine(handler).fetch_all([
+            FetchJob('https://a.sg/1', delay=0.1), FetchJob('https://a.sg/2', delay=0.1),
+            FetchJob('https://b.sg/1', delay=0.1)
+        ])
+
+        assert started['https://a.sg/2'] - started['https://a.sg/1'] >= 0.09
+        assert started['https://b.sg/1'] - begin < 0.19
+
+    def test_retries_server_errors_and_reports_failures(self):
+        """Test that 502 is retried and network errors return None instead of raising"""
+        calls = {'n': 0}
+
+        def handler(request):
+            if request.url.host == 'down.sg':
+                raise httpx.ConnectError('refused', request=request)
+            calls['n'] += 1
+            return httpx.Response(502 if calls['n'] == 1 else 200, content=b'ok')
+
+        responses = make_engine(handler).fetch_all([FetchJob('https://up.sg/'), FetchJob('https://down.sg/')])
+
+        assert responses[0].status_code == 200 and calls['n'] == 2
+        assert responses[1] is None
+
+    def test_streaming_limits_truncate_and_skip_binaries(self):
+        """Test that page limits cap the body and skip non-HTML responses"""
+        from scripts.http_session import PageLimits
+
+        def handler(request):
+            if request.url.path == '/file.pdf':
+                return httpx.Response(200, content=b'%PDF', headers={'Content-Type': 'application/pdf'})
+            return httpx.Response(200, content=b'x' * 50000, headers={'Content-Type': 'text/html'})
+
+        limits = PageLimits(max_bytes=1000)
+        responses = make_engine(handler).fetch_all([
+            FetchJob('https://a.sg/page', limits=limits), FetchJob('https://a.sg/file.pdf', limits=limits)
+        ])
+
+        assert len(responses[0].content) == 1000 and responses[0].truncated == 'max_bytes'
+        assert responses[1] is None
+
+
+class TestPrefetch:
+    """Test handing prefetched responses to the HTTP cache"""
+
+    def test_prefetch_sends_validators_and_serves_304_from_disk(self, tmp_path):
+        """Test that a prefetched 304 is rebuilt from the cached body without another request"""
+        cache = HttpCache(cache_dir=str(tmp_path))
+        requests_seen = []
+
+        def handler(request):
+            requests_seen.append(dict(request.headers))
+            if request.headers.get('if-none-match') == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, content=b'<html>v1</html>', headers={'ETag': '"v1"'})
+
+        engine = make_engine(handler)
+        engine.prefetch([FetchJob('https://a.sg/page')], cache=cache)
+        assert cache.get('https://a.sg/page').content == b'<html>v1</html>'
+
+        engine.prefetch([FetchJob('https://a.sg/page')], cache=cache)
+        with patch('scripts.http_cache.get_http_pool') as mock_pool:
+            cached = cache.get('https://a.sg/page')
+            mock_pool.return_value.get.assert_not_called()
+
+        assert cached.from_cache and cached.content == b'<html>v1</html>'
+        assert requests_seen[1]['if-none-match'] == '"v1"'
+        assert not cache.is_prefetched('https://a.sg/page')
+
+
+class TestEngineSelection:
+    """Test the fetchEngine setting"""
+
+    def test_threads_is_default(self):
+        """Test that the async engine is only used when selected"""
+        assert get_fetch_engine({}) is None
+        assert get_fetch_engine({'fetchEngine': 'threads'}) is None
+        engine = get_fetch_engine({'fetchEngine': 'async', 'fetchEngineOptions': {'maxPerHost': 3}})
+        assert isinstance(engine, AsyncFetchEngine) and engine.per_host == 3
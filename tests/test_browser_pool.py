@@ -0,0 +1,127 @@
+"""
+Unit tests for the headless browser pool
+"""
+import threading
+import time
+import pytest
+from unittest.mock import patch
+
+try:
+    from scripts.browser_pool import BrowserPool
+except ImportError:
+    pytest.skip("browser_pool module not available", allow_module_level=True)
+
+
+class FakeDriver:
+    """Minimal stand-in for a selenium webdriver"""
+
+    def __init__(self):
+        self.quit_called = False
+        self.dead = False
+        self.visited = []
+
+    @property
+    def current_url(self):
+        if self.dead:
+            raise RuntimeError('session deleted')
+        return self.visited[-1] if self.visited else 'about:blank'
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.fixture
+def started():
+    return []
+
+
+@pytest.fixture
+def pool(started):
+    def factory():
+        driver = FakeDriver()
+        started.append(driver)
+        return driver
+    return BrowserPool(size=2, max_pages=3, factory=factory)
+
+
+class TestBrowserPool:
+    """Test lazy start, reuse, recycling and shutdown"""
+
+    def test_drivers_start_lazily_and_are_reused(self, pool, started):
+        """Test that sequential pages share one driver"""
+        assert started == []
+        for i in range(2):
+            with pool.acquire() as driver:
+                driver.get(f'https://a.sg/{i}')
+        assert len(started) == 1
+        assert started[0].visited == ['https://a.sg/0', 'https://a.sg/1']
+
+    def test_recycles_after_max_pages(self, pool, started):
+        """Test that a driver is quit and replaced after max_pages uses"""
+        for _ in range(4):
+            with pool.acquire():
+                pass
+        assert len(started) == 2
+        assert started[0].quit_called and not started[1].quit_called
+        assert pool.stats['recycled'] == 1
+
+    def test_recycles_on_memory_growth(self, pool, started):
+        """Test that drivers above the memory limit are replaced"""
+        pool.max_memory_mb = 500
+        with patch('scripts.browser_pool.driver_memory_mb', return_value=900):
+            with pool.acquire():
+                pass
+        assert started[0].quit_called
+
+    def test_missing_psutil_is_logged_once(self, capsys, monkeypatch):
+        """Test that an unenforceable memory limit is reported once, not silently ignored"""
+        from scripts import browser_pool
+        monkeypatch.setattr(browser_pool, 'PSUTIL_AVAILABLE', False)
+        monkeypatch.setattr(browser_pool, '_memory_warning_logged', False)
+        BrowserPool(max_memory_mb=1024, factory=FakeDriver)
+        BrowserPool(max_memory_mb=1024, factory=FakeDriver)
+        assert capsys.readouterr().out.count('max_memory_mb=1024 is not enforced') == 1
+
+    def test_dead_driver_is_discarded(self, pool, started):
+        """Test that a crashed session is not handed out again"""
+        with pool.acquire() as driver:
+            driver.dead = True
+        with pool.acquire() as driver:
+            assert driver is started[1]
+
+    def test_size_bounds_concurrent_drivers(self, pool, started):
+        """Test that at most size drivers run at once and others wait"""
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def work():
+            with pool.acquire():
+                with lock:
+                    active.append(1)
+                    peak.append(len(active))
+                time.sleep(0.05)
+                with lock:
+                    active.pop()
+
+        threads = [threading.Thread(target=work) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert max(peak) <= 2
+        assert len(started) <= 3
+
+    def test_shutdown_quits_all_drivers(self, pool, started):
+        """Test that shutdown closes idle drivers and refuses new work"""
+        with pool.acquire():
+            pass
+        pool.shutdown()
+        assert started[0].quit_called
+        with pytest.raises(RuntimeError):
+            with pool.acquire():
+                pass
+        assert pool.get_page('https://a.sg/') is None
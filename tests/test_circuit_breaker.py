@@ -0,0 +1,118 @@
+"""
+Unit tests for the per-domain circuit breaker
+"""
+import pytest
+from unittest.mock import Mock, patch
+
+try:
+    from scripts.circuit_breaker import CircuitBreaker, CLOSED, HALF_OPEN, OPEN
+    from scripts import scraper
+except ImportError:
+    pytest.skip("circuit_breaker module not available", allow_module_level=True)
+
+
+URL = 'https://mothership.sg/2025/01/a'
+
+
+@pytest.fixture
+def breaker(tmp_path):
+    return CircuitBreaker(state_file=str(tmp_path / 'site_health.json'), threshold=3, cooldown=60)
+
+
+class TestCircuitBreaker:
+    """Test opening, probing and persistence"""
+
+    def test_opens_after_consecutive_failures(self, breaker):
+        """Test that only consecutive blocks open the circuit"""
+        breaker.record_failure(URL)
+        breaker.record_failure(URL)
+        breaker.record_success(URL)
+        breaker.record_failure(URL)
+        breaker.record_failure(URL)
+        assert breaker.allow(URL) == CLOSED
+
+        breaker.record_failure(URL)
+        assert breaker.allow('https://mothership.sg/2025/01/b') == OPEN
+        assert breaker.allow('https://www.straitstimes.com/a') == CLOSED
+        assert breaker.snapshot()['mothership.sg']['skipped'] == 1
+
+    def test_half_open_allows_a_single_probe(self, breaker):
+        """Test that after the cooldown one request probes while the rest are skipped"""
+        for _ in range(3):
+            breaker.record_failure(URL)
+        with patch('scripts.circuit_breaker.time.time', return_value=breaker._domains['mothership.sg']['opened_at'] + 61):
+            assert breaker.allow(URL) == HALF_OPEN
+            assert breaker.allow(URL) == OPEN
+
+        breaker.record_failure(URL)
+        assert breaker.state(URL) == OPEN
+
+    def test_probe_exception_releases_probe(self, breaker):
+        """Test that an error between allow() and record_*() does not leave the domain probing forever"""
+        for _ in range(3):
+            breaker.record_failure(URL)
+        breaker._domains['mothership.sg']['state'] = HALF_OPEN
+        cache = Mock()
+        cache.is_prefetched.side_effect = RuntimeError('cache broken')
+        with patch.object(scraper, 'get_circuit_breaker', return_value=breaker), \
+                patch.object(scraper, 'get_http_cache', return_value=cache):
+            assert scraper.extract_article_content(URL) is None
+        assert breaker.state(URL) == HALF_OPEN
+        assert breaker.allow(URL) == HALF_OPEN
+
+    def test_probe_success_closes_circuit(self, breaker):
+        """Test that a successful probe resets the domain"""
+        for _ in range(3):
+            breaker.record_failure(URL)
+        breaker._domains['mothership.sg']['opened_at'] -= 61
+        assert breaker.allow(URL) == HALF_OPEN
+        breaker.record_success(URL)
+        assert breaker.allow(URL) == CLOSED
+        assert breaker.snapshot()['mothership.sg']['last_success'] is not None
+
+    def test_open_circuit_starts_next_run_half_open(self, breaker):
+        """Test that persisted open circuits begin the next run with a probe"""
+        for _ in range(3):
+            breaker.record_failure(URL)
+        breaker.record_success('https://www.straitstimes.com/a')
+        breaker.save()
+
+        restored = CircuitBreaker(state_file=breaker.state_file, threshold=3, cooldown=60)
+        assert restored.state(URL) == HALF_OPEN
+        assert restored.allow(URL) == HALF_OPEN
+        assert restored.state('https://www.straitstimes.com/b') == CLOSED
+        assert restored.snapshot()['straitstimes.com']['last_success'] is not None
+
+
+class TestExtractArticleContent:
+    """Test that the scraper skips the fallback cascade for blocked domains"""
+
+    def blocked_cache(self):
+        cache = Mock()
+        cache.is_prefetched.return_value = True
+        cache.get.return_value = Mock(status_code=403)
+        return cache
+
+    def test_open_domain_is_not_requested(self, breaker):
+        """Test that links on an open domain return None without any request"""
+        for _ in range(3):
+            breaker.record_failure(URL)
+        cache = self.blocked_cache()
+        with patch.object(scraper, 'get_circuit_breaker', return_value=breaker), \
+                patch.object(scraper, 'get_http_cache', return_value=cache):
+            assert scraper.extract_article_content(URL) is None
+        cache.get.assert_not_called()
+
+    def test_probe_failure_skips_alternatives(self, breaker):
+        """Test that a blocked probe reopens the circuit without trying fallbacks"""
+        for _ in range(3):
+            breaker.record_failure(URL)
+        breaker._domains['mothership.sg']['state'] = HALF_OPEN
+        cache = self.blocked_cache()
+        with patch.object(scraper, 'get_circuit_breaker', return_value=breaker), \
+                patch.object(scraper, 'get_http_cache', return_value=cache), \
+                patch.object(scraper, 'AlternativeSources', create=True) as alternatives:
+            assert scraper.extract_article_content(URL) is None
+        alternatives.assert_not_called()
+        assert cache.get.call_count == 1
+        assert breaker.state(URL) == OPEN
@@ -0,0 +1,71 @@
+"""
+Unit tests for the concurrent fetch engine
+"""
+import threading
+import time
+import pytest
+
+try:
+    from scripts.concurrent_fetcher import ConcurrentFetcher, get_domain_key
+except ImportError:
+    pytest.skip("concurrent_fetcher module not available", allow_module_level=True)
+
+
+class TestConcurrentFetcher:
+    """Test ordering and concurrency limits of ConcurrentFetcher"""
+
+    def test_domain_key_strips_www(self):
+        """Test that www. and ports are ignored when grouping by domain"""
+        assert get_domain_key('https://www.straitstimes.com/a') == 'straitstimes.com'
+        assert get_domain_key('https://straitstimes.com:443/b') == 'straitstimes.com'
+
+    def test_results_keep_input_order(self):
+        """Test that results are returned in input order regardless of completion order"""
+        urls = [f'https://site{i % 3}.com/article/{i}' for i in range(9)]
+        fetcher = ConcurrentFetcher(max_workers=4, per_domain=1)
+
+        def work(url):
+            time.sleep(0.01 * (9 - int(url.rsplit('/', 1)[1])))
+            return url
+
+        assert fetcher.map_ordered(work, urls, lambda url: url) == urls
+
+    def test_per_domain_limit_is_respected(self):
+        """Test that no more than per_domain tasks run for one domain at a time"""
+        lock = threading.Lock()
+        running = {}
+        peak = {}
+
+        def work(url):
+            domain = get_domain_key(url)
+            with lock:
+                running[domain] = running.get(domain, 0) + 1
+                peak[domain] = max(peak.get(domain, 0), running[domain])
+            time.sleep(0.02)
+            with lock:
+                running[domain] -= 1
+            return domain
+
+        urls = [f'https://a.com/{i}' for i in range(4)] + [f'https://b.com/{i}' for i in range(4)]
+        ConcurrentFetcher(max_workers=8, per_domain=2).map_ordered(work, urls, lambda url: url)
+
+        assert peak['a.com'] <= 2
+        assert peak['b.com'] <= 2
+
+    def test_failed_task_returns_none(self):
+        """Test that an exception in one task does not abort the others"""
+        def work(url):
+            if url.endswith('/bad'):
+                raise ValueError('boom')
+            return url
+
+        urls = ['https://a.com/ok', 'https://a.com/bad', 'https://b.com/ok']
+        results = ConcurrentFetcher(max_workers=2).map_ordered(work, urls, lambda url: url)
+        assert results == ['https://a.com/ok', None, 'https://b.com/ok']
+
+    def test_from_settings(self, mock_settings):
+        """Test reading limits from scrapingMethodOptions.traditional"""
+        mock_settings['scrapingMethodOptions']['traditional'].update({'maxWorkers': 1, 'maxPerDomain': 3})
+        fetcher = ConcurrentFetcher.from_settings(mock_settings)
+        assert fetcher.is_sequential
+        assert fetcher.per_domain == 3
@@ -0,0 +1,75 @@
+"""
+Unit tests for the precompiled filter engine
+"""
+import random
+import re
+import pytest
+
+try:
+    from scripts.filter_engine import PhraseMatcher, compile_any, get_keyword_matcher, SITE_URL_PATTERNS
+except ImportError:
+    pytest.skip("filter_engine module not available", allow_module_level=True)
+
+
+class TestPhraseMatcher:
+    """Test that compiled matchers give the same answers as the substring loops they replace"""
+
+    def test_matches_naive_substring_checks(self):
+        """Test any/count equivalence on random phrases, including overlapping and prefix phrases"""
+        rng = random.Random(7)
+        alphabet = 'ab c'
+        for _ in range(2000):
+            phrases = [''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 4)))
+                       for _ in range(rng.randint(1, 8))]
+            text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+            matcher = PhraseMatcher(phrases)
+            unique = set(phrases)
+
+            assert matcher.search(text) == any(p in text for p in phrases)
+            assert matcher.count(text) == sum(1 for p in unique if p in text)
+
+    def test_prefix_phrases_counted_separately(self):
+        """Test that 'year' and 'years' both count when only 'years' appears"""
+        matcher = PhraseMatcher(['year', 'years', 'prime minister', 'minister'])
+        assert matcher.found('two years ago the prime minister said') == \
+            {'year', 'years', 'prime minister', 'minister'}
+
+    def test_regex_metacharacters_are_literal(self):
+        """Test that phrases such as 'us/uk' and '.js' are matched literally"""
+        matcher = PhraseMatcher(['.js', 'us/uk', 'a+b'])
+        assert matcher.search('/static/app.js')
+        assert not matcher.search('/static/appxjs')
+        assert matcher.matches('us/uk a+b') == ['us/uk', 'a+b']
+
+    def test_empty_matcher_never_matches(self):
+        """Test that an empty keyword list matches nothing"""
+        assert not PhraseMatcher([]).search('anything')
+        assert PhraseMatcher([]).count('anything') == 0
+
+
+class TestKeywordMatcher:
+    """Test settings keyword compilation"""
+
+    def test_comma_separated_keywords_are_cached(self):
+        """Test that the same keyword string compiles once and ignores case"""
+        first = get_keyword_matcher('War, Bomb ,  gun')
+        assert first is get_keyword_matcher('War, Bomb ,  gun')
+        assert first.search('a bomb threat')
+        assert first.matches('gun and war') == ['war', 'gun']
+
+
+class TestUrlPatterns:
+    """Test combined URL pattern alternations"""
+
+    def test_compile_any_matches_individual_patterns(self):
+        """Test that the joined alternation agrees with any(re.search(...))"""
+        patterns = [r'/news/[a-z0-9-]{3,}', r'/[a-z0-9-]{10,}$', r'/\d{4}/\d{2}/']
+        combined = compile_any(patterns)
+        for url in ['https://a.sg/news/abc', 'https://a.sg/short', 'https://a.sg/very-long-title',
+                    'https://a.sg/2025/07/x', 'https://a.sg/NEWS/abc']:
+            assert bool(combined.search(url)) == any(re.search(p, url) for p in patterns)
+
+    def test_site_patterns(self):
+        """Test a few known article and section URLs"""
+        assert SITE_URL_PATTERNS['cna'].search('https://www.channelnewsasia.com/singapore/budget-2025-4812345')
+        assert not SITE_URL_PATTERNS['businesstimes'].search('https://www.businesstimes.com.sg/short')
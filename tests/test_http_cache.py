@@ -0,0 +1,86 @@
+"""
+Unit tests for the conditional-GET HTTP cache
+"""
+import os
+import pytest
+from unittest.mock import Mock, patch
+
+try:
+    from scripts.http_cache import HttpCache
+except ImportError:
+    pytest.skip("http_cache module not available", allow_module_level=True)
+
+
+def make_response(status_code, content=b'', headers=None, url='https://example.com/a'):
+    """Build a minimal response-like mock"""
+    response = Mock()
+    response.status_code = status_code
+    response.content = content
+    response.headers = headers or {}
+    response.url = url
+    response.encoding = 'utf-8'
+    return response
+
+
+class TestHttpCache:
+    """Test conditional requests, 304 handling and eviction"""
+
+    def test_304_is_served_from_disk(self, tmp_path):
+        """Test that a 304 response is rebuilt from the stored body"""
+        cache = HttpCache(cache_dir=str(tmp_path))
+        first = make_response(200, b'<html>v1</html>', {'ETag': '"abc"', 'Content-Type': 'text/html'})
+        not_modified = make_response(304)
+
+        with patch('scripts.http_cache.get_http_pool') as mock_pool:
+            mock_pool.return_value.get.side_effect = [first, not_modified]
+            cache.get('https://example.com/a')
+            cached = cache.get('https://example.com/a')
+
+            second_call_headers = mock_pool.return_value.get.call_args_list[1].kwargs['headers']
+
+        assert second_call_headers['If-None-Match'] == '"abc"'
+        assert cached.status_code == 200
+        assert cached.content == b'<html>v1</html>'
+        assert cached.from_cache is True
+        assert cache.stats['hits'] == 1
+
+    def test_responses_without_validators_are_not_stored(self, tmp_path):
+        """Test that responses without ETag/Last-Modified are not cached"""
+        cache = HttpCache(cache_dir=str(tmp_path))
+        with patch('scripts.http_cache.get_http_pool') as mock_pool:
+            mock_pool.return_value.get.return_value = make_response(200, b'body')
+            cache.get('https://example.com/a')
+
+        assert not os.path.exists(tmp_path) or os.listdir(tmp_path) == []
+
+    def test_derived_results_only_returned_for_cached_responses(self, tmp_path):
+        """Test that derived results are reused only when the body was unchanged"""
+        cache = HttpCache(cache_dir=str(tmp_path))
+        first = make_response(200, b'<html></html>', {'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT'})
+
+        with patch('scripts.http_cache.get_http_pool') as mock_pool:
+            mock_pool.return_value.get.side_effect = [first, make_response(304)]
+            fresh = cache.get('https://example.com/a')
+            cache.set_derived('https://example.com/a', 'links', ['https://example.com/b'])
+            cached = cache.get('https://example.com/a')
+
+        assert cache.get_derived(fresh, 'links') is None
+        assert cache.get_derived(cached, 'links') == ['https://example.com/b']
+
+    def test_lru_eviction_respects_size_limit(self, tmp_path):
+        """Test that the oldest entries are evicted once the cache exceeds max_bytes"""
+        cache = HttpCache(cache_dir=str(tmp_path), max_bytes=3000)
+        responses = [
+            make_response(200, b'x' * 1000, {'ETag': f'"{i}"'}, url=f'https://example.com/{i}')
+            for i in range(4)
+        ]
+
+        with patch('scripts.http_cache.get_http_pool') as mock_pool:
+            mock_pool.return_value.get.side_effect = responses
+            for i in range(4):
+                cache.get(f'https://example.com/{i}')
+
+        body_files = [name for name in os.listdir(tmp_path) if name.endswith('.body')]
+        assert cache.stats['evicted'] >= 1
+        assert len(body_files) < 4
+        assert cache._load_meta('https://example.com/3') is not None
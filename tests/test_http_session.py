@@ -0,0 +1,152 @@
+"""
+Unit tests for the shared HTTP session pool
+"""
+import io
+import pytest
+import requests
+from unittest.mock import Mock, patch
+from urllib3.response import HTTPResponse
+
+try:
+    from scripts.http_session import (
+        HttpSessionPool, ACCEPT_ENCODING, PageLimits, UnsupportedContentError, STREAM_CHUNK_SIZE,
+        configure_page_limits, get_page_limits, read_limited
+    )
+except ImportError:
+    pytest.skip("http_session module not available", allow_module_level=True)
+
+
+class TestHttpSessionPool:
+    """Test per-host session reuse and strategy state"""
+
+    def test_session_reused_per_host(self):
+        """Test that one session is shared by all URLs on a host"""
+        pool = HttpSessionPool()
+        first = pool.get_session('https://www.straitstimes.com/singapore/a')
+        second = pool.get_session('https://www.straitstimes.com/world/b')
+        other = pool.get_session('https://www.channelnewsasia.com/c')
+
+        assert first is second
+        assert first is not other
+        assert pool.stats['sessions_created'] == 2
+
+    def test_retry_change_uses_separate_session(self):
+        """Test that a new retry count never re-mounts the session already in use"""
+        pool = HttpSessionPool(retries=2)
+        default = pool.get_session('https://www.straitstimes.com/a')
+        adapter = default.get_adapter('https://www.straitstimes.com/a')
+        no_retry = pool.get_session('https://www.straitstimes.com/a', retries=0)
+
+        assert no_retry is not default
+        assert default.get_adapter('https://www.straitstimes.com/a') is adapter
+        assert adapter.max_retries.total == 2
+        assert no_retry.get_adapter('https://www.straitstimes.com/a').max_retries.total == 0
+        assert no_retry.cookies is default.cookies
+        assert pool.get_session('https://www.straitstimes.com/b', retries=0) is no_retry
+
+    def test_get_with_explicit_retries_uses_matching_session(self):
+        """Test that callers running their own retry loop can turn off urllib3 retries"""
+        pool = HttpSessionPool(retries=2)
+        session = Mock()
+        session.get.return_value = Mock(status_code=200)
+        with patch.object(pool, 'get_session', return_value=session) as get_session:
+            pool.get('https://www.straitstimes.com/a', retries=0)
+            pool.get('https://www.straitstimes.com/b')
+        assert [c.args[1] for c in get_session.call_args_list] == [0, 2]
+        assert 'retries' not in session.get.call_args.kwargs
+
+    def test_strategy_identity_is_stable_per_domain(self):
+        """Test that User-Agent and cookies stay fixed for a domain within a run"""
+        pool = HttpSessionPool()
+        first = pool.get_strategy('https://www.straitstimes.com/a')
+        second = pool.get_strategy('https://www.straitstimes.com/b')
+
+        assert first['user_agent'] == second['user_agent']
+        assert first['headers'] == second['headers']
+        assert first['cookies'] == second['cookies']
+
+    def test_strategy_headers_are_copies(self):
+        """Test that callers can mutate returned headers without affecting the pool"""
+        pool = HttpSessionPool()
+        pool.get_strategy('https://mothership.sg/a')['headers']['Referer'] = 'https://www.google.com/'
+        assert pool.get_strategy('https://mothership.sg/b')['headers']['Referer'] == 'https://mothership.sg/'
+
+    def test_accept_encoding_matches_available_decoders(self):
+        """Test that br is only requested when a brotli decoder is installed"""
+        headers = HttpSessionPool._normalize_headers({'Accept-Encoding': 'gzip, deflate, br'})
+        assert headers['Accept-Encoding'] == ACCEPT_ENCODING
+
+
+def streamed_response(body, status=200, content_type='text/html; charset=utf-8'):
+    """Build a requests.Response whose body is read lazily from a urllib3 stream"""
+    response = requests.Response()
+    response.status_code = status
+    response.headers = requests.structures.CaseInsensitiveDict({'Content-Type': content_type})
+    response.raw = HTTPResponse(body=io.BytesIO(body), preload_content=False, status=status)
+    response.url = 'https://example.com/a'
+    return response
+
+
+class TestLimitedFetch:
+    """Test byte caps, stop markers and the content-type guard"""
+
+    def test_reads_whole_small_page(self):
+        """Test that pages under the cap are read unchanged"""
+        response = read_limited(streamed_response(b'<html>ok</html>'), PageLimits())
+        assert response.content == b'<html>ok</html>'
+        assert response.truncated is None
+
+    def test_stops_at_byte_cap(self):
+        """Test that reading stops at max_bytes"""
+        response = read_limited(streamed_response(b'x' * 100000), PageLimits(max_bytes=40000))
+        assert len(response.content) == 40000
+        assert response.truncated == 'max_bytes'
+
+    def test_stops_after_marker_split_across_chunks(self):
+        """Test early abort once a closing marker has been seen, even across chunk boundaries"""
+        body = b'a' * (STREAM_CHUNK_SIZE - 5) + b'</ARTICLE>' + b'b' * 100000
+        response = read_limited(streamed_response(body), PageLimits(stop_markers=('</article>',)))
+        assert response.truncated == 'marker'
+        assert b'</ARTICLE>' in response.content
+        assert len(response.content) == 2 * STREAM_CHUNK_SIZE
+
+    def test_rejects_non_page_content_types(self):
+        """Test that PDFs and videos are rejected before the body is downloaded"""
+        with pytest.raises(UnsupportedContentError):
+            read_limited(streamed_response(b'%PDF-1.7', content_type='application/pdf'), PageLimits())
+        with pytest.raises(requests.RequestException):
+            read_limited(streamed_response(b'', content_type='video/mp4'), PageLimits())
+
+    def test_error_pages_are_read_as_is(self):
+        """Test that non-200 responses bypass the guard"""
+        response = read_limited(streamed_response(b'denied', status=403, content_type='application/json'), PageLimits())
+        assert response.content == b'denied'
+
+    def test_pool_streams_when_limits_given(self):
+        """Test that the pool requests a stream and counts truncated pages"""
+        pool = HttpSessionPool()
+        session = Mock()
+        session.get.return_value = streamed_response(b'x' * 50000)
+        with patch.object(pool, 'get_session', return_value=session):
+            response = pool.get('https://example.com/a', limits=PageLimits(max_bytes=1000))
+        assert session.get.call_args.kwargs['stream'] is True
+        assert len(response.content) == 1000
+        assert pool.stats['truncated'] == 1
+
+    def test_page_limits_from_settings(self):
+        """Test that stop markers and the article byte cap apply only to article fetches"""
+        try:
+            configure_page_limits({'pageFetch': {'maxBytes': 5000, 'stopMarkers': {'example.com': ['</article>']}}})
+            assert get_page_limits('https://www.example.com/news/a', article=True) == \
+                PageLimits(5000, ('</article>',))
+            assert get_page_limits('https://www.example.com/').stop_markers == ()
+            assert get_page_limits('https://other.sg/a', article=True).stop_markers == ()
+
+            configure_page_limits({'pageFetch': {'maxBytes': 5000, 'maxListingBytes': 20000}})
+            assert get_page_limits('https://www.example.com/news/a', article=True).max_bytes == 5000
+            assert get_page_limits('https://www.example.com/').max_bytes == 20000
+
+            configure_page_limits({'pageFetch': {'enabled': False}})
+            assert get_page_limits('https://www.example.com/a') is None
+        finally:
+            configure_page_limits({})
@@ -0,0 +1,152 @@
+"""
+Unit tests for the in-memory traditional → hybrid handoff
+"""
+import json
+import os
+import pytest
+from datetime import datetime
+from unittest.mock import patch
+
+try:
+    from scripts import scraper, scraper_hybrid
+    from scripts.article_index import ArticleIndex
+except ImportError:
+    pytest.skip("scraper modules not available", allow_module_level=True)
+
+
+SETTINGS = {
+    'scrapTarget': 'all', 'blockedKeywords': 'lottery', 'importantKeywords': '',
+    'skipSeenArticles': False, 'scrapingMethodOptions': {'traditional': {'maxWorkers': 1}}
+}
+SITE = {'name': 'CNA', 'url': 'https://www.channelnewsasia.com/', 'group': 'News'}
+CONTENT = ('The Ministry of Health announced on Monday that new measures will be introduced to support '
+           'seniors living alone in Singapore. The programme will expand community care services across '
+           'all housing estates and provide additional funding for volunteer groups over the next three years.')
+
+
+@pytest.fixture(autouse=True)
+def index(tmp_path):
+    """Isolated article index for every hybrid run"""
+    article_index = ArticleIndex(path=str(tmp_path / 'article_index.jsonl'))
+    with patch.object(scraper_hybrid, 'get_article_index', return_value=article_index):
+        yield article_index
+
+
+def record(title, content=CONTENT):
+    return {'site': 'CNA', 'title': title, 'url': f'https://www.channelnewsasia.com/{len(title)}',
+            'summary': None, 'content': content, 'publish_date': None, 'extracted_by': 'traditional'}
+
+
+class TestCollectArticlesTraditional:
+    """Test that the traditional phase can run without summarizing or writing"""
+
+    def test_returns_records_without_summary_or_files(self, tmp_path, monkeypatch):
+        """Test that summarize=False skips create_summary and writes nothing"""
+        monkeypatch.chdir(tmp_path)
+        article = {'title': 'New support measures for seniors living alone', 'content': CONTENT,
+                   'publish_date': datetime(2025, 3, 10, 9, 0)}
+        with patch.object(scraper, 'collect_site_links', return_value=['https://www.channelnewsasia.com/a']), \
+                patch.object(scraper, 'extract_article_content', return_value=article), \
+                patch.object(scraper, 'create_summary') as create_summary:
+            groups = scraper.collect_articles_traditional(SETTINGS, [SITE], summarize=False)
+
+        create_summary.assert_not_called()
+        assert [a['title'] for a in groups['News']] == [article['title']]
+        assert groups['News'][0]['summary'] is None
+        assert groups['News'][0]['extracted_by'] == 'traditional'
+        assert not os.path.exists(tmp_path / 'data' / 'latest.json')
+
+
+class TestScrapeNewsHybrid:
+    """Test that hybrid mode writes the final output exactly once"""
+
+    def test_single_output_file_and_latest_pointer(self, tmp_path, monkeypatch):
+        """Test that only the hybrid result file exists and latest.json names it"""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv('COHERE_API_KEY', raising=False)
+        monkeypatch.delenv('GOOGLE_GEMINI_API_KEY', raising=False)
+        collected = {'News': [record(f'Story number {i} about Singapore housing') for i in range(7)]
+                     + [record('Lottery results announced')]}
+
+        with patch.object(scraper_hybrid, 'load_settings', return_value=SETTINGS), \
+                patch.object(scraper_hybrid, 'load_sites', return_value=[SITE]), \
+                patch.object(scraper_hybrid, 'collect_articles_traditional', return_value=collected) as collect:
+            output_file = scraper_hybrid.scrape_news_hybrid()
+
+        assert collect.call_args.kwargs['summarize'] is False
+        assert os.listdir(tmp_path / 'data' / 'scraped') == [os.path.basename(output_file)]
+        with open(tmp_path / 'data' / 'latest.json', encoding='utf-8') as f:
+            assert json.load(f)['latestFile'] == os.path.basename(output_file)
+        with open(output_file, encoding='utf-8') as f:
+            groups = json.load(f)
+        assert groups[0]['article_count'] == 5
+        assert all(article['summary'] for article in groups[0]['articles'])
+
+    def test_near_duplicates_share_one_ai_summary(self, tmp_path, monkeypatch):
+        """Test that copies of the same story from different outlets cost one provider call"""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv('COHERE_API_KEY', 'test-key')
+        monkeypatch.delenv('GOOGLE_GEMINI_API_KEY', raising=False)
+        other = ('Households will receive cash payouts of up to S$600 under Budget 2025, the Finance Minister '
+                 'said in Parliament on Tuesday, as part of a package to help with the cost of living.')
+        collected = {'News': [record('New support measures for seniors living alone'),
+                              record('New support measures for seniors living alone.'),
+                              record('Budget 2025: cash payouts for households', other)]}
+
+        with patch.object(scraper_hybrid, 'load_settings', return_value=SETTINGS), \
+                patch.object(scraper_hybrid, 'load_sites', return_value=[SITE]), \
+                patch.object(scraper_hybrid, 'collect_articles_traditional', return_value=collected), \
+                patch('ai_summary_simple.translate_to_korean_summary_cohere',
+                      side_effect=lambda title, content: f'📰 {title}') as cohere:
+            output_file = scraper_hybrid.scrape_news_hybrid()
+
+        assert cohere.call_count == 2
+        with open(output_file, encoding='utf-8') as f:
+            articles = json.load(f)[0]['articles']
+        assert [a['extracted_by'] for a in articles] == ['hybrid_cohere'] * 3
+        assert articles[0]['summary'] == articles[1]['summary']
+
+    def test_articles_are_indexed_and_reused_next_run(self, tmp_path, monkeypatch, index):
+        """Test that every final article is recorded and an unchanged article skips the provider"""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv('COHERE_API_KEY', 'test-key')
+        monkeypatch.delenv('GOOGLE_GEMINI_API_KEY', raising=False)
+        collected = {'News': [record('New support measures for seniors living alone')]}
+
+        with patch.object(scraper_hybrid, 'load_settings', return_value=SETTINGS), \
+                patch.object(scraper_hybrid, 'load_sites', return_value=[SITE]), \
+                patch.object(scraper_hybrid, 'collect_articles_traditional',
+                             side_effect=lambda *args, **kwargs: json.loads(json.dumps(collected))), \
+                patch('ai_summary_simple.translate_to_korean_summary_cohere',
+                      side_effect=lambda title, content: f'📰 {title}') as cohere:
+            scraper_hybrid.scrape_news_hybrid()
+            output_file = scraper_hybrid.scrape_news_hybrid()
+
+        assert cohere.call_count == 1
+        entry = index.get(collected['News'][0]['url'])
+        assert (entry['extracted_by'], entry['summary']) == ('cohere', '📰 New support measures for seniors living alone')
+        assert entry['simhash'] == index.fingerprint(entry['title'], CONTENT)
+        with open(output_file, encoding='utf-8') as f:
+            assert json.load(f)[0]['articles'][0]['extracted_by'] == 'hybrid_cohere'
+
+    def test_near_duplicate_from_earlier_run_is_reused(self, tmp_path, monkeypatch, index):
+        """Test that a story another outlet covered in a previous run costs no provider call"""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv('COHERE_API_KEY', 'test-key')
+        monkeypatch.delenv('GOOGLE_GEMINI_API_KEY', raising=False)
+        title = 'New support measures for seniors living alone'
+        index.record('https://www.straitstimes.com/seniors', simhash=index.fingerprint(title, CONTENT),
+                     summary='📰 노인 지원', extracted_by='gemini')
+        collected = {'News': [record(title), record(title + '.')]}
+
+        with patch.object(scraper_hybrid, 'load_settings', return_value=SETTINGS), \
+                patch.object(scraper_hybrid, 'load_sites', return_value=[SITE]), \
+                patch.object(scraper_hybrid, 'collect_articles_traditional', return_value=collected), \
+                patch('ai_summary_simple.translate_to_korean_summary_cohere') as cohere:
+            output_file = scraper_hybrid.scrape_news_hybrid()
+
+        cohere.assert_not_called()
+        with open(output_file, encoding='utf-8') as f:
+            articles = json.load(f)[0]['articles']
+        assert [(a['summary'], a['extracted_by']) for a in articles] == [('📰 노인 지원', 'hybrid_gemini')] * 2
+        assert index.get(articles[1]['url'])['extracted_by'] == 'gemini'
@@ -0,0 +1,117 @@
+"""
+Unit tests for stage timing and run profiles
+"""
+import json
+import os
+import threading
+import pytest
+
+try:
+    from scripts.instrumentation import RunProfiler
+    from scripts.monitoring import save_run_profile
+except ImportError:
+    pytest.skip("instrumentation module not available", allow_module_level=True)
+
+
+class TestRunProfiler:
+    """Test stage timers, counters and per-site tagging"""
+
+    def test_timer_records_stage_and_site(self):
+        """Test that timed blocks are aggregated globally and under the site"""
+        profiler = RunProfiler()
+        profiler.record('fetch', 0.5, site='CNA')
+        profiler.record('fetch', 1.5, site='CNA')
+        with profiler.timer('parse'):
+            pass
+
+        profile = profiler.to_dict()
+        assert profile['stages']['fetch'] == {'count': 2, 'total': 2.0, 'max': 1.5}
+        assert profile['stages']['parse']['count'] == 1
+        assert profile['sites']['CNA']['stages']['fetch']['count'] == 2
+        assert 'parse' not in profile['sites']['CNA']['stages']
+
+    def test_timer_records_on_exception(self):
+        """Test that a failing block is still timed"""
+        profiler = RunProfiler()
+        with pytest.raises(ValueError):
+            with profiler.timer('extract'):
+                raise ValueError('boom')
+        assert profiler.to_dict()['stages']['extract']['count'] == 1
+
+    def test_site_context_is_thread_local(self):
+        """Test that site tags set in worker threads do not leak between threads"""
+        profiler = RunProfiler()
+
+        def work(site):
+            with profiler.site(site):
+                for _ in range(100):
+                    profiler.incr('links_found')
+
+        threads = [threading.Thread(target=work, args=(f'site{i}',)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        profile = profiler.to_dict()
+        assert profile['counters']['links_found'] == 400
+        assert all(profile['sites'][f'site{i}']['counters']['links_found'] == 100 for i in range(4))
+        assert profiler.current_site is None
+
+    def test_slowest_sites_ordered_by_total(self):
+        """Test that the profile lists the slowest sites first"""
+        profiler = RunProfiler()
+        profiler.record('fetch', 1.0, site='fast')
+        profiler.record('fetch', 5.0, site='slow')
+        profiler.record('extract', 2.0, site='fast')
+        assert profiler.to_dict()['slowest_sites'] == ['slow', 'fast']
+
+    def test_site_total_ignores_nested_stages(self):
+        """Test that parse/prefetch timed inside other stages do not inflate a site's total"""
+        profiler = RunProfiler()
+        profiler.record('fetch', 1.0, site='a')
+        profiler.record('extract', 2.0, site='a')
+        profiler.record('parse', 1.5, site='a')
+        profiler.record('fetch', 3.5, site='b')
+
+        profile = profiler.to_dict()
+        assert profile['sites']['a']['total'] == 3.0
+        assert profile['slowest_sites'] == ['b', 'a']
+
+    def test_site_block_records_wall_time(self, monkeypatch):
+        """Test that a site block's elapsed time is its total, counted once when nested"""
+        profiler = RunProfiler()
+        clock = iter([0.0, 5.0, 6.0])
+        monkeypatch.setattr('scripts.instrumentation.time.time', lambda: next(clock))
+        with profiler.site('a'):
+            with profiler.site('a'):
+                profiler.record('fetch', 1.0)
+                profiler.record('extract', 1.0)
+                profiler.record('parse', 1.0)
+
+        site = profiler.to_dict()['sites']['a']
+        assert site['total'] == 5.0
+        assert site['stages']['fetch']['count'] == 1
+
+
+class TestSaveRunProfile:
+    """Test profile persistence next to the monitoring log"""
+
+    def test_writes_json_and_prunes_old_profiles(self, tmp_path, monkeypatch):
+        """Test that profiles are written under data/monitoring and only the newest are kept"""
+        monkeypatch.chdir(tmp_path)
+        log_dir = tmp_path / 'data' / 'monitoring'
+        log_dir.mkdir(parents=True)
+        for i in range(3):
+            (log_dir / f'profile_20250101_00000{i}.json').write_text('{}')
+        (log_dir / 'log_202501.json').write_text('[]')
+
+        profiler = RunProfiler()
+        profiler.record('fetch', 1.0, site='CNA')
+        path = save_run_profile(profiler.to_dict(), keep=2)
+
+        with open(path, encoding='utf-8') as f:
+            assert json.load(f)['stages']['fetch']['count'] == 1
+        profiles = sorted(name for name in os.listdir(log_dir) if name.startswith('profile_'))
+        assert len(profiles) == 2 and os.path.basename(path) in profiles
+        assert (log_dir / 'log_202501.json').exists()
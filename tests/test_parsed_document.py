@@ -0,0 +1,132 @@
+"""
+Unit tests for the single-parse HTML document
+"""
+import pytest
+from bs4 import BeautifulSoup
+
+try:
+    from scripts.parsed_document import (
+        ParsedDocument, element_text, is_excluded, set_default_parser, LXML_AVAILABLE
+    )
+    from scripts import parsed_document
+except ImportError:
+    pytest.skip("parsed_document module not available", allow_module_level=True)
+
+
+SAMPLE_HTML = """
+<html><head><title>Budget 2025 - The Straits Times</title>
+<meta property="og:title" content="Budget 2025">
+<meta name="article:published_time" content="2025-07-24T10:00:00+08:00">
+</head><body>
+<header><h1>Site name</h1><time>menu time</time></header>
+<nav>Home News</nav>
+<article><h1>Budget 2025 announced</h1>
+<p>The minister said the budget supports families.</p>
+<div class="social-share">Share this</div>
+<aside><p>Related story</p></aside>
+</article>
+<footer>Copyright</footer>
+</body></html>
+"""
+
+
+class TestParsedDocument:
+    """Test lazy parsing, shared text/metadata and non-mutating text extraction"""
+
+    def test_parses_once_for_all_consumers(self):
+        """Test that soup, text and metadata share a single parse recorded in the run profile"""
+        profiler = parsed_document.get_profiler()
+        profiler.reset()
+        doc = ParsedDocument(SAMPLE_HTML, 'https://example.com/a')
+        assert not doc.is_parsed
+
+        doc.text()
+        doc.text(('nav', 'footer'))
+        doc.metadata
+        doc.soup.find_all('p')
+        assert profiler.stages['parse']['count'] == 1
+
+    def test_wrap_reuses_existing_document(self):
+        """Test that wrapping a document returns the same object"""
+        doc = ParsedDocument(SAMPLE_HTML)
+        assert ParsedDocument.wrap(doc) is doc
+        assert ParsedDocument.wrap(SAMPLE_HTML).html == SAMPLE_HTML
+
+    def test_metadata_collects_title_and_meta(self):
+        """Test that <title> and meta tags are exposed"""
+        metadata = ParsedDocument(SAMPLE_HTML).metadata
+        assert metadata['title'] == 'Budget 2025 - The Straits Times'
+        assert metadata['og:title'] == 'Budget 2025'
+        assert metadata['article:published_time'].startswith('2025-07-24')
+
+    def test_metadata_parses_json_ld_once(self):
+        """Test that JSON-LD objects (including @graph nodes) are parsed once and cached"""
+        html = ('<html><head><script type="application/ld+json">'
+                '{"@graph": [{"@type": "NewsArticle", "datePublished": "2025-07-24T10:00:00+08:00"}]}'
+                '</script><script type="application/ld+json">{broken</script></head><body></body></html>')
+        doc = ParsedDocument(html)
+        assert [item.get('@type') for item in doc.metadata['json_ld']] == [None, 'NewsArticle']
+        assert doc.metadata is doc.metadata
+
+    def test_element_text_matches_decompose(self):
+        """Test that excluding tags gives the same text as decomposing them, without mutating the tree"""
+        excluded = ('script', 'style', 'nav', 'footer', 'header', 'aside')
+        mutated = BeautifulSoup(SAMPLE_HTML, 'html.parser')
+        for tag in mutated(list(excluded)):
+            tag.decompose()
+
+        doc = ParsedDocument(SAMPLE_HTML)
+        assert doc.text(excluded) == mutated.get_text()
+        assert doc.soup.find('header') is not None
+
+    def test_is_excluded_checks_ancestors_and_elements(self):
+        """Test that elements under excluded tags or elements are detected"""
+        soup = ParsedDocument(SAMPLE_HTML).soup
+        article = soup.find('article')
+        share = article.select_one('.social-share')
+
+        assert is_excluded(soup.find('header').find('h1'), ('header',))
+        assert not is_excluded(article.find('h1'), ('header',))
+        assert is_excluded(article.find('aside').find('p'), ('aside',), root=article)
+        assert element_text(article, ('aside',), [share]).split() == \
+            ['Budget', '2025', 'announced', 'The', 'minister', 'said', 'the', 'budget', 'supports', 'families.']
+
+    def test_lxml_backend_is_optional(self):
+        """Test that selecting lxml falls back to html.parser when it is missing"""
+        try:
+            parser = set_default_parser('lxml')
+            assert parser == ('lxml' if LXML_AVAILABLE else 'html.parser')
+            assert ParsedDocument(SAMPLE_HTML).soup.find('article') is not None
+        finally:
+            set_default_parser('html.parser')
+
+
+class TestMetadataConsumers:
+    """Test that date extraction and fallback classification read the shared metadata"""
+
+    def test_publish_date_from_json_ld(self):
+        """Test that extract_publish_date uses JSON-LD from the document metadata"""
+        scraper = pytest.importorskip('scripts.scraper')
+        html = ('<html><head><script type="application/ld+json">'
+                '{"@type": "NewsArticle", "datePublished": "2025-07-24T10:00:00+08:00"}</script></head>'
+                '<body><p>No dates in the text.</p></body></html>')
+        doc = scraper.ParsedDocument(html)
+        assert scraper.extract_publish_date(doc).isoformat() == '2025-07-24T11:00:00+09:00'
+        assert doc._metadata is not None
+
+    def test_meta_tag_date_is_case_insensitive(self):
+        """Test that mixed-case meta names such as DC.date are found"""
+        scraper = pytest.importorskip('scripts.scraper')
+        html = '<html><head><meta name="DC.date" content="2025-07-24T10:00:00Z"></head><body></body></html>'
+        assert scraper.extract_publish_date(html, default_to_now=False).isoformat() == '2025-07-24T19:00:00+09:00'
+
+    def test_declared_article_helps_fallback_classification(self):
+        """Test that og:type=article counts towards the article signals"""
+        ai_scraper = pytest.importorskip('scripts.ai_scraper')
+        body = ('<h1>Budget 2025 announced for families</h1>'
+                + '<p>The plan supports households with new payouts over the coming year.</p>' * 2)
+        plain = f'<html><head></head><body>{body}</body></html>'
+        declared = f'<html><head><meta property="og:type" content="article"></head><body>{body}</body></html>'
+        scraper = ai_scraper.AIScraper.__new__(ai_scraper.AIScraper)
+        assert not scraper._fallback_content_classification(plain)['is_article']
+        assert scraper._fallback_content_classification(declared)['is_article']
@@ -0,0 +1,171 @@
+"""
+Unit tests for latency-aware summary provider routing
+"""
+import time
+import pytest
+from unittest.mock import patch
+
+try:
+    from scripts.provider_router import ProviderRouter, percentile
+    from scripts.summary_workers import SummaryWorkers
+    from scripts.rate_limiter import TokenBucket
+    from scripts import scraper
+except ImportError:
+    pytest.skip("provider_router module not available", allow_module_level=True)
+
+
+def provider(result, delay=0.0, calls=None, name=None):
+    def summarize(title, content):
+        if calls is not None:
+            calls.append(name)
+        time.sleep(delay)
+        return result
+    return summarize
+
+
+def fresh_bucket(name):
+    return TokenBucket(600, burst=5)
+
+
+@pytest.fixture
+def router(tmp_path):
+    return ProviderRouter(state_file=str(tmp_path / 'provider_stats.json'), timeout=2, monthly_quota={},
+                          limiter_for=fresh_bucket)
+
+
+class TestProviderStats:
+    """Test rolling latency, error rate and quota bookkeeping"""
+
+    def test_percentile(self):
+        """Test nearest-rank percentiles"""
+        assert percentile([3, 1, 2, 4, 5], 0.5) == 3
+        assert percentile([], 0.9) is None
+
+    def test_faster_provider_ranks_first(self, router):
+        """Test that recorded latency overrides the configured priority"""
+        for _ in range(5):
+            router.record('cohere', 4.0, True)
+            router.record('gemini', 0.5, True)
+        ranked = router.rank([('cohere', None), ('gemini', None)])
+        assert [name for name, _ in ranked] == ['gemini', 'cohere']
+
+    def test_failing_provider_ranks_last(self, router):
+        """Test that a high error rate pushes a provider down"""
+        for _ in range(5):
+            router.record('cohere', 1.0, False)
+            router.record('gemini', 1.5, True)
+        assert router.error_rate('cohere') == 1.0
+        assert router.rank([('cohere', None), ('gemini', None)])[0][0] == 'gemini'
+
+    def test_exhausted_quota_is_skipped(self, tmp_path):
+        """Test that a provider out of monthly quota is not called"""
+        router = ProviderRouter(state_file=str(tmp_path / 'stats.json'), monthly_quota={'cohere': 2},
+                                limiter_for=fresh_bucket)
+        router.record('cohere', 1.0, True)
+        router.record('cohere', 1.0, True)
+        assert router.remaining_quota('cohere') == 0
+        assert [name for name, _ in router.rank([('cohere', None), ('gemini', None)])] == ['gemini']
+
+    def test_stats_persist(self, router):
+        """Test that the next run starts with the saved routing order"""
+        router.record('gemini', 0.2, True)
+        router.record('cohere', 3.0, True)
+        router.save()
+        restored = ProviderRouter(state_file=router.state_file, monthly_quota={}, limiter_for=fresh_bucket)
+        assert restored.latency('gemini') == 0.2
+        assert restored.rank([('cohere', None), ('gemini', None)])[0][0] == 'gemini'
+
+
+class TestRoute:
+    """Test routing, failover and hedging"""
+
+    def test_failure_moves_on_immediately(self, router):
+        """Test that the next provider is called as soon as the first fails"""
+        begin = time.time()
+        result, name = router.route([('cohere', provider(None)), ('gemini', provider('요약'))], 't', 'c')
+        assert (result, name) == ('요약', 'gemini')
+        assert time.time() - begin < 0.5
+        assert router.error_rate('cohere') == 1.0
+
+    def test_hedges_after_p90_delay(self, router):
+        """Test that a slow primary is hedged once its p90 latency has passed"""
+        for _ in range(10):
+            router.record('cohere', 0.01, True)
+            router.record('gemini', 0.02, True)
+        calls = []
+        begin = time.time()
+        result, name = router.route([
+            ('cohere', provider('slow', 1.5, calls, 'cohere')),
+            ('gemini', provider('fast', 0.05, calls, 'gemini')),
+        ], 't', 'c')
+        assert (result, name) == ('fast', 'gemini')
+        assert calls == ['cohere', 'gemini']
+        assert time.time() - begin < 1.2
+
+    def test_no_hedge_when_disabled(self, tmp_path):
+        """Test that hedge=False waits for the primary"""
+        router = ProviderRouter(state_file=str(tmp_path / 'stats.json'), hedge=False, timeout=2, monthly_quota={},
+                                limiter_for=fresh_bucket)
+        calls = []
+        result, name = router.route([
+            ('cohere', provider('first', 0.1, calls, 'cohere')),
+            ('gemini', provider('second', 0.0, calls, 'gemini')),
+        ], 't', 'c')
+        assert (result, name, calls) == ('first', 'cohere', ['cohere'])
+
+    def test_summary_workers_use_router(self, router):
+        """Test that routed results keep the provider name for extracted_by"""
+        workers = SummaryWorkers([('cohere', provider(None)), ('gemini', provider('요약'))], router=router)
+        results = workers.summarize([{'title': 'A', 'content': 'B'}, {'title': 'C', 'content': 'D'}])
+        assert [r.status for r in results] == ['gemini', 'gemini']
+
+
+@pytest.fixture
+def summary_env(monkeypatch):
+    """Both API keys present, AI eligible and a fresh session count"""
+    monkeypatch.setenv('COHERE_API_KEY', 'c-key')
+    monkeypatch.setenv('GOOGLE_GEMINI_API_KEY', 'g-key')
+    monkeypatch.setattr(scraper, 'AI_SUMMARY_COUNT', 0)
+    monkeypatch.setattr(scraper, 'AI_SUMMARY_AVAILABLE', True)
+    monkeypatch.setattr(scraper, 'should_use_ai_summary', lambda article, site: True)
+
+
+ARTICLE = {'title': 'Budget 2025', 'content': 'Households receive payouts.'}
+PRIORITY = {'scrapingMethodOptions': {'hybrid': {'apiPriority': ['gemini', 'cohere']}}}
+
+
+class TestGenerateSummaryRouting:
+    """Test that the traditional summary path follows apiPriority and the router"""
+
+    def test_api_priority_order_without_router(self, summary_env):
+        """Test that providers are tried in apiPriority order with the fallback last"""
+        calls = []
+        with patch.object(scraper, 'get_provider_router', return_value=None), \
+                patch.object(scraper, 'translate_to_korean_summary_cohere', provider('cohere', calls=calls, name='cohere')), \
+                patch.object(scraper, 'translate_to_korean_summary_gemini', provider(None, calls=calls, name='gemini')), \
+                patch.object(scraper, 'translate_to_korean_summary_fallback', provider('fb', calls=calls, name='fallback')):
+            result = scraper.generate_summary(ARTICLE, PRIORITY)
+        assert result == {'text': 'cohere', 'extracted_by': 'cohere'}
+        assert calls == ['gemini', 'cohere']
+        assert scraper.AI_SUMMARY_COUNT == 1
+
+    def test_router_picks_provider(self, summary_env, router):
+        """Test that a configured router chooses the provider and skips the fallback"""
+        calls = []
+        with patch.object(scraper, 'get_provider_router', return_value=router), \
+                patch.object(scraper, 'translate_to_korean_summary_cohere', provider('요약', calls=calls, name='cohere')), \
+                patch.object(scraper, 'translate_to_korean_summary_gemini', provider(None, calls=calls, name='gemini')), \
+                patch.object(scraper, 'translate_to_korean_summary_fallback', provider('fb', calls=calls, name='fallback')):
+            result = scraper.generate_summary(ARTICLE, PRIORITY)
+        assert result == {'text': '요약', 'extracted_by': 'cohere'}
+        assert 'fallback' not in calls
+        assert router.error_rate('gemini') == 1.0
+
+    def test_fallback_after_router_fails(self, summary_env, router, monkeypatch):
+        """Test that the fallback runs once every routed provider has failed"""
+        monkeypatch.delenv('GOOGLE_GEMINI_API_KEY')
+        with patch.object(scraper, 'get_provider_router', return_value=router), \
+                patch.object(scraper, 'translate_to_korean_summary_cohere', provider(None)), \
+                patch.object(scraper, 'translate_to_korean_summary_fallback', provider('fb')):
+            result = scraper.generate_summary(ARTICLE, PRIORITY)
+        assert result == {'text': 'fb', 'extracted_by': 'fallback'}
@@ -0,0 +1,53 @@
+"""
+Unit tests for the shared AI provider rate limiter
+"""
+import asyncio
+import pytest
+
+try:
+    from scripts.rate_limiter import TokenBucket, get_rate_limiter
+except ImportError:
+    pytest.skip("rate_limiter module not available", allow_module_level=True)
+
+
+class TestTokenBucket:
+    """Test token reservation, non-blocking acquisition and shared buckets"""
+
+    def test_burst_allows_single_immediate_call(self):
+        """Test that burst=1 grants one token and then refuses"""
+        bucket = TokenBucket(60, burst=1)
+        assert bucket.try_acquire() is True
+        assert bucket.try_acquire() is False
+
+    def test_peek_wait_does_not_reserve(self):
+        """Test that peeking reports the wait without consuming a token"""
+        bucket = TokenBucket(60, burst=1)
+        assert bucket.peek_wait() == 0.0
+        assert bucket.try_acquire() is True
+        assert bucket.peek_wait() == pytest.approx(1.0, abs=0.1)
+        assert bucket.peek_wait() == pytest.approx(1.0, abs=0.1)
+
+    def test_reservation_spaces_calls_by_rate(self):
+        """Test that back-to-back reservations are spaced 60/rate seconds apart"""
+        bucket = TokenBucket(12, burst=1)
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(5.0, abs=0.1)
+        assert bucket.reserve() == pytest.approx(10.0, abs=0.1)
+        assert bucket.requests_last_minute() == 3
+
+    def test_async_acquire_does_not_block_loop(self):
+        """Test that async acquisition waits with asyncio.sleep"""
+        bucket = TokenBucket(600, burst=1)  # 0.1초 간격
+
+        async def run():
+            return await asyncio.gather(bucket.acquire_async(), bucket.acquire_async())
+
+        waits = asyncio.run(run())
+        assert waits[0] == 0.0
+        assert waits[1] == pytest.approx(0.1, abs=0.05)
+        assert bucket.get_stats()['total_acquired'] == 2
+
+    def test_registry_shares_bucket_per_provider(self):
+        """Test that callers of the same provider share one bucket"""
+        assert get_rate_limiter('gemini') is get_rate_limiter('Gemini')
+        assert get_rate_limiter('gemini') is not get_rate_limiter('cohere')
@@ -0,0 +1,155 @@
+"""
+Unit tests for RSS conditional fetching and feed-state persistence
+"""
+import os
+import time
+import pytest
+import requests
+from unittest.mock import patch
+
+try:
+    from scripts.rss_state import FeedState, MAX_SEEN_IDS
+    from scripts import scraper_rss
+except ImportError:
+    pytest.skip("rss_state module not available", allow_module_level=True)
+
+
+FEED_URL = 'https://example.sg/feed/'
+SETTINGS = {'scrapTarget': 'all', 'blockedKeywords': '', 'importantKeywords': '', 'maxArticlesPerSite': 5}
+
+
+def rss(*items):
+    body = ''.join(
+        f'<item><guid>{guid}</guid><title>{guid} title</title><link>https://example.sg/{guid}</link>'
+        f'<description>Singapore news body for {guid}</description></item>'
+        for guid in items
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>T</title>{body}</channel></rss>'.encode()
+
+
+def feed_response(body, status=200, headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response.headers.update(headers or {})
+    return response
+
+
+@pytest.fixture
+def state(tmp_path):
+    return FeedState(state_file=str(tmp_path / 'rss_state.json'))
+
+
+class TestFeedState:
+    """Test validators and seen-entry bookkeeping"""
+
+    def test_validators_become_conditional_headers(self, state):
+        """Test that stored ETag/Last-Modified are sent back on the next request"""
+        state.update_validators(FEED_URL, '"abc"', 'Mon, 10 Mar 2025 01:00:00 GMT')
+        headers = state.request_headers(FEED_URL, {'User-Agent': 'UA'})
+        assert headers == {'User-Agent': 'UA', 'If-None-Match': '"abc"',
+                           'If-Modified-Since': 'Mon, 10 Mar 2025 01:00:00 GMT'}
+        assert state.validators('https://other.sg/feed') == {'etag': None, 'modified': None}
+
+    def test_seen_ids_persist_and_are_bounded(self, state):
+        """Test that processed entry IDs survive a restart and are capped"""
+        state.mark_seen(FEED_URL, [{'id': f'id-{i}'} for i in range(MAX_SEEN_IDS + 10)])
+        state.save()
+
+        restored = FeedState(state_file=state.state_file)
+        assert restored.new_entries(FEED_URL, [{'id': 'id-0'}, {'id': 'new'}]) == [{'id': 'new'}]
+        assert len(restored._feeds[FEED_URL]['seen']) == MAX_SEEN_IDS
+
+
+class TestScrapeRssFeed:
+    """Test that unchanged feeds and old entries are skipped"""
+
+    def test_not_modified_feed_does_no_work(self, state):
+        """Test that a 304 response returns immediately without parsing"""
+        with patch.object(scraper_rss.feedparser, 'parse') as parse:
+            articles = scraper_rss.scrape_rss_feed(FEED_URL, 'Example', SETTINGS, feed_response(b'', 304), state)
+        assert articles == []
+        parse.assert_not_called()
+
+    def test_only_new_entries_are_processed(self, state):
+        """Test that entries from the previous run are not processed again"""
+        first = scraper_rss.scrape_rss_feed(
+            FEED_URL, 'Example', SETTINGS, feed_response(rss('a', 'b'), headers={'ETag': '"v1"'}), state)
+        assert [a['title'] for a in first] == ['a title', 'b title']
+        assert state.validators(FEED_URL)['etag'] == '"v1"'
+
+        second = scraper_rss.scrape_rss_feed(
+            FEED_URL, 'Example', SETTINGS, feed_response(rss('c', 'a', 'b'), headers={'ETag': '"v2"'}), state)
+        assert [a['title'] for a in second] == ['c title']
+
+    def test_unevaluated_entries_stay_new(self, state):
+        """Test that entries beyond the evaluated window are processed on the next run"""
+        settings = dict(SETTINGS, maxArticlesPerSite=1)
+        first = scraper_rss.scrape_rss_feed(
+            FEED_URL, 'Example', settings, feed_response(rss('a', 'b', 'c'), headers={'ETag': '"v1"'}), state)
+        assert [a['title'] for a in first] == ['a title']
+        assert state.validators(FEED_URL)['etag'] is None
+
+        second = scraper_rss.scrape_rss_feed(
+            FEED_URL, 'Example', settings, feed_response(rss('a', 'b', 'c'), headers={'ETag': '"v1"'}), state)
+        assert [a['title'] for a in second] == ['b title']
+
+    def test_failed_entry_is_not_marked_seen(self, state):
+        """Test that an entry whose processing raised is retried on the next run"""
+        calls = []
+
+        def flaky_summary(title, content):
+            calls.append(title)
+            if len(calls) == 1:
+                raise ValueError('boom')
+            return title
+
+        with patch.object(scraper_rss, 'create_keyword_summary', side_effect=flaky_summary):
+            first = scraper_rss.scrape_rss_feed(FEED_URL, 'Example', SETTINGS, feed_response(rss('a', 'b')), state)
+            second = scraper_rss.scrape_rss_feed(FEED_URL, 'Example', SETTINGS, feed_response(rss('a', 'b')), state)
+        assert [a['title'] for a in first] == ['b title']
+        assert [a['title'] for a in second] == ['a title']
+
+    def test_direct_fetch_passes_validators_to_feedparser(self, state):
+        """Test that feedparser receives the stored etag and modified values"""
+        state.update_validators(FEED_URL, '"v1"', 'Mon, 10 Mar 2025 01:00:00 GMT')
+        with patch.object(scraper_rss.feedparser, 'parse', return_value={'status': 304}) as parse:
+            assert scraper_rss.scrape_rss_feed(FEED_URL, 'Example', SETTINGS, state=state) == []
+        parse.assert_called_once_with(FEED_URL, etag='"v1"', modified='Mon, 10 Mar 2025 01:00:00 GMT')
+
+
+class TestScrapeNewsRss:
+    """Test that feeds are fetched concurrently"""
+
+    def test_feeds_run_in_parallel(self, state, tmp_path, monkeypatch):
+        """Test that total time is close to one feed's latency"""
+        monkeypatch.chdir(tmp_path)
+        feeds = {f'Feed {i}': f'https://feed{i}.sg/rss' for i in range(6)}
+
+        def slow_feed(feed_url, site_name, settings, response=None, state=None):
+            time.sleep(0.2)
+            return []
+
+        with patch.object(scraper_rss, 'RSS_FEEDS', feeds), \
+                patch.object(scraper_rss, 'load_settings', return_value=SETTINGS), \
+                patch.object(scraper_rss, 'get_feed_state', return_value=state), \
+                patch.object(scraper_rss, 'scrape_rss_feed', side_effect=slow_feed):
+            begin = time.time()
+            scraper_rss.scrape_news_rss()
+        assert time.time() - begin < 0.8
+
+    def test_state_saved_after_output(self, state, tmp_path, monkeypatch):
+        """Test that feed state is persisted only once the output files exist"""
+        monkeypatch.chdir(tmp_path)
+        written = []
+
+        def save():
+            written.append(sorted(os.listdir(tmp_path / 'data')))
+
+        with patch.object(scraper_rss, 'RSS_FEEDS', {'Example': FEED_URL}), \
+                patch.object(scraper_rss, 'load_settings', return_value=SETTINGS), \
+                patch.object(scraper_rss, 'get_feed_state', return_value=state), \
+                patch.object(scraper_rss, 'scrape_rss_feed', return_value=[]), \
+                patch.object(state, 'save', side_effect=save):
+            scraper_rss.scrape_news_rss()
+        assert written == [['latest.json', 'scraped']]
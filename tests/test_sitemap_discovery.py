@@ -0,0 +1,145 @@
+"""
+Unit tests for news-sitemap link discovery
+"""
+import gzip
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import Mock
+
+try:
+    from scripts.sitemap_discovery import SitemapDiscovery, SitemapParser, parse_sitemap_date
+except ImportError:
+    pytest.skip("sitemap_discovery module not available", allow_module_level=True)
+
+
+NOW = datetime(2025, 3, 10, 12, 0, tzinfo=timezone.utc)
+
+NEWS_SITEMAP = b'''<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
+        xmlns:news="http://www.google.com/schemas/sitemap-news/0.9">
+  <url>
+    <loc>https://www.example.sg/news/older-story</loc>
+    <news:news>
+      <news:publication><news:name>Example</news:name><news:language>en</news:language></news:publication>
+      <news:publication_date>2025-03-01T08:00:00+08:00</news:publication_date>
+      <news:title>Older story</news:title>
+    </news:news>
+  </url>
+  <url>
+    <loc>https://www.example.sg/news/budget-2025</loc>
+    <news:news>
+      <news:publication><news:name>Example</news:name><news:language>en</news:language></news:publication>
+      <news:publication_date>2025-03-10T09:30:00+08:00</news:publication_date>
+      <news:title>Budget 2025 unveiled</news:title>
+    </news:news>
+  </url>
+  <url>
+    <loc>https://www.example.sg/news/hdb-flats</loc>
+    <news:news>
+      <news:publication><news:name>Example</news:name><news:language>en</news:language></news:publication>
+      <news:publication_date>2025-03-10T11:00:00Z</news:publication_date>
+      <news:title>New HDB flats</news:title>
+    </news:news>
+  </url>
+  <url><loc>https://ads.other.com/promo</loc><lastmod>2025-03-10</lastmod></url>
+</urlset>'''
+
+SITEMAP_INDEX = b'''<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <sitemap><loc>https://www.example.sg/sitemap-pages.xml</loc></sitemap>
+  <sitemap><loc>https://www.example.sg/sitemap-news-1.xml</loc></sitemap>
+</sitemapindex>'''
+
+
+def fake_response(body, status=200):
+    response = Mock(status_code=status, text=body.decode('utf-8', 'ignore') if isinstance(body, bytes) else body)
+    data = body if isinstance(body, bytes) else body.encode()
+    response.iter_content.side_effect = lambda size: (data[i:i + 7] for i in range(0, len(data), 7))
+    return response
+
+
+def fake_http(pages):
+    http = Mock()
+    http.get.side_effect = lambda url, **kwargs: fake_response(pages.get(url, b''), 200 if url in pages else 404)
+    return http
+
+
+SITE = {'name': 'Example', 'url': 'https://www.example.sg/singapore'}
+
+
+class TestSitemapParser:
+    """Test incremental parsing of news sitemaps and indexes"""
+
+    def test_parses_in_small_chunks(self):
+        """Test that entries come out with titles and UTC dates when fed in tiny chunks"""
+        parser = SitemapParser()
+        for i in range(0, len(NEWS_SITEMAP), 5):
+            parser.feed(NEWS_SITEMAP[i:i + 5])
+        parser.close()
+
+        assert parser.is_news
+        assert len(parser.entries) == 4
+        entry = parser.entries[1]
+        assert entry.title == 'Budget 2025 unveiled'
+        assert entry.published == datetime(2025, 3, 10, 1, 30, tzinfo=timezone.utc)
+
+    def test_gzipped_sitemap_index(self):
+        """Test that gzip sitemaps are decompressed on the fly and child sitemaps listed"""
+        parser = SitemapParser()
+        data = gzip.compress(SITEMAP_INDEX)
+        parser.feed(data[:10])
+        parser.feed(data[10:])
+        parser.close()
+        assert parser.children == ['https://www.example.sg/sitemap-pages.xml',
+                                   'https://www.example.sg/sitemap-news-1.xml']
+
+    def test_parse_sitemap_date(self):
+        """Test W3C date formats"""
+        assert parse_sitemap_date('2025-03-10') == datetime(2025, 3, 10, tzinfo=timezone.utc)
+        assert parse_sitemap_date('not a date') is None
+
+
+class TestSitemapDiscovery:
+    """Test sitemap location discovery and recent-article pruning"""
+
+    def test_robots_sitemap_yields_recent_entries_newest_first(self, tmp_path):
+        """Test that old and off-site items are pruned before any article fetch"""
+        http = fake_http({
+            'https://www.example.sg/robots.txt': b'User-agent: *\nSitemap: https://www.example.sg/sitemap.xml\n'
+                                                 b'Sitemap: https://www.example.sg/news-feed.xml\n',
+            'https://www.example.sg/news-feed.xml': NEWS_SITEMAP,
+        })
+        discovery = SitemapDiscovery(state_file=str(tmp_path / 'sources.json'), max_age_hours=48, http=http)
+
+        entries = discovery.discover(SITE, now=NOW)
+
+        assert [entry.url for entry in entries] == ['https://www.example.sg/news/hdb-flats',
+                                                    'https://www.example.sg/news/budget-2025']
+        assert discovery.has_sitemap(SITE)
+
+    def test_sitemap_location_is_remembered(self, tmp_path):
+        """Test that the next run reads the known sitemap without probing robots.txt again"""
+        http = fake_http({'https://www.example.sg/sitemap_news.xml': NEWS_SITEMAP})
+        discovery = SitemapDiscovery(state_file=str(tmp_path / 'sources.json'), http=http)
+        discovery.discover(SITE, now=NOW)
+        discovery.save()
+
+        http.get.reset_mock()
+        restored = SitemapDiscovery(state_file=discovery.state_file, http=http)
+        assert len(restored.discover(SITE, now=NOW)) == 2
+        assert [call.args[0] for call in http.get.call_args_list] == ['https://www.example.sg/sitemap_news.xml']
+
+    def test_index_follows_news_children(self, tmp_path):
+        """Test that a sitemap index is resolved through its news child sitemap"""
+        http = fake_http({
+            'https://www.example.sg/news-sitemap.xml': SITEMAP_INDEX,
+            'https://www.example.sg/sitemap-news-1.xml': NEWS_SITEMAP,
+        })
+        discovery = SitemapDiscovery(state_file=str(tmp_path / 'sources.json'), http=http)
+        assert len(discovery.discover(SITE, now=NOW)) == 2
+
+    def test_sites_without_sitemap_fall_back(self, tmp_path):
+        """Test that None is returned so the home page is parsed instead"""
+        discovery = SitemapDiscovery(state_file=str(tmp_path / 'sources.json'), http=fake_http({}))
+        assert discovery.discover(SITE, now=NOW) is None
+        assert not discovery.has_sitemap(SITE)
@@ -0,0 +1,95 @@
+"""
+Unit tests for near-duplicate summary reuse across outlets
+"""
+import pytest
+from unittest.mock import patch
+
+try:
+    from scripts.deduplication import ArticleDeduplicator, hamming_distance, near_duplicate_groups
+    from scripts.article_index import ArticleIndex
+    from scripts import scraper
+except ImportError:
+    pytest.skip("summary reuse modules not available", allow_module_level=True)
+
+
+LEAD = ('The Ministry of Health announced on Monday that new measures will be introduced to support '
+        'seniors living alone in Singapore. The programme will expand community care services across '
+        'all housing estates and provide additional funding for volunteer groups over the next three years.')
+TITLE = 'New support measures for seniors living alone'
+OTHER_TITLE = 'Budget 2025: cash payouts for households'
+OTHER_LEAD = ('Households will receive cash payouts of up to S$600 under Budget 2025, '
+              'the Finance Minister said in Parliament on Tuesday.')
+
+
+@pytest.fixture
+def dedup():
+    return ArticleDeduplicator()
+
+
+class TestSimHash:
+    """Test fingerprint distances and in-run grouping"""
+
+    def test_syndicated_copy_is_close(self, dedup):
+        """Test that a lightly edited copy stays within a few bits"""
+        original = dedup.calculate_simhash(TITLE, LEAD)
+        copy = dedup.calculate_simhash(TITLE + '!', LEAD.replace('on Monday', 'on Monday (Mar 10)'))
+        different = dedup.calculate_simhash(OTHER_TITLE, OTHER_LEAD)
+        assert hamming_distance(original, copy) <= 3
+        assert hamming_distance(original, different) > 10
+
+    def test_near_duplicate_groups(self):
+        """Test that each fingerprint points at the first close fingerprint"""
+        assert near_duplicate_groups([0b0000, 0b1111_0000_0000, 0b0001, 0b1111_0000_0001], 1) == [0, 1, 0, 1]
+
+
+class TestFindSimilarSummary:
+    """Test fingerprint lookup in the article index"""
+
+    def test_reuses_closest_ai_summary(self, tmp_path):
+        """Test that a near-identical article from another outlet finds the stored summary"""
+        index = ArticleIndex(path=str(tmp_path / 'index.jsonl'))
+        index.record('https://cna.sg/a', simhash=index.fingerprint(TITLE, LEAD), summary='요약', extracted_by='cohere')
+        index.record('https://st.sg/b', simhash=index.fingerprint(OTHER_TITLE, OTHER_LEAD),
+                     summary='다른 요약', extracted_by='gemini')
+
+        reloaded = ArticleIndex(path=index.path)
+        summary, source, distance = reloaded.find_similar_summary(
+            reloaded.fingerprint(TITLE, LEAD + ' More details later.'))
+        assert summary == {'text': '요약', 'extracted_by': 'cohere'}
+        assert source == 'https://cna.sg/a'
+        assert reloaded.stats['similar_reused'] == 1
+
+    def test_keyword_summaries_and_same_url_are_skipped(self, tmp_path):
+        """Test that only API summaries of other URLs are reused"""
+        index = ArticleIndex(path=str(tmp_path / 'index.jsonl'))
+        fingerprint = index.fingerprint(TITLE, LEAD)
+        index.record('https://cna.sg/a', simhash=fingerprint, summary='키워드', extracted_by='keyword')
+        index.record('https://st.sg/b', simhash=fingerprint, summary='요약', extracted_by='gemini')
+        assert index.find_similar_summary(fingerprint, exclude_url='https://st.sg/b') is None
+
+
+class TestCreateSummaryReuse:
+    """Test that create_summary spends no AI call on near-duplicates"""
+
+    def test_second_outlet_reuses_first_summary(self, tmp_path):
+        """Test that the copy reuses the summary and is recorded with its fingerprint"""
+        index = ArticleIndex(path=str(tmp_path / 'index.jsonl'))
+        generated = {'text': '📰 제목: 노인 지원', 'extracted_by': 'cohere'}
+        with patch.object(scraper, 'get_article_index', return_value=index), \
+                patch.object(scraper, 'generate_summary', return_value=generated) as generate:
+            first = scraper.create_summary({'url': 'https://cna.sg/a', 'title': TITLE, 'content': LEAD}, {}, 'CNA')
+            second = scraper.create_summary({'url': 'https://yahoo.sg/b', 'title': TITLE, 'content': LEAD}, {}, 'Yahoo')
+
+        assert generate.call_count == 1
+        assert first == second == generated
+        assert index.get('https://yahoo.sg/b')['simhash'] == index.fingerprint(TITLE, LEAD)
+
+    def test_disabled_reuse_calls_provider(self, tmp_path):
+        """Test that summaryReuse.enabled=false summarizes every copy"""
+        index = ArticleIndex(path=str(tmp_path / 'index.jsonl'))
+        settings = {'summaryReuse': {'enabled': False}}
+        with patch.object(scraper, 'get_article_index', return_value=index), \
+                patch.object(scraper, 'generate_summary', return_value={'text': '요약', 'extracted_by': 'gemini'}) as generate:
+            scraper.create_summary({'url': 'https://cna.sg/a', 'title': TITLE, 'content': LEAD}, settings)
+            scraper.create_summary({'url': 'https://yahoo.sg/b', 'title': TITLE, 'content': LEAD}, settings)
+        assert generate.call_count == 2
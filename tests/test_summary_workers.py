@@ -0,0 +1,163 @@
+"""
+Unit tests for parallel hybrid summarization workers
+"""
+import threading
+import time
+import pytest
+
+try:
+    from scripts.summary_workers import SummaryWorkers, SummaryBudget
+except ImportError:
+    pytest.skip("summary_workers module not available", allow_module_level=True)
+
+
+def make_articles(count):
+    return [{'title': f'Article {i}', 'content': f'Singapore news body {i}'} for i in range(count)]
+
+
+def tracking_provider(delay, result=lambda title: f'요약: {title}'):
+    """Provider that records its peak concurrency"""
+    state = {'active': 0, 'peak': 0, 'calls': 0}
+    lock = threading.Lock()
+
+    def summarize(title, content):
+        with lock:
+            state['active'] += 1
+            state['calls'] += 1
+            state['peak'] = max(state['peak'], state['active'])
+        time.sleep(delay)
+        with lock:
+            state['active'] -= 1
+        return result(title)
+
+    return summarize, state
+
+
+class TestSummaryBudget:
+    """Test the exact AI summary cap"""
+
+    def test_released_slot_is_reused(self):
+        """Test that a failed reservation frees its slot for the next article"""
+        budget = SummaryBudget(1)
+        assert budget.reserve()
+        budget.release()
+        assert budget.reserve()
+        budget.commit()
+        assert not budget.reserve()
+        assert budget.used == 1
+
+
+class TestSummaryWorkers:
+    """Test concurrency limits, cap and ordering"""
+
+    def test_runs_concurrently_in_article_order(self):
+        """Test that summaries overlap and come back in input order"""
+        provider, state = tracking_provider(0.1)
+        workers = SummaryWorkers([('cohere', provider)], max_workers=4, per_provider=4)
+
+        begin = time.time()
+        results = workers.summarize(make_articles(8))
+
+        assert time.time() - begin < 0.6
+        assert [r.summary for r in results] == [f'요약: Article {i}' for i in range(8)]
+        assert all(r.status == 'cohere' for r in results)
+        assert state['peak'] > 1
+
+    def test_per_provider_limit(self):
+        """Test that one provider never sees more than its concurrency limit"""
+        provider, state = tracking_provider(0.05)
+        workers = SummaryWorkers([('gemini', provider)], max_workers=6, per_provider=2)
+        workers.summarize(make_articles(10))
+        assert state['peak'] <= 2
+
+    def test_cap_is_exact_under_concurrency(self):
+        """Test that exactly max_summaries AI summaries are produced"""
+        provider, state = tracking_provider(0.02)
+        workers = SummaryWorkers([('cohere', provider)], max_summaries=5, max_workers=8, per_provider=8)
+        results = workers.summarize(make_articles(20))
+
+        assert sum(1 for r in results if r.summary) == 5
+        assert state['calls'] == 5
+        assert sum(1 for r in results if r.status == 'limit') == 15
+
+    def test_failed_summaries_do_not_use_the_cap(self):
+        """Test that failures fall through to the next provider and free their slot"""
+        failing, _ = tracking_provider(0.01, result=lambda title: None)
+        backup, state = tracking_provider(0.01, result=lambda title: None if title.endswith('0') else 'ok')
+        workers = SummaryWorkers([('cohere', failing), ('gemini', backup)], max_summaries=3, max_workers=1)
+        results = workers.summarize(make_articles(5))
+
+        assert [r.status for r in results] == ['fallback', 'gemini', 'gemini', 'gemini', 'limit']
+
+    def test_exception_is_reported_per_article(self):
+        """Test that a provider exception only affects its own article"""
+        def flaky(title, content):
+            if title == 'Article 1':
+                raise RuntimeError('boom')
+            return 'ok'
+
+        results = SummaryWorkers([('cohere', flaky)], max_workers=2).summarize(make_articles(3))
+        assert [r.status for r in results] == ['cohere', 'error', 'cohere']
+
+
+def batch_provider(drop=(), calls=None):
+    """Batch provider that answers every item except the given titles"""
+    def summarize(items):
+        if calls is not None:
+            calls.append([title for _, title, _ in items])
+        return {item_id: f'요약: {title}' for item_id, title, _ in items if title not in drop}
+    return summarize
+
+
+class TestBatchedSummaryWorkers:
+    """Test multi-article requests, re-queueing and the request cap"""
+
+    def test_articles_are_packed_into_requests(self):
+        """Test that 10 articles need only 2 requests and keep their order"""
+        calls = []
+        workers = SummaryWorkers([], batch_providers=[('gemini', batch_provider(calls=calls))], batch_size=5)
+        results = workers.summarize(make_articles(10))
+
+        assert len(calls) == 2
+        assert [r.summary for r in results] == [f'요약: Article {i}' for i in range(10)]
+        assert all(r.status == 'gemini' for r in results)
+
+    def test_only_missing_items_are_requeued(self):
+        """Test that the retry request contains only the dropped articles"""
+        calls = []
+        dropped_once = {'Article 2'}
+
+        def flaky(items):
+            drop = set(dropped_once)
+            dropped_once.clear()
+            return batch_provider(drop=drop, calls=calls)(items)
+
+        workers = SummaryWorkers([], batch_providers=[('cohere', flaky)], batch_size=5, max_workers=1)
+        results = workers.summarize(make_articles(5))
+
+        assert calls == [[f'Article {i}' for i in range(5)], ['Article 2']]
+        assert all(r.summary for r in results)
+
+    def test_unanswered_after_retries_fall_back(self):
+        """Test that an article the model never returns gets the fallback status"""
+        provider = batch_provider(drop={'Article 1'})
+        workers = SummaryWorkers([], batch_providers=[('cohere', provider)], batch_size=3, batch_retries=1)
+        results = workers.summarize(make_articles(3))
+        assert [r.status for r in results] == ['cohere', 'fallback', 'cohere']
+
+    def test_request_cap_limits_batches(self):
+        """Test that maxAiRequests caps requests, not summaries"""
+        calls = []
+        workers = SummaryWorkers([], batch_providers=[('gemini', batch_provider(calls=calls))],
+                                 batch_size=5, max_requests=2, max_workers=4)
+        results = workers.summarize(make_articles(15))
+
+        assert len(calls) == 2
+        assert sum(1 for r in results if r.summary) == 10
+        assert sum(1 for r in results if r.status == 'limit') == 5
+
+    def test_next_provider_used_when_batch_fails(self):
+        """Test that an empty batch response moves on to the next provider"""
+        workers = SummaryWorkers([], batch_providers=[('cohere', lambda items: {}),
+                                                      ('gemini', batch_provider())], batch_size=4)
+        assert [r.status for r in workers.summarize(make_articles(2))] == ['gemini', 'gemini']